@@ -0,0 +1,253 @@
+import datetime
+import functools
+import hashlib
+import os
+import struct
+import zlib
+from collections.abc import Callable
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+
+from core import utils
+from core.common import MediaKinds
+from core.models import Album, MediaAlbum
+from core.responses import read_range
+from core.storage import get_storage
+
+# ZIP archives are written in store mode (media files are already compressed), so the size and position
+# of every byte is known before reading any file. That allows sending Content-Length and answering Range
+# requests of an interrupted download without building the archive
+
+# Sizes and offsets from this value on need ZIP64 extra fields
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP_FILECOUNT_LIMIT = 0xFFFF
+# CRC-32 and sizes are repeated in a data descriptor after the data (bit 3), file names are UTF-8 (bit 11)
+ZIP_FLAGS = 0x0808
+ZIP_VERSION = 20
+ZIP64_VERSION = 45
+# Created on Unix, so extractors keep regular file permissions
+ZIP_CREATE_SYSTEM = 3
+ZIP_FILE_ATTRIBUTES = 0o100644 << 16
+
+# Converts a date to the DOS (time, date) pair of ZIP headers, which cannot represent dates before 1980
+def get_dos_datetime(date: datetime.datetime) -> tuple[int, int]:
+    if date.year < 1980:
+        return 0, (1 << 5) | 1
+    dostime = (date.hour << 11) | (date.minute << 5) | (date.second // 2)
+    dosdate = ((date.year - 1980) << 9) | (date.month << 5) | date.day
+    return dostime, dosdate
+
+# Gets a name for a file or folder that is valid and unique (case insensitive) among the used names
+def get_entry_name(name: str, used: set[str]) -> str:
+    name = name.replace('/', '_').replace('\\', '_').strip()
+    if name in ('', '.', '..'):
+        name = 'file'
+    base, ext = os.path.splitext(name)
+    candidate = name
+    n = 2
+    while candidate.lower() in used:
+        candidate = f"{base} ({n}){ext}"
+        n += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+# File of an archive
+class ZipEntry:
+    # Opener returns the file opened for reading
+    # CRC-32 is given if known (recorded with the blob), otherwise it is computed and passed to savecrc if any
+    def __init__(self, name: str, opener: Callable, size: int, date: datetime.datetime, key: str,
+                 crc: int = None, savecrc: Callable = None):
+        self.name = name.encode('utf-8')
+        self.opener = opener
+        self.size = size
+        self.date = date
+        # Identifies the file contents (blob hash, or modification time for legacy files), used in the archive ETag
+        self.key = key
+        self.dostime, self.dosdate = get_dos_datetime(date)
+        self.zip64 = size >= ZIP64_LIMIT
+        # Set when the archive layout is computed
+        self.offset = 0
+        # Computed while the file is sent, or by reading it if only part of it was requested
+        self.crc = crc
+        self.savecrc = savecrc
+
+    def local_header(self) -> bytes:
+        size = self.size
+        extra = b''
+        if self.zip64:
+            size = ZIP64_LIMIT
+            extra = struct.pack('<HHQQ', 0x0001, 16, self.size, self.size)
+        # CRC-32 is left empty, it is sent in the data descriptor
+        return struct.pack('<IHHHHHIIIHH', 0x04034b50, ZIP64_VERSION if self.zip64 else ZIP_VERSION, ZIP_FLAGS, 0,
+                           self.dostime, self.dosdate, 0, size, size, len(self.name), len(extra)) + self.name + extra
+
+    def descriptor_length(self) -> int:
+        return 24 if self.zip64 else 16
+
+    def descriptor(self) -> bytes:
+        return struct.pack('<IIQQ' if self.zip64 else '<IIII', 0x08074b50, self.crc, self.size, self.size)
+
+    def central_header_extra(self) -> list[int]:
+        extra = []
+        if self.size >= ZIP64_LIMIT:
+            extra += [self.size, self.size]
+        if self.offset >= ZIP64_LIMIT:
+            extra.append(self.offset)
+        return extra
+
+    def central_header_length(self) -> int:
+        extra = self.central_header_extra()
+        return 46 + len(self.name) + (4 + 8 * len(extra) if extra else 0)
+
+    def central_header(self) -> bytes:
+        values = self.central_header_extra()
+        extra = struct.pack(f'<HH{len(values)}Q', 0x0001, 8 * len(values), *values) if values else b''
+        version = ZIP64_VERSION if values else ZIP_VERSION
+        size = min(self.size, ZIP64_LIMIT)
+        offset = min(self.offset, ZIP64_LIMIT)
+        return struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, (ZIP_CREATE_SYSTEM << 8) | version, version, ZIP_FLAGS, 0,
+                           self.dostime, self.dosdate, self.crc, size, size, len(self.name), len(extra), 0, 0, 0,
+                           ZIP_FILE_ATTRIBUTES, offset) + self.name + extra
+
+    def set_crc(self, crc: int):
+        self.crc = crc
+        if self.savecrc is not None:
+            self.savecrc(crc)
+
+    # Reads the whole file to get its CRC-32
+    def compute_crc(self):
+        if self.crc is not None:
+            return
+        crc = 0
+        with self.opener() as file:
+            for chunk in utils.read_chunks(file):
+                crc = zlib.crc32(chunk, crc)
+        self.set_crc(crc)
+
+
+# Store mode ZIP archive streamed from a list of files
+# The archive is split in segments with known lengths: local headers, file data, data descriptors
+# and the central directory, so any byte range can be generated without generating what is before it
+class ZipArchive:
+    def __init__(self, entries: list[ZipEntry]):
+        self.entries = entries
+        # (start, length, kind, value) where kind is 'bytes', 'data', 'descriptor' or 'directory'
+        self.segments = []
+        offset = 0
+        for entry in entries:
+            entry.offset = offset
+            header = entry.local_header()
+            for kind, value, length in (('bytes', header, len(header)), ('data', entry, entry.size),
+                                        ('descriptor', entry, entry.descriptor_length())):
+                self.segments.append((offset, length, kind, value))
+                offset += length
+        self.directory_offset = offset
+        self.directory_size = sum(entry.central_header_length() for entry in entries)
+        self.zip64 = (len(entries) >= ZIP_FILECOUNT_LIMIT or self.directory_offset >= ZIP64_LIMIT
+                      or self.directory_size >= ZIP64_LIMIT)
+        length = self.directory_size + (76 if self.zip64 else 0) + 22
+        self.segments.append((offset, length, 'directory', None))
+        self.size = offset + length
+
+    # Strong ETag, the archive bytes only change if its files change
+    @property
+    def etag(self) -> str:
+        digest = hashlib.sha1(repr([(e.name, e.key, e.size, e.date.isoformat()) for e in self.entries]).encode()).hexdigest()
+        return f'"{digest}"'
+
+    def end_records(self) -> bytes:
+        count = len(self.entries)
+        records = b''
+        if self.zip64:
+            records += struct.pack('<IQHHIIQQQQ', 0x06064b50, 44, (ZIP_CREATE_SYSTEM << 8) | ZIP64_VERSION, ZIP64_VERSION,
+                                   0, 0, count, count, self.directory_size, self.directory_offset)
+            records += struct.pack('<IIQI', 0x07064b50, 0, self.directory_offset + self.directory_size, 1)
+        records += struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, min(count, ZIP_FILECOUNT_LIMIT), min(count, ZIP_FILECOUNT_LIMIT),
+                               min(self.directory_size, ZIP64_LIMIT), min(self.directory_offset, ZIP64_LIMIT), 0)
+        return records
+
+    # Yields the part of the central directory between start and end (relative to the directory) without holding it in memory
+    # Only CRC-32 of the headers that are sent have to be known, files are only read for blobs without a recorded one
+    def read_directory(self, start: int, end: int):
+        position = 0
+        for entry in self.entries:
+            length = entry.central_header_length()
+            if position + length > start and position <= end:
+                entry.compute_crc()
+                yield entry.central_header()[max(start - position, 0):end - position + 1]
+            position += length
+            if position > end:
+                return
+        yield self.end_records()[max(start - position, 0):end - position + 1]
+
+    # Yields the bytes of a file, computing its CRC-32 if the whole file is sent
+    def read_data(self, entry: ZipEntry, start: int, end: int):
+        file = entry.opener()
+        if start > 0 or end < entry.size - 1 or entry.crc is not None:
+            yield from read_range(file, start, end)
+            return
+        crc = 0
+        for chunk in read_range(file, start, end):
+            crc = zlib.crc32(chunk, crc)
+            yield chunk
+        entry.set_crc(crc)
+
+    # Yields the bytes of the archive between start and end (inclusive)
+    def read(self, start: int = 0, end: int = None):
+        if end is None:
+            end = self.size - 1
+        for segstart, length, kind, value in self.segments:
+            segend = segstart + length - 1
+            if length == 0 or segend < start:
+                continue
+            if segstart > end:
+                break
+            first = max(start, segstart) - segstart
+            last = min(end, segend) - segstart
+            if kind == 'data':
+                yield from self.read_data(value, first, last)
+            elif kind == 'bytes':
+                yield value[first:last + 1]
+            elif kind == 'descriptor':
+                value.compute_crc()
+                yield value.descriptor()[first:last + 1]
+            else:
+                yield from self.read_directory(first, last)
+
+# Builds the archive with the media of the given albums of a user (except profile photos and trashed media)
+# With folders, media of each album are put in a folder named after the album
+def get_media_archive(user: User, albums: QuerySet[Album], folders: bool) -> ZipArchive:
+    mediaalbums = (MediaAlbum.objects.filter(album__in=albums, media__deletiondate__isnull=True).exclude(media__kind=MediaKinds.PROFILE.value)
+                   .select_related('album', 'media', 'media__blob').order_by('album__name', 'album_id', 'media__modificationdate', 'media_id'))
+    storage = get_storage()
+    entries = []
+    foldernames = {}
+    usedfolders = set()
+    usednames = {}
+    for mediaalbum in mediaalbums.iterator():
+        media = mediaalbum.media
+        crc = savecrc = None
+        if media.blob is not None:
+            opener = functools.partial(storage.open, utils.get_blob_name(media.blob.hash))
+            size = media.blob.size
+            key = media.blob.hash
+            crc = media.blob.crc32
+            if crc is None:
+                savecrc = functools.partial(utils.set_blob_crc, media.blob.hash)
+        else:
+            path = utils.get_legacy_media_path(user.username, media.id)
+            if not os.path.exists(path):
+                continue
+            opener = functools.partial(open, path, 'rb')
+            stat = os.stat(path)
+            size = stat.st_size
+            key = f"{int(stat.st_mtime):x}"
+
+        albumid = mediaalbum.album_id if folders else None
+        if albumid not in foldernames:
+            foldernames[albumid] = get_entry_name(mediaalbum.album.name, usedfolders) + '/' if folders else ''
+            usednames[albumid] = set()
+        name = foldernames[albumid] + get_entry_name(media.filename, usednames[albumid])
+        entries.append(ZipEntry(name, opener, size, media.modificationdate, key, crc, savecrc))
+    return ZipArchive(entries)
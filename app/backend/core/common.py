@@ -7,6 +7,24 @@ class MediaKinds(enum.Enum):
     VIDEO = 'video'
     PROFILE = 'profile'
 
+# Enum with status of video streams
+class VideoStreamStatus(enum.Enum):
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    READY = 'ready'
+    FAILED = 'failed'
+
+# Enum with status of background jobs (finished jobs are deleted)
+class JobStatus(enum.Enum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+
+# Enum with the ways media are matched by tags searches
+class TagMatchKinds(enum.Enum):
+    ALL = 'all'
+    ANY = 'any'
+
 # Enum with sharing permissions
 class SharingPermissionKinds(enum.Enum):
     READ_ONLY = 'read-only'
@@ -16,6 +34,71 @@ class SharingPermissionKinds(enum.Enum):
 # Constants
 DEFAULT_ALBUM = 'default'
 ALBUM_NAME_MAX_LENGTH = 35
+# Maximum lengths of the media fields given by clients
+MEDIA_FILENAME_MAX_LENGTH = 500
+MEDIA_LABEL_MAX_LENGTH = 50
+MEDIA_COORDINATES_MAX_LENGTH = 50
+# Modes of the media files and folders, readable by nginx (X-Accel-Redirect), which runs as another user than the app
+# Temporary files and folders are created only accessible by their owner (mkstemp and NamedTemporaryFile use 0600,
+# mkdtemp 0700) and renaming them keeps their mode, so they are opened up when moved into place
+MEDIA_FILE_MODE = 0o644
+MEDIA_FOLDER_MODE = 0o755
+# Folder inside MEDIA_ROOT for the content-addressed blob store (not a valid username)
+BLOBS_FOLDER = '_blobs'
+# Folder inside MEDIA_ROOT for renditions derived from the original files (not a valid username)
+DERIVED_FOLDER = '_derived'
+# Folder inside MEDIA_ROOT for the HLS streams transcoded from videos (not a valid username)
+STREAMS_FOLDER = '_streams'
+# Long edge in pixels of the image renditions served by the file API
+RENDITION_SIZES = [256, 1024, 2048]
+# Variants of the video streams as (short edge in pixels, video kbps, audio kbps), only those not bigger than the original are made
+VIDEO_STREAM_VARIANTS = [(360, 800, 96), (720, 2800, 128), (1080, 5000, 160)]
+# Duration in seconds of the HLS segments
+VIDEO_STREAM_SEGMENT_SECONDS = 6
+# Resumable uploads not updated in this time are deleted
+UPLOAD_EXPIRATION_HOURS = 24
+# Chunks of resumable uploads not receiving data in this time are considered abandoned (worker died), so the upload can be resumed
+UPLOAD_CLAIM_TIMEOUT_SECONDS = 60
+# Maximum number of files in a batch upload
+MEDIA_BATCH_MAX_FILES = 1000
+# Images with more pixels or bytes than this are rejected on upload, before decoding them (decompression bombs)
+MEDIA_MAX_PIXELS = 100_000_000
+MEDIA_MAX_IMAGE_BYTES = 200 * 1024 ** 2
+# Perceptual hashes of images are split into this many indexed chunks to find near duplicates
+DUPLICATE_HASH_CHUNKS = 4
+# Images whose hashes differ in at most this many bits (of 64) are duplicates by default
+# Up to the maximum, similar hashes share a chunk differing in at most 1 bit, so few chunks are looked up
+DUPLICATE_DISTANCE = 6
+DUPLICATE_MAX_DISTANCE = 7
+# Images are embedded in batches of this size by the background jobs
+EMBEDDING_BATCH_SIZE = 32
+# Similar images are searched exactly among this many images at most, in the nearest lists of the IVF index beyond
+EMBEDDING_EXACT_SEARCH_MAX = 50000
+EMBEDDING_IVF_PROBES = 32
+# Number of images returned by similar and text searches by default and at most
+EMBEDDING_SEARCH_RESULTS = 50
+EMBEDDING_SEARCH_MAX_RESULTS = 200
+# Tags (objects detected in images) are lowercase with single spaces, names longer than this are cut
+TAG_MAX_LENGTH = 100
+# Queued images are detected in batches of this size at most, with the thresholds of the browser detection
+DETECTION_BATCH_SIZE = 16
+DETECTION_INPUT_SIZE = 640
+DETECTION_SCORE_THRESHOLD = 0.35
+# Locations are cached by coordinates rounded to this many decimals (2 decimals is about 1 km, enough for a city)
+GEOCODING_PRECISION = 2
+# Cached locations are fetched again after this many days, the most recent are also kept in the memory of each process
+GEOCODING_CACHE_DAYS = 90
+GEOCODING_MEMORY_CACHE_SIZE = 4096
+# Length of the location column of media, longer place names are truncated
+LOCATION_MAX_LENGTH = 50
+# Background jobs are run at most this many times, retries are delayed exponentially from the base delay up to the maximum delay
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_SECONDS = 30
+JOB_RETRY_MAX_SECONDS = 3600
+# Jobs running for longer than this are considered abandoned (worker died) and run again by another worker
+JOB_TIMEOUT_SECONDS = 600
+# Deleted albums and media are kept in the trash for this many days, then the purgetrash worker removes them
+TRASH_RETENTION_DAYS = 30
 
 # API paths
 LOGIN_API = 'api/login'
@@ -26,5 +109,14 @@ USER_API = 'api/user'
 ALBUM_API = 'api/album'
 USER_ALBUMS_API = 'api/albums'
 MEDIA_API = 'api/media'
+MEDIA_BATCH_API = 'api/media/batch'
 USER_MEDIA_API = 'api/medias'
 FILE_API = 'api/file'
+UPLOAD_API = 'api/upload'
+EXPORT_API = 'api/export'
+STREAM_API = 'api/stream'
+TRASH_API = 'api/trash'
+DUPLICATES_API = 'api/duplicates'
+SIMILAR_MEDIA_API = 'api/medias/similar'
+SEARCH_MEDIA_API = 'api/medias/search'
+TAGGED_MEDIA_API = 'api/medias/tags'
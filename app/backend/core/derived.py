@@ -0,0 +1,109 @@
+import datetime
+import logging
+import os
+import shutil
+import tempfile
+from django.conf import settings
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from core.common import DERIVED_FOLDER, MEDIA_FILE_MODE
+from core.models import DerivedFile, Media
+
+logger = logging.getLogger(__name__)
+
+# Hits, misses and evictions of the derived files cache in this process
+stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+# When over budget, least recently used files are evicted until the cache is under this fraction of the budget,
+# so eviction does not run again on every new file
+EVICTION_TARGET = 0.9
+# Accesses are recorded at most once per interval (in seconds) for each file, so cache hits rarely write to the database
+# Eviction only needs to tell recently used files from the rest
+ACCESS_RECORD_INTERVAL = 10 * 60
+
+# Gets key identifying the contents of a media file, files derived from it are stored under this key
+# Media sharing a blob share their derived files
+def get_derived_key(username: str, media: Media) -> str:
+    if media.blob is not None:
+        return media.blob.hash
+    return get_legacy_derived_key(username, media.id)
+
+def get_legacy_derived_key(username: str, id: int) -> str:
+    return f"{username}-{id}"
+
+def get_derived_folder(key: str):
+    return settings.MEDIA_ROOT / DERIVED_FOLDER / key[:2] / key
+
+def get_derived_path(key: str, name: str):
+    return get_derived_folder(key) / name
+
+# Creates a temporary file next to the cached files of a key, to be added with put_derived_file
+def create_derived_tempfile(key: str) -> tuple[int, str]:
+    folder = get_derived_folder(key)
+    os.makedirs(folder, exist_ok=True)
+    return tempfile.mkstemp(dir=folder)
+
+# Gets path of a cached derived file and records the access, or None if it is not cached
+def get_derived_file(key: str, name: str):
+    path = get_derived_path(key, name)
+    lastaccess = DerivedFile.objects.filter(key=key, name=name).values_list('lastaccess', flat=True).first()
+    if lastaccess is None or not os.path.exists(path):
+        stats['misses'] += 1
+        return None
+    now = timezone.now()
+    if lastaccess < now - datetime.timedelta(seconds=ACCESS_RECORD_INTERVAL):
+        DerivedFile.objects.filter(key=key, name=name, lastaccess=lastaccess).update(lastaccess=now, hits=F('hits') + 1)
+    stats['hits'] += 1
+    return path
+
+# Adds a derived file to the cache, moving it from a temporary path, and evicts files if over budget
+def put_derived_file(key: str, name: str, tmppath: str):
+    path = get_derived_path(key, name)
+    os.chmod(tmppath, MEDIA_FILE_MODE)
+    # Renamed in place, so concurrent requests never read a partial file
+    os.replace(tmppath, path)
+    DerivedFile.objects.update_or_create(key=key, name=name, defaults={
+        'size': os.path.getsize(path),
+        'lastaccess': timezone.now(),
+    })
+    evict_derived_files(keep=(key, name))
+    return path
+
+# Gets total size in bytes of the cached derived files
+def get_derived_usage() -> int:
+    return DerivedFile.objects.aggregate(total=Sum('size'))['total'] or 0
+
+# Evicts least recently used files (biggest first among equally recent ones) if the cache is over budget
+# The file given as (key, name) in keep is never evicted
+# Returns number of evicted files
+def evict_derived_files(budget: int = None, keep: tuple[str, str] = None) -> int:
+    if budget is None:
+        budget = settings.DERIVED_CACHE_MAX_BYTES
+    total = get_derived_usage()
+    if total <= budget:
+        return 0
+
+    target = budget * EVICTION_TARGET
+    evicted = []
+    candidates = DerivedFile.objects.order_by('lastaccess', '-size').only('id', 'key', 'name', 'size')
+    if keep is not None:
+        candidates = candidates.exclude(key=keep[0], name=keep[1])
+    for derived in candidates.iterator():
+        if total <= target:
+            break
+        path = get_derived_path(derived.key, derived.name)
+        if os.path.exists(path):
+            os.remove(path)
+        total -= derived.size
+        evicted.append(derived.id)
+    DerivedFile.objects.filter(id__in=evicted).delete()
+
+    stats['evictions'] += len(evicted)
+    logger.info(f"Evicted {len(evicted)} derived files, cache stats: {stats}")
+    return len(evicted)
+
+# Deletes every derived file of an original, used when the original is overwritten or deleted
+def invalidate_derived_files(key: str):
+    DerivedFile.objects.filter(key=key).delete()
+    shutil.rmtree(get_derived_folder(key), ignore_errors=True)
@@ -0,0 +1,100 @@
+import ast
+import functools
+import logging
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from core import tags, utils
+from core.common import DETECTION_BATCH_SIZE, DETECTION_INPUT_SIZE, DETECTION_SCORE_THRESHOLD, MediaKinds
+from core.embeddings import create_session, np
+from core.models import Media
+from core.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Objects of images uploaded without detections (weak devices, imports, batch and resumable uploads) are detected by
+# the runjobs worker with the YOLOv8 model also run in the browser. Detection jobs are run in batches, so images
+# queued one by one by their uploads go through the model together
+# Only the labels found in an image and their confidence are kept, not the boxes: the best box of a class is kept by
+# non-maximum suppression, so the confidence of a label is the best score of its class among all the candidate boxes
+
+
+# Model detecting objects, run on batches of images
+class ObjectDetector:
+    def __init__(self, path: str):
+        self.session = create_session(path)
+        input = self.session.get_inputs()[0]
+        self.input = input.name
+        batch, _, height, _ = input.shape
+        self.size = height if isinstance(height, int) else DETECTION_INPUT_SIZE
+        # Models exported without a dynamic batch axis take a fixed number of images per run
+        self.batchsize = batch if isinstance(batch, int) else None
+        # Class names are stored by ultralytics in the metadata of the model, as a dict literal
+        names = self.session.get_modelmeta().custom_metadata_map.get('names')
+        self.labels = {id: name.lower() for id, name in ast.literal_eval(names).items()} if names else {}
+
+    # Pads an image into a square (bottom and right, as in the browser) and resizes it to the model input
+    def preprocess(self, image: Image.Image):
+        image = ImageOps.exif_transpose(image).convert('RGB')
+        scale = self.size / max(image.size)
+        image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))), Image.Resampling.BILINEAR)
+        padded = Image.new('RGB', (self.size, self.size))
+        padded.paste(image, (0, 0))
+        return (np.asarray(padded, dtype=np.float32) / 255).transpose(2, 0, 1)
+
+    # Gets the labels found in model outputs of an image, (4 box coordinates + class scores) x candidate boxes,
+    # with their confidence, the most confident first
+    def postprocess(self, output) -> dict[str, float]:
+        scores = output[4:].max(axis=1)
+        found = np.flatnonzero(scores >= DETECTION_SCORE_THRESHOLD)
+        return {self.labels.get(int(i), str(i)): float(scores[i]) for i in found[np.argsort(-scores[found])]}
+
+    def detect(self, images: list[Image.Image]) -> list[dict[str, float]]:
+        batch = np.stack([self.preprocess(image) for image in images])
+        runsize = self.batchsize or len(batch)
+        outputs = []
+        for start in range(0, len(batch), runsize):
+            inputs = batch[start:start + runsize]
+            # Last run of a fixed size model is padded with blank images
+            if len(inputs) < runsize:
+                inputs = np.concatenate([inputs, np.zeros((runsize - len(inputs), *inputs.shape[1:]), dtype=np.float32)])
+            outputs.extend(self.session.run(None, {self.input: inputs})[0][:len(batch) - start])
+        return [self.postprocess(output) for output in outputs]
+
+# Gets the model in the DETECTION_MODEL_PATH setting, loaded once per process, or None if not set
+@functools.cache
+def get_detector() -> ObjectDetector | None:
+    if not settings.DETECTION_MODEL_PATH:
+        return None
+    return ObjectDetector(settings.DETECTION_MODEL_PATH)
+
+def is_enabled() -> bool:
+    return bool(settings.DETECTION_MODEL_PATH)
+
+# Detects objects of images without detections and stores them as their tags, media sharing a file are detected once
+# Images without objects are marked as detected too, so they are not detected again
+# Files that are not images that can be decoded are left without detections
+def detect_media(mediaids: list[int]):
+    detector = get_detector()
+    if detector is None:
+        return
+    pending = Media.all_objects.filter(kind=MediaKinds.IMAGE.value, detected=False)
+    blobs = list(pending.filter(id__in=mediaids, blob__isnull=False).values_list('blob_id', flat=True).distinct())
+    for start in range(0, len(blobs), DETECTION_BATCH_SIZE):
+        hashes, images = [], []
+        for blobhash in blobs[start:start + DETECTION_BATCH_SIZE]:
+            try:
+                with get_storage().open(utils.get_blob_name(blobhash)) as file, Image.open(file) as image:
+                    # JPEG images are decoded at a reduced scale, big enough for the model input
+                    image.draft('RGB', (detector.size, detector.size))
+                    image.load()
+                    images.append(image)
+                    hashes.append(blobhash)
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                logger.warning(f"Blob {blobhash} could not be detected: {e}")
+        if not images:
+            continue
+        detections = dict(zip(hashes, detector.detect(images)))
+        detected = {id: detections[blobhash] for id, blobhash in pending.filter(blob_id__in=hashes).values_list('id', 'blob_id')}
+        tags.set_media_tags(detected)
+        utils.touch_media_albums(list(detected))
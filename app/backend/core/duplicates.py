@@ -0,0 +1,142 @@
+import functools
+import itertools
+import logging
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from core import utils
+from core.common import DUPLICATE_HASH_CHUNKS, MediaKinds
+from core.models import Media
+from core.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Near-duplicate images (bursts, edited or re-encoded copies) are found with a 64-bit difference hash (dHash):
+# each bit tells if a pixel of the image shrunk to 9x8 grey pixels is brighter than the next one, so similar
+# images have hashes differing in few bits (Hamming distance)
+HASH_BITS = 64
+CHUNK_BITS = HASH_BITS // DUPLICATE_HASH_CHUNKS
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+# Hashes are indexed with multi-index hashing: they are split into chunks, each stored in an indexed column
+# Two hashes within a distance d have at least one chunk within d // chunks (pigeonhole principle), so candidates are
+# found with exact lookups of the chunks around each chunk of the hash, and only they are compared
+
+
+# Gets the difference hash of an image, as the same image is rotated with different EXIF orientations it is applied first
+def compute_hash(file) -> int:
+    with Image.open(file) as image:
+        # JPEG images are decoded at a reduced scale, much faster than decoding all their pixels
+        image.draft('L', (64, 64))
+        image = ImageOps.exif_transpose(image).convert('L').resize((9, 8), Image.Resampling.BILINEAR)
+    pixels = image.tobytes()
+    hash = 0
+    for row in range(8):
+        for col in range(8):
+            hash = (hash << 1) | (pixels[row * 9 + col] < pixels[row * 9 + col + 1])
+    return hash
+
+def get_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+def split_hash(hash: int) -> list[int]:
+    return [(hash >> (i * CHUNK_BITS)) & CHUNK_MASK for i in range(DUPLICATE_HASH_CHUNKS)]
+
+# Gets the masks of the bits to flip in a chunk to get the chunks within a distance of it
+@functools.cache
+def get_chunk_masks(radius: int) -> tuple[int, ...]:
+    return tuple(sum(1 << bit for bit in bits) for count in range(radius + 1) for bits in itertools.combinations(range(CHUNK_BITS), count))
+
+def get_chunk_neighbors(chunk: int, radius: int) -> list[int]:
+    return [chunk ^ mask for mask in get_chunk_masks(radius)]
+
+# Gets the media fields of a hash, stored as a signed 64-bit integer and its chunks
+def get_hash_fields(hash: int | None) -> dict:
+    if hash is None:
+        return {'phash': None, **{f'phash{i}': None for i in range(DUPLICATE_HASH_CHUNKS)}}
+    return {'phash': hash - (1 << HASH_BITS) if hash >> (HASH_BITS - 1) else hash,
+            **{f'phash{i}': chunk for i, chunk in enumerate(split_hash(hash))}}
+
+# Gets the hash stored in the phash field
+def get_stored_hash(phash: int | None) -> int | None:
+    return None if phash is None else phash & ((1 << HASH_BITS) - 1)
+
+def get_media_hash(media: Media) -> int | None:
+    return get_stored_hash(media.phash)
+
+
+# Index of hashes in memory, used to find the duplicates among many media at once
+class HashIndex:
+    def __init__(self, hashes: dict[int, int] = None):
+        self.hashes = {}
+        self.chunks = [{} for _ in range(DUPLICATE_HASH_CHUNKS)]
+        for id, hash in (hashes or {}).items():
+            self.add(id, hash)
+
+    def add(self, id: int, hash: int):
+        self.hashes[id] = hash
+        for table, chunk in zip(self.chunks, split_hash(hash)):
+            table.setdefault(chunk, []).append(id)
+
+    # Gets IDs of the hashes within a distance of a hash
+    def query(self, hash: int, distance: int) -> set[int]:
+        masks = get_chunk_masks(distance // DUPLICATE_HASH_CHUNKS)
+        candidates = set()
+        for table, chunk in zip(self.chunks, split_hash(hash)):
+            for mask in masks:
+                ids = table.get(chunk ^ mask)
+                if ids:
+                    candidates.update(ids)
+        hashes = self.hashes
+        return {id for id in candidates if (hashes[id] ^ hash).bit_count() <= distance}
+
+# Gets groups of media IDs whose hashes are within a distance, from a dict of media ID -> hash
+# Groups are transitive (a burst of photos is one group even if the first and the last differ more)
+def group_duplicates(hashes: dict[int, int], distance: int) -> list[list[int]]:
+    parents = {id: id for id in hashes}
+    def find(id):
+        while parents[id] != id:
+            parents[id] = parents[parents[id]]
+            id = parents[id]
+        return id
+    # Each hash is looked up among the previous ones only, so every pair is compared once
+    index = HashIndex()
+    for id, hash in hashes.items():
+        for other in index.query(hash, distance):
+            parents[find(other)] = find(id)
+        index.add(id, hash)
+    groups = {}
+    for id in hashes:
+        groups.setdefault(find(id), []).append(id)
+    return sorted((sorted(group) for group in groups.values() if len(group) > 1), key=lambda group: group[0])
+
+# Gets media with a hash within a distance of the hash of a media, using the indexed chunk columns
+def find_similar_media(media: Media, medias, distance: int) -> list[Media]:
+    hash = get_media_hash(media)
+    if hash is None:
+        return []
+    radius = distance // DUPLICATE_HASH_CHUNKS
+    lookup = Q()
+    for i, chunk in enumerate(split_hash(hash)):
+        lookup |= Q(**{f'phash{i}__in': get_chunk_neighbors(chunk, radius)})
+    candidates = medias.filter(lookup).exclude(id=media.id).distinct()
+    return [candidate for candidate in candidates if get_distance(get_media_hash(candidate), hash) <= distance]
+
+
+# Computes hashes of images, media sharing a file are hashed once (including copies made while the hash was pending)
+# Files that are not images that can be decoded are left without hash
+def hash_media(mediaids: list[int]):
+    medias = Media.all_objects.filter(id__in=mediaids, blob__isnull=False).select_related('blob')
+    blobs = {}
+    for media in medias:
+        blobs.setdefault(media.blob.hash, []).append(media.id)
+    for blobhash, ids in blobs.items():
+        try:
+            with get_storage().open(utils.get_blob_name(blobhash)) as file:
+                hash = compute_hash(file)
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            logger.warning(f"Media {ids} could not be hashed: {e}")
+            continue
+        hashed = Media.all_objects.filter(blob_id=blobhash, kind=MediaKinds.IMAGE.value)
+        hashed.update(**get_hash_fields(hash))
+        utils.touch_media_albums(list(hashed.values_list('id', flat=True)))
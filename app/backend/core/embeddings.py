@@ -0,0 +1,332 @@
+import functools
+import logging
+import math
+import threading
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from core import utils
+from core.common import EMBEDDING_BATCH_SIZE, EMBEDDING_EXACT_SEARCH_MAX, EMBEDDING_IVF_PROBES, MediaKinds
+from core.models import Embedding, EmbeddingCentroid, Media
+from core.storage import get_storage
+
+# numpy and onnxruntime are only needed for embeddings, tokenizers for text search
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+try:
+    import tokenizers
+except ImportError:
+    tokenizers = None
+
+logger = logging.getLogger(__name__)
+
+# Images and texts are embedded by a CLIP-style model into vectors whose dot product tells how similar they are
+# Vectors are stored normalized as float16 (1 KB for 512 dimensions) and searched in memory: exactly among the images
+# of a user if they are few, otherwise in the nearest lists of an IVF index (k-means centroids trained by the
+# embeddings command), so a search scans a few thousand vectors whatever the size of the library
+
+# Preprocessing of the CLIP image models
+CLIP_IMAGE_SIZE = 224
+CLIP_MEAN = (0.48145466, 0.4578275, 0.40821073)
+CLIP_STD = (0.26862954, 0.26130258, 0.27577711)
+CLIP_CONTEXT_LENGTH = 77
+# Vectors are scored in chunks of this many rows, converted to float32 (numpy has no fast float16 products)
+SCORE_CHUNK_ROWS = 65536
+# New vectors not in the lists of the IVF index are scanned with every search, lists are rebuilt when they are too many
+UNLISTED_MAX_RATIO = 0.1
+# Vectors used to train the IVF index and its iterations
+TRAIN_SAMPLE_SIZE = 100000
+TRAIN_ITERATIONS = 10
+
+
+# Normalizes vectors, so their dot product is their cosine similarity
+def normalize(vectors):
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12)
+
+# Resizes an image to cover the model input, crops its center and normalizes its pixels as the model was trained
+def preprocess_image(image: Image.Image):
+    image = ImageOps.exif_transpose(image).convert('RGB')
+    image = ImageOps.fit(image, (CLIP_IMAGE_SIZE, CLIP_IMAGE_SIZE), Image.Resampling.BICUBIC)
+    pixels = np.asarray(image, dtype=np.float32) / 255
+    return ((pixels - CLIP_MEAN) / CLIP_STD).astype(np.float32).transpose(2, 0, 1)
+
+def create_session(path: str):
+    if np is None or onnxruntime is None:
+        raise ImproperlyConfigured("Embeddings require numpy and onnxruntime to be installed")
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = settings.ONNX_THREADS
+    return onnxruntime.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+
+
+# Image model, embedding batches of images with a single run
+class ImageEncoder:
+    def __init__(self, path: str):
+        self.session = create_session(path)
+        self.input = self.session.get_inputs()[0].name
+
+    def encode(self, images: list[Image.Image]):
+        batch = np.stack([preprocess_image(image) for image in images])
+        return normalize(self.session.run(None, {self.input: batch})[0].astype(np.float32))
+
+# Text model with its tokenizer
+class TextEncoder:
+    def __init__(self, path: str, tokenizerpath: str):
+        if tokenizers is None:
+            raise ImproperlyConfigured("Text search requires tokenizers to be installed")
+        self.session = create_session(path)
+        self.inputs = {input.name for input in self.session.get_inputs()}
+        self.tokenizer = tokenizers.Tokenizer.from_file(tokenizerpath)
+        self.tokenizer.enable_truncation(CLIP_CONTEXT_LENGTH)
+        self.tokenizer.enable_padding(length=CLIP_CONTEXT_LENGTH)
+
+    def encode(self, texts: list[str]):
+        encodings = self.tokenizer.encode_batch(texts)
+        inputs = {'input_ids': np.array([encoding.ids for encoding in encodings], dtype=np.int64)}
+        if 'attention_mask' in self.inputs:
+            inputs['attention_mask'] = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        return normalize(self.session.run(None, inputs)[0].astype(np.float32))
+
+# Gets the image model in the EMBEDDING_IMAGE_MODEL_PATH setting, loaded once per process, or None if not set
+@functools.cache
+def get_image_encoder() -> ImageEncoder | None:
+    if not settings.EMBEDDING_IMAGE_MODEL_PATH:
+        return None
+    return ImageEncoder(settings.EMBEDDING_IMAGE_MODEL_PATH)
+
+@functools.cache
+def get_text_encoder() -> TextEncoder | None:
+    if not settings.EMBEDDING_TEXT_MODEL_PATH or not settings.EMBEDDING_TOKENIZER_PATH:
+        return None
+    return TextEncoder(settings.EMBEDDING_TEXT_MODEL_PATH, settings.EMBEDDING_TOKENIZER_PATH)
+
+def is_enabled() -> bool:
+    return bool(settings.EMBEDDING_IMAGE_MODEL_PATH)
+
+
+def to_bytes(vector) -> bytes:
+    return np.asarray(vector, dtype=np.float16).tobytes()
+
+def from_bytes(data: bytes):
+    return np.frombuffer(bytes(data), dtype=np.float16)
+
+# Gets the centroids of the IVF index and the date they were trained, or None if it was not trained
+def get_centroids():
+    centroids = list(EmbeddingCentroid.objects.order_by('id'))
+    if not centroids:
+        return None, None
+    return np.stack([from_bytes(c.vector) for c in centroids]).astype(np.float32), centroids[0].creationdate
+
+# Gets the nearest centroid of each vector
+def assign_clusters(vectors, centroids):
+    return np.concatenate([np.argmax(vectors[start:start + SCORE_CHUNK_ROWS] @ centroids.T, axis=1)
+                           for start in range(0, len(vectors), SCORE_CHUNK_ROWS)]) if len(vectors) else np.empty(0, dtype=np.int64)
+
+# Trains the centroids of the lists of an IVF index with spherical k-means
+def train_centroids(vectors, lists: int, iterations: int = TRAIN_ITERATIONS, seed: int = 0):
+    generator = np.random.default_rng(seed)
+    centroids = vectors[generator.choice(len(vectors), lists, replace=False)].copy()
+    for _ in range(iterations):
+        clusters = assign_clusters(vectors, centroids)
+        order = np.argsort(clusters, kind='stable')
+        found, starts = np.unique(clusters[order], return_index=True)
+        centroids[found] = np.add.reduceat(vectors[order], starts)
+        # Lists left empty restart from a random vector
+        empty = np.setdiff1d(np.arange(lists), found)
+        centroids[empty] = vectors[generator.choice(len(vectors), len(empty))]
+        centroids = normalize(centroids)
+    return centroids
+
+
+# Embeds images, media sharing a file are embedded once
+# Files that are not images that can be decoded are not embedded
+def embed_media(mediaids: list[int]):
+    encoder = get_image_encoder()
+    if encoder is None:
+        return
+    blobs = list(Media.all_objects.filter(id__in=mediaids, kind=MediaKinds.IMAGE.value, blob__isnull=False, blob__embedding__isnull=True)
+                 .values_list('blob_id', flat=True).distinct())
+    centroids, _ = get_centroids()
+    for start in range(0, len(blobs), EMBEDDING_BATCH_SIZE):
+        hashes, images = [], []
+        for blobhash in blobs[start:start + EMBEDDING_BATCH_SIZE]:
+            try:
+                with get_storage().open(utils.get_blob_name(blobhash)) as file, Image.open(file) as image:
+                    # JPEG images are decoded at a reduced scale, big enough for the model input
+                    image.draft('RGB', (CLIP_IMAGE_SIZE * 2, CLIP_IMAGE_SIZE * 2))
+                    image.load()
+                    images.append(image)
+                    hashes.append(blobhash)
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                logger.warning(f"Blob {blobhash} could not be embedded: {e}")
+        if not images:
+            continue
+        vectors = encoder.encode(images)
+        clusters = assign_clusters(vectors, centroids) if centroids is not None else [None] * len(vectors)
+        Embedding.objects.bulk_create([Embedding(blob_id=blobhash, vector=to_bytes(vector), cluster=None if cluster is None else int(cluster))
+                                       for blobhash, vector, cluster in zip(hashes, vectors, clusters)], ignore_conflicts=True)
+
+# Trains the IVF index on a sample of the embeddings and assigns every embedding to its list
+# Returns the number of lists, 0 if there are too few embeddings to need an index
+def train_index(lists: int = None, batch_size: int = 10000) -> int:
+    count = Embedding.objects.count()
+    if lists is None:
+        if count <= EMBEDDING_EXACT_SEARCH_MAX:
+            return 0
+        # Lists of about 4 * sqrt(n) vectors are commonly used
+        lists = min(int(4 * math.sqrt(count)), 65536)
+    if count < lists:
+        return 0
+    vectors = Embedding.objects.order_by('?').values_list('vector', flat=True)[:max(TRAIN_SAMPLE_SIZE, lists)]
+    sample = np.stack([from_bytes(vector) for vector in vectors]).astype(np.float32)
+    centroids = train_centroids(sample, lists)
+    with transaction.atomic():
+        lastid = 0
+        while rows := list(Embedding.objects.filter(id__gt=lastid).order_by('id').only('id', 'vector')[:batch_size]):
+            vectors = np.stack([from_bytes(row.vector) for row in rows]).astype(np.float32)
+            for row, cluster in zip(rows, assign_clusters(vectors, centroids)):
+                row.cluster = int(cluster)
+            Embedding.objects.bulk_update(rows, ['cluster'])
+            lastid = rows[-1].id
+        # Centroids are replaced last, search indexes reload everything when they change
+        EmbeddingCentroid.objects.all().delete()
+        now = timezone.now()
+        EmbeddingCentroid.objects.bulk_create([EmbeddingCentroid(id=i, vector=to_bytes(c), creationdate=now) for i, c in enumerate(centroids)])
+    return lists
+
+
+# Index of the embeddings in memory, loaded from the database and kept up to date with new embeddings
+class VectorIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset(None, None)
+
+    def reset(self, centroids, version):
+        self.centroids = centroids
+        self.version = version
+        self.lastid = 0
+        self.count = 0
+        self.blobs = []
+        self.rows = {}
+        self.vectors = None
+        self.clusters = np.empty(0, dtype=np.int32)
+        # Rows sorted by list with the start of each list, rows added after they were built are scanned by every search
+        self.listed = 0
+        self.order = None
+        self.starts = None
+
+    # Appends vectors with the blobs and lists they belong to (-1 if none)
+    def add(self, blobs: list[str], vectors, clusters):
+        if self.vectors is None:
+            self.vectors = np.empty((max(len(vectors), 1024), vectors.shape[1]), dtype=np.float16)
+        if self.count + len(vectors) > len(self.vectors):
+            grown = np.empty((max(2 * len(self.vectors), self.count + len(vectors)), self.vectors.shape[1]), dtype=np.float16)
+            grown[:self.count] = self.vectors[:self.count]
+            self.vectors = grown
+        self.vectors[self.count:self.count + len(vectors)] = vectors
+        self.clusters = np.concatenate([self.clusters, np.asarray(clusters, dtype=np.int32)])
+        for blob in blobs:
+            self.rows[blob] = len(self.blobs)
+            self.blobs.append(blob)
+        self.count += len(vectors)
+
+    # Loads the embeddings created since the last refresh, or everything again if the IVF index was trained again
+    def refresh(self):
+        version = EmbeddingCentroid.objects.aggregate(version=Max('creationdate'))['version']
+        if version != self.version:
+            centroids, version = get_centroids()
+            self.reset(centroids, version)
+        rows = Embedding.objects.filter(id__gt=self.lastid).order_by('id').values_list('id', 'blob_id', 'vector', 'cluster')
+        blobs, vectors, clusters = [], [], []
+        for id, blob, vector, cluster in rows.iterator(chunk_size=10000):
+            self.lastid = id
+            vector = from_bytes(vector)
+            # Embeddings of another model (changed since) are left out
+            if self.vectors is not None and len(vector) != self.vectors.shape[1] or vectors and len(vector) != len(vectors[0]):
+                continue
+            blobs.append(blob)
+            vectors.append(vector)
+            clusters.append(-1 if cluster is None else cluster)
+        if vectors:
+            self.add(blobs, np.stack(vectors), clusters)
+
+    # Sorts the rows by list, so the rows of the probed lists are found with slices
+    def build_lists(self):
+        self.order = np.argsort(self.clusters[:self.count], kind='stable').astype(np.int64)
+        self.starts = np.searchsorted(self.clusters[self.order], np.arange(len(self.centroids) + 1))
+        self.listed = self.count
+
+    # Gets the rows of the vectors of some blobs
+    def get_rows(self, blobs):
+        rows = self.rows
+        return np.fromiter((rows[blob] for blob in blobs if blob in rows), dtype=np.int64)
+
+    # Gets the rows of the nearest lists of the IVF index, with the rows out of its lists
+    def get_candidates(self, query):
+        if self.order is None or self.count - self.listed > UNLISTED_MAX_RATIO * self.listed:
+            self.build_lists()
+        lists = len(self.centroids)
+        probes = np.argpartition(self.centroids @ query, -EMBEDDING_IVF_PROBES)[-EMBEDDING_IVF_PROBES:] \
+                 if lists > EMBEDDING_IVF_PROBES else range(lists)
+        # Rows without list (embedded before the training or with other centroids) and rows added after the lists
+        # were built are always scanned
+        return np.concatenate([self.order[self.starts[p]:self.starts[p + 1]] for p in probes] +
+                              [self.order[:self.starts[0]], self.order[self.starts[lists]:], np.arange(self.listed, self.count)])
+
+    def score(self, rows, query):
+        return np.concatenate([self.vectors[rows[start:start + SCORE_CHUNK_ROWS]].astype(np.float32) @ query
+                               for start in range(0, len(rows), SCORE_CHUNK_ROWS)]) if len(rows) else np.empty(0, dtype=np.float32)
+
+    # Gets the blobs of the vectors most similar to a query among some rows (the nearest lists of the IVF index if
+    # not given) with their scores, the most similar first
+    def search(self, query, rows=None, limit: int = None) -> list[tuple[str, float]]:
+        if rows is None:
+            rows = self.get_candidates(query)
+        scores = self.score(rows, query)
+        if limit is not None and len(scores) > limit:
+            top = np.argpartition(scores, -limit)[-limit:]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores)
+        return [(self.blobs[rows[i]], float(scores[i])) for i in order]
+
+# Gets the index of this process
+@functools.cache
+def get_index() -> VectorIndex:
+    return VectorIndex()
+
+# Gets images of a user (of an album if given) most similar to a vector, the most similar first
+# Few images are searched exactly, otherwise the images in the nearest lists of the IVF index are searched, so neither
+# every image of the user nor every vector is read
+def search_media(user: User, vector, limit: int, albumid: int = None, exclude: str = None) -> list[Media]:
+    medias = Media.objects.filter(album__user=user, album__deletiondate__isnull=True, kind=MediaKinds.IMAGE.value, blob__isnull=False)
+    if albumid:
+        medias = medias.filter(album__id=albumid)
+    query = np.asarray(vector, dtype=np.float32)
+    index = get_index()
+    with index.lock:
+        index.refresh()
+        if index.vectors is None or len(query) != index.vectors.shape[1]:
+            return []
+        if index.centroids is not None and medias.count() > EMBEDDING_EXACT_SEARCH_MAX:
+            found = index.search(query)
+        else:
+            blobs = set(medias.values_list('blob_id', flat=True))
+            blobs.discard(exclude)
+            found = index.search(query, index.get_rows(blobs), limit + 1)
+    ranks = {blob: rank for rank, (blob, _) in enumerate(found) if blob != exclude}
+    # Media sharing a file are returned once
+    results = {}
+    for media in medias.filter(blob_id__in=list(ranks)).order_by('id').prefetch_related('mediatags__tag'):
+        results.setdefault(media.blob_id, media)
+    return sorted(results.values(), key=lambda media: ranks[media.blob_id])[:limit]
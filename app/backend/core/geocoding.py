@@ -0,0 +1,235 @@
+import collections
+import datetime
+import functools
+import threading
+import time
+import requests
+from django.conf import settings
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
+from core import geonames
+from core.common import GEOCODING_CACHE_DAYS, GEOCODING_MEMORY_CACHE_SIZE, GEOCODING_PRECISION, LOCATION_MAX_LENGTH
+from core.models import GeocodedLocation
+
+GEOCODING_HEADERS = {
+    'User-Agent': 'PostmanRuntime/7.39.0',
+}
+# Connections kept open to the geocoding service by each process
+GEOCODING_POOL_SIZE = 4
+# After this many consecutive failures the service is not called for the cooldown seconds
+BREAKER_FAILURES = 5
+BREAKER_COOLDOWN_SECONDS = 60
+
+
+# Raised when the geocoding service is not called (rate limit reached, circuit open)
+class GeocodingUnavailable(Exception):
+    pass
+
+
+# Token bucket limiting the requests per second, with bursts up to its capacity
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    # Takes a token, waiting at most the given seconds for one, returns False if there was none in time
+    def acquire(self, wait: float = 0) -> bool:
+        deadline = time.monotonic() + wait
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                missing = (1 - self.tokens) / self.rate
+            if now + missing > deadline:
+                return False
+            time.sleep(missing)
+
+
+# Circuit breaker failing fast while a service is down, instead of tying up workers until every request times out
+# After the cooldown one request is let through (half open), closing the circuit if it succeeds
+class CircuitBreaker:
+    def __init__(self, failures: int = BREAKER_FAILURES, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.maxfailures = failures
+        self.cooldown = cooldown
+        self.failures = 0
+        self.openeduntil = 0
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.failures < self.maxfailures:
+                return True
+            now = time.monotonic()
+            if now < self.openeduntil:
+                return False
+            # Half open, other requests wait for the result of this one
+            self.openeduntil = now + self.cooldown
+            return True
+
+    def record(self, success: bool):
+        with self.lock:
+            if success:
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.failures >= self.maxfailures:
+                self.openeduntil = time.monotonic() + self.cooldown
+
+
+# Runs a function once for concurrent calls with the same key, the other callers wait for its result
+class Coalescer:
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def run(self, key: str, func):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = {'done': threading.Event(), 'result': None, 'error': None}
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+        try:
+            call['result'] = func()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call['done'].set()
+
+
+# Client of a Nominatim reverse geocoding service, with pooled connections, timeouts, a rate limit
+# (Nominatim usage policy allows 1 request per second) and a circuit breaker
+class GeocodingClient:
+    def __init__(self, url: str, rate: float = 1, timeout: float = 5, failures: int = BREAKER_FAILURES,
+                 cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(GEOCODING_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=GEOCODING_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.bucket = TokenBucket(rate)
+        self.breaker = CircuitBreaker(failures, cooldown)
+
+    # Gets the address of coordinates, raises GeocodingUnavailable if the service is not called
+    # and requests.RequestException if it fails
+    def reverse(self, lat: float, lon: float) -> dict:
+        if not self.breaker.allow():
+            raise GeocodingUnavailable("Geocoding service is failing, circuit is open")
+        # Requests wait for the rate limit at most as long as for the service
+        if not self.bucket.acquire(wait=self.timeout):
+            raise GeocodingUnavailable("Geocoding rate limit reached")
+        try:
+            response = self.session.get(self.url, params={'format': 'json', 'lat': lat, 'lon': lon}, timeout=self.timeout)
+            response.raise_for_status()
+            address = response.json().get('address', {})
+        except (requests.RequestException, ValueError):
+            self.breaker.record(False)
+            raise
+        self.breaker.record(True)
+        return address
+
+
+# Gets the client of the geocoding service in the GEOCODING_URL setting, shared by the threads of the process
+@functools.cache
+def get_client() -> GeocodingClient:
+    return GeocodingClient(settings.GEOCODING_URL, settings.GEOCODING_REQUESTS_PER_SECOND, settings.GEOCODING_TIMEOUT)
+
+# Locations are cached by rounded coordinates, in the database (shared by every process) and in memory in front of it,
+# so repeated lookups of a place (e.g. the photos of a trip) never leave the server
+
+# Least recently used locations of this process, key -> (location, expiration as monotonic time)
+memory_cache = collections.OrderedDict()
+memory_cache_lock = threading.Lock()
+# Concurrent lookups of a key not cached yet make a single request
+lookups = Coalescer()
+# Hits of each cache level and lookups that reached the geocoding service in this process
+stats = {'memory': 0, 'database': 0, 'fetched': 0}
+
+# Gets cache key of coordinates, rounded so nearby coordinates share it
+def get_location_key(lat: float, lon: float) -> str:
+    return f"{float(lat):.{GEOCODING_PRECISION}f},{float(lon):.{GEOCODING_PRECISION}f}"
+
+def get_memory_location(key: str):
+    with memory_cache_lock:
+        entry = memory_cache.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        memory_cache.move_to_end(key)
+        return entry
+
+def put_memory_location(key: str, location: str | None, ttl: float):
+    with memory_cache_lock:
+        memory_cache[key] = (location, time.monotonic() + ttl)
+        memory_cache.move_to_end(key)
+        while len(memory_cache) > GEOCODING_MEMORY_CACHE_SIZE:
+            memory_cache.popitem(last=False)
+
+def clear_memory_cache():
+    with memory_cache_lock:
+        memory_cache.clear()
+
+# Fetches the location of coordinates from the geocoding service, as 'city, country' or the closest available
+# Returns None if there is no place at the coordinates, raises GeocodingUnavailable or requests.RequestException if the service fails
+def fetch_location(lat: float, lon: float) -> str | None:
+    address = get_client().reverse(lat, lon)
+    if 'city' in address and 'country' in address:
+        location = f"{address['city']}, {address['country']}"
+    elif 'county' in address and 'country' in address:
+        location = f"{address['county']}, {address['country']}"
+    elif 'state' in address and 'country' in address:
+        location = f"{address['state']}, {address['country']}"
+    elif 'country' in address:
+        location = address['country']
+    else:
+        return None
+    return location[:LOCATION_MAX_LENGTH]
+
+# Gets the location of coordinates from the memory cache, the database cache or the geocoding service
+# Failed lookups are not cached, so they are tried again on the next request
+# With a GeoNames dump configured, locations are found offline instead
+def get_location(lat: float, lon: float) -> str | None:
+    offline = geonames.get_offline_geocoder()
+    if offline is not None:
+        return offline.get_location(lat, lon)
+
+    key = get_location_key(lat, lon)
+    entry = get_memory_location(key)
+    if entry is not None:
+        stats['memory'] += 1
+        return entry[0]
+
+    return lookups.run(key, functools.partial(get_stored_location, key))
+
+# Gets the location of a key from the database cache or the geocoding service
+def get_stored_location(key: str) -> str | None:
+    maxage = datetime.timedelta(days=GEOCODING_CACHE_DAYS)
+    cached = GeocodedLocation.objects.filter(key=key, creationdate__gte=timezone.now() - maxage).first()
+    if cached is not None:
+        stats['database'] += 1
+        put_memory_location(key, cached.location, (cached.creationdate + maxage - timezone.now()).total_seconds())
+        return cached.location
+
+    # Rounded coordinates are sent, so the location is the same for every coordinates of the key
+    location = fetch_location(*key.split(','))
+    stats['fetched'] += 1
+    GeocodedLocation.objects.update_or_create(key=key, defaults={'location': location, 'creationdate': timezone.now()})
+    put_memory_location(key, location, maxage.total_seconds())
+    return location
@@ -0,0 +1,140 @@
+import functools
+import math
+import sys
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from core.common import LOCATION_MAX_LENGTH
+
+# numpy is only needed for the offline geocoder
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EARTH_RADIUS_KM = 6371.0
+# Columns of the GeoNames dumps (tab separated), see https://download.geonames.org/export/dump/readme.txt
+CITY_NAME, CITY_LATITUDE, CITY_LONGITUDE, CITY_COUNTRY = 1, 4, 5, 8
+COUNTRY_CODE, COUNTRY_NAME = 0, 4
+# Ranges of the k-d tree with at most this many points are searched at once
+KDTREE_LEAF_SIZE = 32
+
+# Converts latitudes and longitudes in degrees into points of the unit sphere
+# The straight (chord) distance between points grows with their great-circle distance, so the nearest point
+# in 3 dimensions is the nearest place, without the distortion of latitudes and longitudes near the poles and the antimeridian
+def to_unit_vectors(lat, lon):
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+def chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1))
+
+
+# Static k-d tree of points, used to find the nearest one
+# Points are reordered so the node of every range [lo, hi) is the median at (lo + hi) // 2, with the points before it
+# on one side of its split axis and the points after it on the other. The tree needs no pointers, only the points,
+# the original index of each point and the split axis of each node
+class KDTree:
+    def __init__(self, points):
+        points = np.asarray(points, dtype=np.float64)
+        self.order = np.arange(len(points), dtype=np.int32)
+        stack = [(0, len(points))]
+        mids = []
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= KDTREE_LEAF_SIZE:
+                continue
+            indexes = self.order[lo:hi]
+            subset = points[indexes]
+            # Split along the axis where the points are most spread
+            axis = int(np.argmax(subset.max(axis=0) - subset.min(axis=0)))
+            mid = (hi - lo) // 2
+            self.order[lo:hi] = indexes[np.argpartition(subset[:, axis], mid)]
+            mids.append((lo + mid, axis))
+            stack.append((lo, lo + mid))
+            stack.append((lo + mid + 1, hi))
+        self.points = points[self.order]
+        # Nodes (one per leaf) are few, they are kept as Python tuples (x, y, z, axis), as comparing
+        # them with plain floats is much faster than with numpy scalars
+        self.nodes = {mid: (*self.points[mid].tolist(), axis) for mid, axis in mids}
+
+    def __len__(self):
+        return len(self.points)
+
+    # Gets original index of the nearest point and its distance
+    def query(self, point) -> tuple[int, float]:
+        point = np.asarray(point, dtype=np.float64)
+        x, y, z = point.tolist()
+        best, bestdistance = -1, math.inf
+        # Ranges to search with the squared distance to their side of the split plane, nearest side is searched first
+        stack = [(0, len(self.points), 0.0)]
+        while stack:
+            lo, hi, planedistance = stack.pop()
+            if planedistance >= bestdistance:
+                continue
+            if hi - lo <= KDTREE_LEAF_SIZE:
+                distances = ((self.points[lo:hi] - point) ** 2).sum(axis=1)
+                nearest = int(np.argmin(distances))
+                if distances[nearest] < bestdistance:
+                    best, bestdistance = lo + nearest, float(distances[nearest])
+                continue
+            mid = (lo + hi) // 2
+            nx, ny, nz, axis = self.nodes[mid]
+            distance = (x - nx) ** 2 + (y - ny) ** 2 + (z - nz) ** 2
+            if distance < bestdistance:
+                best, bestdistance = mid, distance
+            diff = (x, y, z)[axis] - (nx, ny, nz)[axis]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            stack.append((*far, diff * diff))
+            stack.append((*near, planedistance))
+        return int(self.order[best]), math.sqrt(bestdistance)
+
+
+# Geocoder finding the nearest city of a GeoNames dump (e.g. cities500.txt), without any external request
+# Country names are read from the GeoNames countryInfo.txt file if given, otherwise their ISO codes are used
+class OfflineGeocoder:
+    def __init__(self, citiespath: str, countriespath: str = None, maxdistance: float = 100):
+        if np is None:
+            raise ImproperlyConfigured("Offline geocoding requires numpy to be installed")
+        self.maxdistance = maxdistance
+        self.countries = {}
+        if countriespath:
+            with open(countriespath, encoding='utf-8') as file:
+                for line in file:
+                    columns = line.rstrip('\n').split('\t')
+                    if line.startswith('#') or len(columns) <= COUNTRY_NAME:
+                        continue
+                    self.countries[columns[COUNTRY_CODE]] = columns[COUNTRY_NAME]
+
+        self.names = []
+        self.countrynames = []
+        coordinates = []
+        with open(citiespath, encoding='utf-8') as file:
+            for line in file:
+                columns = line.rstrip('\n').split('\t')
+                if len(columns) <= CITY_COUNTRY:
+                    continue
+                self.names.append(columns[CITY_NAME])
+                # Few distinct countries, interned so every city does not hold its own copy of the name
+                self.countrynames.append(sys.intern(self.countries.get(columns[CITY_COUNTRY], columns[CITY_COUNTRY])))
+                coordinates.append((float(columns[CITY_LATITUDE]), float(columns[CITY_LONGITUDE])))
+        if not coordinates:
+            raise ImproperlyConfigured(f"No cities found in {citiespath}")
+        coordinates = np.array(coordinates, dtype=np.float64)
+        self.tree = KDTree(to_unit_vectors(coordinates[:, 0], coordinates[:, 1]))
+
+    # Gets location of coordinates as 'city, country', or None if there is no city close enough (e.g. at sea)
+    def get_location(self, lat: float, lon: float) -> str | None:
+        index, chord = self.tree.query(to_unit_vectors(float(lat), float(lon)))
+        if chord_to_km(chord) > self.maxdistance:
+            return None
+        return f"{self.names[index]}, {self.countrynames[index]}"[:LOCATION_MAX_LENGTH]
+
+
+# Gets the offline geocoder if a GeoNames dump is set in the GEONAMES_CITIES_PATH setting, loaded once per process
+@functools.cache
+def get_offline_geocoder() -> OfflineGeocoder | None:
+    if not settings.GEONAMES_CITIES_PATH:
+        return None
+    return OfflineGeocoder(settings.GEONAMES_CITIES_PATH, settings.GEONAMES_COUNTRIES_PATH, settings.GEONAMES_MAX_DISTANCE_KM)
@@ -0,0 +1,191 @@
+import datetime
+import logging
+import random
+import traceback
+from collections.abc import Callable
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core import detection, duplicates, embeddings, geocoding, renditions, utils
+from core.common import DETECTION_BATCH_SIZE, JOB_RETRY_BASE_SECONDS, JOB_RETRY_MAX_SECONDS, JOB_TIMEOUT_SECONDS, JobStatus
+from core.models import Job, Media
+
+logger = logging.getLogger(__name__)
+
+# Slow work is queued as rows of the job table and run by the runjobs worker, so it leaves the request path
+# Workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any number of them can poll the table without
+# running a job twice or waiting for each other, and a job claimed by a worker that dies is run again after its timeout
+
+# Handlers of the job kinds, called with the payload of the job as keyword arguments
+handlers: dict[str, Callable] = {}
+# Kinds run in batches: due jobs of the kind are claimed together (up to the batch size) and their handler is called
+# once with the list of their payloads, e.g. so images queued one by one are run through a model at once
+batchsizes: dict[str, int] = {}
+# Statuses of the jobs that are queued, jobs with a key are unique among them
+ACTIVE_STATUSES = [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+
+# Registers a function as the handler of a job kind, run in batches of the given size if any
+def handler(kind: str, batch: int = None):
+    def register(func: Callable):
+        handlers[kind] = func
+        if batch:
+            batchsizes[kind] = batch
+        return func
+    return register
+
+# Queues a job, it is only visible to workers when the current transaction (if any) is committed
+# A job with a key is not queued if a pending or running job has the same key, which is returned instead: the insert
+# is skipped by the unique index with ON CONFLICT DO NOTHING, so concurrent requests cannot queue it twice
+def enqueue(kind: str, payload: dict = None, priority: int = 0, delay: float = 0, key: str = None) -> Job | None:
+    job = Job(kind=kind, payload=payload or {}, priority=priority, key=key,
+              runafter=timezone.now() + datetime.timedelta(seconds=delay))
+    if key is None:
+        job.save()
+        return job
+    Job.objects.bulk_create([job], ignore_conflicts=True)
+    return Job.objects.filter(key=key, status__in=ACTIVE_STATUSES).first()
+
+# Gets the delay before the next attempt of a failed job: exponential backoff with jitter, so jobs failing
+# together (e.g. an external service is down) are not retried together
+def get_retry_delay(attempts: int) -> float:
+    delay = min(JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), JOB_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+# Claims the pending jobs with the highest priority that are due, or abandoned ones (their worker died)
+# Rows locked by other workers are skipped instead of waited for
+def claim_jobs(kinds: list[str] = None, timeout: int = JOB_TIMEOUT_SECONDS, limit: int = 1) -> list[Job]:
+    now = timezone.now()
+    jobs = Job.objects.filter(Q(status=JobStatus.PENDING.value, runafter__lte=now) |
+                              Q(status=JobStatus.RUNNING.value, lockeduntil__lt=now))
+    if kinds:
+        jobs = jobs.filter(kind__in=kinds)
+    claimed = []
+    while len(claimed) < limit:
+        with transaction.atomic():
+            found = list(jobs.select_for_update(skip_locked=True).order_by('-priority', 'runafter', 'id')[:limit - len(claimed)])
+            if not found:
+                return claimed
+            for job in found:
+                # Abandoned job without attempts left
+                if job.attempts >= job.maxattempts:
+                    job.status = JobStatus.FAILED.value
+                    job.error = job.error or "Timed out"
+                    job.save(update_fields=['status', 'error', 'lastupdate'])
+                    continue
+                job.status = JobStatus.RUNNING.value
+                job.attempts += 1
+                job.lockeduntil = now + datetime.timedelta(seconds=timeout)
+                job.save(update_fields=['status', 'attempts', 'lockeduntil', 'lastupdate'])
+                claimed.append(job)
+    return claimed
+
+def claim_job(kinds: list[str] = None, timeout: int = JOB_TIMEOUT_SECONDS) -> Job | None:
+    claimed = claim_jobs(kinds, timeout)
+    return claimed[0] if claimed else None
+
+# Claims the next job and, if its kind is run in batches, other due jobs of the kind to run with it
+def claim_batch(kinds: list[str] = None, timeout: int = JOB_TIMEOUT_SECONDS) -> list[Job]:
+    job = claim_job(kinds, timeout)
+    if job is None:
+        return []
+    return [job] + claim_jobs([job.kind], timeout, batchsizes.get(job.kind, 1) - 1) if job.kind in batchsizes else [job]
+
+# Records the failure of a claimed job, scheduling its retry if it has attempts left
+def fail_job(job: Job, error: str):
+    job.error = error
+    if job.attempts >= job.maxattempts or job.kind not in handlers:
+        job.status = JobStatus.FAILED.value
+    else:
+        job.status = JobStatus.PENDING.value
+        job.runafter = timezone.now() + datetime.timedelta(seconds=get_retry_delay(job.attempts))
+    logger.warning(f"Job {job.id} ({job.kind}) failed on attempt {job.attempts}: {job.error.splitlines()[-1]}")
+    Job.objects.filter(id=job.id, attempts=job.attempts).update(status=job.status, runafter=job.runafter, lockeduntil=None,
+                                                                error=job.error, lastupdate=timezone.now())
+
+# Runs claimed jobs, deleting them when done or scheduling their retry if they fail
+# Rows are only changed if the job was not claimed again meanwhile (attempts is the claim token)
+# Jobs of a kind run in batches are passed to its handler at once, and fail together
+# Returns True if the jobs succeeded
+def run_jobs(jobs: list[Job]) -> bool:
+    try:
+        func = handlers.get(jobs[0].kind)
+        if func is None:
+            raise LookupError(f"No handler for job kind '{jobs[0].kind}'")
+        if jobs[0].kind in batchsizes:
+            func([job.payload for job in jobs])
+        else:
+            for job in jobs:
+                func(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        for job in jobs:
+            fail_job(job, error)
+        return False
+    claimed = Q()
+    for job in jobs:
+        claimed |= Q(id=job.id, attempts=job.attempts)
+    Job.objects.filter(claimed).delete()
+    return True
+
+def run_job(job: Job) -> bool:
+    return run_jobs([job])
+
+
+# Fills the location of media from their coordinates, media of a batch taken in the same place share a job
+# Failures of the geocoding service are raised, so the job is retried later
+@handler('geocode_media')
+def geocode_media(mediaids: list[int], coordinates: str):
+    try:
+        lat, lon = coordinates.split(',')
+        float(lat), float(lon)
+    except ValueError:
+        return
+    location = geocoding.get_location(lat, lon)
+    if location:
+        Media.all_objects.filter(id__in=mediaids).update(location=location)
+        utils.touch_media_albums(mediaids)
+
+def enqueue_geocoding(mediaids: list[int], coordinates: str) -> Job:
+    return enqueue('geocode_media', {'mediaids': mediaids, 'coordinates': coordinates})
+
+# Computes the perceptual hashes of images, used to find their near duplicates
+@handler('hash_media')
+def hash_media(mediaids: list[int]):
+    duplicates.hash_media(mediaids)
+
+def enqueue_hashing(mediaids: list[int]) -> Job:
+    return enqueue('hash_media', {'mediaids': mediaids})
+
+# Embeds images, used to find similar images and to search them by text
+@handler('embed_media')
+def embed_media(mediaids: list[int]):
+    embeddings.embed_media(mediaids)
+
+def enqueue_embedding(mediaids: list[int]) -> Job:
+    return enqueue('embed_media', {'mediaids': mediaids})
+
+# Detects objects of images uploaded without detections, jobs queued by different uploads are detected together
+@handler('detect_objects', batch=DETECTION_BATCH_SIZE)
+def detect_objects(payloads: list[dict]):
+    detection.detect_media([id for payload in payloads for id in payload['mediaids']])
+
+def enqueue_detection(mediaids: list[int]) -> Job:
+    return enqueue('detect_objects', {'mediaids': mediaids})
+
+# Queues the background processing of new images: hashing, and embedding and object detection if their models are configured
+def enqueue_image_processing(mediaids: list[int]):
+    enqueue_hashing(mediaids)
+    if embeddings.is_enabled():
+        enqueue_embedding(mediaids)
+    if detection.is_enabled():
+        enqueue_detection(mediaids)
+
+# Converts whole images to a modern format accepted by clients (see renditions.get_converted_file)
+@handler('convert_image')
+def convert_image(hash: str, format: str):
+    renditions.convert_image(hash, format)
+
+# Queues the conversion of an image once, requests while it is queued do not queue it again (but do after it failed)
+def enqueue_conversion(hash: str, format: str) -> Job | None:
+    return enqueue('convert_image', {'hash': hash, 'format': format}, key=f'convert_image:{hash}:{format}')
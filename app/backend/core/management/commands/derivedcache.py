@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from core import derived
+from core.models import DerivedFile
+
+
+# Shows usage of the derived files cache (renditions) and evicts files over budget
+class Command(BaseCommand):
+    help = "Shows usage of the derived files cache and evicts least recently used files over budget"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--evict', action='store_true', help="Evict files until the cache is under budget")
+        parser.add_argument('--budget', type=int, help="Budget in bytes to evict to (defaults to DERIVED_CACHE_MAX_BYTES)")
+
+    def handle(self, *args, **options):
+        budget = options['budget'] if options['budget'] is not None else settings.DERIVED_CACHE_MAX_BYTES
+        if options['evict']:
+            evicted = derived.evict_derived_files(budget)
+            self.stdout.write(f"Evicted {evicted} files")
+
+        usage = DerivedFile.objects.aggregate(files=Count('id'), bytes=Sum('size'), hits=Sum('hits'))
+        self.stdout.write(f"Files: {usage['files']}")
+        self.stdout.write(f"Size: {usage['bytes'] or 0} / {budget} bytes")
+        self.stdout.write(f"Hits: {usage['hits'] or 0}")
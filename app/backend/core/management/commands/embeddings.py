@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import embeddings, jobs
+from core.common import MediaKinds
+from core.models import Media
+
+
+# Queues the embedding of images uploaded before embeddings were enabled, and trains the IVF index used to search
+# big libraries. The index should be trained again when the library has grown a lot (e.g. doubled)
+class Command(BaseCommand):
+    help = "Queues embedding of images without embedding and trains the search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backfill', action='store_true', help="Queue embedding of images without embedding")
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of images embedded by each job")
+        parser.add_argument('--train', action='store_true', help="Train the IVF index on the embeddings")
+        parser.add_argument('--lists', type=int, help="Number of lists of the IVF index (about 4 * sqrt(embeddings) by default)")
+
+    def handle(self, *args, **options):
+        if not embeddings.is_enabled():
+            raise CommandError("Embeddings are not enabled, set GALERIA_EMBEDDING_IMAGE_MODEL_PATH")
+        if options['backfill']:
+            ids = list(Media.all_objects.filter(kind=MediaKinds.IMAGE.value, blob__isnull=False, blob__embedding__isnull=True)
+                       .order_by('id').values_list('id', flat=True))
+            for start in range(0, len(ids), options['batch_size']):
+                jobs.enqueue_embedding(ids[start:start + options['batch_size']])
+            self.stdout.write(f"Queued embedding of {len(ids)} images")
+        if options['train']:
+            lists = embeddings.train_index(options['lists'])
+            if lists:
+                self.stdout.write(f"Trained search index with {lists} lists")
+            else:
+                self.stdout.write("Too few embeddings to need a search index, they are searched exactly")
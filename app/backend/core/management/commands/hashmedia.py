@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core import jobs
+from core.common import MediaKinds
+from core.models import Media
+
+
+# Queues the perceptual hashing of images uploaded before hashes were computed, or whose hashing failed
+# Hashes are computed by the runjobs worker
+class Command(BaseCommand):
+    help = "Queues perceptual hashing of images without hash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of images hashed by each job")
+
+    def handle(self, *args, **options):
+        ids = list(Media.all_objects.filter(kind=MediaKinds.IMAGE.value, phash__isnull=True, blob__isnull=False)
+                   .order_by('id').values_list('id', flat=True))
+        for start in range(0, len(ids), options['batch_size']):
+            jobs.enqueue_hashing(ids[start:start + options['batch_size']])
+        self.stdout.write(f"Queued hashing of {len(ids)} images")
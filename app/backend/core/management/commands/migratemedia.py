@@ -0,0 +1,62 @@
+import os
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core import utils
+from core.common import BLOBS_FOLDER, DERIVED_FOLDER, STREAMS_FOLDER
+
+
+# Moves media files stored with the legacy layout (<username>/<id>) into the sharded blob store
+# Every file is migrated on its own while the site stays online, so the command can be stopped and run again
+# at any time, it continues with the files left in the user folders
+class Command(BaseCommand):
+    help = "Moves media files from the per-user folders into the sharded blob store"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, help="Maximum number of files to migrate in this run")
+        parser.add_argument('--pause', type=float, default=0, help="Seconds to wait between files, to limit the load on a live site")
+        parser.add_argument('--dry-run', action='store_true', help="Only count the files that would be migrated")
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        migrated = skipped = 0
+        for folder in self.get_user_folders():
+            if limit is not None and migrated >= limit:
+                break
+            # Directory entries are read lazily, big folders are not listed at once
+            with os.scandir(folder.path) as entries:
+                for entry in entries:
+                    if limit is not None and migrated >= limit:
+                        break
+                    if not entry.is_file() or not entry.name.isdigit():
+                        continue
+                    if options['dry_run']:
+                        migrated += 1
+                        continue
+                    if utils.migrate_legacy_media_file(folder.name, int(entry.name)):
+                        migrated += 1
+                        if migrated % 1000 == 0:
+                            self.stdout.write(f"Migrated {migrated} files")
+                        if options['pause']:
+                            time.sleep(options['pause'])
+                    else:
+                        skipped += 1
+                        self.stderr.write(f"Skipped {entry.path} (no media without blob for it)")
+            # Empty user folders are no longer needed
+            if not options['dry_run']:
+                try:
+                    os.rmdir(folder.path)
+                except OSError:
+                    pass
+
+        action = "To migrate" if options['dry_run'] else "Migrated"
+        self.stdout.write(f"{action}: {migrated} files")
+        self.stdout.write(f"Skipped: {skipped} files")
+
+    # Gets the per-user folders of the legacy layout
+    def get_user_folders(self):
+        if not os.path.exists(settings.MEDIA_ROOT):
+            return []
+        return [entry for entry in os.scandir(settings.MEDIA_ROOT)
+                if entry.is_dir() and entry.name not in (BLOBS_FOLDER, DERIVED_FOLDER, STREAMS_FOLDER)]
@@ -0,0 +1,29 @@
+import time
+from django.core.management.base import BaseCommand
+
+from core import trash
+from core.common import TRASH_RETENTION_DAYS
+
+
+# Worker removing albums and media from the trash when their retention days are over, and the deleted accounts
+# Rows are deleted in batches with set-based queries and files are released between pauses, to limit the load on a live site
+class Command(BaseCommand):
+    help = "Purges expired albums, media and deleted accounts from the trash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Exit after purging the trash once")
+        parser.add_argument('--interval', type=float, default=300, help="Seconds to wait between purges")
+        parser.add_argument('--retention-days', type=float, default=TRASH_RETENTION_DAYS, help="Days trashed albums and media are kept")
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of media deleted at once")
+        parser.add_argument('--pause', type=float, default=1, help="Seconds to wait between batches")
+
+    def handle(self, *args, **options):
+        while True:
+            start = time.monotonic()
+            purged = trash.purge_trash(trash.get_purge_cutoff(options['retention_days']), options['batch_size'], options['pause'])
+            if any(purged.values()):
+                self.stdout.write(f"Purged {purged['media']} media, {purged['albums']} albums and {purged['users']} users "
+                                  f"in {time.monotonic() - start:.1f}s")
+            if options['once']:
+                return
+            time.sleep(options['interval'])
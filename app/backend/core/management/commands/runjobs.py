@@ -0,0 +1,44 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef, Q
+
+from core import jobs
+from core.common import JOB_TIMEOUT_SECONDS, JobStatus
+from core.models import Job
+
+
+# Worker running the background jobs queued in the database (geocoding, image processing...)
+# Several workers can run at the same time, each job is claimed by only one of them
+class Command(BaseCommand):
+    help = "Runs queued background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Exit when there are no pending jobs")
+        parser.add_argument('--interval', type=float, default=2, help="Seconds to wait for new jobs when there are none")
+        parser.add_argument('--kind', action='append', help="Only run jobs of this kind (can be repeated)")
+        parser.add_argument('--timeout', type=int, default=JOB_TIMEOUT_SECONDS, help="Seconds after which a running job is run again by another worker")
+        parser.add_argument('--retry-failed', action='store_true', help="Run again jobs that failed before")
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            failed = Job.objects.filter(status=JobStatus.FAILED.value)
+            if options['kind']:
+                failed = failed.filter(kind__in=options['kind'])
+            # Jobs with a key are queued once: failed ones queued again since (or failed again later) are dropped
+            failed.filter(Exists(Job.objects.filter(Q(status__in=jobs.ACTIVE_STATUSES) | Q(id__gt=OuterRef('id')),
+                                                    key=OuterRef('key')))).delete()
+            retried = failed.update(status=JobStatus.PENDING.value, attempts=0)
+            self.stdout.write(f"Retrying {retried} jobs")
+
+        while True:
+            claimed = jobs.claim_batch(options['kind'], options['timeout'])
+            if not claimed:
+                if options['once']:
+                    return
+                time.sleep(options['interval'])
+                continue
+
+            start = time.monotonic()
+            succeeded = jobs.run_jobs(claimed)
+            ids = ', '.join(str(job.id) for job in claimed)
+            self.stdout.write(f"Job{'s' if len(claimed) > 1 else ''} {ids} ({claimed[0].kind}) {'done' if succeeded else claimed[0].status} in {time.monotonic() - start:.1f}s")
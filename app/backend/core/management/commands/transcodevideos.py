@@ -0,0 +1,40 @@
+import time
+from django.core.management.base import BaseCommand
+
+from core import streams, utils
+from core.common import VideoStreamStatus
+from core.models import VideoStream
+
+
+# Worker transcoding uploaded videos into adaptive HLS streams with ffmpeg
+# Several workers can run at the same time, each video is claimed by only one of them
+class Command(BaseCommand):
+    help = "Transcodes pending videos into adaptive HLS streams"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Exit when there are no pending videos")
+        parser.add_argument('--interval', type=float, default=10, help="Seconds to wait for new videos when there are none")
+        parser.add_argument('--retry-failed', action='store_true', help="Transcode again videos that failed before")
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            retried = VideoStream.objects.filter(status=VideoStreamStatus.FAILED.value).update(status=VideoStreamStatus.PENDING.value)
+            self.stdout.write(f"Retrying {retried} videos")
+
+        while True:
+            stream = streams.claim_video_stream()
+            if stream is None:
+                if options['once']:
+                    return
+                time.sleep(options['interval'])
+                continue
+
+            self.stdout.write(f"Transcoding video {stream.blob_id}")
+            start = time.monotonic()
+            try:
+                with utils.get_blob_local_path(stream.blob_id) as srcpath:
+                    streams.transcode_video_stream(stream, srcpath)
+            except FileNotFoundError:
+                VideoStream.objects.filter(blob_id=stream.blob_id).update(status=VideoStreamStatus.FAILED.value, error="Video file not found")
+                stream.status = VideoStreamStatus.FAILED.value
+            self.stdout.write(f"Video {stream.blob_id} {stream.status} in {time.monotonic() - start:.1f}s")
@@ -0,0 +1,176 @@
+import datetime
+import io
+import re
+import struct
+from django.core.files import File
+from django.utils import timezone
+from PIL import ExifTags, Image
+
+# Metadata of media files (capture date, GPS position, orientation, dimensions, duration) is read on upload from the
+# headers of the file only: the EXIF data of images, before their pixels, and the movie box of MP4 and QuickTime videos,
+# found by skipping over the media data. Missing or broken metadata is left empty, it never makes an upload fail
+
+# Media fields filled from the metadata
+METADATA_FIELDS = ('capturedate', 'latitude', 'longitude', 'orientation', 'width', 'height', 'duration')
+# The movie box is read at once, bigger ones (hours of video with many tracks) are skipped
+MP4_MAX_MOVIE_BYTES = 16 * 1024 ** 2
+# MP4 dates are seconds since 1904
+MP4_EPOCH = datetime.datetime(1904, 1, 1, tzinfo=datetime.timezone.utc)
+# Boxes containing the boxes read inside the movie box
+MP4_CONTAINERS = {b'moov', b'trak', b'udta'}
+# ISO 6709 position of videos (e.g. +40.4168-003.7038+650.000/)
+ISO6709_REGEX = re.compile(r'([+-]\d+(?:\.\d+)?)([+-]\d+(?:\.\d+)?)')
+# EXIF orientations of images stored rotated by 90 or 270 degrees, their displayed width and height are swapped
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+# Gets position from EXIF degrees, minutes and seconds with their reference (N, S, E or W)
+def get_exif_degrees(value, ref) -> float | None:
+    if not value or len(value) != 3:
+        return None
+    degrees = float(value[0]) + float(value[1]) / 60 + float(value[2]) / 3600
+    return -degrees if ref in ('S', 'W') else degrees
+
+# Gets date from EXIF date and time (local time of the camera), with its offset if the camera recorded it
+# (otherwise the configured time zone is assumed)
+def get_exif_date(value: str, offset: str = None) -> datetime.datetime | None:
+    try:
+        date = datetime.datetime.strptime(value.strip('\x00 '), '%Y:%m:%d %H:%M:%S')
+    except (AttributeError, ValueError):
+        return None
+    try:
+        return date.replace(tzinfo=datetime.datetime.strptime(offset.strip('\x00 '), '%z').tzinfo)
+    except (AttributeError, ValueError):
+        return timezone.make_aware(date)
+
+# Gets metadata of an image, Pillow only reads its headers (however long) and not its pixels
+def read_image_metadata(file: bytes | File | io.BufferedReader) -> dict:
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+    metadata = {}
+    with Image.open(file) as image:
+        width, height = image.size
+        exif = image.getexif()
+    orientation = exif.get(ExifTags.Base.Orientation)
+    if orientation in range(1, 9):
+        metadata['orientation'] = orientation
+    if orientation in ROTATED_ORIENTATIONS:
+        width, height = height, width
+    metadata['width'], metadata['height'] = width, height
+
+    details = exif.get_ifd(ExifTags.IFD.Exif)
+    date = get_exif_date(details.get(ExifTags.Base.DateTimeOriginal), details.get(ExifTags.Base.OffsetTimeOriginal)) or \
+           get_exif_date(exif.get(ExifTags.Base.DateTime), details.get(ExifTags.Base.OffsetTime))
+    if date:
+        metadata['capturedate'] = date
+
+    gps = exif.get_ifd(ExifTags.IFD.GPSInfo)
+    latitude = get_exif_degrees(gps.get(ExifTags.GPS.GPSLatitude), gps.get(ExifTags.GPS.GPSLatitudeRef))
+    longitude = get_exif_degrees(gps.get(ExifTags.GPS.GPSLongitude), gps.get(ExifTags.GPS.GPSLongitudeRef))
+    if latitude is not None and longitude is not None and abs(latitude) <= 90 and abs(longitude) <= 180:
+        metadata['latitude'], metadata['longitude'] = latitude, longitude
+    return metadata
+
+
+# Yields type and contents of the boxes of MP4 data
+def iter_mp4_boxes(data: bytes):
+    offset = 0
+    while offset + 8 <= len(data):
+        size, kind = struct.unpack_from('>I4s', data, offset)
+        start = offset + 8
+        if size == 1:
+            size = struct.unpack_from('>Q', data, start)[0]
+            start += 8
+        elif size == 0:
+            size = len(data) - offset
+        if size < start - offset:
+            return
+        yield kind, data[start:offset + size]
+        offset += size
+
+# Reads the movie box of an MP4 or QuickTime file, skipping the other top level boxes without reading them
+def read_mp4_movie(file: File | io.BufferedReader) -> bytes | None:
+    file.seek(0)
+    while True:
+        header = file.read(8)
+        if len(header) < 8:
+            return None
+        size, kind = struct.unpack('>I4s', header)
+        headersize = 8
+        if size == 1:
+            size = struct.unpack('>Q', file.read(8))[0]
+            headersize = 16
+        if kind == b'moov':
+            if size == 0 or size - headersize > MP4_MAX_MOVIE_BYTES:
+                return None
+            return file.read(size - headersize)
+        # Box up to the end of the file
+        if size == 0 or size < headersize:
+            return None
+        file.seek(size - headersize, io.SEEK_CUR)
+
+# Gets metadata of a video from its movie box: duration and date from the movie header, dimensions
+# from the header of the first video track (swapped if it is displayed rotated) and position from the user data
+def read_mp4_metadata(movie: bytes) -> dict:
+    metadata = {}
+    boxes = list(iter_mp4_boxes(movie))
+    while boxes:
+        kind, data = boxes.pop(0)
+        if kind in MP4_CONTAINERS:
+            boxes.extend(iter_mp4_boxes(data))
+        elif kind == b'mvhd':
+            if data[0] == 1:
+                created, _, timescale, duration = struct.unpack_from('>QQIQ', data, 4)
+            else:
+                created, _, timescale, duration = struct.unpack_from('>IIII', data, 4)
+            if timescale:
+                metadata['duration'] = duration / timescale
+            if created:
+                metadata['capturedate'] = MP4_EPOCH + datetime.timedelta(seconds=created)
+        elif kind == b'tkhd' and 'width' not in metadata:
+            # Matrix and dimensions are at the end of the track header, after the fields whose size depends on the version
+            offset = 4 + (32 if data[0] == 1 else 20) + 16
+            matrix = struct.unpack_from('>9i', data, offset)
+            width, height = struct.unpack_from('>II', data, offset + 36)
+            width, height = width >> 16, height >> 16
+            # Audio tracks have no dimensions
+            if width and height:
+                rotated = matrix[0] == 0 and matrix[1] != 0
+                metadata['width'], metadata['height'] = (height, width) if rotated else (width, height)
+        elif kind == b'\xa9xyz':
+            # Text with its length and language
+            match = ISO6709_REGEX.match(data[4:].decode('utf-8', 'ignore'))
+            if match:
+                latitude, longitude = float(match.group(1)), float(match.group(2))
+                if abs(latitude) <= 90 and abs(longitude) <= 180:
+                    metadata['latitude'], metadata['longitude'] = latitude, longitude
+    return metadata
+
+
+# Gets metadata of a media file as Media fields, from its MIME type (see core.mediatypes)
+def read_metadata(file: File | io.BufferedReader, mimetype: str | None) -> dict:
+    if mimetype is None:
+        return {}
+    try:
+        if mimetype.startswith('image/'):
+            file.seek(0)
+            return read_image_metadata(file)
+        if mimetype in ('video/mp4', 'video/quicktime', 'video/3gpp', 'video/3gpp2'):
+            movie = read_mp4_movie(file)
+            return read_mp4_metadata(movie) if movie else {}
+        return {}
+    # Metadata is written by many cameras and apps, broken metadata is ignored
+    except Exception:
+        return {}
+    finally:
+        file.seek(0)
+
+def read_path_metadata(path: str, mimetype: str | None) -> dict:
+    with open(path, 'rb') as file:
+        return read_metadata(file, mimetype)
+
+# Gets coordinates of media from the GPS position of its metadata, in the format of the coordinates field
+def get_metadata_coordinates(metadata: dict) -> str | None:
+    if 'latitude' not in metadata:
+        return None
+    return f"{metadata['latitude']:.6f},{metadata['longitude']:.6f}"
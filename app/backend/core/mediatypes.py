@@ -0,0 +1,117 @@
+import functools
+import io
+import os
+from django.core.files import File
+from PIL import Image
+
+from core.common import MEDIA_MAX_IMAGE_BYTES, MEDIA_MAX_PIXELS
+
+# Type and dimensions of media files are read from their first bytes, without decoding or even reading the whole file
+# Bytes read from the start of a file, enough for the headers of images (JPEG EXIF data can take up to 64 KB before the dimensions)
+SNIFF_BYTES = 64 * 1024
+# ISO base media file (MP4, HEIF) brands of images, the others are videos
+IMAGE_BRANDS = {
+    b'avif': 'image/avif', b'avis': 'image/avif',
+    b'heic': 'image/heic', b'heix': 'image/heic', b'heim': 'image/heic', b'heis': 'image/heic',
+    b'mif1': 'image/heif', b'msf1': 'image/heif',
+}
+VIDEO_BRANDS = {b'qt  ': 'video/quicktime', b'3gp4': 'video/3gpp', b'3gp5': 'video/3gpp', b'3gp6': 'video/3gpp', b'3g2a': 'video/3gpp2'}
+
+
+# Raised when an uploaded file is not valid media
+class InvalidMedia(Exception):
+    pass
+
+# Raised when an uploaded image is over the size or pixel limits
+class MediaTooLarge(InvalidMedia):
+    pass
+
+
+# Gets MIME type of a file from its first bytes, or None if unknown
+def sniff_mimetype(header: bytes) -> str | None:
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if header.startswith((b'GIF87a', b'GIF89a')):
+        return 'image/gif'
+    if header.startswith(b'RIFF') and header[8:12] == b'WEBP':
+        return 'image/webp'
+    if header.startswith(b'RIFF') and header[8:12] == b'AVI ':
+        return 'video/x-msvideo'
+    if header.startswith((b'II*\x00', b'MM\x00*')):
+        return 'image/tiff'
+    if header.startswith(b'BM') and len(header) >= 14:
+        return 'image/bmp'
+    if header[4:8] == b'ftyp':
+        brand = header[8:12]
+        return IMAGE_BRANDS.get(brand) or VIDEO_BRANDS.get(brand, 'video/mp4')
+    # Matroska, WebM declares its document type in the EBML header
+    if header.startswith(b'\x1a\x45\xdf\xa3'):
+        return 'video/webm' if b'webm' in header[:64] else 'video/x-matroska'
+    if header.startswith(b'OggS'):
+        return 'video/ogg'
+    return None
+
+# Gets MIME types of the images PIL can read
+@functools.cache
+def get_readable_mimetypes() -> set[str]:
+    Image.init()
+    return {mimetype for mimetype in Image.MIME.values() if mimetype.startswith('image/')}
+
+# Gets dimensions of an image from its first bytes or its file, or None if they are not there (or the format is not supported)
+# PIL only parses the header when opening an image, pixels are decoded on first access
+def get_image_dimensions(file: bytes | File | io.BufferedReader) -> tuple[int, int] | None:
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+    try:
+        file.seek(0)
+        with Image.open(file) as image:
+            return image.size
+    except Image.DecompressionBombError as e:
+        raise MediaTooLarge(str(e))
+    except Exception:
+        return None
+    finally:
+        file.seek(0)
+
+# Reads the first bytes of a file, leaving it at the start
+def read_header(file: File | io.BufferedReader) -> bytes:
+    file.seek(0)
+    header = file.read(SNIFF_BYTES)
+    file.seek(0)
+    return header
+
+# Gets MIME type of a media file from its header and size, raises MediaTooLarge if it is an image over the limits
+# Images whose dimensions are not in the header (e.g. JPEG with more metadata than the sniffed bytes before them) are read from
+# the whole file if given, and images PIL can read but without readable dimensions are rejected (InvalidMedia)
+# Files of an unknown type are accepted (MIME type None) and served as generic images or videos
+def inspect_media(header: bytes, size: int, file: File | io.BufferedReader = None) -> str | None:
+    mimetype = sniff_mimetype(header)
+    if mimetype is None or not mimetype.startswith('image/'):
+        return mimetype
+    if size > MEDIA_MAX_IMAGE_BYTES:
+        raise MediaTooLarge(f"Image of {size} bytes is bigger than {MEDIA_MAX_IMAGE_BYTES}")
+    dimensions = get_image_dimensions(header)
+    if dimensions is None and file is not None:
+        dimensions = get_image_dimensions(file)
+    if dimensions is None:
+        if mimetype in get_readable_mimetypes():
+            raise InvalidMedia(f"Dimensions of {mimetype} image could not be read")
+        return mimetype
+    if dimensions[0] * dimensions[1] > MEDIA_MAX_PIXELS:
+        raise MediaTooLarge(f"Image of {dimensions[0]}x{dimensions[1]} pixels is bigger than {MEDIA_MAX_PIXELS}")
+    return mimetype
+
+# Gets MIME type of an uploaded file (see inspect_media)
+def inspect_file(file: File | io.BufferedReader) -> str | None:
+    header = read_header(file)
+    size = getattr(file, 'size', None)
+    if size is None:
+        size = os.fstat(file.fileno()).st_size
+    return inspect_media(header, size, file)
+
+# Gets MIME type of a file on disk (see inspect_media)
+def inspect_path(path: str) -> str | None:
+    with open(path, 'rb') as file:
+        return inspect_media(file.read(SNIFF_BYTES), os.fstat(file.fileno()).st_size, file)
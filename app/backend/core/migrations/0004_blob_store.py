@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_add_unique_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('size', models.BigIntegerField()),
+                ('refcount', models.IntegerField(default=0)),
+                ('creationdate', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': '"public"."blob"',
+            },
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='blob',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.blob'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_blob_store'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DerivedFile',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('key', models.CharField(max_length=100)),
+                ('name', models.CharField(max_length=50)),
+                ('size', models.BigIntegerField()),
+                ('lastaccess', models.DateTimeField(db_index=True)),
+                ('hits', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': '"public"."derived_file"',
+                'unique_together': {('key', 'name')},
+            },
+        ),
+    ]
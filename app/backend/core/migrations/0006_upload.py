@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:09
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_derived_file'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Upload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('size', models.BigIntegerField()),
+                ('offset', models.BigIntegerField(default=0)),
+                ('filename', models.CharField(max_length=500)),
+                ('kind', models.CharField(max_length=20)),
+                ('modificationdate', models.DateTimeField(null=True)),
+                ('coordinates', models.CharField(max_length=50, null=True)),
+                ('label', models.CharField(max_length=50, null=True)),
+                ('detectedobjects', models.CharField(max_length=100, null=True)),
+                ('creationdate', models.DateTimeField(auto_now_add=True)),
+                ('lastupdate', models.DateTimeField(auto_now=True)),
+                ('album', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.album')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': '"public"."upload"',
+            },
+        ),
+    ]
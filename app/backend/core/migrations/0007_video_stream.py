@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_upload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoStream',
+            fields=[
+                ('blob', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='core.blob')),
+                ('status', models.CharField(db_index=True, default='pending', max_length=20)),
+                ('variants', models.CharField(max_length=200, null=True)),
+                ('error', models.TextField(null=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('creationdate', models.DateTimeField(auto_now_add=True)),
+                ('lastupdate', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': '"public"."video_stream"',
+            },
+        ),
+    ]
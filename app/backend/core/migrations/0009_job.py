@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_trash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(max_length=50)),
+                ('payload', models.JSONField(default=dict)),
+                ('priority', models.IntegerField(default=0)),
+                ('status', models.CharField(default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('maxattempts', models.IntegerField(default=5)),
+                ('runafter', models.DateTimeField(default=django.utils.timezone.now)),
+                ('lockeduntil', models.DateTimeField(null=True)),
+                ('error', models.TextField(null=True)),
+                ('creationdate', models.DateTimeField(auto_now_add=True)),
+                ('lastupdate', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': '"public"."job"',
+                'indexes': [models.Index(fields=['status', '-priority', 'runafter'], name='job_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodedLocation',
+            fields=[
+                ('key', models.CharField(max_length=30, primary_key=True, serialize=False)),
+                ('location', models.CharField(max_length=50, null=True)),
+                ('creationdate', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': '"public"."geocoded_location"',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_geocoded_location'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='mimetype',
+            field=models.CharField(max_length=100, null=True),
+        ),
+    ]
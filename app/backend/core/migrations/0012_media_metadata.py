@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_media_mimetype'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='capturedate',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='duration',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='height',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='latitude',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='longitude',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='orientation',
+            field=models.SmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='width',
+            field=models.IntegerField(null=True),
+        ),
+        # Media metadata is returned with the media of the users, columns are added at the end of the view
+        migrations.RunSQL('''
+
+
+create or replace view public.user_media_view as
+select u.id, u.username, a.id as album_id, a.name as album_name, 
+m.id as media_id, ma.is_cover, m.filename, m.kind, m.modificationdate, 
+m.coordinates, m.location, m.label, m.detectedobjects,
+m.mimetype, m.capturedate, m.latitude, m.longitude, m.orientation, m.width, m.height, m.duration
+from public.media m 
+	left join public.media_album ma on m.id = ma.media_id 
+	left join public.album a on a.id = ma.album_id
+	left join public.album_user au on a.id = au.album_id
+	left join public.auth_user u on u.id = au.user_id
+where m.deletiondate is null and a.deletiondate is null
+order by m.modificationdate desc;
+
+
+''', reverse_sql='''
+
+
+drop view public.user_media_view;
+create view public.user_media_view as
+select u.id, u.username, a.id as album_id, a.name as album_name, 
+m.id as media_id, ma.is_cover, m.filename, m.kind, m.modificationdate, 
+m.coordinates, m.location, m.label, m.detectedobjects
+from public.media m 
+	left join public.media_album ma on m.id = ma.media_id 
+	left join public.album a on a.id = ma.album_id
+	left join public.album_user au on a.id = au.album_id
+	left join public.auth_user u on u.id = au.user_id
+where m.deletiondate is null and a.deletiondate is null
+order by m.modificationdate desc;
+
+
+'''),
+    ]
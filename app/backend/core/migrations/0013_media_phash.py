@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_media_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='phash',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='phash0',
+            field=models.IntegerField(db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='phash1',
+            field=models.IntegerField(db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='phash2',
+            field=models.IntegerField(db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='phash3',
+            field=models.IntegerField(db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:44
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_media_phash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmbeddingCentroid',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('vector', models.BinaryField()),
+                ('creationdate', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': '"public"."embedding_centroid"',
+            },
+        ),
+        migrations.CreateModel(
+            name='Embedding',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('vector', models.BinaryField()),
+                ('cluster', models.IntegerField(null=True)),
+                ('creationdate', models.DateTimeField(auto_now_add=True)),
+                ('blob', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='core.blob')),
+            ],
+            options={
+                'db_table': '"public"."embedding"',
+            },
+        ),
+    ]
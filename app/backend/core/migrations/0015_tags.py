@@ -0,0 +1,125 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Detected objects of media are moved into tags, with unknown confidence
+def create_tags(apps, schema_editor):
+    Media = apps.get_model('core', 'Media')
+    Tag = apps.get_model('core', 'Tag')
+    MediaTag = apps.get_model('core', 'MediaTag')
+    detected = Media.objects.filter(detectedobjects__isnull=False)
+    tags = {}
+    mediatags = []
+    for id, detectedobjects in detected.values_list('id', 'detectedobjects').iterator():
+        names = dict.fromkeys(' '.join(name.lower().split())[:100] for name in detectedobjects.split(';'))
+        for name in names:
+            if not name:
+                continue
+            if name not in tags:
+                tags[name] = Tag.objects.create(name=name)
+            mediatags.append(MediaTag(media_id=id, tag=tags[name]))
+    MediaTag.objects.bulk_create(mediatags, batch_size=10000)
+    detected.update(detected=True)
+
+def create_detected_objects(apps, schema_editor):
+    Media = apps.get_model('core', 'Media')
+    MediaTag = apps.get_model('core', 'MediaTag')
+    detectedobjects = {}
+    for id, name in MediaTag.objects.order_by('id').values_list('media_id', 'tag__name').iterator():
+        detectedobjects.setdefault(id, []).append(name)
+    Media.objects.filter(detected=True).update(detectedobjects='')
+    for id, names in detectedobjects.items():
+        Media.objects.filter(id=id).update(detectedobjects=';'.join(names)[:100])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_embedding'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'db_table': '"public"."tag"',
+            },
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='detected',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name='upload',
+            name='detectedobjects',
+            field=models.TextField(null=True),
+        ),
+        migrations.CreateModel(
+            name='MediaTag',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('confidence', models.FloatField(null=True)),
+                ('media', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mediatags', to='core.media')),
+                ('tag', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='core.tag')),
+            ],
+            options={
+                'db_table': '"public"."media_tag"',
+                'constraints': [models.UniqueConstraint(fields=('tag', 'media'), name='media_tag_unique')],
+            },
+        ),
+        migrations.RunPython(create_tags, create_detected_objects),
+        # Detected objects of the media of the users are their tags, the column type changes so the view is created again
+        migrations.RunSQL('''
+
+
+drop view public.user_media_view;
+create view public.user_media_view as
+select u.id, u.username, a.id as album_id, a.name as album_name, 
+m.id as media_id, ma.is_cover, m.filename, m.kind, m.modificationdate, 
+m.coordinates, m.location, m.label,
+case when m.detected then coalesce(
+    (select string_agg(t.name, ';' order by mt.id) 
+     from public.media_tag mt 
+     join public.tag t on t.id = mt.tag_id 
+     where mt.media_id = m.id), '') end as detectedobjects,
+m.mimetype, m.capturedate, m.latitude, m.longitude, m.orientation, m.width, m.height, m.duration
+from public.media m 
+	left join public.media_album ma on m.id = ma.media_id 
+	left join public.album a on a.id = ma.album_id
+	left join public.album_user au on a.id = au.album_id
+	left join public.auth_user u on u.id = au.user_id
+where m.deletiondate is null and a.deletiondate is null
+order by m.modificationdate desc;
+
+
+''', reverse_sql='''
+
+
+drop view public.user_media_view;
+create view public.user_media_view as
+select u.id, u.username, a.id as album_id, a.name as album_name, 
+m.id as media_id, ma.is_cover, m.filename, m.kind, m.modificationdate, 
+m.coordinates, m.location, m.label, m.detectedobjects,
+m.mimetype, m.capturedate, m.latitude, m.longitude, m.orientation, m.width, m.height, m.duration
+from public.media m 
+	left join public.media_album ma on m.id = ma.media_id 
+	left join public.album a on a.id = ma.album_id
+	left join public.album_user au on a.id = au.album_id
+	left join public.auth_user u on u.id = au.user_id
+where m.deletiondate is null and a.deletiondate is null
+order by m.modificationdate desc;
+
+
+'''),
+        migrations.RemoveField(
+            model_name='media',
+            name='detectedobjects',
+        ),
+    ]
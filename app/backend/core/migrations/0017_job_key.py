@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_upload_receiving'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='key',
+            field=models.CharField(max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('key',), name='job_key_unique'),
+        ),
+    ]
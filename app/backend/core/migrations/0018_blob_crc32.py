@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_job_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blob',
+            name='crc32',
+            field=models.BigIntegerField(null=True),
+        ),
+    ]
@@ -1,12 +1,19 @@
 import json
+import uuid
 from django.db import models
+from django.utils import timezone
 from knox.models import User
 
-from core import utils
-from core.common import ALBUM_NAME_MAX_LENGTH
+from core.common import ALBUM_NAME_MAX_LENGTH, JOB_MAX_ATTEMPTS, TAG_MAX_LENGTH, JobStatus, VideoStreamStatus
 
 SCHEMA = "public"
 
+# Manager hiding rows in the trash, default of the models with soft delete
+# Trashed rows are only reached through all_objects (trash API and purgetrash worker)
+class NotTrashedManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(deletiondate__isnull=True)
+
 # Album model
 class Album(models.Model):
     id = models.AutoField(primary_key=True)
@@ -18,21 +25,29 @@ class Album(models.Model):
     # Sharing attributes (null if not shared)
     code = models.CharField(max_length=8, unique=True, null=True)
     permissions = models.CharField(max_length=15, null=True)
+    # Date the album was moved to the trash (null if not trashed), its media are hidden with it
+    deletiondate = models.DateTimeField(null=True, db_index=True)
 
     user = models.ManyToManyField(User, through='AlbumUser')       # Creates intermediate table
     
+    objects = NotTrashedManager()
+    all_objects = models.Manager()
+    
     class Meta:
         db_table = f'"{SCHEMA}"."album"'
 
     def __str__(self):
-        return json.dumps({
+        string = {
             "id": self.id,
             "name": self.name,
             "creationdate": self.creationdate.isoformat(),
             "lastupdate": self.lastupdate.isoformat(),
             "code": self.code,
             "permissions": self.permissions
-        })
+        }
+        if self.deletiondate:
+            string["deletiondate"] = self.deletiondate.isoformat()
+        return json.dumps(string)
         
 
 # Intermediate table for Album and User
@@ -57,6 +72,43 @@ class AlbumUser(models.Model):
         
         
 
+# Content-addressed blob with the bytes of one or more media files
+# Media with identical content (re-uploads, copies to other albums) share the same blob
+class Blob(models.Model):
+    # SHA-256 hex digest of the content
+    hash = models.CharField(max_length=64, primary_key=True)
+    size = models.BigIntegerField()
+    # CRC-32 of the content, needed by ZIP archives (null for blobs stored before it was recorded, see core.archive)
+    crc32 = models.BigIntegerField(null=True)
+    # Number of media referencing the blob, file is removed when it reaches 0
+    refcount = models.IntegerField(default=0)
+    creationdate = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = f'"{SCHEMA}"."blob"'
+
+    def __str__(self):
+        return json.dumps({
+            "hash": self.hash,
+            "size": self.size,
+            "crc32": self.crc32,
+            "refcount": self.refcount,
+            "creationdate": self.creationdate.isoformat()
+        })
+
+
+# Gets metadata read from the file of media (Media or UserMedia) for their JSON
+def get_media_metadata(media) -> dict:
+    return {
+        "capturedate": media.capturedate.isoformat() if media.capturedate else None,
+        "latitude": media.latitude,
+        "longitude": media.longitude,
+        "orientation": media.orientation,
+        "width": media.width,
+        "height": media.height,
+        "duration": media.duration
+    }
+
 # Media (images or videos) model
 class Media(models.Model):
     id = models.AutoField(primary_key=True)
@@ -67,26 +119,255 @@ class Media(models.Model):
     coordinates = models.CharField(max_length=50, null=True)
     location = models.CharField(max_length=50, null=True)
     label = models.CharField(max_length=50, null=True)
-    # Objects detected in the media using YOLO with format object1;object2;object3...
-    detectedobjects = models.CharField(null=True, max_length=100)
+    # Objects were detected in the image using YOLO (in the browser or the server), even if none was found
+    # Detected objects are the tags of the media (see MediaTag)
+    detected = models.BooleanField(default=False)
+    # File contents (null for media stored with the legacy per-user layout)
+    blob = models.ForeignKey(Blob, null=True, on_delete=models.SET_NULL)
+    # MIME type detected from the file contents (null if unknown)
+    mimetype = models.CharField(max_length=100, null=True)
+    # Metadata read from the file on upload (see core.mediainfo), null if not found
+    # Width and height are the displayed ones, after applying the EXIF orientation
+    capturedate = models.DateTimeField(null=True)
+    latitude = models.FloatField(null=True)
+    longitude = models.FloatField(null=True)
+    orientation = models.SmallIntegerField(null=True)
+    width = models.IntegerField(null=True)
+    height = models.IntegerField(null=True)
+    # Duration of videos in seconds
+    duration = models.FloatField(null=True)
+    # Perceptual hash of images (see core.duplicates), computed in the background, and its 16-bit chunks indexed to find near duplicates
+    phash = models.BigIntegerField(null=True)
+    phash0 = models.IntegerField(null=True, db_index=True)
+    phash1 = models.IntegerField(null=True, db_index=True)
+    phash2 = models.IntegerField(null=True, db_index=True)
+    phash3 = models.IntegerField(null=True, db_index=True)
+    # Date the media was moved to the trash (null if not trashed)
+    deletiondate = models.DateTimeField(null=True, db_index=True)
     
     album = models.ManyToManyField(Album, through='MediaAlbum')     # Uses class defined below
     
+    objects = NotTrashedManager()
+    all_objects = models.Manager()
+    
     class Meta:
         db_table = f'"{SCHEMA}"."media"'
 
+    # Gets the tags of the media in the order they were set, from the prefetched mediatags__tag if any
+    def get_tags(self) -> list['MediaTag']:
+        if not self.detected:
+            return []
+        if 'mediatags' in getattr(self, '_prefetched_objects_cache', {}):
+            return sorted(self.mediatags.all(), key=lambda mediatag: mediatag.id)
+        return list(self.mediatags.select_related('tag').order_by('id'))
+
+    # Detected objects with format object1;object2;object3... (null if they were not detected)
+    @property
+    def detectedobjects(self) -> str | None:
+        if not self.detected:
+            return None
+        return ';'.join(mediatag.tag.name for mediatag in self.get_tags())
+
     def __str__(self):
         string = {
             "id": self.id,
             "filename": self.filename,
             "modificationdate": self.modificationdate.isoformat(),
             "kind": self.kind,
+            "mimetype": self.mimetype,
             "location": self.location,
             "label": self.label,
-            "detectedobjects": self.detectedobjects
+            "detectedobjects": self.detectedobjects,
+            "tags": [{"name": mediatag.tag.name, "confidence": mediatag.confidence} for mediatag in self.get_tags()],
+            **get_media_metadata(self)
         }
+        if self.deletiondate:
+            string["deletiondate"] = self.deletiondate.isoformat()
         return json.dumps(string)
     
+# Tag of media (an object detected in images), shared by all the media with it
+class Tag(models.Model):
+    id = models.AutoField(primary_key=True)
+    name = models.CharField(max_length=TAG_MAX_LENGTH, unique=True)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."tag"'
+
+    def __str__(self):
+        return json.dumps({
+            "id": self.id,
+            "name": self.name
+        })
+
+# Tags of media with their confidence
+# The unique (tag, media) index is the inverted index of tags: media with a tag are found with an index lookup
+class MediaTag(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    media = models.ForeignKey(Media, on_delete=models.CASCADE, related_name='mediatags')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, db_index=False)
+    # Confidence of the detection (null if unknown, e.g. tags detected in the browser)
+    confidence = models.FloatField(null=True)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."media_tag"'
+        constraints = [
+            models.UniqueConstraint(fields=['tag', 'media'], name='media_tag_unique')
+        ]
+
+    def __str__(self):
+        return json.dumps({
+            "mediaid": self.media_id,
+            "tag": self.tag_id,
+            "confidence": self.confidence
+        })
+    
+# Adaptive HLS stream transcoded from a video, shared by the media with the same contents
+class VideoStream(models.Model):
+    blob = models.OneToOneField(Blob, primary_key=True, on_delete=models.CASCADE)
+    # Can be 'pending', 'processing', 'ready' or 'failed'
+    status = models.CharField(max_length=20, default=VideoStreamStatus.PENDING.value, db_index=True)
+    # Variants of the stream with format codec1:height1;codec2:height2...
+    variants = models.CharField(max_length=200, null=True)
+    # Last lines of the transcoder output if it failed
+    error = models.TextField(null=True)
+    attempts = models.IntegerField(default=0)
+    creationdate = models.DateTimeField(auto_now_add=True)
+    lastupdate = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."video_stream"'
+
+    def __str__(self):
+        return json.dumps({
+            "status": self.status,
+            "variants": self.variants,
+            "creationdate": self.creationdate.isoformat(),
+            "lastupdate": self.lastupdate.isoformat()
+        })
+    
+# Embedding of an image (see core.embeddings), shared by the media with the same contents
+class Embedding(models.Model):
+    # Rows are loaded by the search index in order of creation
+    id = models.BigAutoField(primary_key=True)
+    blob = models.OneToOneField(Blob, on_delete=models.CASCADE)
+    # Normalized vector as float16 bytes
+    vector = models.BinaryField()
+    # Nearest centroid of the IVF index (null if the index was not trained yet)
+    cluster = models.IntegerField(null=True)
+    creationdate = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."embedding"'
+
+    def __str__(self):
+        return json.dumps({
+            "blob": self.blob_id,
+            "cluster": self.cluster,
+            "creationdate": self.creationdate.isoformat()
+        })
+
+# Centroid of a list of the IVF index of embeddings, all the centroids are replaced when the index is trained
+class EmbeddingCentroid(models.Model):
+    id = models.IntegerField(primary_key=True)
+    vector = models.BinaryField()
+    creationdate = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."embedding_centroid"'
+
+    def __str__(self):
+        return json.dumps({
+            "id": self.id,
+            "creationdate": self.creationdate.isoformat()
+        })
+    
+# File derived from a media file (rendition), stored in the bounded derived files cache
+class DerivedFile(models.Model):
+    id = models.AutoField(primary_key=True)
+    # Key of the original contents (blob hash or legacy media key)
+    key = models.CharField(max_length=100)
+    # File name inside the key folder, e.g. '256.jpg'
+    name = models.CharField(max_length=50)
+    size = models.BigIntegerField()
+    # Used to evict least recently used files when the cache is over budget
+    lastaccess = models.DateTimeField(db_index=True)
+    # Recorded accesses, at most one per interval (see core.derived)
+    hits = models.IntegerField(default=0)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."derived_file"'
+        unique_together = ('key', 'name')
+
+    def __str__(self):
+        return json.dumps({
+            "key": self.key,
+            "name": self.name,
+            "size": self.size,
+            "lastaccess": self.lastaccess.isoformat(),
+            "hits": self.hits
+        })
+    
+# Location of rounded coordinates, cached so media taken nearby do not query the geocoding service again
+class GeocodedLocation(models.Model):
+    # Rounded coordinates with format 'lat,lon'
+    key = models.CharField(max_length=30, primary_key=True)
+    # Null if there is no place at the coordinates (e.g. sea)
+    location = models.CharField(max_length=50, null=True)
+    # Used to fetch the location again when it is too old
+    creationdate = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."geocoded_location"'
+
+    def __str__(self):
+        return json.dumps({
+            "key": self.key,
+            "location": self.location,
+            "creationdate": self.creationdate.isoformat()
+        })
+    
+# Background job, run by the runjobs worker with the handler registered for its kind in core.jobs
+class Job(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=50)
+    # Keyword arguments of the handler
+    payload = models.JSONField(default=dict)
+    # Jobs with a key are only queued once: there is at most one pending or running job with each key
+    key = models.CharField(max_length=255, null=True)
+    # Jobs with higher priority are run first
+    priority = models.IntegerField(default=0)
+    # Can be 'pending', 'running' or 'failed'
+    status = models.CharField(max_length=20, default=JobStatus.PENDING.value)
+    attempts = models.IntegerField(default=0)
+    maxattempts = models.IntegerField(default=JOB_MAX_ATTEMPTS)
+    # Job is not run before this date (retries are delayed)
+    runafter = models.DateTimeField(default=timezone.now)
+    # Date a running job is considered abandoned and can be claimed again
+    lockeduntil = models.DateTimeField(null=True)
+    # Traceback of the last failed attempt
+    error = models.TextField(null=True)
+    creationdate = models.DateTimeField(auto_now_add=True)
+    lastupdate = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."job"'
+        # Workers look for pending jobs by priority and date
+        indexes = [models.Index(fields=['status', '-priority', 'runafter'], name='job_queue_idx')]
+        constraints = [
+            models.UniqueConstraint(fields=['key'], name='job_key_unique',
+                                    condition=models.Q(status__in=[JobStatus.PENDING.value, JobStatus.RUNNING.value])),
+        ]
+
+    def __str__(self):
+        return json.dumps({
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "runafter": self.runafter.isoformat(),
+            "creationdate": self.creationdate.isoformat()
+        })
+    
 # Intermediate table for Media and Album
 class MediaAlbum(models.Model):
     id = models.AutoField(primary_key=True)
@@ -106,6 +387,42 @@ class MediaAlbum(models.Model):
         })
     
     
+# Resumable upload, its data is appended in chunks to a temporary file until the media is created
+class Upload(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    album = models.ForeignKey(Album, on_delete=models.CASCADE)
+    # Total size in bytes and bytes received so far
+    size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0)
+    # Time the chunk being appended was claimed, or last received data (see utils.claim_upload)
+    receiving = models.DateTimeField(null=True)
+    # Media fields, used when the upload is finished
+    filename = models.CharField(max_length=500)
+    kind = models.CharField(max_length=20)
+    modificationdate = models.DateTimeField(null=True)
+    coordinates = models.CharField(max_length=50, null=True)
+    label = models.CharField(max_length=50, null=True)
+    detectedobjects = models.TextField(null=True)
+    creationdate = models.DateTimeField(auto_now_add=True)
+    lastupdate = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = f'"{SCHEMA}"."upload"'
+
+    def __str__(self):
+        return json.dumps({
+            "id": str(self.id),
+            "albumid": self.album_id,
+            "size": self.size,
+            "offset": self.offset,
+            "filename": self.filename,
+            "kind": self.kind,
+            "creationdate": self.creationdate.isoformat(),
+            "lastupdate": self.lastupdate.isoformat()
+        })
+    
+    
 # VIEWS
 # Users data view
 class UserData(models.Model):
@@ -173,7 +490,16 @@ class UserMedia(models.Model):
     coordinates = models.CharField(max_length=50, null=True)
     location = models.CharField(max_length=50, null=True)
     label = models.CharField(max_length=50, null=True)
-    detectedobjects = models.CharField(null=True, max_length=100)
+    # Tags of the media joined with ';' (null if objects were not detected)
+    detectedobjects = models.TextField(null=True)
+    mimetype = models.CharField(max_length=100, null=True)
+    capturedate = models.DateTimeField(null=True)
+    latitude = models.FloatField(null=True)
+    longitude = models.FloatField(null=True)
+    orientation = models.SmallIntegerField(null=True)
+    width = models.IntegerField(null=True)
+    height = models.IntegerField(null=True)
+    duration = models.FloatField(null=True)
     
     class Meta:
         db_table = f'"{SCHEMA}"."user_media_view"'
@@ -192,7 +518,9 @@ class UserMedia(models.Model):
             "coordinates": self.coordinates,
             "location": self.location,
             "label": self.label,
-            "detectedobjects": self.detectedobjects
+            "detectedobjects": self.detectedobjects,
+            "mimetype": self.mimetype,
+            **get_media_metadata(self)
         }
         return json.dumps(string)
     
@@ -0,0 +1,143 @@
+import functools
+import os
+from django.core.files import File
+from PIL import Image, ImageOps, features
+
+from core import derived, utils
+from core.common import RENDITION_SIZES, MediaKinds
+from core.models import Media
+from core.storage import get_storage
+
+RENDITION_QUALITY = 85
+# Formats of the renditions in order of preference: (PIL format, content type, file extension, save options)
+# Modern formats are only used if the client accepts them and Pillow can encode them
+RENDITION_FORMATS = {
+    'avif': ('AVIF', 'image/avif', 'avif', {'quality': 60}),
+    'webp': ('WEBP', 'image/webp', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'image/jpeg', 'jpg', {'quality': RENDITION_QUALITY, 'optimize': True}),
+}
+# Understood by every client
+DEFAULT_RENDITION_FORMAT = 'jpeg'
+
+# Gets the smallest rendition size covering the requested long edge
+# Returns None if the request is bigger than every rendition (original is served)
+def get_rendition_size(size: int) -> int | None:
+    for renditionsize in RENDITION_SIZES:
+        if size <= renditionsize:
+            return renditionsize
+    return None
+
+# Gets name of a rendition in the derived files cache, full resolution renditions have no size
+def get_rendition_name(size: int | None, format: str = DEFAULT_RENDITION_FORMAT) -> str:
+    return f"{size or 'full'}.{RENDITION_FORMATS[format][2]}"
+
+def get_rendition_content_type(format: str) -> str:
+    return RENDITION_FORMATS[format][1]
+
+# Gets formats Pillow can encode, in order of preference
+@functools.cache
+def get_available_formats() -> list[str]:
+    return [format for format in RENDITION_FORMATS if format == DEFAULT_RENDITION_FORMAT or features.check(format)]
+
+# Picks the preferred modern format explicitly accepted in an Accept header (wildcards do not count, as clients
+# sending only '*/*' may not decode them)
+# Returns None if the client accepts none of them
+def negotiate_format(accept: str | None) -> str | None:
+    accepted = {}
+    for part in (accept or '').split(','):
+        mediatype, _, params = part.partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        accepted[mediatype.strip().lower()] = quality
+    for format in get_available_formats():
+        if format != DEFAULT_RENDITION_FORMAT and accepted.get(get_rendition_content_type(format), 0) > 0:
+            return format
+    return None
+
+# Resizes an image to fit in a size x size box, keeping aspect ratio and applying EXIF orientation,
+# and encodes it in the given format (full resolution if no size is given)
+# Returns path of the temporary file with the rendition, or None if the original is already smaller
+def create_rendition(original: File, key: str, size: int | None, format: str = DEFAULT_RENDITION_FORMAT) -> str | None:
+    pilformat, _, _, options = RENDITION_FORMATS[format]
+    with Image.open(original) as img:
+        if size is not None:
+            if max(img.size) <= size:
+                return None
+            # Lets JPEG decoder downscale while decoding, avoiding full resolution decodes
+            img.draft('RGB', (size, size))
+        img = ImageOps.exif_transpose(img)
+        if size is not None:
+            img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        # JPEG has no transparency, modern formats keep it
+        mode = 'RGB' if format == DEFAULT_RENDITION_FORMAT or not img.has_transparency_data else 'RGBA'
+        if img.mode != mode:
+            img = img.convert(mode)
+        fd, tmppath = derived.create_derived_tempfile(key)
+        try:
+            with os.fdopen(fd, 'wb') as dest:
+                img.save(dest, format=pilformat, **options)
+        except:
+            os.remove(tmppath)
+            raise
+    return tmppath
+
+# Gets rendition of an image with the given long edge and format from the derived files cache, creating it if needed
+# Returns None if the original should be served instead (videos, small originals or big sizes)
+def get_rendition_file(username: str, media: Media, size: int, format: str = DEFAULT_RENDITION_FORMAT) -> File | None:
+    if media.kind not in [MediaKinds.IMAGE.value, MediaKinds.PROFILE.value]:
+        return None
+    size = get_rendition_size(size)
+    if size is None:
+        return None
+    
+    key = derived.get_derived_key(username, media)
+    name = get_rendition_name(size, format)
+    path = derived.get_derived_file(key, name)
+    if path is None:
+        original = utils.get_media_file(username, media)
+        if original is None:
+            return None
+        with original:
+            try:
+                tmppath = create_rendition(original, key, size, format)
+            except (OSError, Image.DecompressionBombError):
+                # Not an image PIL can decode
+                return None
+        if tmppath is None:
+            return None
+        path = derived.put_derived_file(key, name, tmppath)
+    return File(open(path, 'rb'))
+
+# Gets the whole image converted to another format from the derived files cache, as the file (None if the original
+# should be served instead) and whether the conversion is made
+# Full size conversions are slow, so they are made in the background (see convert_image) and the original is served meanwhile,
+# and they are only worth sending if they are smaller than the original
+def get_converted_file(media: Media, format: str) -> tuple[File | None, bool]:
+    if media.kind not in [MediaKinds.IMAGE.value, MediaKinds.PROFILE.value] or media.blob is None:
+        return None, True
+    path = derived.get_derived_file(media.blob.hash, get_rendition_name(None, format))
+    if path is None:
+        return None, False
+    if os.path.getsize(path) >= media.blob.size:
+        return None, True
+    return File(open(path, 'rb')), True
+
+# Converts the whole image of a blob to another format into the derived files cache
+def convert_image(hash: str, format: str):
+    name = get_rendition_name(None, format)
+    if derived.get_derived_file(hash, name) is not None:
+        return
+    try:
+        original = get_storage().open(utils.get_blob_name(hash))
+    except FileNotFoundError:
+        # Blob deleted meanwhile
+        return
+    with original:
+        tmppath = create_rendition(original, hash, None, format)
+    derived.put_derived_file(hash, name, tmppath)
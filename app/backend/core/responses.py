@@ -0,0 +1,227 @@
+import hashlib
+import io
+import os
+import re
+from urllib.parse import quote
+from django.conf import settings
+from django.core.files import File
+from django.http import FileResponse, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import get_random_string
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.negotiation import BaseContentNegotiation
+
+RANGE_CHUNK_SIZE = 64 * 1024
+# Requests with more ranges than this are answered with the whole file
+MAX_RANGES = 16
+
+# Content negotiation for views sending files, which choose their content type themselves
+# Renderers are only used for errors, so an Accept header without JSON (e.g. 'image/webp') is not answered with 406
+class FileContentNegotiation(BaseContentNegotiation):
+    def select_parser(self, request, parsers):
+        return parsers[0] if parsers else None
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+# Parses a Range header into a sorted list of (start, end) inclusive byte ranges, merging overlapping ones
+# Returns None if the header is missing or invalid (whole file is sent) and an empty list if no range is satisfiable
+def parse_range_header(header: str, size: int) -> list[tuple[int, int]] | None:
+    if not header:
+        return None
+    units, _, spec = header.partition('=')
+    if units.strip().lower() != 'bytes' or not spec:
+        return None
+    parts = spec.split(',')
+    if len(parts) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for part in parts:
+        match = re.fullmatch(r'(\d*)-(\d*)', part.strip())
+        if not match or (not match[1] and not match[2]):
+            return None
+        # Suffix range (last N bytes)
+        if not match[1]:
+            length = int(match[2])
+            if length == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+        start = int(match[1])
+        end = int(match[2]) if match[2] else None
+        if end is not None and end < start:
+            return None
+        if start >= size:
+            continue
+        if end is None:
+            end = size - 1
+        ranges.append((start, min(end, size - 1)))
+
+    ranges.sort()
+    merged = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+# Checks if the If-Range validator still matches the file, so the Range header can be honored
+def if_range_matches(request: HttpRequest, etag: str = None, last_modified: float = None) -> bool:
+    value = request.headers.get('If-Range')
+    if not value:
+        return True
+    # Entity tag (weak tags never match)
+    if value.startswith('"') or value.startswith('W/'):
+        return etag is not None and value == etag
+    # HTTP date (must be an exact match)
+    date = parse_http_date_safe(value)
+    return date is not None and last_modified is not None and date == int(last_modified)
+
+# Yields the bytes of a range, closing the file when done
+def read_range(file: File, start: int, end: int, close=True):
+    try:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = file.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        if close:
+            file.close()
+
+# Yields a multipart/byteranges body
+def read_multipart_ranges(file: File, parts: list[tuple[bytes, int, int]], closing: bytes):
+    try:
+        for header, start, end in parts:
+            yield header
+            yield from read_range(file, start, end, close=False)
+        yield closing
+    finally:
+        file.close()
+
+# Builds a weak ETag from the values a JSON listing depends on
+def weak_etag(*values) -> str:
+    digest = hashlib.sha1(repr(values).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+# Adds validators to a response, so clients revalidate their cached copy instead of downloading it again
+def set_validators(response: HttpResponse, etag: str = None, last_modified: float = None) -> HttpResponse:
+    if etag:
+        response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+# Answers conditional requests (If-None-Match, If-Modified-Since) with 304 Not Modified if the validators match
+# Returns None if the full response has to be sent
+def not_modified_response(request: HttpRequest, etag: str = None, last_modified: float = None) -> HttpResponse | None:
+    response = get_conditional_response(request, etag=etag, last_modified=int(last_modified) if last_modified is not None else None)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+# Delegates sending the file to nginx, which also answers Range requests
+def accel_redirect_response(file: File, content_type: str) -> HttpResponse:
+    path = os.path.relpath(file.name, settings.MEDIA_ROOT)
+    file.close()
+    response = HttpResponse(content_type=content_type)
+    response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_PREFIX + quote(path.replace(os.sep, '/'))
+    return response
+
+# Builds the response for a media file, answering conditional requests with 304 Not Modified
+# and Range requests with partial content
+# Strong ETag is the content hash if given, otherwise it is derived from modification time and size
+# Files not in the local filesystem (object storage) have no modification time and are always sent by Django
+def file_response(request: HttpRequest, file: File, content_type: str, etag: str = None) -> HttpResponse:
+    try:
+        stat = os.fstat(file.fileno())
+        size, mtime, local = stat.st_size, stat.st_mtime, True
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        size, mtime, local = file.size, None, False
+    if etag is None:
+        etag = f'"{int(mtime or 0):x}-{size:x}"'
+
+    response = not_modified_response(request, etag, mtime)
+    if response is not None:
+        file.close()
+        return response
+
+    if settings.MEDIA_ACCEL_REDIRECT and local:
+        return set_validators(accel_redirect_response(file, content_type), etag, mtime)
+
+    ranges = parse_range_header(request.headers.get('Range'), size)
+    if ranges is not None and not if_range_matches(request, etag, mtime):
+        ranges = None
+
+    # Whole file
+    if ranges is None:
+        response = FileResponse(file, content_type=content_type)
+    # No satisfiable range
+    elif len(ranges) == 0:
+        file.close()
+        response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        response['Content-Range'] = f"bytes */{size}"
+    # Single range
+    elif len(ranges) == 1:
+        start, end = ranges[0]
+        response = StreamingHttpResponse(read_range(file, start, end), content_type=content_type,
+                                         status=status.HTTP_206_PARTIAL_CONTENT)
+        response['Content-Range'] = f"bytes {start}-{end}/{size}"
+        response['Content-Length'] = end - start + 1
+    # Multiple ranges, sent as multipart/byteranges
+    else:
+        boundary = get_random_string(32)
+        parts = []
+        length = 0
+        for start, end in ranges:
+            header = (f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\n"
+                      f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n").encode()
+            parts.append((header, start, end))
+            length += len(header) + end - start + 1
+        closing = f"\r\n--{boundary}--\r\n".encode()
+        length += len(closing)
+        response = StreamingHttpResponse(read_multipart_ranges(file, parts, closing),
+                                         content_type=f"multipart/byteranges; boundary={boundary}",
+                                         status=status.HTTP_206_PARTIAL_CONTENT)
+        response['Content-Length'] = length
+
+    response['Accept-Ranges'] = 'bytes'
+    return set_validators(response, etag, mtime)
+
+# Builds the response for a ZIP archive streamed from its files, answering a single Range request with partial content,
+# so interrupted downloads can be resumed (multiple ranges are answered with the whole archive)
+def archive_response(request: HttpRequest, archive, filename: str) -> HttpResponse:
+    etag = archive.etag
+    response = not_modified_response(request, etag)
+    if response is not None:
+        return response
+
+    ranges = parse_range_header(request.headers.get('Range'), archive.size)
+    if ranges is not None and (len(ranges) > 1 or not if_range_matches(request, etag)):
+        ranges = None
+
+    if ranges is None:
+        response = StreamingHttpResponse(archive.read(), content_type='application/zip')
+        response['Content-Length'] = archive.size
+    elif len(ranges) == 0:
+        response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        response['Content-Range'] = f"bytes */{archive.size}"
+    else:
+        start, end = ranges[0]
+        response = StreamingHttpResponse(archive.read(start, end), content_type='application/zip',
+                                         status=status.HTTP_206_PARTIAL_CONTENT)
+        response['Content-Range'] = f"bytes {start}-{end}/{archive.size}"
+        response['Content-Length'] = end - start + 1
+
+    response['Accept-Ranges'] = 'bytes'
+    response['Content-Disposition'] = content_disposition_header(True, filename)
+    # Sent as it is generated, nginx would otherwise buffer big archives to disk
+    response['X-Accel-Buffering'] = 'no'
+    return set_validators(response, etag)
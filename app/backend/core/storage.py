@@ -0,0 +1,196 @@
+import abc
+import functools
+import io
+import os
+from pathlib import Path
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.utils.module_loading import import_string
+
+from core.common import BLOBS_FOLDER, MEDIA_FILE_MODE
+
+# boto3 is only needed for the S3 storage
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
+except ImportError:
+    boto3 = None
+
+# Files from this size on are uploaded to S3 in parts sent in parallel
+S3_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+S3_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+S3_MAX_CONCURRENCY = 8
+# Reads from S3 are buffered, so small seeks (e.g. image headers) do not start a new request
+S3_READ_BUFFER_SIZE = 1024 * 1024
+
+
+# Storage of the blob store files
+# Contents are always written to a local temporary file first (hashed while streamed), then moved into the storage,
+# so drivers only have to move a local file in, read it back and delete it. Names are relative paths like 'ab/cd/abcd...'
+class Storage(abc.ABC):
+    @abc.abstractmethod
+    def exists(self, name: str) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def size(self, name: str) -> int:
+        pass
+
+    # Opens a file for reading, it must be seekable so Range requests can be answered
+    # Raises FileNotFoundError if the file does not exist
+    @abc.abstractmethod
+    def open(self, name: str) -> File:
+        pass
+
+    # Moves a local temporary file into the storage, the temporary file is removed
+    @abc.abstractmethod
+    def save(self, name: str, tmppath: str):
+        pass
+
+    @abc.abstractmethod
+    def delete(self, name: str):
+        pass
+
+    # Gets path of a file in the local filesystem, or None if the storage is not local
+    def path(self, name: str) -> Path | None:
+        return None
+
+
+# Storage in a local folder (MEDIA_ROOT/_blobs by default)
+class LocalStorage(Storage):
+    def __init__(self, location: str = None):
+        self.location = Path(location) if location else settings.MEDIA_ROOT / BLOBS_FOLDER
+
+    def path(self, name: str) -> Path:
+        return self.location / name
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self.path(name))
+
+    def size(self, name: str) -> int:
+        return os.path.getsize(self.path(name))
+
+    def open(self, name: str) -> File:
+        return File(open(self.path(name), 'rb'))
+
+    def save(self, name: str, tmppath: str):
+        path = self.path(name)
+        os.makedirs(path.parent, exist_ok=True)
+        os.chmod(tmppath, MEDIA_FILE_MODE)
+        # Renamed in place, so concurrent requests never read a partial file
+        os.replace(tmppath, path)
+
+    def delete(self, name: str):
+        path = self.path(name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# Seekable reader of an S3 object, streaming it with ranged GET requests
+# Sequential reads use a single request, a new one is only made after seeking
+class S3ObjectReader(io.RawIOBase):
+    def __init__(self, client, bucket: str, key: str):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = client.head_object(Bucket=bucket, Key=key)['ContentLength']
+        self.position = 0
+        self.body = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset != self.position:
+            self.close_body()
+            self.position = offset
+        return self.position
+
+    def readinto(self, buffer):
+        if self.position >= self.size:
+            return 0
+        if self.body is None:
+            self.body = self.client.get_object(Bucket=self.bucket, Key=self.key, Range=f"bytes={self.position}-")['Body']
+        data = self.body.read(len(buffer))
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def close_body(self):
+        if self.body is not None:
+            self.body.close()
+            self.body = None
+
+    def close(self):
+        self.close_body()
+        super().close()
+
+
+# Storage in an S3-compatible object storage (AWS S3, MinIO...), so app nodes do not need a shared volume
+# Big files are uploaded with parallel multipart uploads and files are read as streams
+class S3Storage(Storage):
+    def __init__(self, bucket: str, endpoint_url: str = None, region: str = None, access_key: str = None, secret_key: str = None,
+                 prefix: str = '', multipart_threshold: int = S3_MULTIPART_THRESHOLD, multipart_chunksize: int = S3_MULTIPART_CHUNKSIZE,
+                 max_concurrency: int = S3_MAX_CONCURRENCY):
+        if boto3 is None:
+            raise ImproperlyConfigured("S3 media storage requires boto3 to be installed")
+        self.bucket = bucket
+        self.prefix = prefix
+        # Client is thread safe, its connection pool is shared by the parallel part uploads
+        self.client = boto3.client('s3', endpoint_url=endpoint_url, region_name=region, aws_access_key_id=access_key,
+                                   aws_secret_access_key=secret_key, config=Config(max_pool_connections=max(max_concurrency, 10)))
+        self.transfer = TransferConfig(multipart_threshold=multipart_threshold, multipart_chunksize=multipart_chunksize,
+                                       max_concurrency=max_concurrency, use_threads=True)
+
+    def get_key(self, name: str) -> str:
+        return self.prefix + name
+
+    def exists(self, name: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.get_key(name))
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def size(self, name: str) -> int:
+        return self.client.head_object(Bucket=self.bucket, Key=self.get_key(name))['ContentLength']
+
+    def open(self, name: str) -> File:
+        try:
+            reader = S3ObjectReader(self.client, self.bucket, self.get_key(name))
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                raise FileNotFoundError(name)
+            raise
+        file = File(io.BufferedReader(reader, buffer_size=S3_READ_BUFFER_SIZE), name=name)
+        file.size = reader.size
+        return file
+
+    def save(self, name: str, tmppath: str):
+        self.client.upload_file(tmppath, self.bucket, self.get_key(name), Config=self.transfer)
+        os.remove(tmppath)
+
+    def delete(self, name: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self.get_key(name))
+
+
+# Gets the storage configured in the MEDIA_STORAGE setting
+@functools.cache
+def get_storage() -> Storage:
+    config = settings.MEDIA_STORAGE
+    return import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
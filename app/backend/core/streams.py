@@ -0,0 +1,183 @@
+import datetime
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from django.conf import settings
+from django.utils import timezone
+
+from core.common import MEDIA_FOLDER_MODE, STREAMS_FOLDER, VIDEO_STREAM_SEGMENT_SECONDS, VIDEO_STREAM_VARIANTS, VideoStreamStatus
+from core.models import Blob, VideoStream
+
+logger = logging.getLogger(__name__)
+
+# Codecs the streams can be encoded with: ffmpeg encoder and options, HLS segment type and CODECS attribute of the playlist
+# H.264 plays everywhere, AV1 is smaller for the same quality but much slower to encode
+STREAM_CODECS = {
+    'h264': {'encoder': 'libx264', 'options': ['-preset', 'veryfast', '-profile:v', 'high', '-pix_fmt', 'yuv420p'],
+             'segments': 'mpegts', 'codecs': 'avc1.640028'},
+    'av1': {'encoder': 'libsvtav1', 'options': ['-preset', '8', '-pix_fmt', 'yuv420p'],
+            'segments': 'fmp4', 'codecs': 'av01.0.08M.08'},
+}
+AUDIO_CODECS = 'mp4a.40.2'
+MASTER_PLAYLIST = 'master.m3u8'
+# Lines of the ffmpeg output kept when it fails
+ERROR_LINES = 20
+
+# Content types of the stream files
+STREAM_CONTENT_TYPES = {
+    '.m3u8': 'application/vnd.apple.mpegurl',
+    '.ts': 'video/mp2t',
+    '.m4s': 'video/iso.segment',
+    '.mp4': 'video/mp4',
+}
+
+def get_stream_folder(hash: str):
+    return settings.MEDIA_ROOT / STREAMS_FOLDER / hash[:2] / hash
+
+# Gets path of a file of a stream, or None if the name is outside the stream folder
+def get_stream_file_path(hash: str, name: str):
+    folder = get_stream_folder(hash)
+    path = os.path.normpath(folder / name)
+    if not path.startswith(str(folder) + os.sep):
+        return None
+    return path
+
+# Requests a stream for a video blob, it is transcoded by the transcodevideos worker
+def request_video_stream(blob: Blob) -> VideoStream:
+    stream, _ = VideoStream.objects.get_or_create(blob=blob)
+    return stream
+
+# Deletes the stream files of a blob (the row is deleted with the blob)
+def delete_video_stream(hash: str):
+    shutil.rmtree(get_stream_folder(hash), ignore_errors=True)
+
+# Claims the oldest pending stream, so concurrent workers never transcode the same video
+# Streams processing for longer than the transcoding timeout are considered abandoned (worker crashed) and claimed again
+def claim_video_stream() -> VideoStream | None:
+    abandoned = timezone.now() - datetime.timedelta(seconds=settings.VIDEO_TRANSCODE_TIMEOUT)
+    VideoStream.objects.filter(status=VideoStreamStatus.PROCESSING.value, lastupdate__lt=abandoned).update(status=VideoStreamStatus.PENDING.value)
+    for stream in VideoStream.objects.filter(status=VideoStreamStatus.PENDING.value).order_by('creationdate')[:10]:
+        # Only one worker changes the status from pending
+        claimed = VideoStream.objects.filter(blob_id=stream.blob_id, status=VideoStreamStatus.PENDING.value).update(
+            status=VideoStreamStatus.PROCESSING.value, lastupdate=timezone.now())
+        if claimed:
+            stream.status = VideoStreamStatus.PROCESSING.value
+            return stream
+    return None
+
+# Gets dimensions of a video (after rotation) and if it has audio
+def probe_video(srcpath: str) -> dict:
+    result = subprocess.run([settings.FFPROBE_PATH, '-v', 'error', '-print_format', 'json', '-show_streams', srcpath],
+                            capture_output=True, text=True, timeout=60, check=True)
+    streams = json.loads(result.stdout)['streams']
+    video = next(s for s in streams if s['codec_type'] == 'video')
+    width, height = int(video['width']), int(video['height'])
+    rotation = int(video.get('tags', {}).get('rotate', 0))
+    for sidedata in video.get('side_data_list', []):
+        rotation = int(sidedata.get('rotation', rotation))
+    if abs(rotation) % 180 == 90:
+        width, height = height, width
+    return {
+        'width': width,
+        'height': height,
+        'audio': any(s['codec_type'] == 'audio' for s in streams),
+    }
+
+# Gets the variants (short edge, video kbps, audio kbps) for a video, never upscaling it
+def get_stream_variants(width: int, height: int) -> list[tuple[int, int, int]]:
+    shortedge = min(width, height)
+    variants = [variant for variant in VIDEO_STREAM_VARIANTS if variant[0] <= shortedge]
+    if not variants:
+        _, videokbps, audiokbps = VIDEO_STREAM_VARIANTS[0]
+        variants = [(shortedge - shortedge % 2, videokbps, audiokbps)]
+    return variants
+
+# Gets dimensions of a variant, rounded to even numbers as required by the encoders
+def get_variant_size(width: int, height: int, shortedge: int) -> tuple[int, int]:
+    longedge = round(max(width, height) * shortedge / min(width, height) / 2) * 2
+    return (longedge, shortedge) if width >= height else (shortedge, longedge)
+
+# Builds ffmpeg arguments that decode the video once and encode every variant in parallel as HLS playlists
+# under <folder>/<codec>/<short edge>/, with keyframes aligned across variants so players can switch between them
+def get_ffmpeg_args(srcpath: str, folder: str, codec: str, info: dict, variants: list[tuple[int, int, int]]) -> list[str]:
+    config = STREAM_CODECS[codec]
+    split = ''.join(f"[v{i}]" for i in range(len(variants)))
+    filters = [f"[0:v]split={len(variants)}{split}"]
+    for i, (shortedge, _, _) in enumerate(variants):
+        width, height = get_variant_size(info['width'], info['height'], shortedge)
+        filters.append(f"[v{i}]scale={width}:{height}[v{i}out]")
+
+    args = [settings.FFMPEG_PATH, '-nostdin', '-hide_banner', '-loglevel', 'error', '-y', '-i', srcpath,
+            '-filter_complex', ';'.join(filters)]
+    streammap = []
+    for i, (shortedge, videokbps, audiokbps) in enumerate(variants):
+        args += ['-map', f"[v{i}out]", f"-c:v:{i}", config['encoder'], f"-b:v:{i}", f"{videokbps}k",
+                 f"-maxrate:v:{i}", f"{int(videokbps * 1.07)}k", f"-bufsize:v:{i}", f"{int(videokbps * 1.5)}k"]
+        if info['audio']:
+            args += ['-map', '0:a:0', f"-c:a:{i}", 'aac', f"-b:a:{i}", f"{audiokbps}k", '-ac', '2']
+            streammap.append(f"v:{i},a:{i},name:{shortedge}")
+        else:
+            streammap.append(f"v:{i},name:{shortedge}")
+    extension = 'ts' if config['segments'] == 'mpegts' else 'm4s'
+    args += config['options'] + [
+        '-force_key_frames', f"expr:gte(t,n_forced*{VIDEO_STREAM_SEGMENT_SECONDS})", '-sc_threshold', '0',
+        '-f', 'hls', '-hls_time', str(VIDEO_STREAM_SEGMENT_SECONDS), '-hls_playlist_type', 'vod',
+        '-hls_flags', 'independent_segments', '-hls_segment_type', config['segments'],
+        '-hls_segment_filename', os.path.join(folder, codec, '%v', f"segment%05d.{extension}"),
+        '-var_stream_map', ' '.join(streammap),
+        os.path.join(folder, codec, '%v', 'index.m3u8'),
+    ]
+    if config['segments'] == 'fmp4':
+        args[-1:-1] = ['-hls_fmp4_init_filename', 'init.mp4']
+    return args
+
+# Builds the master playlist listing every variant, players pick one by bandwidth and supported codecs
+def get_master_playlist(info: dict, codecs: list[str], variants: list[tuple[int, int, int]]) -> str:
+    lines = ['#EXTM3U', '#EXT-X-VERSION:7', '#EXT-X-INDEPENDENT-SEGMENTS']
+    for codec in codecs:
+        for shortedge, videokbps, audiokbps in variants:
+            width, height = get_variant_size(info['width'], info['height'], shortedge)
+            bandwidth = (videokbps * 1.07 + (audiokbps if info['audio'] else 0)) * 1000
+            codecstring = STREAM_CODECS[codec]['codecs'] + (f",{AUDIO_CODECS}" if info['audio'] else '')
+            lines.append(f'#EXT-X-STREAM-INF:BANDWIDTH={int(bandwidth)},RESOLUTION={width}x{height},CODECS="{codecstring}"')
+            lines.append(f"{codec}/{shortedge}/index.m3u8")
+    return '\n'.join(lines) + '\n'
+
+# Transcodes a video into an adaptive HLS stream with the codecs of the VIDEO_STREAM_CODECS setting
+# Files are written to a temporary folder that replaces the stream folder when every variant is done
+def transcode_video_stream(stream: VideoStream, srcpath: str):
+    hash = stream.blob_id
+    folder = get_stream_folder(hash)
+    os.makedirs(folder.parent, exist_ok=True)
+    tmpfolder = tempfile.mkdtemp(dir=folder.parent, prefix='tmp-')
+    stream.attempts += 1
+    try:
+        info = probe_video(srcpath)
+        variants = get_stream_variants(info['width'], info['height'])
+        codecs = settings.VIDEO_STREAM_CODECS
+        for codec in codecs:
+            subprocess.run(get_ffmpeg_args(srcpath, tmpfolder, codec, info, variants), capture_output=True, text=True,
+                           timeout=settings.VIDEO_TRANSCODE_TIMEOUT, check=True)
+        with open(os.path.join(tmpfolder, MASTER_PLAYLIST), 'w') as master:
+            master.write(get_master_playlist(info, codecs, variants))
+        os.chmod(tmpfolder, MEDIA_FOLDER_MODE)
+        shutil.rmtree(folder, ignore_errors=True)
+        os.replace(tmpfolder, folder)
+        stream.status = VideoStreamStatus.READY.value
+        stream.variants = ';'.join(f"{codec}:{variant[0]}" for codec in codecs for variant in variants)
+        stream.error = None
+    except (OSError, ValueError, KeyError, StopIteration, subprocess.SubprocessError) as e:
+        shutil.rmtree(tmpfolder, ignore_errors=True)
+        output = getattr(e, 'stderr', None) or str(e) or type(e).__name__
+        logger.warning(f"Transcoding of video {hash} failed: {output}")
+        stream.status = VideoStreamStatus.FAILED.value
+        stream.error = '\n'.join(output.splitlines()[-ERROR_LINES:])
+
+    # Row is updated instead of saved, as the video may have been deleted while it was transcoded
+    updated = VideoStream.objects.filter(blob_id=hash).update(status=stream.status, variants=stream.variants, error=stream.error,
+                                                              attempts=stream.attempts, lastupdate=timezone.now())
+    if not updated:
+        delete_video_stream(hash)
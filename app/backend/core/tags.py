@@ -0,0 +1,63 @@
+from django.db import transaction
+from django.db.models import Count
+
+from core.common import TAG_MAX_LENGTH
+from core.models import Media, MediaTag, Tag
+
+# Objects detected in images are stored as tags of the media, in a table indexed by tag, so media with some tags
+# are found with index lookups instead of scanning the detected objects of every media
+# Clients still send and receive the detected objects of a media joined with ';' (see Media.detectedobjects)
+
+
+# Gets the name of a tag, lowercase with single spaces as the labels of the browser detection
+def normalize_tag(name: str) -> str:
+    return ' '.join(name.lower().split())[:TAG_MAX_LENGTH]
+
+# Gets tags from detected objects joined with ';', without duplicates and with unknown confidence
+def parse_tags(detectedobjects: str) -> dict[str, float | None]:
+    names = (normalize_tag(name) for name in detectedobjects.split(';'))
+    return {name: None for name in names if name}
+
+# Gets the tags with the given names, created if they did not exist
+def get_or_create_tags(names) -> dict[str, Tag]:
+    names = set(names)
+    if not names:
+        return {}
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    return {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+
+# Sets the tags of media, from a dict of media ID -> tag names and their confidence, replacing their previous tags
+# Media are marked as detected, even without tags
+def set_media_tags(tags: dict[int, dict[str, float | None]]):
+    tags = {id: {normalize_tag(name): confidence for name, confidence in mediatags.items()} for id, mediatags in tags.items()}
+    with transaction.atomic():
+        found = get_or_create_tags(name for mediatags in tags.values() for name in mediatags if name)
+        MediaTag.objects.filter(media_id__in=tags).delete()
+        MediaTag.objects.bulk_create([MediaTag(media_id=id, tag=found[name], confidence=confidence)
+                                      for id, mediatags in tags.items() for name, confidence in mediatags.items() if name])
+        Media.all_objects.filter(id__in=tags).update(detected=True)
+
+# Copies the tags of a media to another one (e.g. a copy in another album)
+def copy_media_tags(source: Media, target: Media):
+    if not source.detected:
+        return
+    set_media_tags({target.id: {mediatag.tag.name: mediatag.confidence for mediatag in source.get_tags()}})
+    target.detected = True
+
+# Removes the tags of media, so their objects are detected again
+def clear_media_tags(media: Media):
+    MediaTag.objects.filter(media=media).delete()
+    media.detected = False
+
+# Filters media by tags: media with all the tags, or with any of them
+# Tags are looked up by name, then their media in the (tag, media) index
+def filter_tagged_media(medias, names: list[str], matchall: bool = True):
+    names = {normalize_tag(name) for name in names} - {''}
+    tagids = list(Tag.objects.filter(name__in=names).values_list('id', flat=True))
+    if not tagids or matchall and len(tagids) < len(names):
+        return medias.none()
+    tagged = MediaTag.objects.filter(tag_id__in=tagids)
+    if matchall and len(tagids) > 1:
+        # Each tag of a media is in the index once
+        tagged = tagged.values('media_id').annotate(count=Count('tag_id')).filter(count=len(tagids))
+    return medias.filter(id__in=tagged.values('media_id'))
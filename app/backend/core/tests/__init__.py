@@ -10,8 +10,11 @@ INCORRECT_TOKEN = "1234";
 TEST_IMAGE_FILE = "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAIAAACQkWg2AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAC10lEQVQozx1SyU8TURif995stNNlHDuFDshaKouASCAe1LgESCQaYzT+BxKNJqiJiajRoyfk5MnEmwdj5KIHvQmJGJVEDKhlGXYoLbTQdvaZ56vv9OV9+X3f91tA64nz2MMURXkARaORWDQiybJu2NM/f2W20whREDEQUAhBGiEXuzSCMKZE2xL1F/pOxxtqWJ8AAaQorBtmckH98Gli/OtUNpuFJRBAGIGnz54f72qXxJAoivnddCRWFQiGYKlPeRibprW+sTny8vWvmT8Yu57noCePH2q6vrKsqsnf++l1MSIjxAAIEFlUeiAQDHS3t6ynd7a3MwSCOF8gtbyYiNe1d3YxAVFdXVtWl1eXFrKZLSO/HwyFIYI8x7U3J9Y2U6n0Dl0bFesaD/+YnR958So5t2BqRTIcsfxBWe7oaO1qSQz095K1ELh9J3v2CkXQ3HZ0dydruV5nd48khScnxgv5vIcB4QAAZBhGKZcf3B9qaExohq3IEjItB9H09cHBe3eGWpqapEhkZmbWcWwAkRAWG9s6Lcd59/aNGJYcj7IcC/mEwI3bQ9euXuEYGmNcW1OzsZVaUlUhGDrVP3Dm7Ln6RHx+dnYlnVEi4VwuB2OVVb29vURFMpUAeJ67fOmiJEkVh6rlikri6eSXqVx2NxwKjY2NyeEgdBxHXVnN7O4UNY0IwrLMirpoF4uyn//7/ZuHqNXktFbY+/zx/eL8nGHZQK5Q/D4foVGtxBSlsrPr2OjoaGE/T372i1ptPI71wmZq23UdhuWGhx+BSLQcUNiybOIRQzMkVKZlkEI3TQr/VwoAjmN1wyjj+bu3bkJFElzHpQHkSYucjD3icgkPSulgECDESgXDuBgHymh4IFAGyWBA0koVdF3TNNd1AY0AAGUsEw0Kop+3HZvEUfD7hbBEL6XykMIsxxYM0yMLMD5SL1u6mdPMvGHnDYujqSpJcFxPkiWi9T+CB05uAvJkCwAAAABJRU5ErkJggg=="
 TEST_VIDEO_FILE = "AAAAGGZ0eXBpc29tAAAAAWlzb21pc280AAAOHW1vb3YAAABsbXZoZAAAAADilfRy4pX0cgAHUwAADtgAAAEAAAEAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMAAAAVaW9kcwAAAAAQBwBP//8p/v8AAAjndHJhawAAAFx0a2hkAAAAAwAAAADilfRyAAAAAQAAAAAADlGgAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAQAAAAALQAAABjgAAAAAIg21kaWEAAAAgbWRoZAAAAAAAAAAA4pX0cgCJVEABDHp4VcQAAAAAADNoZGxyAAAAAAAAAAB2aWRlAAAAAAAAAAAAAAAAVHdpdHRlci12b3JrIG11eGVyAAAACChtaW5mAAAAFHZtaGQAAAABAAAAAAAAAAAAAAAkZGluZgAAABxkcmVmAAAAAAAAAAEAAAAMdXJsIAAAAAEAAAfoc3RibAAAALhzdHNkAAAAAAAAAAEAAACoYXZjMQAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAALQAY4ASAAAAEgAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABj//wAAAC5hdmNDAU1AH//hABdnTUAf7MBaGf1CAAADAAIANu6AHjBjNAEABGjpe8gAAAAQcGFzcAAAAAEAAAABAAAAFGJ0cnQAADa5AAQHuAAC1RgAAAFIc3R0cwAAAAAAAAAnAAAAAgADBXAAAAABAAMomAAAAAMAAwVwAAAAAQADKJgAAAAEAAMFcAAAAAEAAyiYAAAAAwADBXAAAAABAAMomAAAAAQAAwVwAAAAAQADKJgAAAADAAMFcAAAAAEAAyiYAAAABAADBXAAAAABAAMomAAAAAMAAwVwAAAAAQADKJgAAAAEAAMFcAAAAAEAAyiYAAAAAwADBXAAAAABAAMomAAAAAQAAwVwAAAAAQADKJgAAAADAAMFcAAAAAEAAyiYAAAABAADBXAAAAABAAMomAAAAAMAAwVwAAAAAQADKJgAAAAEAAMFcAAAAAEAAyiYAAAAAwADBXAAAAABAAMomAAAAAQAAwVwAAAAAQADKJgAAAADAAMFcAAAAAEAAyiYAAAABAADBXAAAAABAAMomAAAAAQAAwVwAAACsGN0dHMBAAAAAAAAVAAAAAEAAAAAAAAAAQAJM3gAAAABAAAAAAAAAAH/+dH4AAAAAf/8+pAAAAABAAAAAAAAAAEAAyiYAAAAAf/812gAAAABAAkQUAAAAAEAAAAAAAAAAf/59SAAAAAB//z6kAAAAAEACRBQAAAAAQAAAAAAAAAB//n1IAAAAAH//PqQAAAAAQAJEFAAAAABAAAAAAAAAAH/+fUgAAAAAf/8+pAAAAABAAkzeAAAAAEAAAAAAAAAAf/50fgAAAAB//z6kAAAAAEACTN4AAAAAQAAAAAAAAAB//nR+AAAAAH//PqQAAAAAQAJM3gAAAABAAAAAAAAAAH/+dH4AAAAAf/8+pAAAAABAAMFcAAAAAH//PqQAAAAAQAJEFAAAAABAAAAAAAAAAH/+fUgAAAAAf/8+pAAAAABAAkzeAAAAAEAAAAAAAAAAf/50fgAAAAB//z6kAAAAAEACTN4AAAAAQAAAAAAAAAB//nR+AAAAAH//PqQAAAAAQAJM3gAAAABAAAAAAAAAAH/+dH4AAAAAf/8+pAAAAABAAMFcAAAAAH//PqQAAAAAQAGCuAAAAAC//z6kAAAAAEACTN4AAAAAQAAAAAAAAAB//nR+AAAAAH//PqQAAAAAQADBXAAAAAB//z6kAAAAAEAAAAAAAAAAQAGCuAAAAAC//z6kAAAAAEACTN4AAAAAQAAAAAAAAAB//nR+AAAAAH//PqQAAAAAQAJM3gAAAABAAAAAAAAAAH/+dH4AAAAAf/8+pAAAAABAAkzeAAAAAEAAAAAAAAAAf/50fgAAAAB//z6kAAAAAEACTN4AAAAAQAAAAAAAAAB//nR+AAAAAH//PqQAAAAAQAGCuAAAAAC//z6kAAAAAEAAwVwAAAAAf/8+pAAAAACAAAAAAAAACBjc2xnAAAAAAAAAAD/+dH4AAkzeAAAAAABDHp4AAAAFHN0c3MAAAAAAAAAAQAAAAEAAABwc3RzYwAAAAAAAAAIAAAAAQAAABYAAAABAAAAAgAAAAEAAAABAAAABQAAAAIAAAABAAAADgAAAAEAAAABAAAAFAAAAAIAAAABAAAAHQAAAAEAAAABAAAAIgAAAAIAAAABAAAAKQAAAAIAAAABAAABdHN0c3oAAAAAAAAAAAAAAFgAADa5AAADYQAAAFIAAAAWAAAAFQAAAMoAAASCAAAAHQAABmQAAABVAAAAGgAAABgAAAPLAAAAFQAAABMAAAATAAAJcQAAAIwAAAAaAAAALgAABUoAAAArAAAAFQAAABMAAATTAAAAUAAAABIAAAATAAACJgAAABoAAAATAAAAEwAAAz8AAAATAAACpQAAABUAAAATAAAAEwAAA9QAAABaAAAAEwAAABwAABBvAAAAUwAAABMAAAATAAAC/wAAABUAAAATAAAAEwAAAyYAAAATAAACIgAAABUAAAATAAAEhwAAABUAAAATAAAAEwAAA4gAAAATAAABHQAABH0AAAA8AAAAHwAAAwQAAAAVAAAAEwAAABQAAAQHAAAAXwAAABgAAAAUAAAD8QAAAH0AAAASAAAAKwAAAnMAAABAAAAAEwAAADIAAAPuAAAATAAAAEkAAATLAAAAywAAACkAAAJ1AAAAtHN0Y28AAAAAAAAAKQAADj0AAHrlAAB7rgAAfG0AAIKcAACEVwAAh/EAAImOAACOZAAAkngAAJP0AACZLwAAmwIAAK0UAACuCwAArsUAAK98AACzIAAAs94AALVMAAC52AAAvXMAAL8eAADFDAAAxnsAAMteAADSPwAA0/sAANhsAADZJwAA2eIAAN6aAADfrgAA4R0AAOZuAADoQwAA7CoAAO3FAADzXgAA9VUAAPxSAAAAZHNkdHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABK10cmFrAAAAXHRraGQAAAADAAAAAOKV9HIAAAACAAAAAAAO2AAAAAAAAAAAAAAAAAEBAAAAAAEAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAARJbWRpYQAAACBtZGhkAAAAAAAAAADilfRyAAdTAAAO2ABVxAAAAAAAM2hkbHIAAAAAAAAAAHNvdW4AAAAAAAAAAAAAAABUd2l0dGVyLXZvcmsgbXV4ZXIAAAAD7m1pbmYAAAAQc21oZAAAAAAAAAAAAAAAJGRpbmYAAAAcZHJlZgAAAAAAAAABAAAADHVybCAAAAABAAADsnN0YmwAAABbc3RzZAAAAAAAAAABAAAAS21wNGEAAAAAAAAAAQAAAAAAAAAAAAIAEAAAAAC7gAAAAAAAJ2VzZHMAAAAAAxkAAAAEEUAVAAEeAAEaOAABBngFAhGQBgECAAAAGHN0dHMAAAAAAAAAAQAAAF8AACgAAAAAfHN0c2MAAAAAAAAACQAAAAEAAAAXAAAAAQAAAAIAAAABAAAAAQAAAAQAAAACAAAAAQAAAA4AAAABAAAAAQAAABMAAAACAAAAAQAAAB0AAAABAAAAAQAAACEAAAACAAAAAQAAACoAAAABAAAAAQAAACwAAAABAAAAAQAAAZBzdHN6AAAAAAAAAAAAAABfAAAAqwAAAKoAAACrAAAAqwAAAKoAAAEeAAAA5wAAAOEAAADiAAAA4QAAANcAAADMAAAAygAAANQAAAC5AAAAvgAAALsAAAC3AAAAtAAAAPYAAADPAAAApwAAALUAAAC0AAAArAAAAKwAAACwAAAApwAAALIAAACvAAAAsgAAAKgAAADIAAAA4gAAAKIAAACyAAAAqgAAAKgAAACsAAAAqQAAAKsAAACqAAAAvAAAAPYAAACRAAAApAAAAKcAAACkAAAApQAAAKkAAACwAAAAqwAAAKsAAACoAAAApwAAAL8AAADbAAAAqAAAALMAAACfAAAAmgAAAK8AAAChAAAApwAAAJoAAACtAAAAtgAAAKsAAAC2AAAAogAAAKgAAACnAAAAsQAAALUAAACtAAAAqgAAAKoAAACiAAAAqQAAAJ0AAACoAAAAoQAAAKAAAACoAAAAwwAAALYAAAC1AAAArQAAALEAAAC2AAAAxAAAALQAAAC0AAAApwAAACsAAADAc3RjbwAAAAAAAAAsAABo6AAAevoAAHvBAACBQAAAgv4AAIaQAACIHgAAjOAAAJEcAACSoAAAl9sAAJmcAACrjQAArWcAAK4eAACu2AAAsnsAALM1AACz8QAAuIUAALwNAAC9mwAAw7oAAMUyAADKFgAA0PgAANKaAADXFAAA2H8AANk7AADd6QAA3vkAAN/GAADlIgAA5v0AAOrhAADsfQAA8eUAAPPzAAD66wAA/vAAAQBoAAEBHAABAcMAAABrc2R0cAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA87ltZGF0AAAAF2dNQB/swFoZ/UIAAAMAAgA27oAeMGM0AAAABGjpe8gAAALxBgX//+3cRem95tlIt5Ys2CDZI+7veDI2NCAtIGNvcmUgMTY0IHIzMDk1IGJhZWU0MDAgLSBILjI2NC9NUEVHLTQgQVZDIGNvZGVjIC0gQ29weWxlZnQgMjAwMy0yMDIyIC0gaHR0cDovL3d3dy52aWRlb2xhbi5vcmcveDI2NC5odG1sIC0gb3B0aW9uczogY2FiYWM9MSByZWY9NSBkZWJsb2NrPTE6MDowIGFuYWx5c2U9MHgxOjB4MTExIG1lPWhleCBzdWJtZT0yIHBzeT0wIG1peGVkX3JlZj0xIG1lX3JhbmdlPTE2IGNocm9tYV9tZT0xIHRyZWxsaXM9MSA4eDhkY3Q9MCBjcW09MCBkZWFkem9uZT0yMSwxMSBmYXN0X3Bza2lwPTEgY2hyb21hX3FwX29mZnNldD0wIHRocmVhZHM9MyBsb29rYWhlYWRfdGhyZWFkcz0xIHNsaWNlZF90aHJlYWRzPTAgbnI9MCBkZWNpbWF0ZT0xIGludGVybGFjZWQ9MCBibHVyYXlfY29tcGF0PTAgc3RpdGNoYWJsZT0xIGNvbnN0cmFpbmVkX2ludHJhPTAgYmZyYW1lcz0zIGJfcHlyYW1pZD0yIGJfYWRhcHQ9MSBiX2JpYXM9MCBkaXJlY3Q9MSB3ZWlnaHRiPTEgb3Blbl9nb3A9MSB3ZWlnaHRwPTIga2V5aW50PWluZmluaXRlIGtleWludF9taW49MzAgc2NlbmVjdXQ9NDAgaW50cmFfcmVmcmVzaD0wIHJjX2xvb2thaGVhZD00MCByYz1jcmYgbWJ0cmVlPTEgY3JmPTI4LjAgcWNvbXA9MC42MCBxcG1pbj0xMCBxcG1heD02OSBxcHN0ZXA9NCB2YnZfbWF4cmF0ZT03NjggdmJ2X2J1ZnNpemU9NzY4IGNyZl9tYXg9MC4wIG5hbF9ocmQ9bm9uZSBmaWxsZXI9MCBpcF9yYXRpbz0xLjQwIGFxPTI6MS4wMACAAAAznWWIhAD/6whaJ/geVZ05dt1kNO9YGuXfloNo4WbqGF2jnN9n7PSou/pnPyvNT6wWOpQCmeWpLkczeIe7dRdtyMei5oSef8r0EPMriuK4lYflG9DgplORihQ7NmrBAXzhauseTBl7YB7Deq0AHVgOp8i/eyHKvfjkq+udaM8QdVeqIiqQTdhbqT61IsYBJ5hP89QSaeWs4dYt2qtbmzs0vHqGTfArWo807H6uyh2QVNleqS5RaSw1/FqPPUlPaxP9k91LFIRp0/m5HjvVDuBLieYX/LLr83/SFxbeG2PYBQkR5h0mauvC9dbglj0nfPtQn6fFb0FsOW2cz63zdn6vxZdNw4oLfda/od1NdRNeO0NdYBHfov45j4lu6ZpvF1v2OuTDGjf/5wu8JjTxmNPDbrKSLty+yamLqY5klDkWJ+aAlxN2BIDe5iIIoF4fDv4nLwxR9TNNIyng4LXq/ZxK0aZM8u6poSF9lZSDUkpyhI4CAsyYaKG5FAAtBgp2He6mf3T2wfJ8Dh9mUMVAAlsumIZDgEv9QBEmy05eyEZd3uFvlV4bNtHBvJcKxBD5hdaSZukZ0IPAw7uYSSYqXAyPINZSXQrPJj9rlB6eMXjR24h664P/OIsh1QzwytS14cg3y+DDRBy0SJCcmVCV14NvPbEY8YDzIyJKJwxHXNM7s32OXrCHYdH1bVmK862u2KTg4WjBFkb6tbKeQUKZYJhQ+1In3k+v/y0UqQJIfRPtd8keFUl9sdnmynmxYFGLW/UtLEPB7B70ezooH+9SnDAn6A6j8XMAIC70fU8WUqZdX51L3ubvcNw7nf/bcPTuph4vSbtXTESdrHNWokGitS5DCdLWZH7ye0Y6QErPOQ16gp8egd+G/gKMH2Qkf2EFFOP444BqQA8geu0u3KBKJ/CPxMet7vvldYK7kgLDYUIZwKJVWPBzMZbQ1LQSSEPvolSaBhffmnOLkHrE3cmSJisaFcN2VrPA+v2+CXS8nQSfjubVWQdA/KzFtqnRjkTc8tHGcWYywCXi8yS1QgHUwrNE3sK6eDGr2QaFzim0UlCKCjccCmq0IFH85AJCEXPxyNJfM5uqoLfDr9R0TG2DNjLkeUvqQz2UQulXozfsg6MOsZEVaXV+S4ezgk4JZw4eIoDho6nZPcOLO/fgDgBAYf/5xyn0v6z0h5IGIJzCzWQ3qYFd61MarYA2QN00I/Z95oz6bjQ/PISRZ+qe+Bq6Rtbl+YoCLFTAgHYs0bZGKU7i+pwduVNLo2ADutJMQ8ON9sfP/fvScnjtyXYsxVEX4t3c/PS+8PwRwDJ+rkcOWoIbWFbWzIrdMPzOfhuk9ZK4+lv8/fbH1pbyKPe5YZjozizSFoFE/9oMiyykpAQuMMBZlG+QfDgPkmKv66hJjd3scZ/8By7E4KUTKSTgaRPS9PvU9WU8JIfmL3jwAyMY8HBRiizHCnEuL6DCw+nrkL6UGIPKrQnnZHK5iC79wyDrprAnQbg5hsslziIV+v/FmTHQ3THfc92p/TsybqvcTWDwETbBZyg8YpKGPfYSp+9A0cQQwNdIm3CWk06T+qqkpT4IHymfR3rdrJvMiBf+e9sFNdNBzjfH8CtV3wIPvVlMrh98JNFoW7MMp8OmqK87tApIqhCGPgWetb3FtprCnvey2mJcJFwmaD6yw7M6DRxO5RB9chhjSYC7HcSd+oWlqPEWa7A87iyRNWf4FGkZRJhc9z8BmqY6VzEDBOJ9H30eqa6bvaqmuhfPy0Qs5stwhQnlffJWBhgGaRsB+3wi3sHv6KBhlqsz1SjgmQP/dETAvvo6puP/MNgJtLf7shEd9g/a6JeNOU2UYILKGUMD+k4pivf5dEDedSSjHxWkd9+7nxypa/1KErdaD5TMl3MQKRDn+CjDKooWbuoQgJRvl2HpHf02FFjBkPQ5TupmXKIttPzCOpr2QBQswXFjIUMKUSquDn69yCojdOZYqIAsF3GQk+PBrPYY0j9oaBQhCQU3FBcM2LLPlI5ShgdJRp7hGHZKUEcwpxA6WX5a+cCDEI2ZWZI8h2vRH7JhoPbG3ITpbFcDEkyVcbsT9avzA9ep5FtXlUyogbutcB+0Q5choIU+9JGgB9hWGUI5i+hbU85YeWYVHrOMfqQSblPW1iTUGesnCcUXfBdhvdxMcPAWqFU94YfVxFuSiG/RfhIgOXHrY9qTfmkwlXccCCaRS3hTS3ig2nHZ/02PzWwiI7CQno38Xd72Rsx/EyzB9CWiSNyox93x6U2zLKgtXSHNgyCYx2hjhMb7a3HOEdM8ejJU2M1485RY5wfldbmIBO7B+qzrkkq2gzT9Cuo3YxQQ/f2D4BVor3qtDj8Ef9rggpUnE3PNp/YDahVBy2qe5V2yJyRBPOQ6qCGdcgtmUCDapW8WxU7MFPzQvEMBBWPovFuP/3xuFrv+hN59w1rrjYfdKA2WirZUJLtzmb3BoVKfSC9vkRSBObFxN+0dO00YUAu4Sr19Had0mKhRmJyQPty8G8P8HHyrAGlYB+42XyzyKRImGJ+qOUSgjdGZCjseVP607dwA0JBPMYZ8mKouJW4rq1sJ2RkukLgQqQC5UnsqFeTkRX7jFE5cH62K6w7TBVfcOmQASXPuK336cmwKCLVNXLzT2EeoeShqJIwaUaWYxdAt91/4Ram8z6O4WbPX9KT6rrrYehsLYY1MZIu3XOi44w2RSfnjEroCcjIOb36jnxqVdQ2QmCUYQk8PxlHGlZywUUwF8XuRMdTK6HhtOEJVqEDqpOxNNgHOG1g4OOYgaxs4CZOSLNck+Y8jETwWbgkFmJ4RBS3QuK5H5dUY9G44fszaV+rorc2O7YTIGotxxqheOp8DU4BB71Tj5uZ59S6jaFml+j2/oEurBdfASzugzahlewfg5y5U7eWRG+yKtzOMEvCXgv4R0pi/OPO3t1msnuYICOxlNTIntc3wsDSddg8YwzxwIa7BKFambArYiNcGtLxUe407ctVzue793tmGueqrhFhkqsvOV+0mDIeWVD4oqaO9+gA8TZ3hMg+a75nLOZoDnOnTZErKUgPNcwGaQMyU4FHanmqM1i9sy4cLsoLnvgXTwPoxDhILg7JR3c8PVyeUl5Yi7Oyt6QMovLOSr2YxhEn2i4OErdmQHIOjSVuatMZKXwD9ZmF1HTDUNneJZOkA+DNau4mL42+KASVPCBou/WjKpntUmZeNmK4FFKOpIOfAo5HJs5gAj25nVcFC3b6m9lhLTiIPBbEaPT0HKl4SUgVAr2r0oYHcJlJ8174mjrTt52LUjKM9z1e9tVQc30fM2RZsDkvXfgqKxCd08ru9jEQ+ycylzhFqF3ydfQ/9NPJfTsX3UjYDqbPLuUi0jSe2xPIdSSY/l0gZxqDx5+JrIwLXbfVu1TlXUSp1OKYMzYmGKj060nVHeZxhxShvNGPSWuzHjRWY7ISw0HnoNaaqkOAQXgm9M10zMdDuDVtYdPLe+JznJb21kmRqg4SY7YXXZFJWHNw57KrbSdg47kqqRL5eBcCqgXr3fWCYwpf+Ltk2AZZ794OsfcEM7y9CAmZwtzGDX6XRt1FCfQVmo8COlAYcHPntOX9YEXDHHd6cXKyauu67Zk90/cNPU5SgeSCuzleKpyb8n+LskH1XGWQOgPPHJ36N0tVaS0OaasINXzOuEdtAogEhJXVPvFQiEOM9mCQkvhuoBPuR4VlnZt21ZlCBDCfJ9c/JFIKLifE7Q8coQWxD8jbEFuILnsYuw+pWIbPq1RKuZW0R4dHhAeKz9N405YOQtvVXMxz3VRn/cgC5YIbXwpemPJfINo1Fmc58+pV4AWy5nytRBQ44r2ywUtIn1IZ1+acrQddW5ZgyWYu2DZL9kQVyOvCGSnmQQKDmCQhjb3ZW5vJ5KnXBCq2ipT+paWo77Dw2TMzdRCJTrSc9lt0t/wFZL0uh7cU6kAJvIM2DOzUpQxO2oPMQi3B0dlWvmLeNlsLHyLxlQbkw7xEHhoMXaTEsKWvNzOGfGJaHsxEDNjtsQpiyetEWtBsKWyBQINN8JEf8xC17eAWwA3DReT/lllt6ZLGLFyHCG4Sdj7WzDIsKo3NVUchlc3aO127W9y+RxbWhe8oM/YySrwENLsTF79Fr4gYNrxEr8nINsjIG/7udZKug/yXST+ijAk2Oo+oJWJomsCnv+bxZ2SFNSgxtua60XNYTJE0XLQeGEsoMKcKkhlsn9duA2YrhX+NLa7imqq5t2s7S8YORsUQiqXImx7c9tqTwxSIVJi5kpYeNfFYin5eyS4Nvr0S8N+kUDPaOwk9aaxQr4gs18Ay0EVv0sOjN++AyEHwA+VpgKj/uXYRAQrgcNRyRbWsbuQdZXjwdTrLdHTmEaZJlUxJkzCiMVCRuEzGd8sypoHPqvIgAjyBfLFqdGCkdLwlFEVXAmeOE3ons8t9ov6T9MlhmbmGHwIMCRGxfkTo05cNIlrWzPJwy1nOtYWYJfV9IB77kwn3GAcGJ6jl2KTe7SLpKX25IxAWwoqnVBrM60+NHoD3aOfAy099XVUSmIpxDYh5wnzxVpVEwNdcCw1aqs4lY1LKTlN1I6rtpLLqZcs3YfA4Zn4tRazC8rK6yI8pbYxi7W7DbGiqD/HSlV/TMq8eZcxayx2ISXUDyN4CHwSgBTQjAbvSbDNcLKGHgNH2T2c/0P0A2VPGWH0+cgcNEKYn6bzddyaajLVZ7atxbKiZJ05n+jN6WFaYONHExcuhZ7EKBo5OXIbCbayIedtYX8FD5iXmqgB8crxgp0EKV355eTf1Ry28OjbXUw1aacVi56cBKAZl4MP8NK8fBL8elbloGDHEvi3+halScQGZMxhXtLazpuidqFoKGn1TyVhkEqGQO7n0yDPx2goseUsG0eU0JhvvkLg4lLjGXHoe1wanoeC7lOekPwnsFcKVoZ6eVpLAnuYAdBXhUYjYGAHNNQdSn3u1awBjrTebYqt9eQH6D4OAvS7lgpZN+v0ONuMWkHeTvbwyJL1ySkxj0pni965Cpv/Gl8I8Xijwo5aMWHcU2W+ofqpgYaAZf4iahbuDppvjcyJ7AvT/I4bI2n3jvUxhgGOxbSarxU1crBcWB/o3M0LrL3KmOZ6xP6laCBZBtTEDzxmS5cpXFGO/6OtJAJgyj/lCoW2Ci8R8j5yXhP4+GC5vyFuSvNBhmvg3L7NWrCDhAriaAQYCTDPZ9p4uYNOUU8jUlGeuG14M1NfZNL9rNmJqrvPiYtw+tyefqiKBgOFqM1LM8FYqknhb3jZalr3/zVGoFr4Tupk7wylRnse4IegAn0NzB6TLUBm+Pu36Rtshhti9L65Yy8VGh28MrKVEPPPMhwNTxrYXLDdJsJA6KOJA0n5mUuRL4WtL8hBu1CqRy6cSM+KOAmgMOuLWF1UMthCGt6QPTESk+ZnfiPSbeqmo4uwK9lPK/TNFQriXJyMyJbelowx+oRHc1VLt2XGfKas0Yivc11aPIVc2LwK+XTjmqIgwiUD9qbligYEvCCyFgTxMPFurwcB3d+PNJMNAPqM3Stat5esCfLYxzk2WP4LVLN4zPjWwU0inDQ52Bvmpy/LQCXsEjH/Jrvt9ldm287Yt1XkybeT4t1wJcqu4l6jMUVeLnizaoSrGR7Xc3fuG4tXe3atrY6Dc+a+MfXNILxVyfPnSZCTFPKjlRuRvc8L9d66tqca1oXZyUc+WQv4NU6TBWyupAylWlBygsDqHXFjTkMT8eEPAU/kNbXRd+Ejv/5mSWrGsfUltnIvB8e/MJp8ab/zR8XaYSGijfF1YeCZuoNUgCuGwZ6IqjV5l6PQ+/575DK0ad/HjyGqpiA4PxIplo3qnFygUO7OHnQQMHmhHpZXh5V3QYi0kqtWN91f4pF/fQmGIjGCeirbOHxrf3mO+l3PLG5/2zJrIwLDaX6cVOV7M/hpC0rJ8jZrC0BU9zdTln31zaAZEQzuS4/R9OcGKwB2jjUjDzB6/otNHy0KsD1HNLACYAhZpuVjew+DUthmOq8lcSzJKwZecPBeKIBY0OXECwmcikWWNlVjeZHqNfhMv2dMCFpeVYojsPeN4wj9F9wPL9u+nxQ20Jkn+HSjLoG0FpR6a315zZ+Q4w5N98SCHYF/Weo6Rbh3121JoIcC6rJB5ThVGeG6aiP2/7XR7OeVrF9Uz6JKz6wh+vgedgwCRtv7ygmp4JH5oVa0wXJ2RfnFzgYT1m3qvStD0kkKL1LSftFiI5G9xgzIBBw68+aFA/CqOLJmSGjlq6Xhx0tZv4En9oekie24ieTCLSCkCJ7l2ffCStBJnYrQVuww1adeyz6GK4t9mQCZjtuRjn2t7IIKJgxqnAVvnE5I3zxFQt+vH5k0n6mV8Z7o4c2MZ0wP8fNKlnJKkg3XDE58LzMNsQSyLNCLLQY7ZEivN5gGxavSeEh7upJCWK21g9aG7EWS9FDMucF3j/7sMB9lmfb0lILiohtlaB/74bAqh35pxOkT3I24WnI9C392clA5CqQtbr3rBGt2cvKqKEocHLlxzijEH0rrWQjbwcq6cD49Rug/f+KWwdAv1bfJch0BzvUXOCXgNUyKRs2Er7uzWsxBc1hxukZPHeEDUxjtcvc0PkZ2k71ZeCxX5lPYdIhnnKiGQ3t5f9up8ivHJ4XsJgzuXgOesMsrp6izWEhyXl5YofP5KGPUu8bTLqCcFya9thADpsSk02AeWmiOVu/jyuGoPw06R26PXvzeq/Rz+a7OSaPmtXGXSkCgKPYLddi/XrCCkYJ1xe1BUw4KmrRo3te5GIlZmo5a4mkDY55FMlVHMLIAyAgr21kTtlWYBiNH5nEKDLopJjFQ0pEDBO96VDsSv7H4mreBypjG1gW8l2tss5AEs0ztol45gy+r+bbS/NviLVrsOmoMaSGi6iQcp1/XjNAGdp5Jfq29JNOrM4/cqGorXCoLhWfwGtKRwsj3a2/+I8GTmmyOJWN4NYmLXfbsCQfN5WYHNqMHHsNqOPod6ylEofDrG9hUf+szPr0/L8M1WV3WbQDAFAYA8hB544t8Rwpl1Ry9zl9k/Kbf/mwYsgxNsVy5d+spuqoILsnlunGau1B6K1D4awrJ4ZmRkXcFanl1SZLJKYoWQx0IaZlIu/QCMTSft6jWhJfebzl8ly2Cv9LADJGKmw1Q7Up4P44XTuy227VJ58FCz40flUCu0JEJl0vzvKwWfmBLP13SOIfVLYFUNOzQVF7vRuVaGlMTWWm64dGuybWcbhsi0ZvbiVoe4bcQ376J12lwWNbHwFErKjHFCNLgkO+7rgknE4LoGzwM3HZXeluiwHEqnu8bx4kTqC4dp8SBUFpupHDFEYXtGKFFtZyVjD2Nm4DfoPlHShFuNnaBXZU14+J1bDrAjtnC+dF3IDcWuiE87HrKV1ko6gevCAfCjsUGYcE3C6zsjG19AeWC5xuFpzH7ExytO22NVa7zKWZeIu82UuWpyKm7kykzeSNFfg9KA7o8LaqUb8tjJGg4ie7kD1moVRjqgh1umfyW1GRy+t5Xco19QjHmq4zVQcUlViC641w74Z4HuN5vG8eRYg8UIKuDkhPfPLHBIdtq8atLz+IjT0tgYvM3z4qW+ht0yf2VDXEekh3mXOkbEQ9x+wAgiHbnVerArFgXpQVEootYCVm/qCy3c3xm/M9I0ToWtj6IwuIT3CsZ+cpqBzkOSpX6oclPNXy8E9JtKhiXMTQTORwyBW+G8ZldlOhv3Tpyxum6UoyXUkMn4i1QNc2xOct/yB5ESScFbLE5g3b9v2bn8kg1JhV7hE7hW5GaDIhC0GRiZm1TUklfwzbVwIjsCiMic6Y/CjhNevDKA9VDY+CFaPLW2a2GBplt5Z0aRIG1Qqxo9FPCFJ67zAtm/+Ybk5FhyFqqQTrvGP96txve+LkbM/pMno3jsFy2Ov9EuTPVFifacDzQ5T1c+2qcuq1sw2bCUzu4JpRSVYKWkaHLl6IUnflL6wZAwKs0iN2rliP6taMVA2CQwpNYHXhT4dvgRkuTs7JFNPYjqUOLMoEK7ENisCq5NmOJt4SkV0X45IZhHzDAucGJ9CLoh79qVjTzjhAIED5e3k3af+PQg4RBAy8lPK9+1CCFgf+Coc3eauHi5oUVpwJ0zVUzMyGEOhAxbZT1Tjbi33BGOMD25f7/w3H2nfUX5FQw+i1Pk9zy3RlPUNH50nzOdgohYb7lYJ+pzSNevyRASzCFs0jB74g3lyDc20NQGdnutoTaD+QJy/x08Tolu9xbvviKOJdskwFpk3Rz3P6MRalEWRu4wwEMzZAoEL1rRa7d3NK+PuFxmbdEmvCWH/oDExNRG6Tte6jBKEyjkkcXVb4XslgIfflA5QzBC/b+HrLPN2rXqlT5XbpEUXvpOWQgyYNYRjjos+aQvEwIVuKubLNhNerP6MwV3K1O8wtxlBqAbRM6uUMO6YQabmw/CW8bzcUDqF531hZxL6D63C+xMJrZQJCably2DFUVcv7ng1UE/FQkaJGtT41SR14LX+9eztGOkM7udKfGN/KkNFPVzSPyFa0VZ4J/Hn6kiDYNR6dL8b5CS9UVepZLTq0Xhi9FcCfGEgo1m3JBD5bGii7WTVQ68TFYx42WE88FeTwJ9jKqPKPXZWDx1/PnEOZWBgLOfsjwS/dJcf8x7K94gXFi2ZweWe6P+7JlNp+lcBpBh3JLHPlZ08d3SwyfEiTYXI0pNY4T9n3qmZpVU2v0v2m2tu4eB0PdG5HZRNF+djez68vVqfXiFXxVhn7wQGy8c2w4snXIGosAQ10H5hJPWfyPYTEAdnIISZxOugZMu84goOT0qWOJND592X82Cj0epFrF6AU1Op6KZdfkzuS6ktDsnTe5+vbKthdWYFe5hZQP0n0mRen5cUeZlUu8d6/rFveSduyQ+XXaUP04XXmTkvNydHzqyR2lldzXk2MEQa1pvsa04q1RhWc/F846At3Zg/nqeF1JTjEenrvDKOn7HY+SIR1CVpeIEFJvgpGbIegXw2y0ETvTq8x5IX2ItSZuDKAQhOX86tHh5DQZ8BnW/zn3bFJrMvLrGU9M89TH0hVgG8OmW8vgiTBhAmcnly358trca15s8Ej6c/QVT2xLHYLPBRuGXbcndpEDGMnvFxU+zCJPAZgkaX/WjkcyAN2KVnPWCxgzWk4u7KnDItB+jjFQfdpsAmSmmRo8x23xm9Wto1YqMn8e9EgOO6DlsLDb9xzMq3IqSIJG5pZb5CL1PL6Nt72qRnvCAgwzouYlHjaTjBqAvHh/tfmG+Ql8s3H+XV7JR46SkzkPpPB0ookFiLtH4i6/OW0KncIo+boK2sureI7RvlX3nvIymgEynqHh9Mta0nb+OrMqwRmnHsG739+0PsNcF7+lsYIxuh9+HWoT00Igc8p2yTrv3RYlafwIh1adzM9e9ABitxGIDN1Zb8J8ZZU6PbmklhISgIQvvC3mcWEUm/sPwqg+6L9UvS0dqiL+zZH+CleSOJ1EMvRrXUk9M1Peq90JKj91t4rGyvfWDNWMvzQexw7snF/W2t5wpCGMeR02Oi3zXPazrSBvx8h45/xUdhYFdP52guY84iYSt389sl1rpZhpO43e/LNdKyfAGk3sYFvPHFly+KZyBUMC2IH7yX1RlOwYfHzNrd4nrCMS1cWpIJTFTMudurw6axwPjFEyX9qrByNgRtknVdCvMePxOzQCGL0ma+XQLgmOMZN2nb0lmWIXFd3YUKuv2BTO4vZEZm9yAmdp5MinXFt8bdSf/RASBWpT+DG20OSFJB5B5Lri5i3m/ZWWZrp6xJZ1kTZoW4VT01qFkiwpKMB8t/rlmehxf2YPf6j3aZ7YfP1TfNDrqIo1As6UdJv1kZlaqqeXRZR9PSzD6nFbgYIBGCVC9qkSWUKWmW/KlpRYpNL1d3ugdq4wSuhZHu5dAljXzc88UhT/YWRLuTozZA+UZ8m1n26HIAFsRWiLG+nIovkhpclVtK1qgKfSqbwVCBFLVJBwWjHduuU6pH1LtlLq6gtnLHM16CZGGcaKuvhdanszWRToAqvr/kFSka9Di77JntcJLJ9GLeCXekXyDf6ldqw98ZdmGZ9emBqK6GwdQrRV5WvX1iS0ODuGVqpHilzcfre6UzhagQ+LdamhFHao/KndyrofqqA4L2RTDCv5CYhFrpyssoSL9ktWT3vLb0qhwruN6QLtweRuQCvx/vOuLbbviSuyeJBitbWMl4B1ZleAtlqnTk9pdWfdW+B9Wiex5fWS6s+IrrkyyxG/swkjPop+1u0RY79LbxdtWDO5268DQFizxnEJ6+yl7ifDGodsTCH9JRRdI6cwagOYVVOLXKRAvDX18izd3Z6qdxeSNIDzEwByLF726TmStAKS2QED1QBQWz/ui5uY4gAURQMRSaWfUydHLHCZpzyNCXI/+JB6J4dzR2MHPRG6dsXzu4KuxRcLVX0XyASv6C9VHLwmPsbfxcv3Q47EZG1GHDY3dcpwYEQkzh04MKZS8cV574HW9sWbyQMVhvGymHnGRvUo0ev4GPcyKw7ryeljEGHJEeFxSNUQK8rKQJfvlVfrKxKsgDGaAUeVp97yjHv57TzFmryxicF9y7f3b9aS7RgTGgybzfpOCz7biBiXmhLiKpZfkbAh+Cc6HVZtRcR1tO1DyMjxBJtbFWLcabHDjjjimmmgJlBhORzsmLL88FcwsoCUEnihgcydLp7oQMp1ykSV6WuGisMGMGLdNHe7LHKkvbP9rHwlZFAE3w6K88iiKSxJ8rpfvcEX5pDAZm9MuqO4QcI8hCD+3Y4GbMjvgSurRMFNw2KIksdrrNn5Yl1PTZQaFW1RFL6zPeNZao5++qYCPR0Urq7MjRrFUAVPyRjUo4u1rCJDL4VzxARrAP91duGzWKii0nrO0LFmrPE8LMQosxPJTwYeG5q5/xV7/Y/le89nkMJ0w6mQKiX8j8p5bFORWI2vgIgyzqGf5bhwHVvL1aZGyqaJwH86LAZdrTaROFwyyVgWlMtnT7prH9r4voldxIZo8yRpSVpblkXteIcUdhyQF1QcodabgkhcxM7R8vv9jDMtqbP49mc0S0Rr5d3ukewGE7NZ030gnxmGOlQA7ktbjHcp/86K59iOsG5TakEGrN50+Dl17PjmUhQqZo+LZ5VS9Y0aMcEd+JSpFzY8q+2PKajU61Tvki8LNsdFqv6592gcwM8z9U1/u7zI8iVMDSQVfCTFLr68LUSsW1F2dlygdJVjKtmAint7KNP/PTtvuP/p9KNc7rrcTFSTPPXl1crI6iEhJQ5COaegVXri6grH2/Vf6Ga1K7gUI+yziXXsJYdv6L2cutjOKhL47B9opcAf3lkIBLACJIBlJmmvGlh2qtug2E368aI2JmmB9mYGKcUcqiEuV8kRhpQhmJRPwwY3chqbeiBQdnfjx7g47sag7zNskGJQEuoconujXAKhJaEGcenPgQwpNNqUb8zVUVCFzt9hbl4wOAawJSHhCDwe6sZ8XVpei9QBtDQJUclZeq31VrS4tq67/xTv2d42fkMBgtm2s295ZGPduP/0dk+KbXpSOXdSLEI4docekAoXvYhjNp0vT+IxXDEtRE9RnZf8FnPxGL2BLL6RdFJJVGmE2ZGD8+HdeUhG5pJS53zPrnHHyAkEgY1ybyXgoNIme9kjtBZ8juefqQKCDhxvarCaoXm1TzfhnZWKrzHHpm8xSaPFYkbImVhkYNJpj3PsF2Y8StD9z9rdgUIJPf/fPnnz+w4G4lu/fV2YxI+eKWzTqISMZvgCZjAZgalkKuyAlosAHA+GEoyIOEymNofrCWWJeW2aB9SQDiqzJOWZYM/GH9LeY1QQJwiXtsp4cODlBZuPWe6LpETgfrxsPF8rQt6KJMCFnzn5NbDvsLAY7t54Dutrw5VLlH+jk2j216mPWeL/mmnr6tC+JuUjYoMd3hJmfu5Ny/ndL/We8UH8O20S62OTJVmO6Aqdf64c7MdbEgbNUUd2uWCndnnoN80NJFgekemuI/7xshqk/aqYw6wDEBB3eLKrT5m2pdcWCM9HVFuQAVjp37enwgqxo4QLrb7JWMXwqa6wiWmexCG8XLm8Ml4Dl0QQ9KokDRgHaiDpdIJLJHQFw4+FpbyG6EVbMgwZapS01iSR/J/Sz+i6ZqZh4ZXdMfEWEGCL22PYuYSD+Odkbt2YROaV6HmROIyiJeJWevaTNugW7OLi4kV+yZebqTL5y4rPhYy3aateFsd92nqQc5pLbCtK64ejfKhS2oIxN0eLCIX/kT9xZeWYpIRhCjkjP4DctdaSRtgRBDUCA6ZyGLLazOtLGPZs9nIb/nMlnJkOJQx4p9adzzV9s2wm4qohJbY8H6kpnP0KKujzmfQJzvUH3YsvetlmDqa9PDn5FHyg/2qtffWZhlu0Ekww4ai7FrL2RDKqk2lIl3sIViN0ISdyNgUAH5UUuWPOjU8ZCDSR581YKxzCYGbJbAcDqbFhP6t3VXHxy1VpTwCTzvkHGjZ4c1DEVAYsCwqryag4MODTEORh7f4FlbG0NlZVPb+oc07D0WRon9qUxOJxix6xkQiPLCaOTwNT95UlUaxwV7sHJYxoBGkndnU9/9YsacIUwutlFOECE0NBwHeHqKSJguglA40NehRmNmFGZooabtxD+cY/R37nLSjAJygnyE4rW9VHaK8jHlqQ6+CJTHKEN2i7M76KUyT9HiWn32HSEgxd45GzmjGHaQ8/HeZOOAZ62dqzDj/5QCYSZlQtZgyIC6PxGZBczMtVgCyUjuj/6i4FN4rPMOU0OG3c1s0S06bFiTCuSYxWmUFN9oJ087TVcWdQzKc2NCSylYtwMHgPZfWU0VdSPPLEHIYuue3Oq4OWMze4mRciaBs5zJdu7XftM+04KUqL9peIdT3B9iRFwNrXvAUC/ePazrybTqeKtjnm1QPEWkS+pNcHDeoA8SY+cY/rKWr2SbSvwk483wuQHfgiHbPXpge5vTTb8gqBr8xtGUWY//GrzDoMU6u+hf6ByKPfpRdPdPxRj2qYzdeTQFkgghF541pbkge+FP7s2o8RT1AX1UlCt/Mqienq6uSpzHQv9QDwluSZ9+r+fG8Nkv47EITAu2ISTTAAXOXPZSoQFOGRPSexK/WEu9+HE4hw7/IcEGd7EnN3rgTg0LnR96C4etcMAjw0P2o8fZMVqGRAO/uXcHxXLqd6n/aIbltzld2myJZVn6eLBUl+Al4zlqLUl7vY1bBg6FvvL8NS+NHjBKM/1+JIcjoWwWlJeLT4mxIDrmbxdKzEzdZZayIjBEpLpZ7Od/2uVt1Khln4vgA2kR2liNsPdVyqXcLmJ1qX+mJLaj/CkDC9TNjtVaPZSFFBcIWnK3wjEfnaM4ZFt37WyrmmWmhGIrPokZXNYdsjz5+0dOPhSiu9CkdTZiNGb3+wYbh6HDMIXtzMoVDLLZXKjdXznulrhut9BXdo4TH+Gaw5nVUC4PCnAwaHOtN++OKb224uuDUdqEM4fMGOT/C0Q4JMP9HghVFgfAjXMF6iIA1CTxmjmPE64L5aVqrShIb5Jd089p5bW2t0iM0qAuz8V4y+1wg2+S5kLTZpl+vJak/OyH3VVAi33B32HsmS5MuU5EVLcxvyO15Y3czwKAxLDfaIRlbc1MtNFMaEIN2VvAnMoxc/1vMQtwcGrIxsXSpKbGnKOmNmYTc+TKToMZqL3I7Yhmdi8zXGmOA3ybYXQFh23Q+c5YmuNejzpO8UINPP69DLdDy7T/x/WEu2vFQ7iwEvnuc9On0LLdlq4lAmFoFVF7CcDHqWt0Vz7tMHW7WAxzpdRoNmv7CfgGe++w29H22rqf2xm2bzwu2kDS3sSVyMzsfas8HKI20M+5SNMnpzSoZF1Xkvun9glClGLZoB/AEMOyTkyxjSaaenb9NNgj/ULCJ2Fms7Xf7yRWKmLUXO8CwRm1aFBfXYrl6ZK7/WNrns1YrGIopEPyaYVnj+q99NG3z3IH6U7C3qFQ1Pqq1P5Hq2k8azdkWEtahEA8T0RRFDJrkxy+xXxd5zc/02Qc7M3dVZqUbuzwVhWDSOGQeEwQYz7h8qMrc6f8wSEpqCscLHg3dh4yFAzwcJagnon+X+gVDC9woF/yojcYJytr4jhM1fIECj7oF8dQ9hELq1CBa5qjI/KMwHBx3Tp/5Rg/OIAJfKcDkOJ48apnncA2Mf+hueAqad02trP5WpL3UsRjSjNyB388h12rvi6ZbBx5K8E1fzBSQ7zWuajJDw1IIOCqiI/4xE3EeCIDT1Az287q1hoIN3+jZ0afu6QTmpEEwl2GCwJ9Q1+opaFIudFzfkKYjbv27n2tQwMPMf3TVpZaDrQBOCUsHXc8k/1IZPcLyr20dPldW+g2Z8FrXU9h0+Vp7gkpJ1GpIZDjXZJItokW7w6aGexn7ky7R9pGIzAxkB5IwFG6twqYet5enQkCy8yRBSowzIdM3Ur6H65w3eZ5ySsnilZS2jK3L+AiSYLjxCv7xfXEUUvNey99vtnjn23pdp/uSHt38HcyDC4epy9uHGkB4b0nKirYWjz/9XLPbn5fTnuphuMNrbQHhyF7lmD/tn/j1EH84DZPTyI0hAy1tGnczxJj1A8Ya/HlPbYb9w8IhPhH1XzQ6PcIwho9qvWxRNS3sBbOPkq8z2G6tBVDDaxQXg9mK+CBP2YdtvS4c6ghQhY1zkrJuzyHkFn2upg0L7rn6LRaCIdNDo9/Bfby/ACZEQSJ2/hS8+5ue/N4XyDpUxHahRFTX/QrpgSExgbMrf6yXHO6VGyCBYpkePtuB8Db2w18ikvWyegcmFfa4ruND8KWyikjmQnuhJdYMwslzCj5b1Xm6q2GgqEyuEyLqQWsGi+wonbYA23kWypSbrJqBNG7zl07+bMKPK7jKEIglw/GAV6chduQg9Xgc4xRuIYjsGuq8dATpQtJBtT6/rSFfKOslCUg7mhygV6apXB41+UaLV37tyRzPW0heQVm2gfY6AydlzqS9dsNjXBbs32gLxYdusTinvXVpq5b6zS4W6aIVAbPaWO6BXq3oWquyyF48IUNm/G/qeawwtoNz9XEyTW+pranSjcEvdL25H6XXph9XrXjDCCR4+K7ZX2pCDbgnM98l+FFsSFxdKQQpUIuKYsT+mhOYAOHOqdOPNYVpo/5JOnOpIExTtaChNYj/+Ekpcix1Qp7z72KLMygn4VnfripfVOPpZiO58nQASxSpKb8CpevN9Hlwn+6Qo2duQ2N61+d9PV+nQPCagMUz69v2/jLTAT7HEpNK0rasnmcvNcnJ1ESbkaDSJt4JBxdbnSDSzQNa7v45BnRfOSqDq3/L2uzczL1wSm3a4aU4+Jk1/sVUxwUlin3HFJt4Ll2AFZ/4yxQVgcZZB0gfGLaiohQp5+NTFQIMyGXt/5aWvKFWY9AQpIsHTA14k3fHfwIptYOUffacuhfwHjm2qd7KrDK2F/Ecu5Wyt8JZlMdTFsijLBRBOzKYccqaLfqA3O4IjgX5pnCFHubnXfAzTDSDTMwTxOYWi1bTikZEq7ZmNzd5NBst5xCtO2qcezlEt61mZ5I/nxsk3CfpkCO+6WMx1teStFnI/fwXzflTGiHsV4Bi8ogqbXi7YaHSzKe9NRgvBFUQ/pvIZ7Oc3kSDMhUgWBKEX0Bz1LnkFzBqZcRWh9eok1yxLuAKj7Xf+Ft5ljLZn3/8xzCGvv+YvWwiPB6B/7NTP4i0BQnVC2Ape2tBp4WnfGwqiFuOf6fCK0MYc39QSYKMjZt2gRtmlYeiVZ1odDvy8tNdeAVUHGQKhJwCj5Dw+1DhbDHurT58Jb1m6VMwEGkACT4aKEMCqHQf95qbvJmyDdfXYiEU5na4xhPTLQ4yXVXI7X1vkcSn4E1TdAXxz0i6NyILKkMVoFuwPepcrcYLS4lAIA/k6uW3Hafdqc2XmSIKBpzoYnoaUc/PbJACRUnnIpMLx6k8dJ1Lb0/Ni+kPePR1pmR/jORHn9S8EfpdcpxDyg/EhVJIGCrQhQ1HnX0yQW0YigGVQBoz1fqN1PhN7seReSOof87AsealZuIy9599hYa1hu/ZVENU5j0QIrR+F++2Gc4phVsAhF+XY2Nqstm0JKXn/N3OpBuvigR+OtBqmh4LRzoB+rezqo8vwfHxuC5H7dGQOBzPnKK2L8V3POcHgTQ6MBKeRVK0DabezwjitoQuVucxFBU1vUHX4YsjtONBaJcnPj9D84HN5nMgPymr1vgsrnEa6TxBufkkIMU3cYKYdRR9PbBBwgt2UwY5LP7+P+0PN86NM7LH5+fzR8j7iaezyGsJr8KUCbWUzA+epFxW72tA8btM2OgMBiVmHIOCmlsXwZHkNswDBRW1qZpmXnOgTDNdQQtkJXTzA5WD805aFsvu9W2QoYAyTDqvAx2KK3VblvMga77BkK4EkaEaG32SGkl1ioxKr33My18OZqB58KsPurMY38R74zQwEp2IL/3YYPN/NCylkwLQajh/+jIFKIHkKRn1bL4ubdW6rs571i4PA3cyytQSlxp+vl0IlakVaxUKzCYGxLy8Pv16qqdXHyOJkENj2jfdufvXNnsWH4G/8224+s1gtg0jqfDtm7yC6KtBI+HB5Gqt07l0R7okTPEfKwODUjbMUuXJMrI42VUVDOj/CVF4uGQt3bew1VWbOsZijNjH43OM36XMk5M/dywzBxcDVkj3vOS0XjLTF2+p8lVQNyZ6HKgRf40far4qrDfRBR3U13p9E7tf25+zKC3QAIRbThC2uULgdErUW20QCiuTGbUN88r9YtGNpeetFFGFSFrmBBVWYSTCqRSWl4Bz9WTqxMnhazkvIelhykeAKA5Yug7Z20RA3KweMSwPcEgAB9uId+iQUld3tWdf1n/30L4i3qQENgt0Z3UZ4wMNwivrotUM3Tpri3cXZVj0PmcpNv5GEaEPGAWDBT68lIJ02wU6Ay0y3L+6iQ2HQSe1tmbdHNTnx/qGA4ld2eCl77GO0w7gWqlHu0SLOhRN5vhKqSRX5GUaX87QCuWQSj9JQlxNM+WGncz9Pgh1yKE/Y8zxPBi9eTORsAU0w5LLwpJdST816UmBEKyBhwVM2AztwRrX/Md+dpNXp6YrEB02EcYMq3S86YaLjdbc7jIjKHKZ57NvrM1mrRMkpSsivjqXGuQNUndPkozhYZNU4IhrAX328EbqZRz00t7oTOrKbT1bNOaEaTB34RlnxZtgxA0SHjxqoIOBUMFYmudpHG+280X/YAUHuS6jKCjUrPsiEGCvzRPmrQM0k8sUjOypZ+Uv5zubJZD8BRiwySqwUWeCa9qoCgO/N0CywTkH8QK+FYhhjbCn1mTCx7V8iuW1bwamHVY8Rg4dnPMiKCMcTKpA9MIaxh+ydiQMN6DNw63y+pPGo8GLeODT9OYnZLzsYaaYgsjyfRWaNNIPKd2Ztm3RlpUcH7VN9U0KhOWpwMAzxt0OsZjlZUvfp7wGBnughDa0yj+nomkw/J2RZJE69kxXh0qpY/nH5aTnC0z38R8dvGi/8cbS7m7hKhUUaadLihB2afxSs4ybmcz5SDcH8lyU67G75HWOmuDxtgIu8Hczv2JdkjcVCFhCWjAKL80GNA7zngXLKa9LquFcXu35ESc7INeISWAtkzrkUMMfPHLiMKyH/DEgXGW7pnbDM2oTZ0AAANdQZokbE//BjLtRTe6DxtFflLemXigtnZQxhs3NKTh/U0a710LcZrDgs0pRN8hUjo8lkZ66xKxZvmuLcdvCXMYU+6GIPyKU2gMbfOZTJ7bE5we9JgzNoOU4VBu3a1AS3hPdUw10KNhbjEqG1wmTjqoSYgD6ThN/iAeZcmWHsXoaStek6hRWRGuhphJzRH4SkvEUJv2d7+IuEQ9cZkhLl+fJyH0deOQuPRlCF+ZtsYZJokXDCxoYXZG8mfdQTRkBqAXiT4e2Qa7oqBp5ANcN7G4E0wY0JmOtOBv5svhpgW6aw+/+t+5vKytZcogS77M5X9IAOiBR8htU4bTSG08C8jvEzybV7HzT+aS0IevC5gPp/oyAG37D2Sq1I5yMrkTpq0lpE/ARC7efOzt4OhVmVV8XzqVZqAU+6qwv5ML+mcrRP4Q7v4gxKTIf0/T29jIHt9QL0JfeUErUGKI7Lb7U6yBpzeFQVVakk0ZbwSTEYBx/LOaU7gFVeJJomfnkSNp5xjso5hU+d4xq+PjT4Gs3Msm9aJHrAns0o7tWtbWUMTcC6W/h5TqGr4Ea4KgUJql+WzjZtV4PdEXmDUJpdIMOdNq8IfbNBz+eB0vUc5S4zZRocw/v2webeIVVJflZIoO+hSnJZY/dgtS+KzRHPrY2dm2ZFGFxRwfmb5qrUdC//CnN9ZaCJxuUUnnpOqjXEt6SgzaxGDkAQiS+c8i0etyXnG/yn2AC9AKJxcqu//4a1u9/sZbX9Cl0sUEzskfFT0ei4S9MbgexfRued0YQOFI1aa7PwjOb/tRQ/KW0ve9EVXUvEeWlv4EzuogPw3deO5HXM+AkYw7SS9I/fiQOqlrrUcVmm2sttxQRrHCPT9ud2u9w2FHIZ23+BNIfjGUWuW96SIlLTtkINiuROmcZ88SRINKzEhx3hmWrw44YiRMKx6QaPNbf5Y7C4rPz9BCG9VeRl9dp+lH+iTQrpOrgDtQQfxG/lQBQDeDCbMNAVtV0Qjb+4Merp4XAsrk3NIahNLYJPzzu/nzTqoc3uCSHtO8wWVWXlk37wc2UJKOqgkh6lvJpfBSeEt2o5yhMg5oOolcw70mGWTt6Qrr3+6RFPTKP/uCvXQWoW7iwMgaCOHNPdI85so6A8fLFpPHXEmBXV/QAAAATkGeQniT/wAMvy1goLTKn/siGbHn4LOwuI0sUEopeoMxZjDQKyZ175Tigd5i2MUnuimESIGe+/b22ILNcTohTKf3VkvjCaemc9Rv8kUEgQAAABIBnmF0RH8AA2jUWkDiMaAAA9IAAAARAZ5jakR/AABsYsG49p4AAUMAAADGQZplSahBaJlMCf8BMVW9NZG/bvV3AV2hxqbIkwz6I4R6CwRz/IKgYdcrkNeBuvt0pi2utgxwJZFw91FTsM392h7TzRDmtSwIjtk9i28L8Z1v9O9Pzi9icFPDRTMxDlwNMsoeeAWUEL58Hj3zrqrelhRySptUzVM+Z/Pnqu7Hwqupecd/QX6IokeXF0YgxveuCTXMz9wUP6/TAf8EVQZZQfBuO5/QHVi/Tw5qPuHaamXHq3N+wlTUAFoWfoN18eeXlI7Pb2dJAAAEfkGahzwhS0TKYCiZfwAGFX/EGX96G0YEQKJbvG2f6Ysk0ZHl1Y2vqgNkqdCU+GQJTXjFnMUINoXKGUOJ5Z4z6AqEIGvYN51NTyN/e0aD8MzpYGLyfVUzT9PFekt4o/IArgW64AP749/JQGL7Zona5rr/SBW5eMR2OEyGfki3MFRtoD/Yhi4imhcmUjWDZ/E3gUQil02MlnMAUJ5OS96QErr6Lz+Q25AFK9AlsIk6OIC9rja9yO6Ewud87oynSoc4A4KpXuUP1GL+911DAlQO4yVO+RSgb9djMPf/pqmPJiLP8lR3HH76ss0Ydp1Zzkch913Mkk6Q1EKSH/Ve3Xyg8Dh66q4sMVKM7G/lPBhG83kGQYZr3m+hfyHgYCyvU6CTfih1CkHp/AlvDxOhYW2kYKjHybbvPdMZGZ9xmyfeEJ0KTEVCy/9SItQJ5T5KrbjSR/UDRg5lCU7ZqoHaAxrR/fpyEqpLvn+O61tzgaytC3vAxrH9rx4FEOCroPj8AbGCG6YZ2yxr2tvRSKwwin1CxGs4fzLlYFDhTxAkJMaHgfV/9G2ZTUGaDs0WBzhns74wN9qy+9qW5EWA+4FaMcxNU9dPN7BdI1wg0FjkK/Bl6QWeF2PXGigSx+4y7AtiUT+d4P3fKYYw3I5DJQGZ67u+p+Dg1cickGZ+mSDob+ur8xxAMfD0RJmPv0tRjuR6rnVEyg/dkxholXwIy5YwgQ08D8pfmcmb0NRA6fhfIFcSPKqMhpH0xeCe0r7P6KZxF/8nTN4xF5JbsF66eCgf2Oo2j1x9oZ3u15Pf5Z9JLFEgXrnKw3tboq6UfnkOscbrsvSyQwO+qgZVJ1I7AjK8Cnl+vIPEiUj9OL3EQsVQ9l3SM3Q7EjhpgEnf1kNBqBOxGR//niW5/w/QkVdjkmm0vV+IXF7qPmKC8+kn1FBt7dSFwB2+N9Ru05tLULa5H40q9scz0YR3XV2kTaWgd8jun8cflb2VGnrBQEs+4tCJRtlrRhn7nOWe8pig95oO605EfYsmC+KRezhnHnhlxXvUv34JWAuiKLgL91i/zwe6Ps6jAoY0bX9Ivzx+K8KEN35S01gz6ccOsgBZQvQwkuZYwEcZ2CGyAfLeIVEBqFRfNanWPDvhJtqWMiR9ygzSV6qbCvLF3+CQDG/8HVwHSxZQjE6Yazy/coCq+NLSiXSbTRR0IexQ0acJFh/LR1UV/84I9NufhuweT0C4pGH+Lef7TZe8LuTd1j9GSQ6cRrTEi6HIQf8I+vVpXXh1pf7tNPEbyzQemH+LuyI59P03x2g4UBgwoKpDkDtAZVQbhdQ4vsAtI2vO2H0SnNYb9p7wNKN+7iIWkXHkbfpYLmlYrY45fahVO3C7ZtJtu/22OllhnnVRAarC8ZDaz/+kKsgp01FX+pale3qzH0Dt2rce/JST9xKDpxlC+bhd0VtEB0Y3k0qQW1jR4IHJL3fjp8N8C6QiCJ0plcYjE3LM+PvsVNiPWsi6s9qNjtJUAoSk26oFbBvrASxT+jncLWxw/Gy9942TLC0AAAAZAZ6mbkR/AAPHMQWUVaz/mqZJr/4QrgIBKwAABmBBmqs8IdKTKYBP//VXOgV9WAMXCCO4UEsJWQm5cf5rxyO1oKXqltRrUS1XI1z0iiCR40Yq2Ci8TlU7lH9SHVkEafPMQxepD5zE4auVClCLKK3An3CCNWzr352kR0nlnTZjiwLvisp9umn2hs17JSu5GJKCd++ZXK1sWRbbjOdOzn56sQcNWd5DMkkzv6P0EU9zZUvKc23QhcwOfVc2FYQ+AS36GW58lMJorGT4WF+6jlzbWcs1V0S24qng7+mUpEc+AWN4ED+cRbOSH8en0SXyvJZ71tc9ZZHBQDnS6A3XxuAOUdB9IvwFE4l/rIXwWOMz+XB4dwZgaSpIsld7HExPI/+VT00qjNh9xkEgH0oNZYbhEFVo6iBCeurScZHXY2QZj+Wsydg8Zit5Jc8vz2TptTEbN9aBB+gckGghH/jJtnr/Q3WvGlFCzG/dhPG3rOxfS2DfWDtmUvZaVr3PlTw59y4Nxkrfg2PeMSwSxhcwul1/lWiuEKegvL1H93N4yLeNwZpkIcb2wW1g+wN8h3wP9fSSRMGSWvhk98j6EOxwuPQvG/78WJ8Kq8WQ8Ea2LlKAlK5FhgNqXf3QzJ3b/JEgDFFXspIaoyjqyiK58nSIuM3v9ScWBeya2nLmxIACRBgc/aPNS/DhdoWfz4u/BYr0FPiMct6TXHAvqn5KQVTCausYzcMYqIn4dPC/HvIKNkaaEXFWgRqG89DXZGFjTuphAvDxoorDna5P+GyPm/QfEXFeGkEf4NXRKUrF9HTtbOjKiecafIMg6MhZM95V2fg8GuqJvYg9tX5liBd+IRQ2vT7kcxHY5I6AJRHN0ndV5DFPJtodQeRt0eH1nOKvU/GyoE8DZzHKLusApXaL3JkEIjxNU308nm20MTjlul13JX2H/CVAlNtcTZgxW1RzjeC5vLe71feyFB6DqtzIk+VqSwq+iBI8V3PKyD2qa38ohn8Z91RpgD0Pl7NMnIHjYSzf2x7IwGB4i74jBDF5T9CDVIsGvGl9anRLzUf4EaUuXBLcD6ZanCP/6kYDd4SHYC5BS7kfG71zRogoatjivutsOmA5Xo5MuATZJ4oyUtB2k8UPaGhK9zugUBLpsW+RrRPuw4AMuxBSfEcHvt41pRPHJVR8rKENpQZQ+802l1xDhdmUNhCS5BCV7X1pGC5tnw3awd1rBh8N6CDp17k/CCnGbVugYGLDu1T3+4F7ebRHr9XmJcNGT+RgB0OIgn+7FKSJZj9cnlvKoXCQkFTnDWooEc+/Abcfm+GN6006PrP5ECbtY10gHMKfEgZqbiHCqiEx/VJtxhQ9tUzlLQMilvsJJcbhBQLf0bcuGLq7vBIr65hdMwJXBysAm3/E/Jl73+8fp4/mSktXP/ul9o3t1H+X7WIwFqJ0SWVrE/jDQpeLNq0WgE9QDwKWbuULxdQOmKzZr+i5oZSfE52ZM6ZGLXTzhSXCxAeD1Goy7zEJ7emP8HW99Jwj2NHrcHR1dAjq8IDkgKmUwyPcuISrEb5VkE/oYrY7XBTHUO+XulKBbKmOz2Cz8313nog02087o+ONnwe1pxp0v2xiO2O5vTmsI4mz3zzEE/pUmUKfEkfw7GGvcdDbMELEH18CU9OP4e01TEF8rLSZ+bhTy+oXKuS2x/wWzpbTOefR9AfYhzmd1axOHvmoPLfHTVOqEqD3DtL6p9ZQyNJN0OEQBc1wMzdWSkKHgmrb8BJB4vijiXo3tq+MTZjJN1nL4frwZxp4UyX2cY6PTQZ+SqFfn3FNG1lMDO2JmzLlDTxM4WbLNBCd51b5afssuaGjLvQ+LYPrNUiJA/gQx/zdajB9V13PRLDU/oWgIZ0VzE76bQU4YaqoE7tniTWMVZobb3ZYjcwecpdGPDpayfXmNzi51S1l7QxFFtt3RL0tVNtS8aoL9OTKWzlNRuImL1nt+vKGekF8mVeJoOkNIULfLZ48B4wB118iGJChjAhtzlp9okExLj0JjI2zCxrvtEu4YNtfvCwwJ7Avs3TAZcVrz+24rJ/SmSNwne1JnHGqxPxvMa4eBIV7otICmm9MXUjGEuwmCu1kaLGl8DhqopSE3cYyYKjpsOdcGX98FMDn0CAssBmiGD6E3WLh5pbjFBBAXFz4lg62OJ9vuqrapBGMmuebyinXI+MFRnMx4aTBpOFeXanlcjTutXPsFiAAAABRQZ7JZJREXJ8OpLSHlcb09jXEvHNMN+B8aC6uyZ3LYDpL9nmbNVknjOdfz3ktm9rexQ/mJjIy3jh3aLGZ/0rXeB5gyBOFIA5JhuNlDNOLp6dMAAAAFgGe6GkRHw7EwwLBP5k2z+CQASqtpZ0AAAAUAZ7qbkR/AARFtYYvzDjD4364BbQAAAPHQZrvNQgtZMpgEv9lbBObcx46wn65N0zyN7wk9K6kcHqzmU90OhiOkozjXj+VNaXDig3/h243GfLSTTJvhbV0zr1Q0wIQroN6zU0xH5bC0tgcbNn5z43BR+I93xDR/AWGONUEqMdFw55ch0BjPmmTHWLrPCHNIpBHvQJR8Sg3oJmplEO+TnCX2L6DjqZtSF3IT+7mmF4n67Lt5azwC8kXBBDg2GyQdS9T/MN48GBTvSXeZkWobzAHElhfKTnET7xHF4C52PoZ8o6Lvq+3n4T+oCbhcBdZMldODTHbxKrUKWEARtY/p1mQWbh8rwrjQen0Y+hPdePxzsU2qS2UgjfX7b44+fQjH5OiDd/oltYJrwetCoge9WIdfcx6U43ZZwKF5hReGSYFKe17lqk9ODGizzwDhc3RT0gq1HUhYAH2TMj52K5ZYm8SJNpo8Ifc7t8+0bphorVp/QyQxSnv6kb2ht+b/Lmpz31DvVgn+5n0KYW8+twnZYqptI1yfz17IFFHBZvMqnTMS5hFtgq6YFvX9k0fjMLIA1tX4OJw2A2BPaQfa38oTxUfz1vEdECzF/DGDZiuWkMsfbrXx/9X2ntzrog0y/eP+U2uF+8MKBXWlY2oHlTWyTX25A8D1oYIzPJArZSdJuaQfSyCsyVbwqSear01Xzmm9v+A021ntpMDFSwUFM2FRPX9hMV+1K450r5o+4NYoSwVYE0OLXIrLtC+QriHHlHyJTMxmU+00O4lLzWNsF9366/gmQ4J0nftI8bFsWiN8MRnggCDDNo17Jh2YVKMoOACUNb7PN6E9SE6ts5W7vI6Tn+ta6NWA/oiE0umBWTVNeVWjAzXcvGD1ezjNOjbUavEeLXs4LMMW9dg4ekB9J1ZaZ2Mt5hcJQlOLMYlSf9RiIzezO5RPAmGRtG6+WDgO+DzVGDgBdFSNcWh2B1i3LVrDrLzUKJo9Tj/SRkOPFwMBHg+ibgGtWGMMEt8aPVEj8DZM2//0ddIFa3YJQDtgMGZX2cTS1y8S+4TLI8hODua2nbhbv8PvGkmhLpHzHWfy3buXQ0OqUN/YXuklyPNfZbg7NhZyFc5jgTLUGaoP35tRlox7Mxy6C0bToT2U2e2o8lRnMjhzDAtHGWTeMP47DWYWpISdmHbufrGFz2zNFlRp9n1NF6Rn5m4yXcUq0omySF07c43ewmRIaPzG9JjDBXpE6BaRXgI/SQFTZaHiDMlNeqjE1sNnnO5ZEukcMwYdY6LUqvlY9Oes3dv24AALtdCSG0eLA53l4FXtQTNF78pJsDX1AAAABFBnw1klFRMnwAAAwAAAwAdcQAAAA8BnyxpER8AAAMAAAMAIeEAAAAPAZ8ubkR/AAADAAADACHhAAAJbUGbMzUILakymARftYLoftmmFbxiI4G6jlZLMCY4y75HAa3lkDjA1qpxsYlFudwGDxxHAPdxpnGO1iV5EK0Ry/9m/EJH1weUPIdS5hFDwaaQaSh26DtUFi40siQbQjlYj50x2Yd9FEEUz7GV/tjQYDZderOwRzevNIZyceAU7lWKoATnYBVviKy+mST+CsVfl23fvFVB+ej9LP87DHe4By/zEuBTppRN5D5eoeEus6mGkuFCZOabjnD5mt7RxBC99WLQnItlik9BodRtShEvIRXdVQNMctz4i0ZQeUiv4ts89juymkx9jD4WNtT0s7ktVMAGzsOHDpfucW+2g9jbwfI5lU2h9ocmYyNGmJCaCsVlzAsG8lolqjN0rKqslfnMqmAHGTvPdU7hgdo8gtwcoqqfPa/EublsYuB1RGI+QeqIVZ4mw2c21bWz2JQxqgt/Qmlqe2uc142OHGQMqOkz2fhkNAMR8QfBiay+Cct8JfUy/ck+Ygm/vDCsEUqg2TZS3wzanS0sdlhPlUIAqZJG6QeAQLuP3ykqvwf8jGI2DfPmWK6DqwvvcOEzcKRe4JK6lIHKSjFQaYFiu2vfdsBYTe3MfhtGBiuP5M1Kt6q2ohNkWg3/ZvwhWv/wNNTBqm1sYsI44DeuxE3r0GanRqkNT1gLUbN2dHZUMH7cHXOEzyjpSKjGVWV7uP9uwhY2VYmLRqlyMeou1etjwcEuCgSgf//a5xn8fiPtyNWRtqk8zNcBNjA6wsWA4pvqqhGq9aqmkLAIutZaM5UdHXzhQp5ZTekPA4di9X5LS8l5iFJIw7viWf9ow6KPVcjxFz6S9HM1Ut7ynRofBt3xSUnweiGZGKl4vZ0cH56Cj+86n32llWgkfHvd1Wdg0wNqCCt4pOimrtXwmoAGLwR605gFegTo6xMbeRegExV1SnEQzdYSYCECJNj2kM/Fk3c3E8qfyG/14VQZawvZF2cGFMyCaFOyr0pzaJCCfJTrJHDXcehKGKI1JuB87zritzD30w53LSY6dgXFSWjUcFoDBdRJ0gajUpBHKT7fVvWpXb9h1aOfmB3d5uNZ9vwyczAU/cHtiU/5QkeFSU1j7VcFf1GdkLQ6AdnmgmtRtV1KpxzYuTr87E9zVBdF8J16Gt1BqyUmNTlpJXWvJC4+2Rjppa/cLSkXGj8AF0+HZ/pRVXGujq+lLtgh+4I93K+Ztcwx/6Ghs69nmZ4Yp4Oo644fSKlthira4iKIpOTW8b1lBdbnj3WRgKFfBTjg7m3jmXy9BxLLFGOueYcKG3Xbh6dX43KMUY0nZmahWViJfwor5SPxVYNgpoD6UXIjGJtgLxFmloJ1H8exGNO5i0FRgbtFNJiAhdRbuKmvLqVbceKNnmuyZnI39lLZD3rgXhk3K0A8Fd3NMfE36iT4vhwLojH1HZ0FoN0orp6yyGanZhPLlsj/ZKdc1H/O4RS28Ene24Wteh34b/8am5WvMVKbGJnmTgdcvw4VfLZ5aOaAtCxc+TwJxG7PJwvN5HK2sIRgsfLpOKFWBy2SdPk8+JK9z2Ofu9fuMnxLNFCiXHI3ISjdSzozs3kCSIccU8GfUoeRTMRxblmJH7apgg0V3MohqNCy6jWeIBTUPo2w73s6VYc5H1a5wITNweLwydVJc9SUMpVE8KzjdyfthR00YIYd/P78l6i3RrcBHMBbOjnAfiuHHjBjRoBmWaV9YN2kAUDMbPIPN5TVlFN9xclcjnKXw+vUmsCq7iKG8yPLREbKZWx/M7K0/t4oKUoJ9ySb7ofJ8/0r4lLyyepC92zozVTi9bARSARTxgbBPU5/2XULKEmBoCbzG9mbfoEArnIf7m1R7ee80GBASpIkLt9saSt/Jsu4RpziObaEtFa+5PI4XMSdm13I7M8ZeJtm3dfnj7Lg5+IXeMNeQz7Cb/S08ghDSWrv5CiAgnWCDX8q2odEp/qQLwjOL+QdEvVxnBk5Z9NCSKBKltMiW/cq6M2clsXrMHNux9776pF+rbeoLpSgffZwgDdcjd6yZW5ou+2d6G7Xrl5aTX6DTzzVe+Dqwcljn0x5Giry2iVugUqwEk2ksVjVEe+g70uJzxJ6C1FGR76IZWosZVLwiiW/7bMQ1rBquA1xmGUxrbw70pZoN8De9muV12O0qG3418ncsXNY/4L9vG0ehhUeAblVP6xUQHyc0Jj4tSkucgLc776bKrKkeU39x913gvfp3XZKDowqJoyl+pvpN5KokkjzvYTKFqQ7PORAxvGjlpF8wsToIIyBpdfA2RggK5455y9aiGPyPtS+XTTNAe76OP42lMGliFFOGoDJqiRj1iaku7Ocv+9Q1RVYrQHApjhqqZH6U9MILXJ31+DdJWpVv/crfNRjz9ip0IgNyEDB6ok89zftZOxN8LKwcAvubRXnHlRHOXtIYolpnoBVGMTVKj1Vk3re+rP5FpJLZncNMM5vFjeLZUQ+Cb4AKrgFsHVCZC+lDMdrN4kPWksjsSKx3bgOSPCmo23HVuqOIcAghaBHKPgleDsgGwe1g+WZmr+k+dU+H9miv2WFCFd02KMfQdi/HuYmYzWMA5EEUhHAq9Vp9UP6skAdwYWNZr84FEfn/PqLTcoAwcwgWwTHcmiyDR/Ck2cM33nbO3/S5f2sdXlgrkfO7O1lo2SxiYE6UgGWW5Mc7ASW37lNOe3pvqZ5ZpvT4T0Cy8jB3pLpVf7Ynm+Lb+TQzrx+jw4FPv9KpJR8yiM5rZEMDWj46n5VcNHN6WF6sB9pzKGnrIc/bueZm+8vLlsdGA7PekVUuIRrq85+gUGUgY+qxjKE8T7OEcbruqbLCrempBDYlcF9C7lcW443KRNm+FEQqWMFqMev7NqcviXjNHORIFc3aHsvywHmAZrL8WZb8AUKn2ATRw59ddOQ7NpJTFePCr9jjeS2K25UUwNKa+xb4B/ETCT/PG2y5t8V2+V4anxdAKXVYnGQIAOwrXUlEd5Thjuy4WAMDD0rWxubkkA2qblIGMcqDzut/FhHNeKulR3UOM1RuYcS/IpPWfMvePkKA70DqjoNUxIHAKaLL908vNZgxXA2Njpw9uZbN3dODasgpDBIyVbIk2GWGz/WFpqysDPRNxrgVxZ1/NevxE0VhQ4Jhy0ZAy7/kbH+m18080QCDfqiyumLsZvCtjYJsdywkTDaEj0YxmVF7j6wx3cOIQ683GEcNPAK6/8JyS1u0Bc0GTCoBZgFfoIAAACIQZ9RZJREXX8NfGP+GtTrtoivM8D8v08dwLqdMwSg/Kgdnog6jrLqbHw+hx0QaPOgypJG1STz5Z3OAKvV7MwP6ZS+SItHYgFFJVf7xUu0yEjI4y1seejx/16CmmVKCm261GV9sAeeQPHZoQ3WXN/1XEsYW24lsRqWlbMsihkCv9v6xhi2/tpxgAAAABYBn3BpE38BXV14ABzaRJTyMIFWLFqBAAAAKgGfcm5N/wAEEscYnm2m84aFtEWgS3yGO15CV8aVV5fyfvOCC90MTKADjgAABUZBm3c1CC2pMpgEX4cAiWogB5gWmE09Ce4aq1shFuLPMlrYA9KDr0vbcwdOecxdwwwOktAPhoXklUcphBKtMs231jyQ5RT/fnQSVTei8CxNjqYopdRu4xEE+tNDGQ390dm2UrnKIAfZwhokhoZ3p6n+JW9FcCMnm7hVjaO6NwvgP0JymJOdBjEHvK5Mhe95AoO+o4tNjrIEKixIcm5ZgjW1QaS/aBGUOmzTGOnvPR1I+oUSa5H/NeIXgLAT+VS4h+EBaNGER66OVb/rpBLFcEgS4RwuXkyTINgULqARfSTYxlXkatxtcutJ08j4JAr2us2n1ZhT2lb8dq8JeQ3snzFB2v5MCxWyniw0CHl6BsPckv1ZKOHpnUHntgNj+P7DdHdraGB4FP2hMpImYHFQRPlK8whmVBFxzuuTjL+6IfX1r8bQNOWvgZyrVNCgEDS5eh3CousFz6bh3vEfTpTRTBSfB8m7OYJZc78xbhsFuBcEhgpxYWKVftxzhvWvk0liFc3XzufI2O9rBeWayOskYxo9hDUrTjwfEGl15GYeqOxEYfYYd3CDnm3iez0R+vuzL8S8C1ube840MfIJyY0gtH8f0qUqFOVSTcCASx+lJ2KAefUDYVb1FChRg7E28MZK8/uqy43ewNduinTCKsg9Ei6MD9u2LYSt7ry3riwb/uAkyJ9LmCMfgO9SJDB19MRf/Gp3C8zEO+/+BG7qB60Lqnj5O0IyuGoKGc2f9eGolznXeBvirCOsCk61RjIXTKsiY+X7NBvxuo2YgTjD5koTDU64XUQKgfYa818X8LiZtGJoioTkleC7iJP0ktD+KSk3VX0inJWa9Rs5CeZahJIR31UqoXI9kM+xEaWl2mNJ0g+Ht78qY8imP+Ae5j+f6QWHyBjWlc7XlChpmBEvilm+i7iYfsGD4MMASUTUMIp7rjLTYvkgY+lrVha8KkVPv8qE9uGrVM0ZInMpqCIw7/5+icYvxHFoeO37rU2lwjHgq6YWJphXUY0L40uU4Xeav7VhhRAOqV2Goh2NdnJZ7SgQ2Q79kLSz65JPt23V1qYDK6FJ806hVa+3BdeCOpJ6oWQ3X1Qz7kvTT4TBwhWNVSFjg1Krm+2HaMZXA88dZiKSfIloNbrvjLCP+06D8hXeBWaPIuJFrszyQocZ/wwaGX04Myo1gkhGw99MESNGAVcwik5C53B0VfsSY2ik6af5i2L9+rnP4j0YNNPnnbWU4h6+2CChFivZqLWGgu0vzropTeqwXkdWUwD14D/5RFmcfXRPQNbUpNMwWHEcECIGZMCjb9rI5N0Q/h/+a3wEUiPg9dWLmC21NnWXqREizbJC88iKUQwKRP0GWnd3PQG4jDFJnsa3OR4ETceuYaO90iWKVSAfMBGq9EumR0uu7dizicghfsScjZZeVpPQ57mu4wNReY7hKPzRjEKkfiIXC91umHoaDKXFhrhaYc3zLXdZHr8LYnU+Lm0B+ms/0BbilmBtSDBDcu4dC2Ktz7wIYVovqtsNxA/cI1SBdJd8VoAtoBXB3dOIpp25u6oLRy7cSnZdXHmw8CuY08Ecui5o7asZv7QL73G5sIbsJpUDIPlrglwFyhEBJfIuDzFqNxS7VWCdE0L154h0qqR3b0fRSXwhsmpljJhxGyD+H44mHTMAkAwpWkTyY3yGVpp/7xe9pupf6P278Npjxx/U7Nq23JjkuOIpAKHeTbjxdEl9E6v1FjgmrdJiLXZXX3z8Qr0kQoCe3u5zZ7BgzkHO247G8M2jPvkJYqiVhTAoldQYsQDkov6E+z33HXdDVoAAAAAnQZ+VZJREXX8AC+UgGFvJ043zdeuSC7raYusmWACdYe/EC46f8z/BIRFFABRQAUb5MQpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpeIRFFABRQAUb5IQpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWl4hEUUAFFABRvkxClpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWl4hEUUAFFABRvkxClpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWl4hKVTAfM1tRAoA+Hh5xSUXuTAfM1thJEIgHh4ecUoSAW95EKWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWlpaWl4CFLbUjEKG7kSixA3ITKCxA3GooGhDZpdJ75NaiVfYLpZpbGAMEK4FZBMB3WkSEbWf+/f6mgN8mEEx2FY4tGZKuVp72pyWB2SfzYV+0cp9w320RvD46LDrSx1VXPN8r8J97u++8Aky0CSkCHAKCiB/DVxZVXWkMnAkABQRJRJfaM9IFiMYRdWQM46ZxatO0cqgGeZLbj7y5xY3KLDkjiDXb4Oq0jg0IZqGHSGY0NxriI33MCdKz2XpzxeLT6KTgB3gB4I9RKeDCaaHnzMQ3NH/m6M+iHXomSDp2nGgwD6X1WMfrAkRPdfYMyECrjf0OAMLvTbsndRrJBEK8YfsasYjmQdUQ7oh3BDtgaWxgH06QCWVyiF3EHQjGEBz4HtT8heU//////5i4Ulh6SgqHRCFKwNU5q44iVoWP6a8Y+MDMm/94OnYf4aNnW2/PqRHwiv+KWykjvu+PNoZYnDrjpKimYUqAoQGvdfzKHo6YfCOaMb5zYX5VPRdaq3mSjO+vV7O73+V/J5p0DMMXCqTlLWT46rxQhA54IACyHahgrE15qdd9LueNb0+IqF6hofDC7ljzbRzDL0ZksDrvov1jFQWtAjVWAWmrkjFUAkXNlh54mCnOVD3lkm3LG+lMmRkb/+5Z4cRFOQufhAmLIowrpAFogCgzH9NePjApXjpNL3t5GuTHOsOAhGU//////5u3USw0YxIFhwHSGEOeLFYE4FkqXQgX1IChIcf6vbGhHBGShZE0z2kqMNUvwpp7R0M73iJvbFBY4rkMuplQWqI61JzB4DvOp+UKK9hde1EKtzl21kOX7ldHXD0jSlyVYVXtyfJ9/ZvqeQRRf4c8CIJkHMKazbnIX9zr83TJ1yA5LLkO0cZrHGNmsdkfTz3Jv9vdziaSMR0IbWFkScEZxk7tgvMNCY5tbSwUWnaNArQYiQJtIAFkh1uc0+wV4lt4c/Azse/+gATzoDGkAJkgf/1IK1b7O+hv0AW4hGU//////5y20aDKPRwJQoIAiMtasyVqRTgOD5352zUCg736wRSeUbo56xWFvL6r+XATgTDMLz8lgD/Tn07j+qZNDYGjr/mgOIxfBQ7yr4nd+3c8mX+832vaeuOlGL6I06VKbJkcbLM6bdrwXql+VC4ZEmX+l8VbmcnxP35l6ZbXOMlrt6T/uTxWNqCvageiuqt4hIJUQGKyGtEbtRzuUcJMMmBNRRtbtspiXtvAHidfWa200aVI/z8uEd4m0tkkWe9mCBuL4ID5WOMQop2CEILaMDIbPjfkCDlbXmf6j4SLgIRlP/////+bs8EsNFhDi0TBQLhYWiEIbvcmcYJEJKlnl4thvoElJ6dB2mq3lNjFtwuGHz+AxK8dLS41nZ3klkbWosPAfkJ9Ssc7gk+Js9F2eQvjAjcZtmXY3fsEBQ5WWzlW9PcwUmH7XUGlwmHA4xxhotwS8Xfp7yVRdNORIb0/WbOtK+mXPnpHv8Hr/JOjBJcrhmSMADS8+IHT5g55gu3ZXmicTRFawjW5XCYcT6fD69//R/7R+f+Df9+GiUK+NvXfyNkqZ0nIZT4gnmMFdEBdEAVQO/xvoWdrn9febwEBwIRlP/////+ftlGguiQOiUkBcLBESSpVHBirWWj+P8asZIAJrEXw1t4FB6fyBv8+9TY4SGPbl4M6GxOGbb+esKqtpot5hXntX7SkhB9x27zGxogxklf4+ul7p4dV/cZO61dBvRbZJth9fFUPzmGuOUKFSppotxlhRvp1/xrStFrFYCkxxcO7Xj1eFupmojqdF3UjBgVohOq3RynsrgoR4SYFpKEwCPqZhXecfd1uKcpzgZTbIrlBXTPJSAZTfadRAiBPQNRhHRAHRAkQf7/GhIHaCl6KqOtwhGU//////52j2GCWGjsbRIJSaIQlSoCVRpC6WeFWDmwdroSxlUpK6UvZvPE8tqMLnpyZ/zeg8gber5Wp+/SqHVDolUuNN1xIL2OwDPQFNom9ZWrrSIb/TvihZk4OoyfVDCEyXZqtPOmtq3a+im+nKjAlRTa4N79Ozxqs/6fxL1bXvoxUVuZTUAelK8PIOecMa+NgfZ8nhZuQAheKF9eu2pEkCcxvG739WXn/H5/f+EFERNZxYBOwYKaIDaIAoMeFc2IGsRL78gIlOTdwhGU//////52DWmFIHRCHRGFhgJCpWSzLKcIlVbz839uCoMNtF1tlJpyRRwKUaZnv3NOsCPehWtUhckujj6NHRqy0xcbq2caup/I0P12+tXnszsG9xLPp9LwNxXY3H2R1vXN4mxxsHR4FR+ms2OBV6/AYDIh4CnCvHaaglNYZF34004dqPUNPHSI8n5gDSNLBlSNnH6XOBNAGOC3ElaIXBJm01cUYURIVRIlQjmlFxgBMJ6DBTRAHRAYzhjy8/bgSEKO/ognUNcDsHIRlP/////+bt1GYkBUIB0SGEQGZwYyRXARHhzqhYJJqoKbzYpGvGnTBjlhTSTpXUv1o5Ibi+vOl3xoxqG5e3c/KHttDgzuHDsuYXLkKbE8w+mQkc5JyeTRn1zHaH2PCb/k7qoUNmbNDKDXLTcnWIKAkSWAVvMRpRqG+Z/Dl5tGilRbgSItleH3z8OWVh9jHH6TRrStCx3KLeyE+fE1qfDWnMYlarDuGKpNOE/tRrT7qcVrvKGG9xi/g32RmsTBOwNThHRAhAB3ciwaw7Owv6vwd7AJchGU//////5+kWajQVQ6JBaYQuBkbXVZ5MuLId128bmddWJqZ8rFZjGM5OQgs5dx9Vyn2V6TFp8kpU5+INOy4zkHZH6zJoZGnpY4kgGwY50aZyeu2k0lX6Mun5TWcjsa+E2352t8lZkuSrqb9dxvsMrZW/DQhlSblB0Nu41wrfKjsTC2FuxZFYpT1+/4ujLIinelnYvTuvtsEcSIFY4UgJ6CEIKaIBaYAqq90778bmddCDGfD5hlIEziEZT//////noPZ6OxdEgdEZjfBWLM0LLVB4Tj5+MHAS4GsZZkpkF7q3NvgiHkoNxkpSSzXLLAxxztmKu/sTAQfgnFJL9mQtmX5mvSKSrzmveOtXO8JlwdabV2tmk+DOgSFFLMXLnOmmxwLjsZDsTsmBapEoDS1gdW+fHOSgCuK+3RI7ASOAADtc180rH8CjYZU5amDTQivp+l/rNPpfFUkJqQlV1kqLgT7mCmiAOiAxS+3fPn4DW0+4/RRutbghGU//////51i2ikQNhGPRGHSCFRFVYyyREStLPbTtx5D0K/1+gzWxg/GJo1Mg/fRAeKSA4gcc0g1XU5c2Ouvz+PI38ylrUp84jGYLBspU0O9+pz3vXXNogbhX1VwrTxOzVrZZdwTGdDMGipO/DA5zqmEAiSV3mpkkl0gdXi2NlwrD3y1Yw5NK6T4UgIOgc3RmspC/AWutLtPoGpbsoH1XguzgUDmC+iAOkAJJW3px248hp6XcfD3XtwU4IRlP/////+cttFg6B0aB0whY0by5ee/xLVJYR4zxc14rjzoTmQGltv5K8RU6t6BbeYhsZ+JiL1HDipJ9SA2oH33C/zFUqUwuW95ReLFjeGgZ2TzFbIQ07hEE3lO9BVraN3Lyr8mSxjqXvUmrWCWzvJUyncU0YITvM2u+4ipWng3OGe/SmljDv3c+FtKH7scH4YvWG7E/FwJ7tQE7Q0GFNGAdMAVSrPCeJrxXHkO6sUa7tdCfVzPgISlP/////+eg1no0GMmjMOiESyK3obuQOAcTHlLfbyBOJh3OVxmvarxUpnWPdnfktgpeSG2rs2IecSSPhVPqdbj+Vf0mg6GAnkXuy3TuoQU7ojK4ON5hr2h9Eh3Bs3FEZhJEUvBOyo5c6cyMyKzgDAdF5y0kxVRxWOyu96qaBFO1OqZsb/7nZ5sIttMBSWIYspObizQ+T1oFVgAm4MF9GAdEAhinrL+3kXfHz9T/9o01jGI/IUubTFxENvDbkJGJA3VKQCsjo2AGP0+pWmkr+nxoroIFJakiNEZSmLoJzckNrI1NNBsHiZs9vrn3UtdfWOiBSJJB4gAEIGGIZdeqOu/0kwaN+XiiBTg5jYpROZUFPfR8efULKl4Md/qOiMU/CS+DzpFxDS2XXfaos5SuB9SJNfaybY11G+Xrd+9ZYlYT5UbFi9dgYMCaPKle89XrQbCzhvtFoRa/tOF16nDg4ZjrgErg5N31rvmj1zJGGeKRhL4nYrLcZP/yTvl20rcL+OgmZh5t+v8JLx74M4e2/I8VTakOyIdqQ7Uh2yECktSRPi7HHiwhycHAIXlVPamFZ4EhREhBCQRGh37etIkVcUiZLWHCatbakcgfjoB067a1BD2cFiP9j7d+ez9UQLFBGLSo1+8O6/XEkLxem1Nv67hwgBIgwiJyN1TGxvTcYKpcffbutI0e3BsRVGKTz1KGXecEjcX/6V4tzHqX/UtP/pzHb/EjG4D/iOJ6qJ5YQ5Q1omiO4SeOAiGILyvwHSB5CAAPo87YsJ62ass7TQpbNXGwGy59D76eat1gvuuTWlk/YFIow+ARk/ELbUjkD8dDjfq5XIGIiAAcIRlVRZ6LYaOpjWhV89BN2hQi10atOgMKMevkOvmPXTnUs87j3HkIEHBIwMw9QKufZRzvlH4pSYd/vj8sHf9pMNBeCXQCjA9dcVyE7n8r1EeQeZU1oDzz+cc7uudcfhhFfCx2j4Svt9/BXu6cZry5HHgXXZcx9fKY7tTuwJEw7Jlv1XKcx66fZYoxVCPTL/Re5DnAFYZALALcUNbJuIqgKchh8ZsKUXAhGVT1qpTFQQqbyEouIY1FqXYFrBIl74839pUK95tyJnvZMY/VeAZGjKLU0YKuBgKQSVKrO26S1sOu5lxW1aE/GuGsTItOK7jcTYaGMyXYslj7MvOhFQ0UHSmaV0wqmm1XgDtfi0rfyc9oQJzOjB1/QZrao7u563qhR7zaO1Bpkk0Kin4WG+Vi7Ktfi82AT+n0yqFIQn398Nn6eEAftTrijAL4wEv4fwYsIChQofCxsO68g2tfAAAAEQGftGkTfwAEUQ+SYDxWgAH5IRlP/////+auUF06k0QhVGSq0unPUbauR/r61dXKSw054v/LXVb8aqeG6rNaZj500yEG4NqWcrMZrDYxmXvr/l0O2NyJe6WIT145VrbN7K0e/IH4vjG6ssT1yDmyqmvkTn13tXEy461pkStK1KleO1pTKL77zjvwsO34d/WQ3QgiYrsfCXRu+HbPDHVZPAAkVtzjpnlH+kRZAsb5ATMFCWnAmiAIIAvrV1LGGgqy5+IQp53AAAAADwGftm5N/wAAAwAAAwAf4SEZT//////nqZYqJYYExDPpBCyyZcKJGWhDPNB555v2EwNqlzosYRbLyiFeJBqS52vuuFUx6eAKd7T1CyI85Ba47oJfsJpfhYwlk90w0ytyFdj8+uULfNr+pAXo0Q2GnMTtJuRUTM8DCLaJpDMCoFsRTtIWFc7KpneemzJtELDr4DsaR2qAsKiYAaJODeU+r6Otp6kC1LnIE6xg1pACUHpnmxdZ+1vmeEALgwcAAATPQZu7NQgtqTKYBE8ABaI+rVwWmIdbCiL5OjuukNpqUMNMaY68fnLv1EmPUd2+pfG36cedbD/tQDhSiAgG831Efb/VNYo9eEj/RTx2kbYq5OWUyIIOSKoM2qPKaPaWuuktmfHM6nSiFKnyUqFRi/JySUuEyAmCiPqioZfgkvr7cPtcHRJRfQW5LzItChMg0UXo3+JHwSBAVUqLBemMEUa6sVSjwC60hXPAGIctklQde5fqp3Jmmye8ckYcgA+D36v4OenQmB2MtMH3wTD8dBgfFGIY3S3vxrS+4G4wvKkFX/+c9/aah6YdhyApBJTsUZlcEd4VJVnxSQkw+b7DlJeW4cyyMuQRgfjd/d52M+hB9tvrio8Cr1K00Vap/ApfZwHTTz3yy+Fb77uoSrfrmMvBeQQ3gJCy+4F55nH7Kyqv7ViRIg/sfAt+3beI3UvPGm0W2nhvYj2fad2DfaxO/IAK2wHDwvFW5VhBrjXrfqzhnGN2XAhCfIATFNnV9MAEuMtY8jjaA1Xvh2OuyYWgWFVK4LbFpit+Z0iRJ/sztR99iA/ZJ1C+2PcAqX4ZRxsWW5k1fvEy4aFh6aVzSxXYT/zVAznvLM0ggd9xbh1tDz/0swH85eFZ4PkNya8EvN3yTnKFBv/H3m7cJ4ZTfRJbtaeQUYIdMeUzFJp4CdrI5WH63V1NrXQPXK9xZoEEUGUVqz+a7RnTWYTJzf2NLrYQ29oHKceayNOuCTwDMusdWxQ+68Lazqnf6hvXV6e0+Yj/VnqKVWzZUvwd+AfAB8R922t0NjgyBWfm5EfXp6oLsZZMj0wdQDYDOio0Lqx8CY72C5o8mn3Ob6ATXqRJm9cXJZ0j3h211RN0qwaaYLjP0re6N9BgG/Nsa4ruHhnXbrm/xo0YREkOOERh9VaXLTJblwvjKG57rOo6/0/fKheZeMnx9wqSon8I6gJCpK/iKIDJ7r+t8y/dxGt+eyb5/HhA/5rh9XkvJ1Rx9oxt77gEIHJ4TPyB239S9vpkpveClyaXGZzao5OwA0iny9YDDg/aFpsVi6t0K5MGlrx/wzy8wX/J+XmVjL35Lda5/9n47nn8LNfpomAriHCsJr8cm0x8v651vW0tsRMcHuEHqYasDRJsTB+ZDfCMC9VWoCEj/63rA9atfkSyUUCTtkKWQBJtwUB0I6kIXMwTv3YtWcSQc1ZqTHs9qA3IIgqvcnW/+0nVeHBKgf7qCDd0oDdFEHj5tMEGS3IZ5qaN4R9Ai/Q9TnAVbJRge9y/atYLlz8Q/g6h2AVLhV21Qh6FvSao5iWlVYiy/mu3zCTKF2Z1p8pk8dtSDml2oqpMS+3LxArmKH0AMh2JJmM4HoUqHl2+HPmhxNSbFKV7kwLlWcnqhOnTdY60BvbKYNrUMa0x+uB3YwmGh3w9UUEKHFj9DBrtQzgRzvaYI9Ht85+5SR2uCHVRUajo6obnWQNHOvvscHM0RSA4Iz7SrXE+jt5Vu7e609FPYiyOUKJfvnSkQ8q8BeAiF+8OnnTg6j0MPOcXfxkazF3Xs7DhyumV7y8U5sY39bXY11k9uR3weejwrlgaeoBAuoFNGZqZ3nAAoIAVi8CNYG+S+jPybPRTONIofqRatF5wK44axABohxExQ1I9T8/sbLwb+yEZT//////noXY6OxBHojJohCpkFSKRGTgQ6d82aqwwX7pcy/BCyXxHmpXhuscS0QlDaTMZ7ScevinZA2vUgo9O7XvkbPx5h+mTwlzasqiYFdA6foGuFyJtguRAECgFq821S1HIYXvBvLWi5gJI4WIFKPl9cO8bqZG+Pq6Q91aRCELTkFocXY8fROVf4I4Ilu3Kp5tsELgTjGC2iAmiAIDxlWOX1xiXRNEocw4hGU//////5yGWKjsOAqHRmPRCNQqIozgpWkg8rdbeupYYK7V4m5YiXMPk6FTVE0JEH5jt3N2VJX3PxvO38QzXDsnhiMj/f/cwuoMLrOJ81JItrU6WX47idvf9PbK6CRCmjkHGiEyl1EkU6jIAMrud9AWdyzxU9dWdxqxNfVbpMKBkdRcuFpJkAGvWNKg6703wAOyu/8smgTSBOMcJ6MB6IBqA8reugUnqrITucNwKHAAAAExBn9lklERdfwF6HSSJhRVmoRb0tabkc3uMfmbguBTTyrB1IsvPEv9syTscJBeDVkLhc+aOTsDLg6E0h6o67s4N0D4ytP2o7bKzkHb0AAAADgGf+GkTfwAEZTuAAAGBIRlP/////+bplio7EMOjMuiAIBRTLkUWg87nWDmACnX+pOzgmaQIUU/V7xxY7QcwMyHhUrgxTd+8hS8Zn7dB5dGGZzkdKp7K4vmi59x7gKflvLUkDrOvQMCum2VPL8eic6c1EO4MDi6wdq9dyDdTeE0wOZLo5u0sPvL7P3EIhcsbKXj7sAotb4vy9YLtBuyag4T0YF0QBBlPS5zAmzLbv5pNMQZCju4hGU//////5mp2JBaIx6JR6IRBUpUjCRWi37Th++Ub4roJ7X2bn7ndz1GiLBGU9RynOCw/FS6lYEXalpiLMZ/2+rfh4L9bamuzuprLKkIhlnG5DGiTVmJXZ3B+8d+hm839lxLdHOdWj3VWvjwy/l/2r3dn6aXC5Dy+lSMoVUE7Fg5TjX2JiNyAFzMirvkzGui7pF6oXAsCZgwR0QD0QD0QCAftfvmaDvd62X3VmvSlCuw8AAAADwGf+m5N/wAAAwAAAwAf4AAAAiJBm/81CC2pMpgETwAAc542qfD1+AfsUtE5UYHb7wnEyYweCySE7WSVj3R42nPwclhqpXKCC2sOY+k+O0gVWxGtFAJGdENYIOz+liR7kaQeYqZDmT2FkP8dJ9A0hOH+rgsPmBU8oiCOS0uXJRNJ1Lg8g3Dd+/OVIiFlG1QqGQYHwQqyU5hTOMpEsZLQyYiG/NmcyySykF6Ta+ZXHfjlrMb/7uO2bJ+oew04Dsqut/58SEI7xAs96M8OQu+X2QFjtefN6fWrZWJk3RG7mIND9lqCXLUJKC5M089ikQY4Gb+EHgjfVz5bz79jpTUq4to35/WSZR+cN3gWTynu60XtQM0Pr8POnZF/LeH+btDcheiPknoqd3AX0jt89MAohIptCFy9qPUWWD0bJs9ENDdzkmrvmqEvuZxRfRlMdlZlMSGgg5xHRQ3F5OswdlWObY2hqX0qdRWBCwC6DvY7xnGT8OH82a1kA5c8TjANAXLn6d2QF3LqbVv0aKcCPaoFZt+83ZXVPUW17OOLCDApUiX9jqwLJm7Fa8CoFMCXdCaFYhntEcA4KCRzsqmWBo1hYJC09hEjiVtGAUFpNEWOTfEoGev4zI2MYXtIa34BnnCbb2JipyjqMh8TvkaN57V8lEhg3qOYeT1JSSD8x5EvTfLIn5CyaGL8CO87Oz66kynoVI5SgA9LCKm2TrSjEEjaSo1Z+OT0xChvi6XGBo/3dhNvNGPeAj8hGU//////5uGWOjMQw6Qw6IyFIGXKoXLAd+t9zXrQEm33c6vQwR36EQl5VBjC6xATesUJsQGRcGj/V9lxxqDunYcY6jcjEHHIIroJ7CRr3VPAbjtegVuwwWa2rQdajIO/VzeTt7AMKhRqxIJVBUGAUDG+wwiL9/lltnswPJOD3MYJei7Pp523qsGOxGsa2a89IXgAE5BwnpADogIVYd2t969CDJy5JWiERHXIOZ3AIRlP/////+aucDULCMOiMWiMOiAQCkFBEsrTw1HzxnehJeJ01rtM+Tqc1nGYwqOaoW02vH9EZdSOhYRpX4z1f762Osdm2TYGCAl4d6TCdPNDJqYzYdjDy2oTXr3qu+6bNznEojiXzvm3sbihmbzTTjgEhJgIdFciAnSESLitTfbm/IZy/FbEIyBUtP9+A0i2lpX+y/+2eYwjCOiAWiAOiASyUHZfvx3oM+ryv4nrnC4CfAAAABZBnh1klERdfwAC5C2oIz8mhHjIJBNxAAAADwGePGkTfwAAAwAAAwAf4CEZT//////noGhbWwkGwRHozMq8vLJAMNWlHs7fWq5X0Hjq74qE+qc63y6rjhewoNAafhrJiaGtmqxKnvE9WZ7olWybVB15GpNlmpKKVNBE4ogrdF8b29DohXsUFSYDE/VM6BOAyckIRlatGXqqLRHN98nXT48JprV8gAqByAXooO3+t6XfsNHcAGoAxWJrAnYQFNGBlirO71oA4rCoJ1prAhTDjqcDByEpVL2OlWaBMQykMxAIBVRlBOhFOOOQ2HH/gPYP0e3cpUj+5n26yfONwb9hde/Gj2thBCaC124ZDGq8v2x+Gd24Xy2XtpRIIQMLB1ZSjukrJynYoN9fG6Sj5xsM1DkSzmsJwl4L5WhedhxStzMOY3O78HhK6Xo07qe6vUsf7HteAKBQGuGzu9Nw+vytLR7GkKEG9Z4WQpalAJLyWvdC5zcP4La93HRAMomKOJAmIgKAHP7hmGU+hjOR2t7wzUaPBMHCCJ8g25wOAAAADwGePm5N/wAAAwAAAwAf4AAAAztBmiE1CC2pMpgKef8AAbeO9huftdIO21VgoYd7boDoPlN7Lo6iEYCY8BmIqD8q0Q0XwKACo5969ItxFBDpuyueg0lw/EWBXQThE211m/jrsDKBlXSEd9aw4Cibtf4wzai6NPwh16wQomnpFZ6mUWDeUWVOkqUP0ApIFBsMLt9mjjeL7uVvrrk9iL4zu+GS5fN3+SYJCFBx30yYtzKJKrLOOCyx5qm4CJlOjChXNOrdSJkHQPt+qo/WGtBBp82yJ6OSXoh3/oICR00r+GnYiJ3FW1tFPtNU0UNr9RhjPsm9NOlNsfczch54cD+jGarmmein1sptzqnEYNRWOdTrvpVoLr51Y6QFGpVirfNu5Uxbjwl4qvhgLdkcXRaUkrrsG8z35ByepvdTz1QsydCoACJqBAEAkHxl6dHN26BREKZB3X2DscFdBQmTQChtNB3xtBWHDSqSWS+JG+5a9ww6f+rsC14TFNe7pymaZNbE7vseGQfhav70q0clkknhYfBRq6XSUL6MkkwiY5CJmggEO4yZ6UtL55LVxewMJv7+EK4iIvllsW13oLHuAQugEqB1a4riBbw0WTtmW4bUjdAPUe9hrFdj09LwuRu4+zXTeZNIT+UFfjASI/pH+9eK+XoIkPARnCKKweV5+0swZ0WzWxwT4zKmGrTQ1jMLI/DnP6q1bUEC1KHhLqkW8YtMy7Y7xLS1MQMFTi9QnFoIEPUKS2/mg+BIlKGqYdGkPaC3PGdeyzKTDT+TNAwu/AsxBJS+iVKIaafeFQIHEt58EHEHNSqYzLgdfVA9GHGVmO4cmBxLnD97em+71dxzFY3SDggnQsi6UuFW2ThEBslWdy09HD/XVbD75SEhy/AvCHTI/ta1arWzWAV4RKr5hBzG7aY1miQ18y9zZNq4X57N1QvT54n7jPwXHt19wz5QAdfg0PP08WqBVVpdAjhdDyl9YWYu9c6CaD6Snfe0Tyzy1lOxM+bA51sqthKm7LCA2j5cYadyKmeEUP46Ur3zY/sAzU7rOjFgJ0UGgrOIns5B2pkqYGcVewMLmN3FEeRcKlD1F0ftgvelScRRHo+yZ+5GXn+4YZoUJ20l5BryJ6Zn8SFLm0tcZDbw25COAbkJYBJGoUwAPt0S7lb9+kjViUp0CTRzdlPmFwLaRwPNOROI5oHqsFl7ehIB4yWgRCfBLGRLgGVa5IDaBNdQO6KjDkMGfNs05uwc+Jd3yf1KgdfwPiNFBtv7LA+h2jRbC6ZpHeq8Uh7xxQex22vqzZfwELiQRr8If359AGvNWkRXRTt6R1epl3uB8Qrn9dERIGreFA//DYp0K3LkvfbjNT8FqiWxQfhstS/n5zxNfZ74aFBdRr2Xhet3FNSxkDATikOxIdsQ7Yh2QlKdA4uczyGUbQvW4eAheU//////6O0wOzQcS6QRsGevhCFWqxY4HrXWRwBxgXc4HRYwoUDUJBPNpovVmppCnTGFY+wjjdcpFmFx5jxdcET1fIQPbviyKawfW8EenZPpf5scaM+xKlnkTbeOKLPTx6pY6uOBY3Frbw6Grbn1Twhz9oTFRYAwrHwJG1chkkBQvtWMFQA3j1wyeSL6NsRdcAAQAqBMGNIA1jHhXWBrF+AAAAAPAZ5Abk3/AAADAAADAB/gAAACoUGaRTwhS2TKYBL/AAOOvSfXbTFox1t9akcFKKw727GY5tQ5OKcqGBmvlPfBTjiIPXhn9KdyjxuA55M8yDWhL5lpqmE5Whrz0Hz2OK6UfkY8uvZS0alH01q3Z1TUa/RieVdbP8uoNZJxk4gzqcf09z6uwOH4J7V3Vzhh766/s0FpYL3G8u1cC601AheWJ7lR75NQEQuXH3o7HkIKMbvjRBbbmwONu5Q+nbaH69YKcqwKKXAKZF+NIZQtIrbCxyR46hqRKxFUJRqj22Vv95D+0CQEtiODhEYKYJ5Dk0mGmO2h7cb/0GUAJUm2FAIAdkrRXDYtaYAWgERdaM+8VYnM6vnJQM0urLA9rHwGV/mRWGgRhWT4DoAzy3SpQ9TN/1ZgXPS4gmKKccExsFfwZM2omDeaQPB0N2As/H7akYYeDNehs6E5v8UgZcjsb/5+eDStFe8iVMg3RPoJ5g45KSinXY46QgTNmPu6tSOtTafrWauFBxiJ9oTLfCuBQQfEeQs0cCHFkIypWgQZsg/c62kc/dPNSwmb6R/Pi2Bx80goqsurMjZkwr5YOc3NFPMA13sTQxIymiCbWH+YBbWvJU9NTxyUPzc1Jpjh7Y/PrFB80p6nMyqbXUOyhI6ogIb+98ZTMmQ0G8128NC9tMg4rKDrjsZKhhmhw7rmLOYgh7qYlkXoPn3U8TXpLY/74NXKL3iUijxjDtZqKWKHD0JNVyRQptaTr/LS+5zOuvjnWCsGtDEOOI4oDUeE++SQIZzYJVlB22/1g7ZA6Y9qfHoItFe1KSVsY0RMzfmQHiEvkdkGBOX9Z9xkfAnuItY8L/fmHFScn0pnaSYrexCjzIABa9RXTbeQDWAB2xR5P5qyQqENOTzUuB11mH35sZbCVEJzA1I9BYEhGU//////6a0USzURhIIUaIQmBCrgQKtpoEdmvILOOjpzUJxo3IptEM6IwUOYafxOMKTt7ooEadnXtVxbpHXf2+yMKPXO+KOYM9wpqaIXDNxXIo0paQvOs4zXIIXn7vrtrWeewzT7eUVbI5G3P1Rup6WxdMk6kqU9nwn1fdovxrOY1SYFW+aC09AsuNW+GgC070tTwQpG2bpuScEYjstY40skqCsHfqZyIGAHx6IAtLQ4IRlP/////+itNLYaDEekEjCLIKCotbSzz1UX0a2VaPJxRBEBGGf9qTpmlo/Yctdf6pS799lp2rAd4qde5WTBWZm29czYzJVuAN3OQgqabTADjsRX56rKvJrKSlkJcHMkB8EoJmGDPG5AgCthENj4+ESOAP2u+gFwB0lSmwVA9GM4utxdEFI3vO5EtGpECs9iRZSMAokIGdIBFMeeqjWyrR5OKIIgKMV0q+AAAAARQZ5jZJRk9f8AAAMAAAMAG9AAAAAPAZ6CaRN/AAADAAADAB/hIRlU7Z6axTUAhUqRKKiotcI4bAAgkizZ0cxr1pvPqaOTgLS4jaoMZhNGaV4JhhNJb5fl3x3XoCz/lZzTv4juSMqxqgwgJ+9dJ47VoW8Y5vz0TBxZZughshEt6mZCIuwaQ3BgwXioJASpaYAgrWf+whFfm9WlSTV2sYzMRKwYdWpHb0c9oyxtPH22nkyAsjyCjn59PJrKozpcFp9UB0qAKvPncUnfIVHAIRlU9SXFSjGwhIpQEqAZIqRoBo67gCZiDL3fLhTCU+NNduPls5BBMPm6bDWmrRrz63K8PozDv2ZwsMZgad4N3U4dDr3Pfs0c/35PWE+YzDXEZiMnBPeTL84chB838CjfeHHnTEot77EzQrZ4qhI2WEVUIgAAxqD/9KRKtu/Xe75zEKiwTWND5bUJ1vUbuXH29F9epi0mr1UgqdFlptjB8AYFlv8fr1yyFAUBwAAAAA8BnoRuTf8AAAMAAAMAH+EAAAPQQZqJNQgtUTKYB/8AUh0SKOkIZ5VlechFBNv4bDkzqp3GmoC6U/mbT3IKtm1ReRqrYonXoGErfa+sWHEDduG9NPtlGqkTvytwccvJftGg2+ds7qUDGyBw0QR9MeJGDMX/v78O62prD+jlUipjr9Vex/BQYInvqWIowIzHPwvqS9zpGEgjQo7qIXBkDGRD6qW0vgidJR1Im09zcez6zk9sPzioRJXxRfy/kUa/tS96tIMEM94BJ+dYQV+/yCqBpcKobMwPT44W4vBPC1AiYpFR1bee5lPZ20QwBVBoBI4+hZxugCwhjYxTP9UzazqX7qkhsEuBplLWykkw9YZbWPKhKjtMvaGO2gPRpS3/EbHS92BJYbQ2VxjJ11k8AxYp/VkoTCS4ji+CLF87xm3hRKzfD7/tGWXYpRJkJtAy8aMVCXBADM5BHj/p733hzX3ZWkhUbsK/RJ+zn+1hYH4mvyK+M0rnjzafjoSnpTD0ns8pgYoFylT0Sb4lyM2m/W3eUa1nGLqqa9huMyOjoxIkuNezvIh1kdVfHv8eKBB+jXos94qZjChdJ5dCY1ufbgP8xdwz6g7PxFu91CN5sj50ZBaHQOf7XcVzKAKJ3Vd+smwvNOM2jZRFTPcxnCrVuspdgesS8pMLMPq6tSLGdd28LWINVCSYpQR2tOiRj7jNAuf2HlLZ+tuILdzjJ9ySMd4J53bgyCbP4Z+Xb3ckAMNRLzWIio4ElGm3sO5cbQlYZnEP1glcVew9slqucOYRzN11deA5VgXNYfOONJ66vt37RcUmCWg3utfJBsA4WUzd6fjO7EJrGtTg10ndkBqbKGqttT+Ek8X3lypkSS8C7TtLHGF1wC05qMjJfayxN5uRej0PyTUInl2wRemqphFoDPAAOfoaRlxuu9cOQev47h5glDm8ilNOrlRpPYV63eDUnyLOZgIRWDEkdHrk1M5vRJJK+DwjYHT9oMpRbrtVvtq/NcQgKCsGW5T/iyuK35Cmnto36IaTwCHvgSwjrjLe8iD4ENZjRaDwDcgH7x+TgDVUg8KiDll1NcbBFrQtic0gV6z1En9SGkTtF2OkNpYJaqEBiRQfAv/LPrfYWKvzzqgn18lJ/r1l9mf1iIh43DuAfucmuWMyNws7Zp8msKiXkG6oECq/oBFJ5qT0pQlvOYY07BcDT//67QqcTM/K3yCzv9yJN0prrn2xtRDydEDocyGoVsHbaorcsMi2oUn10tvBkG+k7wR4uB84ILm+yJ+JW7BRco7FfNwP0AIagVULJlExdvBh2VNFxPcK4qAKKY6NeRGdISEZT//////n6oxhDohDojKqWqFKgRJZWjrj9AsEiinW1VwCU5GcrCS7o2SAsFdlgVPbhpKJ7y5ZXatipdTqm68wzCqDJUzdo1hNTczPGrLJywogAV2YRtVjIKAXx3aZC6qZcliEuwwm8Uuqkh0WzmsmwAG1M9k7MFOIEQXgZlqAAx9x1TYxcXFuubl2Rel4WKRBEAJ5jBXRAHRAVU4U7J+gHxsOYicwqLghGU//////5yqsLRKLRCFBaQAq0bsVVXl0uuB+ctf5sr9PLQgmFfSYmFn4O6o6qYZDKnmXFdHWdbUfb82tCewJaltWKN783jAR1G98C9HXTZaxYZD0NXEO09irEHC0ekVvUKepgLTY77DwJjHJAAEDYb6wsp6unlPLkfDgXOpYgq6Aes/su8v8MvJMJW4d1xvbe6nmKEtEAtEA9IAVh9c/5v9PLQBuTtsbN04AAABWQZ6nZJRkTX8EWrHVS5Wk2XkfqEdXZ4viHXL/0xAuS9Lw6VLTypG4airyesK1+L/mlPFiNA0JdReBYUkau7YCnq/rT6lRgmeZIKMzop6cxoJLLjKpTYEAAAAPAZ7GaRN/AAEiX+OAAAXcIRlU1bKQhGEZUGIwBQoSKurNNOQsIQ4c1a4dbSiUkcJiSBcnnLPTsVZs4/V5ponvU6iz5OI8rs4WsaKWxpizdo5I4Q8BLrVEbnEhoxijqtJ3aEyOVGzz91CnCl0BYHX/zVfLEgSWggivPj+cOzJ0QJpEWGAP6qIAFQExTET8Xc627gZye8KCgruzrvOu/I4q3Z8JLZF10BUFAATTHDwbsBo6JhrwvQXAQwchKVTNSsSEYQkQZkCkEhUIkEdbDOAYDc9DxbaRZoBD1lM3KmbO+kBd5iUycF/84SZ5lP8mpt5867XYoy4ZKSaWoVr6ZjVSeM2vg8ntG2Z5dnpSk6DVFEKYG2QqyGftNHBZbL/6OhNGoarcAH4fn28OthGZCWmaADGAGXVee+l5blyVoxrW5IN8SfbeOqttklmztJKZkdZvBoz+t5EtGLovV+F9rgTIAAJqDEQNrGCguvnAvc0t/iMko2tCuAAAABgBnshuTf8Qan60wPx19Wc2IgICzwAABiwAABBrQZrNNQgtqTKYBE9pH2T7S9GK1VfxDwVB8LCyba074jouTi0f+iAsHGoX+4OQFB3TqV/dARfVobbgSMhdt9iboELWsRurjjGBBMtgktgVRmBl9tcN3Wp/kbS32Kh2D+3BBS5z6gW5Q+YdHI4Zh8Go7Iwgmy7amPUt/VbuKfXS8xnn770RQ3Wr48HI7mGLM4+Sp6OMNl9BvCYSYADBo3vQo7gW6iEMtObh0dpSlz5ikOGoT+tZR1WnUCyPf2sDgL8+PUsJZD71BLzcnUNry5N6l7EnNGH3QVtq8ngX2+acylbzutTlSXJGxae6UVqTpU1FR2/QwpDyHQuZCG2gCkJDepsOYIICYi8iHzeeXTLNrhrep0OdQy3+p4V0DdvNEr7nbXDBN3eHm9Mp1WPST5JxdTt7WSn9Artg0L2lFTXN/GC/6+SKnCGr1zuWzCwbkx2V1CbeMvpH1xVdWLzOoL8ncos4fIh57AZxJyRf7AcVxyipZGn9n6DwXqMS4v7G0eRlOFK7V8J1otXG/DOJhgSyyL32niyWJCcFN63JdEr8uZHSDiQfA/x7VSZ36Ot+AE9BCHKSIuatbp0rvxAgbOcK4mABBKPDZEwDGnmdfELnWijM0oDWSrL768HbfOrbihPu1SrK1CtL3TsFIazeHYEGFJVpLmTAOvHIZ3PwrUwOUPUY1kqQr4kRTZsaMUv0xFAUg6Nc6VoWKjsTbb2OqvMZcbLwEE/65DTIZljbMpl5Po6Odu6EDRq4mfasMZI796jCdeL/dAd5zKSFBNxTn7GmDga3LKxVx2ZxPANJthRu9itd/fFif28aAeIhdKUL3OKTyc0HVLpRaANOB8VVjBAIngQI7LSiKfCUNZFRbxKuURA8KKEavNEVnvHAqdy7IgfM3HVwGb4GRGVN2waeRUE12FePAGCn8N+dHakEtVY7/wacEKPyn4hGRtodwbVc1uuxZemKpHtDKSDefuINoOaUmZuAOR1ZsPSGvWqeM+Vhqp1+/yH1kcy3qAo2EGAbS7Q842ZhFhpJE5s+9X7zVYuLdhiXG28oCGvbDGTEhsyQRP3DInoNF/56i340dc6p95evdk9KwxuREcmurw7W+HAahIKvKLuZKF7IlJ15q+QD0m4xjiL9psW+w9is/ytyQ4rY9ragZ4x0xTKt9vap3/4NX3ct89mAjIbdAITbnlq97fjl6U8dtieHRZnBblLzz9saPx8nj9Lh/rXEvbVwybqeEgkFgN8oydaQC0ODGvNGGBT0arIrzB04Fl4DdOy0fl5UvJ4KBzNbqmJSodgvXdp7VbSDIBW2GzISSsYHx2YxDMYo24i/lpEo1meia1eEqfgG0nWgZbSSA+028W3WQ3TW4PqstdkMKGec10pX1Nj7sqp07hEzy/d0wx+4yB3L4AnRqrty9e+6OH0uVSZMRT/AGER9O66i6ix4jZ/Omub7WV8Q6N1MFnbZxggYDmFr/5TVSvUrb9ff+VK+nYAMz2TXO6Sy7/pJT6i7LAeqjdcOVm+8f2qPhNtUlzCWjpzIuoh7H8K09kMM1gnOPAH2tSF11IrBT168KJhSdaYipF2z496TGSEt5ZtrXQ4ezaZxe+aYNct66yiguQXVbLTvUI4bIKevjnYF+L+aHovfLZ6I2lq8xmpjYnV0eM2gDcTdNOT0C6HnTeqR4QG7aqEufFRqTNeE86VEqXIqjqGun9GCBd4J1nr+/8W/PGSzyQ1guuxtvzZTn6JuR9oc1P0qUggjR8W0hAZSq6Nch05LGqBIQbxEOppfnGLcytr4GTS+8gPZhXr5d5lF6vtB7HS3bcMb7Rwj0opS7HzzrO+/TlWGQyTR2UG2Deue4l6BvQG8Q7nvsClE1YUJBln/S2/krSQx1mhfvd0loaK4nqDuVj0Y8knkOpA1jvJ+zLkvcNvbqeu9q0JU/J7+fsmTfaK36cVLV7XSpnQHIzN8QkmT4QMWArzAfjsUXenbzbj6aw13KqqNtE4YfIhAVxLEIob54EcnpN4bc2sfhV6MCAIFPHvzA+1dfvWgWWURzAUpRByBY7YocKHNmJHniWSMW2RSU0wzE2gG/s9Q3lN5bDX3XLAPDUAYkQLzosyBSeuDK33RWid15RAaQlOkaJbYMEHPWRabGg/Xj2TRIhoG2o1nqIyRvnM7q+XaefyWziAxbS+JDqBGRcIFhySttWHdWJNsHIEOqknDeYtSvWOawnJGXlCYISyly34gLo8rPBvH6ezjb9Y7T5SPPobgLGDG+Wfg5SVsZl2BRYDWB/3dX7c/ro9fHidmh9WYbeVTZeQ0FqcBvhs+N0T+8pSHLtmXnlZoN9O0czlnHe6BMs0I5tC74+TLoMiK41kBuuRIFkqgxkfylFYt2+wt5aLmo9MYkdtAZOHsmvonQeSTkEEUgASIPWDFNqD5IGTdx/iy10/RRZCb0vo4P5vRe+vFEB9xurnRAE0Gb+DghjqL2mtzRiqJCMc8VVrAwM7DYEu413l7UPnEoAFLgyCV4uy5S9DwswNQtzw7bnQArKuNI2V5heuQbX0pCQ3B2/doH7+TlKriZYu0jUqQq+JIBPxfi3B5zZ+jP4EztNXRra2+cTxJ6F9+nixlN5GQoAzRqp2q1xVhbo/VSmiZYX1qoCwCsEONamMolH35IR05AkpSXurvnANj+uD6uSwNy8wNfafLjCwOTVXz4OX3tjKK3lcxurE+s9MausJXneTh9e+noxtSHGjfKRiio9BebsxDIbs63mgnhA3cHO57SUAkvu6Uq1c5GYGd8Q+9Hk2wHkQgb0ZeoYgtx+6wPiuE1kZcbFm+OZjiYjBlq09BWLagXzvkI6K0M92Dy9Cx+5t5OCIF8mXepqA6+t3tM6c2HHwjjCBmC49UHH6BvB4sUBmU3b8OpMlDY8pp79xvUy6/C77c6sAOdEGUhumoGp/eNbnZR/fKElnzDMliFGEJTVcJv7L1jWxU1IUGBDs3aQlXw6DMxQK9bAdW1B5mPAlGyGJ2dWrv/nBhelkXuvbN+BcP5A44ug4urb2bc4GbeN5hjYq59x4q3XjlKwSPs0IWi4R38JNixCSRx6pnegIvD/zGxnlJBCE5r6qZ+FPRA/VQ2CUN+Dok+lDPtHdtMFxqdqIg3UF82f3h+JftjY730zYdpz3DwF0DAQ32vSa7RKNjO/lTt8lqG67mXT9ERJQBYr1YcYbY175CGarphKP1XFKgszTvolFkgxSBqmaNJuhIfLGU30TvUqvOCRaOzTGN7/phn/uA/8RUzyjLuy+0RbmE000YqqDqmtH3j2Gw8Bs2w4AT0qsvdIZhNco0C3I/Iixr4fBpOdwKp21XcMY6/zUVGkAbCvIBj40Gw/TRzuB6aAGyUdPUWwD9+ReZsKrRAfvZPT5xUDAxFr7xr/XnEsjl2UIjhRGMZf1wayACSj+LpWyKOEWtUWA/NFhK2IEiY6NnvUVY/d+pE0SGmzAC2IK6p7dYXXTBBXHbhkhpsOdmMElrIAfNYD5sh4vMcUm16tgqDKbA/wScJms/+/2NoyGjTRqJMLc5+f1Sdadt0G967CHa17UscJEOi4vkHyti5zMEpyXdUmeaDDPCQfzQwk1jkx1ehSnnW2CgDWxPU3MUED8/4APdEqkKLH0PGy/FSx/lcqA9W1hxjM8vucN50NXBEwjfAR1y6BHTPxuRqT9onmojtcIZESsy4PWfnliNSuJz+t+eswOV+wSxFWINthMtvQDlCK+3hX4gqsPlUM36IK3FCamd6H7xT4NP8CrpCItk5gfYopTbHpHIQHBFuTT1fKeHLPUR+hRWjn1apXxYFsUTuGMwz8eie14Cvc2Yyv1NKH4rHEpFIK+lgQ+T7ORncjKjRSvj86sTED0DDvsEf/jy4/gD8KkQaUJ8Fx7InyTpWS6V63WfrLCN2kJKp/5Big1QjqvGZjWhd3/J8NL1VhqgNOSndZGBlnhaVMEMXY3r88alZiKmJT0lTLvHsSNRKkCRmrDjNduBMs+jUvYJpeVWXZ2tokneLPXf2pzg5VZGx/PkQBmHf5IiRsExCM3eWkG3A5+jpfBfVDELhloYd5t7NuGGAubJHNtH+jN1LWunLFaLYKnSdXEQ8BIO85PeIBVddkvDXR0iLrOSPY3GxGo8DRIoKRGbQJrgc5aZ8AjFxQ6poMFd8P6kC0voOcZ+LG2hbAAWQGDcbUY03MpNSFU72KKXjGQlpJu5DerXHHhLH+JAfqlufBIpbDJwEfTd/fQ7dHSxsSLFWkp2sbMIrVMGWefZdTV/GBcf6wiwJURAhXYjhrLv7N2//WPTxHqdWK+D0HPI2K2vWWgeN4nFAroS4zj/gsP2MZrA+a3xnxLdpK/ialJ87ghi4YwDahh02vZk6MIcmmRf04ZVSL8Z5nC5aUOCngYjM83rXAXUKsZKfMdTIUP3IPYwNoeDQxv+fdkMMPXeRuCmlTl7rhvsGaRKgyyEhG21frNoVcIZyw4sfcE8Nwkl2eMACfAQbnLi4LymrnHKZp6I8mW5rgK1Mn8NfnqbviZqC/g6Gkmgk8XPO8lsIX47Jvd2x7hoC3fchoj07lVHYIIBGuL/GPulThB3yweZipPHdhUgJa+s73dLb2WajAiWlFlM0tv+uHW260he0h0NpvbQ9mB106LvZZeLIqWijfeSKgk77gH1PqKnSDoz349GjJOCQ+Dz58Fyort2bP+RKU1my/uFhSK7k2hXna/LxdCEk6fpEY4gjEHVEou4PxCVKehpCjnH2olo2tBhXTY9GtI9xAn/w9kLWSPXoHOMKL40uFRpPgc+SJAVWYP7yia+iYc4cdP/1jvpj/9uEuV9AXOgXvpAp2KAYFMROJqHQPcsqcENckFb5RY7Lbq46cuqqS/58ZNd/hjcu71H4xC0AvYnrkaRybt70TBqW8AzwFNjNtckTjWjD5PAVyiHiIKe8/1Y0mC8Xk1EcKF8CmVNMh/KxF+3rnRIPlIsDyBZRWHtGOJextOMi13OjZch0hhqAi1MGWjEexuJQiCpUMzxf4KVUzKK1cKpXDtEmVuyabXWAlQBgriClKGXzbN59QWdOBncbf5sBxyu1qtGU8aihqNReKpmNqzMkNy3RWCLdb9SpqbLrNk8hlL+XnCqOAO1jfVELoYI1dMC3CpX6QNuAUmVdFWPlUzTXIPIBxrAIVm3JlUnihFjUZ2nLcnqdXCWy38MNee+bnwUO9bb3fIQRuou4wSV64OjfSZMEAA0ayhsXNvBZXc/tXCkpY2sWWuWWdw77d1HrAxOwoQhLML3ko2LOpsD6Ropg54R+5YXJmQMgLzRxAtJKSOldyEGnD+SwH0dWyydMXKBpV3FQ7WagAj3ypQIqOzviYS2rbQSkQF1hRtpP2zLkeIgeeGjEB8c0hpVBo2FjlV6XmSi6SXCkG0M41zY+pYAniE6n6TBhVLxkJ61P79yyWrECz0Z/t8ZHkx478DvDdEcFFfedLZiTpQs3byKHDJBpkA3TI+lFglRSHWnxZwCILC3+dwQhAqzU2ZvytfPfe8Asz0jJffz9jTxQEZPgdnJF8DTDoUBNAe2QfIslpTxgGC0goE1vB3fyiaVaZPWaEHTMtg670QPUYHD7/FQGKab9mI6EVPq1/vvIUvTSdmlZZHANxGBJAbylmBuQlTE0vg1Y/PWL4W/r92+DinoaRoEiKH2NaIAAkpvQS3uZLgcS+5ziK/46q6aWNHvJnBIgRLwAMSDOebxmFqJxEfa96vfo0PA9UReEZ4zl4mr8JdTHCIvosaEnypseWtG0XJ7n/MfIFuddzK0jAkkL1j2TYe/KkB5x8p2ytyGorTncZneLmPxUE26bM4RAAk4hKUvykiQk8WMDdnir4yNOCpTMp581HfvVBVSQKXYxNYfzW5zEOOoqYbZK8KqSagBt/eMZAEqiDpUFEg4IduQ7Rf+P4Dhc+aLWvx5fv0SST3V88FwIXlVNaKTYmIQhUAiJKyJVlpiFtPOzt1oGFoq9SpXbkhK7fuPV625m3MCyJaGi7SEHOK2v4Lh+AjGsYzk3d3IKLFSG4aNh4DdbA1p0BgguKfz/bdKyGifqLxfEYR0N1EAOyukt3XJM1QASZ4+9DVH7u6HUo1xuzogBJ2r9FSQl3XrxCmn8Y7goUpMVE52FaHzDgAAAE9BnutklERdfwQxsjze6KSNnDYJ6ZibPi//UwT34Z1FNeACiHGPQHyxKBa+x8QGJ45feJ+3P2pQ6YxeJYmZrlNE7GsC4s/WSjMESRZYk9bQIRlVFaWFYqJY0Ma2UihIqGcZqwzqijyA472a5WFTadHcIyj/9ugEwxs6NsB40SNfA2KRVH0TJM99QXmTfM/q6hncGLepaG6sFH8hA396NkMfg+M7cooGUMJHfjGtMR8wCWeEQv9p/EJ/FcIUKklLFdiyZOphdzqCqgSXCy9Iy1bYzLZwkSK8LX2N72mbnaKfyHP4p82FgdQKRQGyABRiIPkBWPAAAAAPAZ8KaRN/AAEhStJkAAHpIRlP/////+jujD1KBEOiEJMjucEqzM6iR8VqbklS/gW2hCwABOImaHdEifzf6M5RrB+J23mOrOEBS0aLGw4KlcU8slYvkEkVRrTz/dnWXp+1KWtnim25hpblLYn8sB+Rv7Jon4WKF6v+w8KPjHkTymhRQ5hiT/XCI1xs4gSomRM5mfXe2XaPIViLp/DmYL0k7XK3TAYgX1IC0QBa9am5JXwW2hCwABcAAAAPAZ8Mbk3/AAADAAADAB/hIRlP/////+jubF1ghYjNFWlQ51JanrJ3qK5vq/pbaEbgkFYP935Hv2+Y1pDQkh5f0H+96l6JsSgAqNtuODZYdklO916DVWtP5KxD3hyXZecoNSmUMo9u8j+prtjcE6c5q6f6r437hjTUEpC/vXYXx3cLZg7axpVIoQZVeK3ss2yz48m+tuiuk5mAiRDNN0AK0ShPWAELdcneorm+rW2hG4JBBHgAAAL7QZsRNQgtqTKYBG/l64XAIDs4VuhSLLVmIuFvR8cXY1K5XmtkHaxZkqYwIqEkkzNCM2xCFeuHDA7o2ZSsXn8hQiwrQGlWHGKDWEDcYSfpP77gwb0HXEcrM3r712Ez9IWVUv8NtHqoFVMJubhkBjrT7Dyy2tHQQnNyPSHzPfPjFwZWVsxTZSn6F6UJBpJw8Nb+P26KiYtKW2MoK5wocQbZY8GAGuQEV+Ik44bNvr9lJbjZebr64gNqI8B+jyHk+3kvjdwsdQkcB8XWhlMvR9I2SzUH/5S1zn6oXi0lm0Ri3VJz4DuypIgGxdyJ+StMfXJMlySfineiBalVqtSS/AZbxD2GgmJ1stS/LsiI8wj90IMzHxDlBEwAhmEHCOtpBQLDv9of8o2gL4z4sMSLU1CIjasJ69qZNEsPycebElBrEstk0z+beSL5G5nNGlGA1uZmq72qHLCjbQQsaspMUY7YgurSuVHkw3iiV4ko8T7ZvPhJIdffSafsawe5aWRQM/lXBmi2r/y1bZuCxHhz6a2sSTyGsR1tUWzPnV/PXNxyNa66tLxib76c+x6rVX27idtnxmzP/Y9gZKveo5220aYeqTbDpNgFQWz/Twz2pV3lv6lIitmd8yeuGqIMpzYD5uwku3bI3EbC/KpoiXe7rhooMcdK5uBYc5GRtZYxG7DU7VwTw3X9oCXHTB7P+dVzvTF0rcplFAKk33UICzH6E1f71/LltgSfwt7AZ9PZCbwRrJDhxM/iOto9AW+RtfeuG3R+2BU6JHLv1mtqw6pY6KeR2d+VJIFW90RXgiDelGmErFPsjgWZtwiWCPqKzavYQqkc8REUcEIUYwzd1hoqtonoMfWgsreZLeMDSNqm0U4iPk+XLWroZdXLelbHi5N2aXs65MH1p8eXjSxB1n+egG97Mz7+TcS6tePUaP2zudL30IaIqijX61QuJPI6G1/PGHUwtKvhUcd1azk1oofdHzFW5GOM4ywsPTEQIlsUwpaRaV9+NZbSjJRhCCbv4SEZT//////nLnRNaIXqNl3JFEOpZ98Ta05jXXs1tKyODxziiGIedM3U5+10NI1HelTFYH6nNrXsjqf0lS2Yr6fHUYTlJr+YI3clpB4o4JNtLBfoAxv256QkJphSpox4YIF6P439dlQWXw5ZZQZI4AwISVeGAcbAKYEycxoSbe007xmtchzekBWwtuQFAQgrrQC8PfibWnMa6a2lZHB45xRDEPdieAAAABFBny9klERdfwAAAwAAAwAb0SEZT//////m7RSrCg2FpBFokEIQELzeqWhuK1NGnj44o1SAo+jfNFtxXdTsb3LWJKTVEffdfNOI13KgmUmkCydkVYvUcaU0j5DYtoM4PsbVWVJONPtUm46ljt6Z1iDTmpRVVXiszlA8HOcsqRVj/3ALwZpBM8WBQ4IYeACmG1imu97CfGhbO3SuRLwomMe6eghlB+kAWiAq17B3eOK1QWtkf4Wj0nx/GKcAAAAPAZ9OaRN/AAADAAADAB/gIRlU3TrKpmCaQEqREAAaiyzBBgaL1c3oKpbibrTcli+lZ1y3q8jtUnBz0xUt1ersqfmkzVjXGldgw7xR1Du8Msp5bprCwTZ2h0S1NjZtK9E6EdFUSC8tn7O8tpFSQjh6uca4455r76nWiLi4TFLUoTJoLwjKhqOTOTPgri+Da1OHRkCWIa4Y4q54Tpp/f8Y8O9wWsdIZ56nrV3Pj9LxlgTyoDqIUFunz/L5x15ciF8AhGU//////5mnWGCKJhEHRGLRCFBiEBAAUMtV8VHvtP3omWNXiPxFhuAUAXJB8FgtCh0XN/YVa6UvYuRXnLVdvwHZ8Z2LSOmt77/YCtTjxDjl9te9nvchqtve3uZMqGwjoyJxRZxKPXXdWneaSSsFmisTfifkNDNc2FbBgkdjvGKmEDlPdJom931AAu8B26RqMgZLTcEIQS0QC0QHKKeu/3oQq47DP438Ba+AAAAAPAZ9Qbk3/AAADAAADAB/gAAADIkGbUzUILakymAp43+RADw9lC3RAPxioz6jka9R2/3Q3GROmhoooF4f7y6UPVee/nan2Qy2MZ53way7T5uHqYbLRZywgzL3Dpj0qD/d3aSgZBr00qZIXrDmsOcUlOJPHkPFcmQZhJ972LVET0dHVjmN9ZNWxrSuLfh/NPR/d/58Gouh32u54RjVOlePFL/LlJsBOxvWhvKZuL7Uzl0w3k2Nt/62ldrxy+w0nN22t/ULX4hsfeaBa/ayFSOosPbLqCPeYts5Br54PCibYqNhwavy83zRMxSC1g62otkwzWwdFlrARnDLUz0f9qShUtOVoj4xoqau8fCWw3CN1tPZdqAszOVGcDJsLz0Sl/yug0EYRYr0PoZw3oA9GPy0draeraFVwFg0fHzUyPtn2vG20kgnDRYn4xSkc+sMsz8WRSokA0EscxvBJLsHf6f3EU4t4GZ12q0GLowGP7CSOB7GhN2xeo2LCYfknkkiQZ4wJMDnGg/QwqPSkPAz0/FjdFXJ6iTttDR0EAM2Dv3dDOGaAJSubUVPvir9/jDxVCTFFgCBOpEnoltZ0txvkDFuXy0vIdYxJEcKLb+zVb53rYZToQowExG76qGqx3xaE/WsObRV9qQ+HHQQmMR7S2VFM5bqcJ0ZaDpWjwR5OeL4sXlJrOPmh4nXvZRPSySLDvShpuPo2rY1KPl5El0V8tPom9AOjgB3JFv5gZXwNfzMbELLDLirOcGR6KjIcpe3OwfLWYtUWdX5O3FO4M7+Cn1GruCc5UV0pOS4khMC0MqM6mklY+RlgJKFB9BHPuGFf9En6L3zcDh0y/9zyq7INSFSgjBiUyL3NrKCK/3oNubwyV6pi5ov3mHtr4WRTyVSc6M/KeZIKqGWbNSsmY4cRheHJVU8kbD7cEwbXXpmDPXY0CxqjlCr6Lql94fmm7O23Q36W6kRL1Fl0ypUlgMgag8qQ4/s6Vs37ClxpC4PQtqogvh3jCD1oJr0fmVqkCeuS0082Ta5BPkeq2IAfQ9j9H1PFmFeZFnaKHt3rYVtu3LJRbRHRcny/ds8JkXbBWUs5x1XQ7R5mkeEhGU//////5ymWOiiFiILSkLRAFKkqoFZZeiyDrle9k6FRC610JZdLj3AEKG1iJVD3zEoMBNImp+XRbXxPFJFV2I/erk+mzDHIt+GsE2mlrM61ppAeRtGgNmqk1iVAAh4NZ1lu67pq5rqXmWSXhFWaKaAKIaBoIEIRVaLDek7SYou6+Pr4Lj8bs/1PMc1LNd09BEIE9KAtEASXKHTK97nQWGGH8RQNb2yG2cAhGU//////5e20dT6gRAVpmt9x0qaKuDt7euMzoGrdC5n+FiUdwiGJ9ObzULH08N9rYY+TGp4iiM48snOgKIFsWe9232OUbob3nVZEzoSaSbdXxbJ/G5RfF0s7wVdp6O3bCZJIiQvPa5dc95wcD1+7tnlVuPRyuZ1pEOPBxueUcOu60j2Bc0ggVVqABPOsIagBJqAW5u68cZnQu61fgauzj53lVyFN9I4AAAAPAZ9ybk3/AAADAAADAB/gAAACHkGbdjwhS2TKYBG/5EAPv2RBP0hYAGl4eZbJ7Ptm0gEpQqlV7M/opbkDWcs1NkQ8t47Qw8vWdU5P8pfiSlFo6zfHD2rRVk+Uw7joBMX+wz+VuChLvc7qvVDW/XET96gLpen5LBkebquzQXDUVCfmU6uu8Udc1UYzC1oUm+68mFBXQDzM3k0VPsnTXYBm9p7LEfwdIdBP0GzSewq1KIpDkAplSfHTf8oRvn1blP+bhl8ogtVdQTiDGbaq1qBAhUINkXp2AV1pgSvt9ZHNCs0zPj1kZsXE/qxX2mnF/TY4iryZo3j/HL8v8mz2Z5I9jNOGfD56U7cOG+sMVmMwjRbVHB5GydKz958HjcMGCYKyY0znrUG4vPfHfbNcQKZdVyDuAD6K3QMHZh1/Ar5tFzziDr86h1v+kobAwXdDzidXXGSDELjWuNDfQAMGTZ+3OwWec0f+UKhgq1C2TpTIe5X+dYIRIahWmu3AWU2n2t609g+cvpREr3KcwqnrfmvayOasMBhNqf1+Zb9o4oMSsKf3BzKiX3t5kmW56PyJOcZWY+vTpZGBld50d7mGLzCUjdzouSr4WGKD0nEddaxKxCuRtYJOSncWHxUBbkULCAH+Svdy27YaFh4oP9qXdOtC/CjujgyRN/Gp1UynaVS4qU/4dvKqZ95mcQR0H5GPKZBS/8aOjvGUdiFNUU2i+Ly0YABnQjiK9cDBR5QwaxC7VE84IRlP/////+Zo9moyDYOjEOkMwlS4yYgpdw+Jj+a58WQHoeg8Rc4KmlSmieFlx9u/EJk+ZVZoeVWErd/pH8yfHE5SeENSO2ZHX/+bpby0bOtOlna3pqk4RumrYhvrDxH54w6GY4yC0LopUlnZ4BLeHPvwTLAJFURjDNp8cN3b/8zRTo7I1oYRAAE1RDODNGAdIBkgoHvM/nN+AKC9RnTRjLWnoeSOXTghKVStkpFioqCgSCNCBEYARuFRbVEe262WmhidO9e+07ctiqoThRNaat/eLeev6k1dkizV6/jQ+dWz2j8rn3onQMM/3dt9O+URlig4KgGIs1B3O20aoer4THEehChRTVmHzLNIxNJvsgCIlZhdWyXY+1pocrGlvbR27AmLgGjiYwTZumf6XtdlG4NpRaVTC5p06c5L3PWNt7sfSa4CAEtR1GERECAB5+gGvOs862OVo4CxhCHihB9VQhcnmGeFnAAAABFBn5RklGTyfwAA//yUGAAEPQAAAA8Bn7VuTf8AAAMAAAMAH+AhS9lHWah0DZiKRgG8zFXkYoRpdPm9JJxm/21xv2dJj+t6rp1QQKSxwCqPpkR8HyXVPlapuCzGXOp8OXcgfzpPtMvcYc4s5KdM/B4fq+lxiCgJNIkD8aKNxB2Q36jJhEth3/vf8a3e7pbqVUl0sr9a9+l+0pxbJbCFE7RDx7oguEV7cd51hoKVgA2b/X3u4Ko7Q/ScQWVunylw2mBACEWxvnhPiCmv1U1vl7nHxfUKLXOpBgLSZw6C9N+F8QJOCRDpEHTEO2IdlBApLF1f4r/bKI1A8CPLbfXJbRwheU//////6K00mwsKBaIS6MQ6IQkVl1cuzKp0UevHQXRq7W2po4B4BKEwWzJWk4+430zHPFvc3Lmtb01WroIavORjwjgK3HQ//xhOYbTxf1eXdnbItWchMuogUySoQvJRsl8bz7/+14TPa578TVxalREzOtwQAuNCSa2tVwxhz8nkclIxALhe5ILy/coj1IAKcShLRAXRgHRAEDw4umrW2po4B4BLkOAAAASDQZu6NQgtUTKYBF+HBk+jGdV0l1X8veKKa0Blc+XLNbs6h2Xs+i9SbA57eOK+ZAc0rO5yIiRojYdAOS2CGnQ/YZ8w4D+8hwodD7RFRhTpMy/3HJw9360E9ACXi9og+0c1U4/1FvLzyVrdbz9idsFHsYt62vCWg15nK7yjVAjJLxFd8fJJ5zSixfoiRj2lsa1yNVqFnLugEgtTkSVY1tPi5qdp6tS6DaPY3PIStZP795Zv0bjgmuHt1UB2T/dOKs3vXzrtGhgevEm8gF3qV8B17xIerDzCkVMVWxxPpzXIy7ZmQN9Eoo9m4k0rqDn5CR6sEQsiY2dFHN9z2+NEngFZdwAOXt9aUqRlUhswCoKgzwDtWmP4C3GtuWhX2wy2fgY0CmSklhDF+OlbTUOeZJeNdVMeg5QSdcLjGBIiYyUYKYLDoa6cZzMY38ui+QeHAj5dd0IKoEGjEySOFku8B/hH+1UwWpDshcfDCMSg+IsMvirHYhLouRj65IkBgqhoqmU6hYEefm9UnM3miDXL2sXpHR3FOUCsJ1nRsrjAMY+zX5QuHwslgrAaCu3jJpddkOBxVpc6LlKQYis/faXOfRwYKpjAHnku0pMh/RY+kBHozA/rFptLWeqIBjrrItNIxpGyX3m4Pfc9DGDWtzI1CGsenpP+52Xv6u2beLpOJ9UXVuJwp+PjJ+0VIpy7yBssdeLXcCqp1pQXa7vHvliNIa9BbdIYJA+6Aol32lMMJqtT6mO9oevst0LIFNXcP5WVKcvTRqt5DSRt84RYpU+kytC/3LjZTzpGSajouqlHFrpdyzhJwl2wMD/Z6YHefk8vqaZ/2tEeEGLi+gS4zfYBS85uBi1MkhlKHJXKYBeZlevJFJdANBHL+TsUNLZBteoSGZIAj/Ss/Q7rbgH4XRcbVUnh9KSCQq5nHIOH4fyQVaUudrWVFPoX3k0g1cKPlmOvTcGg9ye/gCoVnaiGPcsMEUSUo1r+AfQC9q5b6PDqtnU/L4XGOmxuWYB4F35ilEzuX679QUgwVbY+Bhy/AqHXKjUmpR6Nr1C1zDui7EzDlRnDkASb3oxl9mCqDN+8wdjPfaKi+OqCKT7Xb4rkIM6WaroUtY2dJ4Du+7bmqsmsuox1DrEXJW+S10HFraKSpXmXKoE/iDj+c0u72rSuC6y5EINw2WzV886sNYBrQPlAhJlPNiVyIyCqiA78AdCqrUM21z9uylf0s9MsC1rp/Qviq5w1T8Mi8gRBvsbMB8v6rES1r8uHnSocbxtY2KqQ7wKZ2WZ7erAqlAyUFFIs93Rc+ZBa1fRO2p924zYrTb+xCS0mYvqsgDusxnL+9kgRA2O0L3Z/1IwpOLh+Bq+8g9YQzaIfsoIG7kDCErtlOmZVvGhLpsglxTA7EGYiZt+PF2DDpWHzVStxVojY2y5WX5lkaiRX5A+PaGIcYeTxzTYM93y6oez03yb3H3WxELAtvPoJ+QXWNdi1d1kL6vnWy8SmisxD9JdB5FNADRdCjyZ2s2m/MprJLVw+gFptQX6P6mlHDalMMGbVAAAAEUGf2GSUZEyfAAADAAADAB1xIRlVNZqNYoHZGEhRS704CIMlThRYZZAOHXH5T9e17/U+twLQ9OuKTQ/3NAuF++VKyqq/kJrWGyy+6zykpQKY4tXQvOtGAn9TIrLedW5EFV2sChl9qOdx/R9pVfiAj7VJEdDGJCHLi63IkEOz3s5iM9SJPItqhLEqqE1S6thsC5MIVS2iVVTGoF0iI7B5jMc605o2ARkYNt7Iyp82fxeAUkMVw1VgEsctULSiUXAqxCHyhbghGU//////6W5sJCaIRaQSN8/BuyWoVrDoeti8HALDx8joMX9ypnX/2iHbo/LSoCOWyLtjQKvVREDmfqWvuxPMOI8VfP33kEPedJvKq4LBnMQf+Z204EEoh+jd2f6wI7+d+XPDtyO6Mnfx6vXcd3ujbuctt92m/8302fg2KPoGa7bKw6aHKxgheoAQIA0stGUAKsRhbRALSAQp32vAIcAAAAAPAZ/3aRN/AAADAAADAB/gAAAADwGf+W5N/wAAAwAAAwAf4SEZVUWSkWGiWKBIEXiUqQkoLKLHFBOAVGPb2g1CHENdeC2mn9S4WBotplKcrHIWLwErwoMafy/XtP47vLxVYOXp4B9IUY8zU9WpcZiljgaNbUWPX1N9yNmm5L1X4dn+Mu7rqzEwAPKu0Pb6doaLf0kHGnTEruz3istpufm3C+soSWVsrUHJCDstERZ6e+niUSBYEohEAwA+YcAhGU//////6S1QewwNBiLRiLRCHRCFvUKsUUkvbi4PKrtKcTprZlkDk4ohAIhOe/0t6Y65tvfczk4x/O5t6a+1b61SqwQGik9BDiPPFUpbOziKI0TwJqzlOFk4VUOg38ypXwx28fxeRb9Pz7eCTevE0U1qUBAFevD5L2WpPwCKmUXarOoM91l67sX4YZKq12YidEcpcFSQgxowFogDogCO2rldRrZlkDk4ohAIr6cHAAADhEGb/DUILakymAp4v4cDYQc+ARj2nGSuktkybT0bgy69VHGBwOmomKbppXGH/KwowNT07D0uBEl0JPr/eG8Mge06BZwexvfhoBZm9nOiQ8Pb4t3Fcx27b2BFv3v7ZRccozekYLEyeBfAXlgHepIRu+owp88NBDjBF1936hvrQ8ffCF6+yADl3j6GXYgTU3a2QdWJqOwzqPvTTvt1AAieDfvYlCiFjOgUt1tv3NM1SpcIO5pwHb7rq6v+XF5zroiBWTJuNBoZLktj1OFB1+4nzfSUPNIU12LiPs10b0rlcOzVCoa33Qk6eqGA8GjAL3G63t/ek088YKcSUF3tE6jy7J+o+Tky9TRmolhuoJ+LiLqXk/heoLsV+8SA7yRyNdRxauXoxq1h7z1HCB3L8w6w15abjK+qpNDb5I5V2j6yLfPDjZb+18dvJLz2b0K1/Ad+lcCfhKbFe57wmxTdEVXqrQ7BV7blaXsoPS+NhUOBqNlprDfIglt2DR5i0EH1vkiy/Wkw42JsPu29v4Nb7VgB6ColUYYIXEfC4EHKwB3Er4JFctQGrqK1FQCVA46GSV5W6+hBSjIQzGBBM7FZnRERVcZd2Gb+X8uiZilWilydz+x3GN9ntgmA15+31Eyf1dEJsno4VzkeVNczJ/iUTTiqAmusUIVucGqan0uv4JYtjZs2s4G7cZt6wLRTIThKMFKhGwdfvce4DAhKXyyyttH3W1VRF5iJLmoimp79FXJ8iiiN38JdcAuN7rBb9et4RLhx6kV3EpdRzgdSJB2K179eC0u0nEGyGR1C18JZ32bVU51VmTuHImnSGRFxoyEk3vgwMlZOkpgHhlrjpbXIFA4k+LTGtGy3053GwYKeKvuv1//Y3f/KohYdRWYCtkhgo3ee64QAL7gc9P47++hDx848bbPvg4RNgq/hyJGhcXbdnXVn4uUVP/bWXEV4Ajzdk9NeXP+jCfqV5R5uEwBtPRmRH5OBfOOzl5ABWZSmIBFuhG7daCu1q+0PH5M4bV/h696c7Q0wmzaV4ynKmz7oViZNFObVnKsXEKzKTW/qolVMgAkSPbZ12dWdJh4MstXUcRIlOLA4GzCu7xCeRAWCVqmuYsdNBX1IpFIr+3EMLXqjc5gOTUmVcd7VrN/O6YqOU0M9FTOwUeTKvUBFBLfZ7AOTt8PVAwDEHmYa9CxgKziQyiXYa6D5oAAAAA8BnhtuTf8AAAMAAAMAH+EhGU//////6Cy05UmPSgFTQuVdKl0Gliw8JegOYj/d1r8B69NfheUG+wAk5dwNtZT2Euqd00va06K+jfQb14P//TYXYX9zfymbmTftqkzHr+scMFmFU+jAbYLkkPHnV9kQlVMuaYL9/z7/rxvhncUuF6iwGugxNs7dczrLOEDdbxNyXSkgCJqwxaqaz3E+qgrpQCCweMvQcdfuzw5B9EAvLiEZT//////nrJCbMxFJohFpQCLiIN10oaLQ8OI7p1wIBR1luTPXtHLGfsmHuaH48rJORCCKgVb6onkdtt2vY+TsM6C1s2Hjm3YYrrjB3toVysnl5iVyrob71o4FyB2eBaeqbmhkIbQQkqUhvp4EVp4NLuTPW5pre7xVWGd2dA5bzro+vhxp2XRNggsE0YTsDUoT0QC0oBAqPHjunXAO3Zz4H9Wx6SVcAAABGUGaHTwhS2TKYBF/h0ocQCHJMUinQwChayp+nSIXZESLSftCG97sCXnXidqFa3Kp6OJ1WA93Zf6be2SHd6GO4wO4nv7RcEGbfY1j+Ogbfr4rfuYzYqfjNyz28kvmbdKS9R/Ud3Tzu2qaA8/URcFZ8ez4MhQ0xpu7mzcOt/cp7A3p5SIxgurJX0kxoxo3kUJj/UQMCn5ycW9Ks3WG26iSB0hD0Dz314EJhG5yuOACerg3ObjB+dEkzuYQZG/CryDHfv/B3tjR2DnGSBa0P2025q8wVoaiUjSry/tsrXj6J8j1AcWkeTqiwnNmIljAJTO6Xg1I+dTCD+LSQLjjSo7nN1dBvX83ThbvAuwXjaf2VlIKxSl3ZOhoWDghAAAEeUGaIE3hDpbJlMAIv4ceZ/MJjRXJ7u+trjpheQLXRBALC1hY+85E0Y9yn0J48D2ijzZ90m3ZEdxTF8gLxJz5q4Oft0cmgmH0mu7F9vJvv/OBr3aUApnA89r1QaXY2UkVO2DPDML2IDOcM1Fx8/4S84f4P/tfW9X/2oTe6tF47qw+lOxqZMBYH7ZhIpsZ0hAqUDkqhVQhYIUvWRT/nSbCCqU1ynsAnp/yA1tzbSLHYm1KZgtUNBZkCQxJHBl9aXcb150PJ8FgQe+YyS73IyGutgrFhZKoAyiwyzMebgFhScF1xZ1/s4Fd82I6vRVKFlSOyrU38JjY8jN30h8GQQH5NNv/FK6wrCC5+8P9CDGNkWBg/u6nYIST0IGbsTpJmmeIDKGtU61IJsa/d3fK4w86bSZyi3qhKGLSOiutzJdXYnBtsnlb8G5OF+psCF1LkINkmX0KwHkIqitEAZIb7iwjVe7iWd4NkuJnDX1LtYAo+1G5ot9L6oTvIgX0q/ppSx4vM87M3wk9A9ft8IEFbqkT2R8YKebAvTd2IxdJVE9TJbe9AtZMv2byMYCUCSBwRrc/6lp90tlpIjS8ubJsoIBU/eoIW/Z2Yg7KeoHKwiSdiRDcgvnO6WvfM3EEgSaB/EzyjRVrwgFPYf/dpyn6Qn1lnKU71L9c1UoMs9Xin3yIg/um/DxGyyepusuKNEd+YQVPNOsah4/BQAC9zc7IIPie+wfRrcscy3AtRS3Rd0HcMdZLzgAz5p74IviH2bL1MBkWkvGBsPZE99DJli3a4dWb5doNDBaS0Dsk+mPJJgeTqjJ+hGjRwDPeCtK+4kyvfCV2AOW58FN2JukzL1rh871C9qg9SRKMYSTOrpKyrbE48JBR/8vZqR7RpTbPJu+XWfZfTjRo9we+XilJyyVg/3iT2611T4Xx7nsdMUQEjTbIZXV3onkrJvmJ5ip/ugGUYSnIpxeUL4mL/wASlMzJyUU6HbwFhCoxC+jCT1eHtz/7c90OFhxvr1tSCrtQuLDVw1urgWOsT4Iu9w85K6LYOIV9GOvqx4C8+Cdti0O61wudP0cN6rPZ+wNk8mPtXUV672hMg3kdzNe0obuy+s1Knltmcnp1klsDIuVmhpEghIDVHRUzlmPoC5V4DLJ31zCSK6xa9glCDHCOKNmpUOmVpYmLXKKI6tiOmH1LpJaDVoI3vEGL0yxltJHyh1HMgtXDpBUqHmVePeSzp5SV82IW1v0gG4MKZ5NZb2ZzmFwFKm+FA8PvI9btpLLS8uQfqHNCJzaLlFH1W5xVAMxbiqELJZqJb6oQk8v6XP/pjwggursbXG/gfjs5DIN/R9mHdOkW4hpEi5/yynJAqJS/LlPkNZCSmwhF2l3ZNv1Bi0kPXV0QIFnsupsY4HH1Q/QKszexYwOMa/KDiSw7PHwGHS0f9/8hVCgVfVGxuvfYQW/0drqXP72CiGcdyQpxyyqr23l7HuiYoUCcSlHJYPv47yy2YfKE47xICiRW3cR/3Bl7qLp9aGw41rHNWOyNXjRAIRlU5ZIRYqKg1KKAEASlERl8AeTkAocZ+39kZ4u0ecL+COaszaDS00IoRFx5SdKGZJXG1U9FViBuV9ImdSpjBWqPQqq45QDGZbh8B+TbA2qVKdwAkm+cBMM4cKubwfy9mu8zZc1sEUlLUZxrdxPKRKxPpoUqoDJeJE1krXCOlP36dFHWAcUL+Xw9ZUC91Ahw8IB5vxJmkvO/wCEZT//////nbHCLSomKIdOAk0Ku0zNy7Li0Dre6aBY1n3I5ONz2O1vxf4knStWak30CYwuWpKcByRlptdbNH4fOLVBaQjZyJHl1Hl7w0Mb135rbQapG7qjuNmCLpgYFNsogBpG6Hx4S+Hm4ddB2nyN1dCRgkAmU4I5WC3gPkAB8fAqWiQyd2EgDxbC7pPwgyBDTgJqzhB6dL3jQKbzomvLAYSmBbIQidJ98fRlOAAAAOEGeXmSURFyfBBvtK9oIKOwymJ+NxA6cB6DAhLNe1J1d3EEVcRRXwGZ2dOyJsKWIzCyTD9PgAAK+AAAAGwGef25N/wAEa9fl7y8lBSN3A6uWVtGAAAAfMSEZT//////mLdRULohHozKERUlbi4WQ98cPv6YOgykL/vsiPsVbEPiWRIerOUpnOUSeQ0qQV6KenFuPka2+yh/rXy3IbZYXMKCaMjOZsgfB8w/wxSm3OtxMPWTgJaXVJODJnBDfZ8Jfv1lev3sta9hQHuqSg9S0XW/wPmgJLHuMyKuiVE4AsCVs7qA+iAQh0YFAAA+s+/39AbtPyWO+FFHz/QMZTbZoV2dZtkIttbgPaACV3W4OIRlUxbqKhzQQgC3Jc3pUoXlmlQeVYNWHzo7v39Xy/o93dubcN3H+n7r+95f7LpuMGh0MIq0WMuhnNPjGvNfRzB1tjBYolAp05tOekRWTqehN5Ls4sM3AODIBSnoupeIh0bdM5wDGWn87LHztNXDqynUAdCJAJAtZOB9m2vRcPZb2VEuI25AAo3q+0ZIHYDwKkUoJkmaGxRGGihABmc7Rs9ylN2ULpYYBifm4AAADAEGaZDUILWTKYBF/hwNhPX7bGBVlCQorxwvAAKILiqrRsw2p4WzVlGGAbEbt7UX++wFanot1ZeVrIKbyXws9Dxh9rXttOS9f0FGwaWuaListOklrP+6nWn/JgpPYGr+sePSM9lA8goZsAf3HOXui1t5oeDW9+rUMOq2ZL/l2SOaSuddvURBHwhISIrdQQ7OKXPlBNu3pEBMtJ9EUNh7kljxjWdgnXCnzt9/hZ/CLMQEAMyh9P7K9M//HKYWTGiU1ym2WiMvkcLYYTVBJjobF5+uI/HgdcKbS8pZLXctsjHkMy7rfQx6D7HQRxdORqWVwSdrrIFHsxvFmDk1ydae6vwwUUjGkrTcIM7rV/dsr+uUc+SZOR9ZfiwHzLlru0zizZ7MQobXHaXYA9umyqYZCrzCnc2GsbRTXKi/erwkaJX9c96R/bPiEaAtcg13/bcGLhX/6AohG1HCtzG/XvXLJNp9VPF7RjtJuxVqY7tL9uTtMOHSXbYoMikFszxT7TViNXCJtaLUzuMf6Kpg98BEpYmuTL0g+ixOBv9X8PAeWhI2V1a25AbcaTXcKh3Buadm2HAXqxrhq18ghxZugEe7Oqlag+nFVy3G0Yh2pdt9KMGL9V0cu3+Fcx6ZbzoRaHqjmLsc3xjFBPcFXWq3O+ppVcb7fWh6vnEX80cG++ged5kISESQqOPkFUrE7Xv/NY9uiWTjc4jiDu8vR4TClC5LHp8omYuxFW4xzjUZ/iZKPRkQOdtnUKtYx+sjst21DJY5antWQ+91Ytp5s2YyVkZxp6wLR0enmwIZ2WrKBYZDkn37/lpVbF0fchmlSNUbObtbA0FV8RfOJTZKaQpdMTilHBVyw29VXF6i8BBJEl5jksVn2M+0+GLvE5WBUggJ8SV3ChRYTNkWYJXaO9iBPHRsLbysrIW3lxMnf1ivs6KRTyy3GplwuBUCqBYyv9pk5SH4AlrHW+mtXMaMxMUNafGAGBkWA+OVJR6U1YJKjsixcM4wzBBaQ/QpAGbrw5QuYgpr+8AAAABFBnoJklFRNfwAAAwAAAwAb0SEZT//////nbTSLEomHohDpEDoxEoHRKqtCCz24v4b8NcT4LbUg9b8gind9Arxjm3Zemv++j/kvU9HzMD9rN+fojJwj9prAormw3/FZ3Vc+IcMkL8mr5WwT8vUwZpLf25ojn+ZS917yufnTJbj2xf93t3BstEEaBJQXLRcZ4lE5SHI4mKzTF2LLMIr7AJx9X74kdtryBPOYJaIA6QA6MBAPXr2b8a4i21IPW/IKr9H6XdezcZsHIRlU7aKawhcMK0RURlyyFcTZdmg9zdbXKcejOakm/077JbfMvyvhz0DaacMe6Xy1VImzL+no6bRwjddHpGlA3AQVJZOo2KsA3F+rHnqjosnPwCmuVSWlbiByFIgC/g5AFlV07BHBBBRvl3UyY4YYGPRXzUuALTyUJacwE6AE6Xyxvn2IdPZPftkBjzIgWxw0PBtSXkCfggfEsA42tp5jQ0sHAAAADwGeoWkTfwAAXvurAADPgCEZT/////vnINbaIgtWITBV2VVuN00sj2aGTNdfC2ys3PQ5WXrEXpeltPYk7/J1hnUseQuqzVicK4sIvhpsO2/bZIti9XdjtlbDzp+H73oAOyORqPxk3JrI67+T/s8DzBPgIZpjNlG0n2/DPHIKSjmprJWE7d7WTkpSHEpUVYOOAABdq/sYnQN3iUjh/ACcgoU1YBVWHsuGa3fC2ys3PSZHWB3ohSnH4AAAABABnqNuTf8ADfDCKwAAAwHpIRlU9c2EcAAZBSugsBaWW2lPOIH6csT6gyqZR8bRq5lN98afTdZ6Lp+MGpkotDbe4nChao8Dd9mAUtQMy77dETkPLdNNLVFaqzY93Jo/6516bfwuQxvOgXvEFdFEg3oydoSoHtuCmB9V+25oGhRxLmWlShS2+lNFEkA0fteE3Zga0sJChrQZJ21+t4drQu4CACaDMSAKFSh8IqltpTziB+Y+/c4mpcAAAAQDQZqoNQgtqTKYBE8AAHYeInjKm3uAbdoAok+f3NhfWrSDamAMO6hO1g5dP1YpEA9N8zxP+zgzf6SNhGLsTQnPOBJRx8cpSRC6F0qId9C84urbRzSElQNQ7IBS5rUV6NZGJJfSAVBpmEW0M6LyLTayUXsOerDzU5CwD3lgj/jlCSSvq88rPC5tX4dd2tlDRd8eoQVjPFIUSDMcowNgbepZC3Smlc5eHDZopaWKB5hQQ8QwVgkiK/62vbEsnuumqlAM0zf7fz2Hkpk5RS7r/I1FrTaYV/ot6QjSUsf3CirxH65E1f2FpNnsXyZKyP85wMPwW7y6Mk1h7y1FqW/omGs1W97Pr8c3eLrfrkYGTbUTvZmbwcakZ3ONGZnptjmvt4IyawpeKiG7KXN5kLabUIzPDDh8o524JtxMVkBb/EBoWZYtRfFVcfGMl1IpeGk8BMINT0abu4X9HtEuv5xQ5xDJkvSBrPnyji9YKaWEQslZiUfDoiQq9RniLQT6OUhQhmIQYU1CaCxvhGBRK9gQyHe1cOIISWYYR4mBFBLQ29awDotde6l4yap+9kyMBHpPU/Uhs88tFz3ULe9OY/dx53VMmBECQ5IseV0HtYlMHIQy3HmE4PxvxKiUKov/NDghxQ5F4QfESPbFiIBuWFkMA+B67kIFZN+LBd2pp/gb7cTNSrKXeOGTJEkPjNz9YFCrzz5ut+/AO4qXVPJwUhhHc4gDTNfS79RRcdhiKWV7RTUj3GUDxnqked4mNSzeQitoAm6kVpZV8BRegutCgludL2iFTTlKXXF2egBMQMU+Oa3hlntx1StCFfhchQ5UGbgIDhobguCmM0hwyqfPka5k3fYcQE+XcFOPMF83nIJ0UVXwzC2Cc+HEpe90CIhBO+2Z9wDsUm+1+H7LgGjNaWV/4aAz4SlMpB9PZEDi40SYV+V2G36uGbXDoqv7ncqRDfYWPLjWhrr2CIEkCvh6U6LzkBuwSLsg5BRLsDuSO54RvU1NhUUsq650ABFLCt1o0cRIO4PUclzojbPqFP4Tka772Rs5BcAYDaB7RSz19DiEJLBJjxTFG9S+R7L27hh5k1S9VL6Ff9LS4X3m/q8o9Go3wahxoCXWXP8ctjoDB9zdL1zSJ4j6QxzNYLXJYT2p9hC07syk1m1j368N1kAMIVxJ/hn2pmvKcAsXNGTC6lkdVHWyPUOEfoUNrJ3mKq/0cNYX8u/ip9OibCw3FpDJf+tRebWsFijnxlxOIctJssv+OPi4XLKwJxHe+L+fsIZMsG/eUbwddYI/I04GC/ecsp3ku2Ud7HuJiY0k2RgtGGvBQ7yIBmTuRaTMmlwn2Ds85eBu68FIudC0Ww+3L/OiGnBx47YWOy1YgSEZVSXNRwFBmtcptaFSoyzyAq8DgM0brpZHAYz13eUS4s/g1V93+39vTiyHxf16Zox235CyxN3imk8ri6Z2/YGIuzT1eqKU1J2XMTX4x4JxLcvy+Yu4bQB+8lkPZWWbLgynBOQENyquXFjmOPZy68SIN0DPnADp9f4cujjryKe8g6ikhSvWItOvpHQa7agSpocH6fUr85f9/apa9ogI9vSEoMlKoVkAAKKgphGHxliqvAAAAFtBnsZklERdfw5kvwDZtXezWkNbY5DFCQ/VRaslBV/iXbiq5hr/nYw0gIaAkWZGsX/sGDwqHlx4DbxxEG6/4eyY7iKjuZtxBFIkf+vKV8aoOzl+rpSB3QzUV8ExIRlVLc2IpRSDESlaSBYgBdgzMuTi2HHbA2U4tWVfB0PuF5RPPUBQjqqEppWkIk9Ap/gVKA2BEYFCsow1Ry51k1Z+f8Eids5sheVi8FWlPM3MVNWXnCc+TnsFDkMDZ3eqnFmhz4u2w6ZpvjGLwIDSazNz3zKKhdBRKDHEy1eLqOG165FwWtjQdPJhv7sKyLAiwURfRiwbPNrxwuJGK9wuAUKmDgjA9gc9/B2wHk/wBin4hvADBwAAABQBnuVpE38ADfKuM6YoUk8AAAMBTSEZT//////naSw7DRWOg9GY9EIQAKqELKulvfrC5Av69/mB0zdrfV73bo1Hec926/SP2OWAHiGhZX4itjp9dsPp+9x7C6lQV3E7mxqlDjSxrZsCcH5trwjHZTEtHWF81Q1JKZTAmU8hEufWC258tqC0Gh1t0S9WX/vAHibrWKWWr3DFZro16mSe5YCQwNKNIspjBPsYLaMBCHRAEQevWfUgDtupwlG0AsAJYHk4IRlP/////+gpliokH0Zi0oiS4gg70ipCafcs9u+EBNBqcHoMgG4UVCvgbgnXpAKkveRxHCASIG1bsccBfUgru+P+Gpeu0zzMbS6vhazqgd+6EPv5hd3LeU7BgssL7j2L6oGJj6DkHWgoR+KNTv047cylTdbLiRKNCReqtYKgNIH33v+3R42NVQjmI0JAE6xhKDtGAtKAlgB/S/bvhAn+4/fR25xB7ydTJfgAAAAQAZ7nbk3/AABpdAu07AAC7gAAA+1Bmuw1CC2pMpgE/wABty618BJ7kHuhgO+69B0rN7GlvQV1kGp4cUywbXWkyou7femydMdjc4pj3Nu6bBJZklp93XvjBustIvnlK/eJkhLVgjIWAIXz4b1fOVY/gcxtP7hi8xySJed/pkg+FF/siy+GhEcrVKs78+MRx0+od9ruBn+ug5ybEl8tbjvstGz2BuEG6Khqxgv6pjt+akh2NUlyVDTwAlwUfDXOnZcUW+1tIJHSc9D/8vLYvbn2zsi2ygwwRKNPGKJh50DB5qqEfN+7F6CeoB+5IUJmyh+Q3rEWBiiViEvXL2eWYm8P/fzubatLnTFYAXjDoIHF8fsY40eVRwAVTcr5J3UlWG2CvQqoHyvbawuR5jMGOJGoJewIhEyCd5YTlgOIk4lOR9pSoADJH3Mjk9pIjAxvgAEdX33fgRxTq5+Thzcp0Jvotxlb54utRGeUc1OL69NjtZ2rBy5Pl9VZoBJC3LWRQLgOj/vqGn3s1YGC3UdmuuYzQvPx4maPK1t1Vhoan8R0OuIeK0m4paMC9WL87/bTB6UBtPv+Dr6DHg1AUjj3zW3NLD2YMwNWmj8T3uQp0VNZuHPvQUVO1e84iQyRuFl79Y8Ea0K41u2KFNtirIUiHDWZdUpliCZcnfFJSUcQSRPc+a5q0+zdkGsxHXvhVtjVpdkR6oZixXm1HsyhpbW/w9K80ZcoxxeL4htZpDWG9NDkCUjFUx7pMOQN0KvjXHDIBkMKD5iWM6zKUR9MckLRfOo5MDZt+Mt5xfMFuGtCEhjY3hbMHSnjhWlFyIpwhY5JTh0Jh+16yKP0hbDjyLpRIu4GSqtKQAnLLyNewvoqnB0wUTuHCG1F2sAH7j8MA5XdYL6xfVyZnUPqeENdtDI13gmHObUBM3POmKJ8KfOBn8f1+U0e/ay+gk7N19JWHIqmfnYXz+Mrbhwr7WXG9qMWnWdatqzaQVgfh51rk7V4Do2wKHQ/BNyrei7M6oLJIDdNc8e6fG8vl+UyPDOKCcktfst6NlZFwBiqOsEdVWfFrmeWDAQgiRYjM0/K1rmYua12MI/c3YmzXPH8MVgcICmtvwae02wmyjczlwz7ZNSvaQwIfM8RpZxVh0sih1tfsRfflqDv1piSaDg/5kwzzM3XuuzoAP64DL5A4XWPghRhPkvh5Asf/UB9iocwTO9dMjCNPm4+Vh8h7VnPlIW2qvB7VWD+FuIO0owqnQBxEZuXsBCC7ZW48yeYBAg8ObioNmB8TViwM0CVvgUrnw6bYy4p1S6SwqffIyTWGjTTiiTangmQz71YqpjUNk2KgnvYwJY/o4RP7q2qpYr+wSXi00WdRSkOIqAhGU//////5+GWSEaJC6UAiIAokpYgF3mre13XATvZlRetYTSKSU0ivfTjolX+Ipl90qTVU1C9jNfN1djvPD1SrtSQW/sSmpnFakvkLglR2r7n3V3Fxxitq9rt7bbS0PhTv3aMc2CfJ41EwRH9fK47N2BzoYe3n4Kf0f9OGbohkOxY0juNlVbqfJUAnxXEMX96erhOKYJaIC6UAgqB37XdcD9bsr/P0awdbiEZT//////n2XZWUQtGIdGImSpUZXDBV2qUaHtMq06C7T14z9Sqs1Dpei4GIDeag51EdYiDBYe/ulebPSFJ3vp3HT5wsOJxMcJieWo/M0vk4ynynliaastu35rP+uOqGEQuqnrtlmo5yIqIZ0HOdhVQu1tGi1k5qD98tUuwAy0nQHaBhhs2wVSATsDQoU0YB0YCEFPiZaBe5Ajb6MLBut7qzgAAAHlBnwpklERdfw2uC2NO8YuPOHsDbYdPEqesDkVk4WB89O2G2xwZ4Ds6h+DMe35vFGMlMVWMZ5yi3Qwe5s2XgqQoXweCC2qR12F8vUOxgyONhMKVtrFTq6WESXySGgFrnJAnIKPUyZulgGSwpcGeeVxqUC+GOfRfCyPjAAAADgGfKWkTfwAN8tvAAAEjIRlP/////+dhlihOkUWiUOkEJCpBTF1L2lwK7lz65XUoIYvB1vp1SbEelLLEkuDGhtdhbubt7UR7lNwTPWeeLINBfgsn4auPt5cEeLpi0ZygCWXjN1clhCgaMavyarQtWdpOdlVVsiihObSs3Qy40XhzqfOlxvn2xcyzdKuaOQVcud96EEgJqCmYGaQBaIA6QAgAgt3Prm6lBvb6DVx9g6GMLb8cpvet4CEZT//////n2ZY2XozJoxChUVUVS4glWPu+IL1sIw6f1p9PTtn2/15O/OUJmm5PpYLCHipsbTSuRKs5G9j2C42pqxx7nyv2ElubmCsymG7hofy8q5IL5ReflxpvuxOnE2dKqqsr+vj+qEoL75YUa4sDIjS4GCGRJkgqincCUvfRB7sRABOwMjBHRgTRgFQB+3xetjDA9hxO9nx1gjcAAAAnAZ8rbk3/AAR6z5YqF52++XBOxOe36JJsgLYgr57ZyrArXL24AALaAAACb0GbMDUILakymAS/AAOICElA8MA4Wj0/26F7E4ETKmH5mzl0y1xMmk6aPsW548lKPOIKdQbDk8X4bjq1eNXw8rOyd4xj4G+aNJgAUooKVG01dAf5TYJg5yoyoYlqt9C6tBpkdEOm47g6gcfWMq1vwUpZVNCIBCy044Wt4FcFKdOr5hFu4DOk9IYC67tY7PknUNw/013GcCkY+4xgyqEx+0SviXohYopmTNBBFtBpaaU40cRh41Po5EXwxsyDPD6NEha4kQHjvakiOZJ2BaaPp6yOAzMiqNXMUX/UEDoURY0sbsHxxpUkxBwTNCwTD2A0f47rT3zG6JV6pKfYgJQPstuWrD21inNTeoXu6eKpn9jB7UV6yLOQpJtbcUe2ZbBkggWiWxiQua+lW1CifXnnltHWCQpmsdTSFeui5t7deD8ENszAb+jrxEYrNoNiCuO95DIL4IlUM/uxpBioqOkwIGY7W75cz7duzMStUCLGId1QfNAv9mbuxxcl5VL3c4+Zs8VYhib+rjcwu2vxfBhhAehEDshrqILvL6gWfmoDQhNQjCoZHDvfQ5qHtmnOvs+xyfAjl/0wsNbXNU7wMlS1BLVbzbQPrRNC/KEqXGCDCBSSGxO5z9dvN146iRm/Vo6eYi21uAX7AsgrmoTNq4xp7g5ejwi6Ppf780nImaYwVTjqYM2wjU5Jgwmah707Itey1zCjX9yeNnzHiEvXGvHHeeUBjanXDcbqBniTSLliQ8yUBbY+0IAg0+Uz8QqS3p7AnHNSSDqBlKBSipBI91ymCP2In8jogwzMNPm+TYRgUK8NfNix+0UhzqSeJWSJF235IRlP/////+ds0HsTK0yD0QhAyVEyuAhB/68zju7ToDHDqS4Jja9asO1Iw6nM01nhNiOhnwvIwoXsmWHt9v9zNEcYENTy7moene2A7y+1Ntt7P/JTgnY9fPllL5vomTHR3hxoqkC/GeeyWvC2gbgAJsfVOp0W6v80XkhO9jGnRSDHGJP+GjW+FcJpZ5mdGP5AE+pgnpgHogCA/deZx3Og8fi/P6OESxfAIRlP/////+gtVFZRl0QlU0IyUC1WtQ4PKqPIGMENGQOKJWU5uKuuP0qJ0U0/Ek0NBK4ckOb5ExcDpJd1G41nE8YxPBqdZtMeq0NFFB1nUxomgLZwKmbCrVuzm0JOsgjQc4E9out4IjXgqT5eTx10QC8GzPYu5X9fx6tCAK9ViFgUqS2OYovCTy05gJUy7X3ncAoDMGNEBTDl5UL//4/nxXgAAAA8QZ9OZJREXX8EciXWNZBe+DOnRu1PjhxGMocakMJZI35bEfzX2UJ4gwmJ3wy23Y+M+Ut4NXXzlZHXDAz5AAAADwGfbWkTfwAAAwAAAwAf4SEZT//////m6QxLGx1LpDHogCAA3WolJBHtNbhYJK4Vx+z5Cuog5jrPC0thuibkScH0a75d8zFq/mFs7q1lMNiCvWnkCPzblsxo3p22c6ufpPHlXlVJTfWieGPkdqpOqdWITTUWzDOe9UXx+rnz/+f69VcC2TkjJtW/C+3OaFDL9b2PCJ90CEFCfgglCWkAeiAJAHlNbsFyAjz7QMPUlDghGU//////5y0QWxMVSoPRGcAFVUJAuot44DgHqbLkhG7mw3YHfmPWPWnyE95zpiLj5BI1NTiB1OoF5avMtqO80UQSmapGHxOTfKq45//5WfLRsLyOE0hYt5i7hF9LojZpIEZW6E3nhfr5ccyoPy8eW1JK/3/A75v2ZJK2p3gTzKKHH9hxhrdxAAz9DyZwontpx70O0lsgUCnCuiA4B24H2X+H1cwN7wcAAAAuAZ9vbk3/BTpGsdl2X3AScI4hY/UmVBTQBBeU1kv5QyPtJa9IjP5eFepO+zQLaAAAA+pBm3M1CC2pMpgF/wAGlV3kWjkOvXsUAD9TKFh64bk/nbEs7hQJ8gsZndVXSa2kdTzbSTnr3pTMpdSuG2ws07CzLQOItUgrDG0BQ4LKlM7JQVoibkZ6wL+nVZ14Lhuy0hiSvEOIAkEfg3jZ5/6rxfFZOZe1owpdcKdjFasHxRPKeNFGSAp8hiNyGRa2mjPcKBO3WiaFUhVFSfew52fx4kLfA2awnkQmK+OFdgu+QkV53KsSOpZtbIcWB3w+jvHONmMtMEDZTfcdr0w6uib01FpkDVhBNbvtjQNFCEbsDLQFXQvFg9yoJU+DXoxJth5/gSdUYBCe2/+BTY+orGTZK0aMKaUJN7myC5zfD/PEhURw80N0KH/2zO2yiQw/neO26274cdivDhREy6+A0NmKkx4Va1PhNS6mkqNyl5opp8ltRQlgOo4MTl1zsLHf7SEZoCQBjES0DHxqmpcl+49mwafSt1NLFt9goZfqspHGrl+tN8l3+REUEq8yNCM+auHG88xcUlWsNLnV08xPXmUsticSLeGPPHWGa37XJP4AzDxcEgjdPMSXuBJKdSCa93e6qbp1ytJKvuFIP2R6WNJYYw66klrIZ7lAhABzGW+ypx3Z8ahcmLSoBdwSuyjX1HjwFxUqBGXLcs0/WauHYTJoUGqvu+0/NqpAoOayk1mCdWvSABX4P/khZGD9oMYFVkEn5rmq/nxXrLXp15dNOnmFRj9uMoqjdzjMK/+izV25wdTvjdBF4cz2OlAtcQxjByuLQ/wtYLEEHubQNZ+AKfbPXi7YUfiguUawetOzMh1uK2uUiLbqveqyGgbwnUXaufFVOXEiP2UOo5X6P12aSFRvLmirxpUQdGUtCChp6uW44tSNtlv2bTHr3T/6isABkVtW8wCz8iehI2Iu51hOhvQUQ8/Y3CxmxqP/USGBU7ai6TyNYxGRPTc+UTG25URBc0wLQ/4NEpS64Lb7/+lV7gsUWcKkAH+oSlFKOftjCKZO0lZbTnANiuNXjcHBaDTAipZwjgA2E4bhAx1P58HIp1830gaFx+lAUiDGX/Do37ZsgL5o68xJ9ewOY+12AONaKiFBPQoJOlOGGj3zP5z9qhz4M6ZPyL16AaSycRebAZuBsoDuj8cvSd7vksJ7ChC5kM0SJ7LnvEMUY7TtLLxVGTAZUJXV8kvcnLa2Nrm5lvqtEiAlEeP37cPqMznVAkkZl4HufBQbCiWdVgG9yaTnHBlUb4YxLzdW8kHXHaD5nGdexzMzcRkYMwAMR6eb39jV7NmuSGsC0Qtz+idkGKWGU1UR+0TPZkSG9R4AMpXXQgWFNFNuRw6h0Z8QZyqKfmAhGVTdTYiFEaCEKCEIVksUpEWq4CDNAgIy91nNv3dirlZ/z+97NyX1GWTXTRrPtmiEDDTdx4cFZppaTzT3Pq3pVZUEREMgkXM1OXFf0drgX+YwATs8kuolFbxAcwO3AWopD2xuaWW3iz/v/N1r0A0NI29f4F0r1n9GbG+JV4hIf+W00SN8uW7z2uATVvsjllDTMA2HeRBQK9fBtGtWKwJfplzeS2lANMVCGTwkAq1poCcgaoDSgAIGKfV8CMOHxa2BQwchGVT9uoyFYKCFJl1tOstKzhRIC3XagD0go+Jw15L0hPM2eM77/UN3MmhMy5rW4O5HueN1vLldeLd4KGxJszH4t/LVDiMZTU1R6/GYe8fn443ue1f4KDfmms8/XwzxmgghtXqCn4xX4nwPmfvP1p15X0NvrJjET+Ek0HpNDIbiYRzdsjwrbh0ebBQPCC4F1IyfG2t+toP2fWG0b4WaABlSW1xdoqF6QpnAoHKHwsjkNSY+5sZ04AAAAEhBn5FklERcnw6d3dshaADy199F+DaXXJU2Q9kKgiMKQRGst2LY+z3pPDgjMAjYxKOyfg0z1VySt6GgQ/96XzjgptP4N89AXcEAAABFAZ+ybk3/EFPdWiiV2JKKvoJojI3QQV5MPqZ/Lzf9AzDX9IcrCJ46XtVJlyTgH2umXmtagerlgI/l83hc2MwosW2x596EIRlVRaaahhS1DnRaUgkuKEAAAIBzZI618BFxvbOme+ei++McbrsvZlvNbZk570Fh5XifqHW3YrQM1g2kCqrRir2XxtVnqKpG0uUTox7w0k6hvOTlyTxh8rsFIrvaSFg4BQbf5AhuyMO/M0X/wP7egS8fZaXOV8ntSYgQMAhP5+2rPzObuADiiOe058YaV5RAbM7jDXSeL34dPz7xvOo67AEvivKPnt2lwGy6lwClQYfGUBD7FyEZT/////rn7VCkLAkDpxE5kosqJEWWA8de+sZo1sq0QThCCR5n9SvfHOurLdEW37iGe/7MgZi5qyWKgRJCGp8Bw42Tcv4adF6DJkDwtGopQYvHVeBJ8HoWdhRxtA8GOw8Aor7W4Vh2hZtdEfWFK8Z6ub+LUEnWtThyePUtD0lWBaFNTz8gGAOiPsv7kw+T2A72WBPsUL6cBKDx176qjWyrRBOEIK/BNfUyLQHAAAAEx0GbtTUILakymAp//wANfeHcMLngGRGAo7zf5E9FSaX8Uif4NN71CT6oa6NmBWPNzqCSf7JL4rmLGJnkXJbAGAHBhH88NZJtCUb3uVtZhKmdjbDf+HKUwjR21TZAyx7gAkAO3oSyMJ3K+owmKo6rFH7nPapXzgNxd2/s6Jzr54cQyXOhqEykH26WPlgl2ygpXhnGa7CH/JC3DS49wF5lnN41k8yUpV+RgCGjBS7o9A+le8L5B++VoYph04Vpd62hh8miyRD02P3mmTorGqaLEXiTScqVM5m4Z7vzhIQljdxDG+v+rRfBmtD0EAP1AoH3qkV0wW+SK7girXHVzeNyc2LrJxvAcK9+dYz3Bax1KaIUQNAeA91z15SvvzgGs0gjqOrLCZedup4WXlapuQZPdOzzg6BLu5UvR1T/0FyJjnKsaPrpSjyXAGgU6QWs79vnEh5KmfmKggLfM7CPsO51n3bVqu+KdKUjbb5JfkPhzTEkA0+8jbwRwcFEJmn90EswNrB3/MQDpx5IGJCEletnY/5lLXDSP7JfKf8WbWnWHvh6ZP/dWPL+zYapkHICPgcG/azouXTZytWE4j3M3JV39p2CFAJucXvyMJw4XZtcBmH2WVn8yuQHUOVD802wB2E3NheBF1JRPfLrnuaw/U4p7T37x452CJ9Y3+HfFJaQaP8gxZqcSWIcEYIj8gnJ6VJmDk/YsuMPS3NUKuBaS7S28YlPwxjZ3/2v5usJXevIxqXblshWC09OR3yJM5AeWoWiDtRCEiIbz+i1F6DpIMO3iPHbb7iBwp3DWsmWA1Rekhleg1+2a8KacvOt/uTzOHmrMgvGwY4ttHNlYo0JLMbamPsdeU/sgYJxCiYO4raO4EyvnmJ8sHsHI6E1Lwf/DhRXDlyDhftBsEcjdAItA+YmbB/Hx0qqyWYkZ0zJObkwu116LJ30JBA2pEPKVYB830/hDFcS7ao5pha6DeXnV8cVeTiLSNBiER6xLeeIyehOe/BG1Y9gvTx4WDmI+G27OKrEBuWIJsXpfcx1N+Y9MLPtKh9WS3owBueiRvnmae8iMqgihxDVGcJEYIMPPenvJacocDQ32ZnRfTddOyOmOp9VnJ1qzl8envW9eKWl/FK8FE6z4JXXVqqe1tNv7+uudN6+dRSWhNDWnFPu5NRxJhZOsdmL9njnTHV3Fd5OJgKHY2urb1fTeQA0j+cC9OSUVN1OpmKU80AQ9jXtdG2TgXVlUZZbpqhXO5ph6JfjYlkVsaq0aFACbbuKKE7Wfy3CFAfAk5c9DBfeScR//HIT7kBZhmnDCdrCScDHsZM0FCE9MwKFNMc9qsDkq8bfNH3xpCH9x20XlKxolq4QTgJm2C2bVe4t3car2cMljDPnvr6OUz/G8PMXhj90dl+jlEAZ9Glj2adZ12raGnU248yjDS0RPvCo3xk4PB9aj5uX5wDQBOqJ537yoSBlfGYlJkpAHGHXaiMUbNvTlGHmbdMprhJkkpbQahGO4RfNFy8EwKl1bMdLGWsZII0vJO/XzmIL2WRJLrrV7tgBpeUecOIsxNZ7PNenNAzx+L19yEsEitcQfixB+DeFEHisypJRgZqjT8/R2W23ZVdUj2auatgXkdX1c1AuWyFUv5Z4AAAAxwGf1G5N/w/rJCQZZopnUIRr+GBYrRugBQI4LflvCyC4EdrKpQuJLxs/NnwBwpJdGV1JvQXJcg9ryx4E1cbQnOxpqJfzorWQGN4/10ZkUOCvSrVTIoSmbzU3CoMSSBjvVi5bgV9eYtY5++CBYENO6xX+/1tRu/acr2SCrdpnuyguUDSyFU/xbdM9yobVmNAc12tswOtNSM5B/wOin1dPd5vYsXAZg/OnMotCRsp9zU/4qv+esC9bKYFPeQa/Ji7h1Yskpa8AfMEhGU//////5qnQYysIyaIyAEqVSGiygdR35vQFP6nheSVY/FVkRrjUsHpO2mmJslE0yAmBHpWoIqWbO9PJDvBPCneW+tR1drCGhbPXHLubnBSIRMo4NjK42eYgSoyVv1nySVuwGWGIPeYWu7UL4Hol/+zpiuAAGbai2+DuijV9P5kYiM8LhmOsXa0EgTdjYgnCOiEQCAAHdj+Q9Nbig2+x6eZrYDQvxhvD0ADyReEy+/ghGU//////5ax0qwscSMIxaIzAAUSNArLHdz1SwNHIc4c8R9yk+6N40qQfuE5DxOBLDeZcwNBKEyLTGYicFZHLwyOo+z8/zVFEd1WOjpTZhP8YOb/lL4+SDOEYKklasUFJ2ulrg/h3FwMjllkKQ2p0E8ipdBdf+bDYmABcBATO21Omfd1eXPCsEMhlbyOGfHrgmbOhwfogMqJAY26+QoOl5gPKUhqruVGCJs1kYKudiwMWp3hz4AAAACVBm9Y8IUtkymAV/wAV5wZ3+YDr/K+LkLbIACY4OH7lq5b07gjgAAACcUGb903hDpbJlMAJvwBOInuZgeBtABJ04AClOXQQ5NCjFA5za5JYgNgCslbYWGsXY4nUZO/HEv79F3KcqeKljP5dzjdmIAUws70KywCDSBtqSQav6KI7Cd7sFHapLeh0vX7t40RD9fkk48659+96A0Wva9SALDc/vO2Grkcvx4G8PVpRF9oOvul80HrWfMH+fymT5wuUWZKHn5s4+nvDaF8EjwzqsFlUaWA47HZSkDNUxNS2YpnxXuusqrBRvnMHQBkQNgVBVxkJGkbOOzfY4W2/6sh0ijp3IglAEFO60PzUFNoHERRuJupNgYbCXyPKFvajhMdErwOXgg2KmxxTGHFnizLL0AssLKLFjtylxQaxIazMu2x0RruleTtWWIpWI53c9CzOywl5vVwug7ydc0VmkLB8qa2x9QZPJrFMhIlSMr9sXVdERgKy2WaOxhf/vm4HdqxeCy+qiE5vw8RDWwue3M4Z604CYaGWAvf/+6UBWZ8y9lUSg/FbL8ugFqDwegKPnVEiFtUxxV7MwtVUZaOh+XosDCwqi03qxXrHjM9PUlVjhHjzyx0aOV/cCMsR2vR9sj47PI6wO14JLy34MKYntSK8nILAlF870y1Yj0hoTq4+UpR6RkcMY+OBfkLHM/jSTKX6pg/nhrMSW8gOCzKM9TXFthU6Caa6FBuMZ1ql2oPRRgVZ89LbcTlBj2OFb45OX1cEXqThUh0fHkJnRgTms5u2HFPz16W1yjQasdmdO94ZdlniGKxSMTbRRcy8CIG2Hr7K71MN+qmC5LLxPovziOCF49kzphUw2eOoHLC65tXu/RmTnhfM025oYxWMEwchGVSdoo8FQYiYRqAAqiI0A6woBljZ/KHSts0QK0AZ+edFZHy9Fauy1mA4gY9WUQW0vCfV8J0PxH/lmUsZvTQZJwArXAscFmWRIpqnxGOPrJyqMUwXP5xDFgYYB8J7tq/QN99pa+UmjQbYqdM7ygGAUheNv1qNQEEwUa2elqmlqyFDR3oqR+weqp4dkhvF8cM+52isxagEpZmQDiCCAAMv+RXmseKfPU2sH/G7ghekmcS0Y8UxVllSGrkBaUYBZbIRyTPwIRlU3YoNZ2MREEKlF06hRRLqEFpguFtlaACkT3SsAcWFScsoMvIL0isv8fLNbvWYFkRE0Ft5NOJu07gFBg5x9S/oYo/Yzf5kWSlOuY7//T5ft5d9GSyZZIh2DaBIEb1gt7yHaI8Qc9wmZgKvrrc6dHu5H49c+NNkIozakgFImJGQKaNBQcdHZBAIDjhcmxSkfJRGtrgmbGqA0jKy00W2VoAKAPOKSDyhm3h655e1iSGd7rOuIRlP/////+foaJoTGQeioTBMOiMOkEIQCoIgt+3an1HeuNxbaWnkADnX87pqeHq/9n6mA+/cS/yqs7GnAoKQ5PxPtHt6wO0QSkwV4RBAVifpCzys4VETvjM+tk5j6GbDXOSlgocBR0OYfUVSesKcSpYu43ZhcWmKaqEJYOGT8Lzp7BMQ9r207nME3R0IDNEBNEAdIASEBAb+p3rja20tPIAHJFVLIcgZos1gksJExRjfxWMHIRlP/////+XpLGQ7CcLC1IhAhQ7cBphuoH11urmnsuk4SGQ/6N/K1f12lW6tFWW3V+qR0lp5Dg632HTAlfRIleGfwc2xIYfdXq1ftURbvuPFEtUlnWGTTFf8Io7M13/9W7/4/npoWbByfheiTBbmTgDj1+G7To/iTulxABpR/oWCWpQR1IBACCddbq5wXScJDIf9br3wvtWb2SPWQMI5dJ5Q7gdyBFwhGUgAAAM/5gPma2wBg388B8BOKAvj6Y+4O7AEAyQNbYAgV+gQgBHEAQPcAAAAOmZyZWVJc29NZWRpYSBGaWxlIFByb2R1Y2VkIHdpdGggR1BBQyAyLjIuMS1yZXZyZWxlYXNlAA=="
 
+import base64
+
 from core.common import DEFAULT_ALBUM, MediaKinds
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APITestCase
 
 # Register the testuser by default, but registers any user if credentials are provided
@@ -80,6 +83,22 @@ def put_media(self: APITestCase, media, albumid=None):
     return data
 
 
+# Uploads a media file as multipart to the current user (test image by default)
+def upload_media(self: APITestCase, content: bytes = None, kind=MediaKinds.IMAGE.value, albumid=None, filename="image.png"):
+    url = reverse('media')
+    if content is None:
+        content = base64.b64decode(TEST_IMAGE_FILE)
+    media = {
+        "kind": kind,
+        "file": SimpleUploadedFile(filename, content),
+    }
+    if albumid is not None:
+        media['albumid'] = albumid
+    response = self.client.put(url, media, format='multipart')
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    return response.json()
+
+
 def check_album(self: APITestCase, responsedata, album):
     self.assertTrue('id' in responsedata)
     if 'id' in album:
@@ -181,3 +200,18 @@ from .unit.auth import *
 from .unit.user import *
 from .unit.album import *
 from .unit.media import *
+from .unit.file import *
+from .unit.upload import *
+from .unit.export import *
+from .unit.storage import *
+from .unit.stream import *
+from .unit.trash import *
+from .unit.jobs import *
+from .unit.geocoding import *
+from .unit.geonames import *
+from .unit.mediatypes import *
+from .unit.mediainfo import *
+from .unit.duplicates import *
+from .unit.embeddings import *
+from .unit.detection import *
+from .unit.tags import *
@@ -0,0 +1,24 @@
+import tempfile
+from pathlib import Path
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+from core import storage
+
+
+# Runs the tests with MEDIA_ROOT in a temporary folder removed afterwards, so blobs, derived files and streams written
+# by the tests never mix with (or delete) the files of the development server
+class TestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.mediaroot = tempfile.TemporaryDirectory(prefix='galeria-test-media-')
+        self.mediasettings = override_settings(MEDIA_ROOT=Path(self.mediaroot.name))
+        self.mediasettings.enable()
+        # Local storage keeps the folder it was created with
+        storage.get_storage.cache_clear()
+
+    def teardown_test_environment(self, **kwargs):
+        self.mediasettings.disable()
+        storage.get_storage.cache_clear()
+        self.mediaroot.cleanup()
+        super().teardown_test_environment(**kwargs)
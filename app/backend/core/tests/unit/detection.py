@@ -0,0 +1,100 @@
+import io
+import unittest
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import detection
+from core.models import Media
+from core.tests import login_user, register_user, upload_media
+from core.tests.unit.duplicates import get_image
+
+np = detection.np
+
+# Session standing for the YOLO model: boxes of 'person' score high in images with a bright first pixel, of 'dog' in the others,
+# and every image has a box of 'traffic light' over the threshold
+class FakeSession:
+    def __init__(self):
+        self.runs = []
+
+    def run(self, outputs, inputs):
+        images = inputs['images']
+        self.runs.append(len(images))
+        output = np.zeros((len(images), 4 + 3, 10), dtype=np.float32)
+        for i, image in enumerate(images):
+            output[i, 4 + int(image[0, 0, 0] > 0.5), :5] = 0.9
+            output[i, 6, 3] = 0.4
+        return [output]
+
+def get_detector(batchsize=None):
+    detector = detection.ObjectDetector.__new__(detection.ObjectDetector)
+    detector.session = FakeSession()
+    detector.input = 'images'
+    detector.size = 64
+    detector.batchsize = batchsize
+    detector.labels = {0: 'dog', 1: 'person', 2: 'traffic light'}
+    return detector
+
+@unittest.skipUnless(np is not None, "numpy not available")
+# TEST IDENTIFIER: UNIT-20-01
+class DetectionTests(APITestCase):
+    def setUp(self):
+        register_user(self)
+        login_user(self)
+        self.detector = get_detector()
+        patcher = mock.patch('core.detection.get_detector', return_value=self.detector)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+    # Valid test cases
+    def test_detection01(self):
+        # Labels of the classes scoring over the threshold, the most confident first
+        output = np.zeros((7, 10), dtype=np.float32)
+        output[5, 2] = 0.6
+        output[6, 7] = 0.8
+        output[4, 1] = 0.3
+        self.assertEqual(get_detector().postprocess(output), {'traffic light': 0.800000011920929, 'person': 0.6000000238418579})
+        
+    def test_detection02(self):
+        # Models with a fixed batch size are run on padded batches
+        detector = get_detector(batchsize=4)
+        images = [detection.Image.new('RGB', (80, 40), color) for color in ['white', 'black'] * 3]
+        results = detector.detect(images)
+        self.assertEqual(detector.session.runs, [4, 4])
+        self.assertEqual([list(result) for result in results], [['person', 'traffic light'], ['dog', 'traffic light']] * 3)
+        
+    def test_detection03(self):
+        # Labels of the model metadata are lowercase, unknown classes are named by their number
+        detector = get_detector()
+        detector.labels = {0: 'dog'}
+        output = np.zeros((7, 10), dtype=np.float32)
+        output[4:, 0] = [0.9, 0.5, 0.4]
+        self.assertEqual(list(detector.postprocess(output)), ['dog', '1', '2'])
+        
+    @override_settings(DETECTION_MODEL_PATH='yolov8n-oiv7.onnx')
+    def test_detection04(self):
+        # Images uploaded one by one are detected in one batch, images with detections from the browser are kept
+        ids = [upload_media(self, get_image(seed))['id'] for seed in range(3)]
+        response = self.client.put(reverse('media'), {"kind": "image", "file": SimpleUploadedFile("image.png", get_image(5)), "detectedobjects": "cat"}, format='multipart')
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        self.assertEqual(self.detector.session.runs, [3])
+        medias = Media.objects.filter(id__in=ids)
+        self.assertTrue(all(media.detected and media.detectedobjects.endswith(';traffic light') for media in medias))
+        self.assertEqual([round(mediatag.confidence, 2) for mediatag in medias[0].get_tags()], [0.9, 0.4])
+        self.assertEqual(Media.objects.get(id=response.json()['id']).detectedobjects, 'cat')
+        
+    # Invalid test cases
+    def test_detection05(self):
+        # Nothing is detected without a model, files that are not images are left without detections
+        media = upload_media(self, get_image(1))
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        self.assertIsNone(Media.objects.get(id=media['id']).detectedobjects)
+        with override_settings(DETECTION_MODEL_PATH='yolov8n-oiv7.onnx'):
+            media = upload_media(self, b"not an image")
+            call_command('runjobs', '--once', stdout=io.StringIO())
+        self.assertIsNone(Media.objects.get(id=media['id']).detectedobjects)
+        self.assertEqual(self.detector.session.runs, [])
@@ -0,0 +1,108 @@
+import io
+import random
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import duplicates
+from core.common import MediaKinds
+from core.models import Media
+from core.tests import login_user, put_album, register_user, upload_media
+
+# Builds an image of random blocks, images with different seeds are not similar
+def get_image(seed: int, size=(320, 240), format='PNG') -> bytes:
+    generator = random.Random(seed)
+    blocks = Image.frombytes('L', (16, 12), bytes(generator.randrange(256) for _ in range(16 * 12)))
+    image = io.BytesIO()
+    blocks.resize(size, Image.Resampling.BILINEAR).convert('RGB').save(image, format)
+    return image.getvalue()
+
+# TEST IDENTIFIER: UNIT-18-01
+class DuplicatesTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('duplicates')
+        register_user(self)
+        login_user(self)
+        
+    def upload_images(self, contents, albumid=None):
+        ids = [upload_media(self, content, albumid=albumid)['id'] for content in contents]
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        return ids
+        
+    # Valid test cases
+    def test_duplicates01(self):
+        # Re-encoded and resized copies have close hashes, other images do not
+        original = duplicates.compute_hash(io.BytesIO(get_image(1)))
+        copy = duplicates.compute_hash(io.BytesIO(get_image(1, (1600, 1200), 'JPEG')))
+        other = duplicates.compute_hash(io.BytesIO(get_image(2)))
+        self.assertLessEqual(duplicates.get_distance(original, copy), 2)
+        self.assertGreater(duplicates.get_distance(original, other), 16)
+        
+    def test_duplicates02(self):
+        # Hashes with the highest bit set fit in the signed column
+        hash = (1 << 63) | 0x1234
+        fields = duplicates.get_hash_fields(hash)
+        self.assertLess(fields['phash'], 0)
+        self.assertEqual(duplicates.get_stored_hash(fields['phash']), hash)
+        self.assertEqual([fields[f'phash{i}'] for i in range(4)], [0x1234, 0, 0, 0x8000])
+        
+    def test_duplicates03(self):
+        # Index finds the same groups as comparing every pair
+        generator = random.Random(3)
+        bases = [generator.getrandbits(64) for _ in range(50)]
+        hashes = {}
+        for i, base in enumerate(bases):
+            hashes[i * 10] = base
+            for j in range(1, 4):
+                hashes[i * 10 + j] = base ^ (1 << generator.randrange(64)) ^ (1 << generator.randrange(64))
+        expected = [[id for id in hashes if duplicates.get_distance(hashes[id], base) <= 12 and id // 10 == i] for i, base in enumerate(bases)]
+        self.assertEqual(duplicates.group_duplicates(hashes, 5), expected)
+        for id, hash in hashes.items():
+            self.assertEqual(duplicates.HashIndex(hashes).query(hash, 7), {other for other in hashes if duplicates.get_distance(hashes[other], hash) <= 7})
+        
+    def test_duplicates04(self):
+        # Hashes are computed in the background and duplicates grouped per user
+        ids = self.upload_images([get_image(1), get_image(2), get_image(1, (640, 480), 'JPEG'), get_image(3)])
+        self.assertTrue(all(media.phash is not None for media in Media.objects.filter(id__in=ids)))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([[m['id'] for m in group] for group in response.json()], [[ids[0], ids[2]]])
+        
+    def test_duplicates05(self):
+        # Duplicates of an album, and similar media of a media found with the indexed chunks
+        album = put_album(self, "burst")
+        first = self.upload_images([get_image(1)])
+        ids = self.upload_images([get_image(1, format='JPEG'), get_image(2), get_image(1, (160, 120))], album['id'])
+        response = self.client.get(self.url, {"albumid": album['id']})
+        self.assertEqual([[m['id'] for m in group] for group in response.json()], [[ids[0], ids[2]]])
+        response = self.client.get(self.url, {"mediaid": first[0]})
+        self.assertEqual(sorted(m['id'] for m in response.json()), [ids[0], ids[2]])
+        response = self.client.get(self.url, {"mediaid": first[0], "albumid": album['id'], "distance": 0})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_duplicates06(self):
+        # Copies of media share their hash, trashed media are not duplicates
+        ids = self.upload_images([get_image(1), get_image(1)])
+        response = self.client.put(reverse('media'), {"kind": MediaKinds.IMAGE.value, "id": ids[0], "albumid": put_album(self, "copy")['id']}, format='multipart')
+        self.assertEqual(Media.objects.get(id=response.json()['id']).phash, Media.objects.get(id=ids[0]).phash)
+        response = self.client.delete(reverse('media'), {"id": ids[1]})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(len(self.client.get(self.url).json()[0]), 2)
+        
+    # Invalid test cases
+    def test_duplicates07(self):
+        self.assertEqual(self.client.get(self.url, {"distance": 8}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"distance": "-1"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"albumid": -1}).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(self.url, {"mediaid": -1}).status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_duplicates08(self):
+        # Files that are not images are left without hash
+        ids = self.upload_images([b"not an image"])
+        upload_media(self, get_image(1), kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        self.assertIsNone(Media.objects.get(id=ids[0]).phash)
+        self.assertEqual(self.client.get(self.url).json(), [])
@@ -0,0 +1,153 @@
+import io
+import unittest
+from unittest import mock
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import embeddings
+from core.models import Embedding, EmbeddingCentroid, Media
+from core.tests import login_user, put_album, register_user, upload_media
+from core.tests.unit.duplicates import get_image
+
+# Encoder standing for the image model: the vector of an image is its 8x6 grey thumbnail, centered
+class FakeImageEncoder:
+    def encode(self, images):
+        thumbnails = [embeddings.np.asarray(image.convert('L').resize((8, 6), Image.Resampling.BILINEAR), dtype=embeddings.np.float32).ravel()
+                      for image in images]
+        vectors = embeddings.np.stack(thumbnails)
+        return embeddings.normalize(vectors - vectors.mean(axis=1, keepdims=True))
+
+# Encoder standing for the text model: a text is the seed of the image it describes
+class FakeTextEncoder:
+    def encode(self, texts):
+        return FakeImageEncoder().encode([Image.open(io.BytesIO(get_image(int(text)))) for text in texts])
+
+@unittest.skipUnless(embeddings.np is not None, "numpy not available")
+@override_settings(EMBEDDING_IMAGE_MODEL_PATH='image.onnx')
+# TEST IDENTIFIER: UNIT-19-01
+class EmbeddingTests(APITestCase):
+    def setUp(self):
+        self.similarurl = reverse('similarmedia')
+        self.searchurl = reverse('searchmedia')
+        register_user(self)
+        login_user(self)
+        patcher = mock.patch('core.embeddings.get_image_encoder', return_value=FakeImageEncoder())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        embeddings.get_index.cache_clear()
+        self.addCleanup(embeddings.get_index.cache_clear)
+        
+    def upload_images(self, contents, albumid=None):
+        ids = [upload_media(self, content, albumid=albumid)['id'] for content in contents]
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        return ids
+        
+    def get_similar(self, params):
+        response = self.client.get(self.similarurl, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [m['id'] for m in response.json()]
+        
+    # Valid test cases
+    def test_embeddings01(self):
+        # Nearest lists of the IVF index find almost every nearest vector found exactly
+        rng = embeddings.np.random.default_rng(1)
+        centers = embeddings.normalize(rng.normal(size=(50, 32)))
+        vectors = embeddings.normalize(centers[rng.integers(0, 50, 20000)] + rng.normal(scale=0.3, size=(20000, 32)))
+        index = embeddings.VectorIndex()
+        index.centroids = embeddings.train_centroids(vectors[:5000].astype(embeddings.np.float32), 100)
+        index.add([str(i) for i in range(len(vectors))], vectors, embeddings.assign_clusters(vectors, index.centroids))
+        found = 0
+        for query in embeddings.normalize(rng.normal(size=(20, 32))):
+            exact = {blob for blob, _ in index.search(query, embeddings.np.arange(len(vectors)), 10)}
+            approximate = index.search(query, limit=10)
+            self.assertEqual(len(approximate), 10)
+            found += len(exact & {blob for blob, _ in approximate})
+        self.assertGreaterEqual(found / 200, 0.9)
+        
+    def test_embeddings02(self):
+        # Images are embedded in the background, once per file, and stored as float16
+        ids = self.upload_images([get_image(1), get_image(1), get_image(2)])
+        self.assertEqual(Embedding.objects.count(), 2)
+        embedding = Embedding.objects.get(blob_id=Media.objects.get(id=ids[0]).blob_id)
+        self.assertEqual(len(embedding.vector), 48 * 2)
+        self.assertAlmostEqual(float(embeddings.np.linalg.norm(embeddings.from_bytes(embedding.vector).astype(embeddings.np.float32))), 1, places=2)
+        self.assertIsNone(embedding.cluster)
+        
+    def test_embeddings03(self):
+        # Similar images are the most similar first, without the requested image or its copies
+        ids = self.upload_images([get_image(1), get_image(2), get_image(1, (640, 480), 'JPEG'), get_image(3), get_image(1)])
+        self.assertEqual(self.get_similar({"mediaid": ids[0]})[0], ids[2])
+        self.assertEqual(sorted(self.get_similar({"mediaid": ids[0]})), sorted([ids[1], ids[2], ids[3]]))
+        self.assertEqual(self.get_similar({"mediaid": ids[0], "limit": 1}), [ids[2]])
+        
+    def test_embeddings04(self):
+        # Searches of an album, new embeddings are found by the index of the process
+        album = put_album(self, "trip")
+        first = self.upload_images([get_image(1)])
+        self.assertEqual(self.get_similar({"mediaid": first[0]}), [])
+        ids = self.upload_images([get_image(2), get_image(1, (160, 120))], album['id'])
+        self.upload_images([get_image(1, format='JPEG')])
+        self.assertEqual(self.get_similar({"mediaid": first[0], "albumid": album['id']}), [ids[1], ids[0]])
+        
+    def test_embeddings05(self):
+        # Text search finds the images best matching the text
+        ids = self.upload_images([get_image(1), get_image(2), get_image(3)])
+        with mock.patch('core.embeddings.get_text_encoder', return_value=FakeTextEncoder()):
+            response = self.client.get(self.searchurl, {"query": "2", "limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(response.json()[0]['id'], ids[1])
+        
+    def test_embeddings06(self):
+        # Trained index assigns every embedding to a list and is searched the same
+        ids = self.upload_images([get_image(seed) for seed in range(1, 9)] + [get_image(1, format='JPEG')])
+        expected = self.get_similar({"mediaid": ids[0], "limit": 3})
+        call_command('embeddings', '--train', '--lists', 2, stdout=io.StringIO())
+        self.assertEqual(EmbeddingCentroid.objects.count(), 2)
+        self.assertFalse(Embedding.objects.filter(cluster__isnull=True).exists())
+        with mock.patch('core.embeddings.EMBEDDING_EXACT_SEARCH_MAX', 0), mock.patch('core.embeddings.EMBEDDING_IVF_PROBES', 2):
+            self.assertEqual(self.get_similar({"mediaid": ids[0], "limit": 3}), expected)
+            # Images embedded after the training are found with the rows out of the lists
+            new = self.upload_images([get_image(1, (200, 150))])
+            self.assertIsNotNone(Embedding.objects.get(blob_id=Media.objects.get(id=new[0]).blob_id).cluster)
+            self.assertIn(new[0], self.get_similar({"mediaid": ids[0], "limit": 3}))
+        
+    def test_embeddings07(self):
+        # Images uploaded before embeddings were enabled are embedded by the backfill
+        with override_settings(EMBEDDING_IMAGE_MODEL_PATH=None):
+            self.upload_images([get_image(1), get_image(2)])
+        self.assertEqual(Embedding.objects.count(), 0)
+        call_command('embeddings', '--backfill', stdout=io.StringIO())
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        self.assertEqual(Embedding.objects.count(), 2)
+        
+    # Invalid test cases
+    def test_embeddings08(self):
+        ids = self.upload_images([get_image(1)])
+        self.assertEqual(self.client.get(self.similarurl).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.similarurl, {"mediaid": ids[0], "limit": 0}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.similarurl, {"mediaid": ids[0], "limit": 201}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.similarurl, {"mediaid": -1}).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(self.similarurl, {"mediaid": ids[0], "albumid": -1}).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(self.searchurl).status_code, status.HTTP_400_BAD_REQUEST)
+        with mock.patch('core.embeddings.get_text_encoder', return_value=FakeTextEncoder()):
+            self.assertEqual(self.client.get(self.searchurl, {"query": "1", "albumid": -1}).status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_embeddings09(self):
+        # Files that are not images and images waiting for their embedding are not found
+        ids = self.upload_images([b"not an image"])
+        self.assertEqual(Embedding.objects.count(), 0)
+        self.assertEqual(self.client.get(self.similarurl, {"mediaid": ids[0]}).status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_embeddings10(self):
+        # Searches are not available without the models
+        ids = self.upload_images([get_image(1)])
+        self.assertEqual(self.client.get(self.searchurl, {"query": "1"}).status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        with override_settings(EMBEDDING_IMAGE_MODEL_PATH=None):
+            self.assertEqual(self.client.get(self.similarurl, {"mediaid": ids[0]}).status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+            with self.assertRaises(Exception):
+                call_command('embeddings', '--train', stdout=io.StringIO())
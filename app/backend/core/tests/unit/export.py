@@ -0,0 +1,118 @@
+import io
+import zipfile
+import zlib
+from unittest import mock
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import archive
+from core.common import MediaKinds
+from core.models import Blob
+from core.storage import LocalStorage
+from core.tests import get_default_album, login_user, put_album, register_user, upload_media
+
+# TEST IDENTIFIER: UNIT-09-01
+class GetExportTests(APITestCase):
+    CONTENTS = [bytes(range(256)) * 4, b"second image", b"video contents"]
+    INCORRECT_ALBUM_ID = -1
+    
+    def setUp(self):
+        self.url = reverse('export')
+        register_user(self)
+        login_user(self)
+        self.ALBUM = put_album(self, "exportalbum")
+        upload_media(self, self.CONTENTS[0], albumid=self.ALBUM['id'], filename="image.png")
+        upload_media(self, self.CONTENTS[1], albumid=self.ALBUM['id'], filename="image.png")
+        upload_media(self, self.CONTENTS[2], kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        
+    def get_export(self, albumid=None, **headers):
+        params = {"albumid": albumid} if albumid is not None else {}
+        return self.client.get(self.url, params, headers=headers)
+        
+    # Valid test cases
+    def test_getExport01(self):
+        response = self.get_export(self.ALBUM['id'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        self.assertIn('exportalbum.zip', response['Content-Disposition'])
+        body = b''.join(response.streaming_content)
+        self.assertEqual(int(response['Content-Length']), len(body))
+        with zipfile.ZipFile(io.BytesIO(body)) as zip:
+            self.assertIsNone(zip.testzip())
+            # Repeated names are made unique
+            self.assertEqual(sorted(zip.namelist()), ["image (2).png", "image.png"])
+            self.assertEqual({zip.read(name) for name in zip.namelist()}, set(self.CONTENTS[:2]))
+            self.assertTrue(all(info.compress_type == zipfile.ZIP_STORED for info in zip.infolist()))
+        
+    def test_getExport02(self):
+        # Whole library has a folder per album
+        response = self.get_export()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content))) as zip:
+            self.assertIsNone(zip.testzip())
+            names = zip.namelist()
+            self.assertEqual(len(names), 3)
+            self.assertIn(f"{get_default_album(self)['name']}/video.mp4", names)
+            self.assertIn("exportalbum/image.png", names)
+        
+    def test_getExport03(self):
+        # Resumed download matches the whole archive
+        whole = b''.join(self.get_export(self.ALBUM['id']).streaming_content)
+        for start in [0, 10, 60, 1100, len(whole) - 30]:
+            response = self.get_export(self.ALBUM['id'], Range=f"bytes={start}-")
+            self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+            self.assertEqual(response['Content-Range'], f"bytes {start}-{len(whole) - 1}/{len(whole)}")
+            self.assertEqual(b''.join(response.streaming_content), whole[start:])
+        response = self.get_export(self.ALBUM['id'], Range="bytes=40-1200")
+        self.assertEqual(b''.join(response.streaming_content), whole[40:1201])
+        
+    def test_getExport04(self):
+        response = self.get_export(self.ALBUM['id'])
+        etag = response['ETag']
+        response = self.get_export(self.ALBUM['id'], **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        # Range is ignored if the archive changed
+        upload_media(self, b"new image", albumid=self.ALBUM['id'])
+        response = self.get_export(self.ALBUM['id'], Range="bytes=10-", **{"If-Range": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_getExport05(self):
+        # ZIP64 fields are used for big files
+        entry = archive.ZipEntry("big.mp4", None, archive.ZIP64_LIMIT + 1, archive.datetime.datetime(2024, 1, 1), "key")
+        zip = archive.ZipArchive([entry])
+        entry.crc = 0
+        self.assertTrue(zip.zip64)
+        self.assertEqual(len(entry.local_header()), 30 + len(entry.name) + 20)
+        self.assertEqual(len(entry.descriptor()), entry.descriptor_length())
+        self.assertEqual(len(entry.central_header()), entry.central_header_length())
+        self.assertEqual(zip.size - zip.directory_offset, zip.directory_size + 76 + 22)
+        self.assertEqual(len(zip.end_records()), 76 + 22)
+        
+    def test_getExport09(self):
+        # CRC-32 of files is recorded on upload, so the central directory is sent without reading the files
+        self.assertEqual(set(Blob.objects.values_list('crc32', flat=True)), {zlib.crc32(content) for content in self.CONTENTS})
+        whole = b''.join(self.get_export(self.ALBUM['id']).streaming_content)
+        with mock.patch.object(LocalStorage, 'open') as open:
+            response = self.get_export(self.ALBUM['id'], Range=f"bytes={len(whole) - 100}-")
+            self.assertEqual(b''.join(response.streaming_content), whole[-100:])
+        open.assert_not_called()
+        # Blobs stored before it was recorded get it when it is computed
+        Blob.objects.update(crc32=None)
+        response = self.get_export(self.ALBUM['id'], Range=f"bytes={len(whole) - 100}-")
+        self.assertEqual(b''.join(response.streaming_content), whole[-100:])
+        self.assertEqual(Blob.objects.filter(crc32__isnull=True).count(), 1)
+        
+    # Invalid test cases
+    def test_getExport06(self):
+        response = self.get_export(self.INCORRECT_ALBUM_ID)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_getExport07(self):
+        response = self.get_export(self.ALBUM['id'], Range="bytes=100000-")
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        
+    def test_getExport08(self):
+        self.client.credentials()
+        response = self.get_export(self.ALBUM['id'])
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,234 @@
+import datetime
+import io
+import os
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image, features
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import derived, renditions
+from core.common import JobStatus, MediaKinds
+from core.models import DerivedFile, Job
+from core.tests import login_user, register_user, upload_media
+
+# TEST IDENTIFIER: UNIT-07-01
+class GetFileTests(APITestCase):
+    CONTENT = bytes(range(256)) * 4
+    INCORRECT_MEDIA_ID = -1
+    
+    def setUp(self):
+        self.url = reverse('file')
+        register_user(self)
+        login_user(self)
+        self.MEDIA = upload_media(self, self.CONTENT, kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        
+    def get_file(self, **headers):
+        return self.client.get(self.url, {"mediaid": self.MEDIA['id'], "kind": MediaKinds.VIDEO.value}, headers=headers)
+        
+    # Valid test cases
+    def test_getFile01(self):
+        response = self.get_file()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT)
+        
+    def test_getFile02(self):
+        response = self.get_file(Range="bytes=10-19")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response['Content-Range'], f"bytes 10-19/{len(self.CONTENT)}")
+        self.assertEqual(response['Content-Length'], '10')
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT[10:20])
+        
+    def test_getFile03(self):
+        response = self.get_file(Range="bytes=-5")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT[-5:])
+        
+    def test_getFile04(self):
+        response = self.get_file(Range="bytes=0-3,100-103")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertTrue(response['Content-Type'].startswith('multipart/byteranges'))
+        body = b''.join(response.streaming_content)
+        self.assertEqual(int(response['Content-Length']), len(body))
+        self.assertIn(self.CONTENT[0:4], body)
+        self.assertIn(self.CONTENT[100:104], body)
+        
+    def test_getFile05(self):
+        # Range is ignored if the file changed since the If-Range date
+        response = self.get_file(Range="bytes=0-3", **{"If-Range": "Thu, 01 Jan 1970 00:00:00 GMT"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    # Invalid test cases
+    def test_getFile06(self):
+        response = self.get_file(Range=f"bytes={len(self.CONTENT)}-")
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response['Content-Range'], f"bytes */{len(self.CONTENT)}")
+        
+    def test_getFile07(self):
+        response = self.client.get(self.url, {"mediaid": self.INCORRECT_MEDIA_ID})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_getFile08(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_getFile09(self):
+        # Media of other users cannot be fetched
+        register_user(self, username="otheruser", password="otherpassword", email="other@mail.com")
+        login_user(self, username="otheruser", password="otherpassword")
+        response = self.get_file()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_getFile10(self):
+        # File is sent by nginx when X-Accel-Redirect is enabled
+        with self.settings(MEDIA_ACCEL_REDIRECT=True):
+            response = self.get_file(Range="bytes=0-9")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['X-Accel-Redirect'].startswith('/protected-media/'))
+        self.assertEqual(response.content, b'')
+        
+    def test_getFile11(self):
+        # Cached copy is revalidated with the ETag
+        response = self.get_file()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        response = self.get_file(**{"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        
+    def test_getFile12(self):
+        response = self.get_file(**{"If-None-Match": '"outdated"'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+# TEST IDENTIFIER: UNIT-07-02
+class GetFileRenditionTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('file')
+        register_user(self)
+        login_user(self)
+        image = io.BytesIO()
+        Image.new('RGB', (3000, 1500), (200, 100, 50)).save(image, format='PNG')
+        self.MEDIA = upload_media(self, image.getvalue())
+        
+    def get_size(self, response):
+        content = b''.join(response.streaming_content)
+        return Image.open(io.BytesIO(content)).size
+        
+    # Valid test cases
+    def test_getFileRendition01(self):
+        response = self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 200})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        self.assertEqual(self.get_size(response), (256, 128))
+        
+    def test_getFileRendition02(self):
+        response = self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 1024})
+        self.assertEqual(self.get_size(response), (1024, 512))
+        
+    def test_getFileRendition03(self):
+        # Original is served if requested size is bigger than every rendition
+        response = self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 4000})
+        self.assertEqual(self.get_size(response), (3000, 1500))
+        
+    # Invalid test cases
+    def test_getFileRendition04(self):
+        response = self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": "big"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_getFileRendition05(self):
+        # Cached rendition is reused, accesses are recorded once per interval
+        self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 256})
+        self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 256})
+        self.assertEqual(DerivedFile.objects.get(name="256.jpg").hits, 0)
+        DerivedFile.objects.filter(name="256.jpg").update(lastaccess=timezone.now() - datetime.timedelta(seconds=derived.ACCESS_RECORD_INTERVAL + 1))
+        self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 256})
+        rendition = DerivedFile.objects.get(name="256.jpg")
+        self.assertEqual(rendition.hits, 1)
+        self.assertGreater(rendition.lastaccess, timezone.now() - datetime.timedelta(seconds=derived.ACCESS_RECORD_INTERVAL))
+        
+    def test_getFileRendition06(self):
+        # Least recently used renditions are evicted over budget
+        self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 256})
+        self.client.get(self.url, {"mediaid": self.MEDIA['id'], "size": 1024})
+        small = DerivedFile.objects.get(name="256.jpg")
+        self.assertEqual(derived.evict_derived_files(budget=derived.get_derived_usage() - 1), 1)
+        self.assertFalse(DerivedFile.objects.filter(name="256.jpg").exists())
+        self.assertFalse(derived.get_derived_path(small.key, small.name).exists())
+        self.assertTrue(DerivedFile.objects.filter(name="1024.jpg").exists())
+
+
+# TEST IDENTIFIER: UNIT-07-03
+class GetFileFormatTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('file')
+        register_user(self)
+        login_user(self)
+        # Noise compresses badly as PNG, so converted images are smaller
+        image = io.BytesIO()
+        Image.frombytes('RGB', (800, 600), os.urandom(800 * 600 * 3)).save(image, format='PNG')
+        self.CONTENT = image.getvalue()
+        self.MEDIA = upload_media(self, self.CONTENT)
+        
+    def get_file(self, accept, **params):
+        return self.client.get(self.url, {"mediaid": self.MEDIA['id'], **params}, headers={"Accept": accept})
+        
+    def get_image(self, response):
+        return Image.open(io.BytesIO(b''.join(response.streaming_content)))
+        
+    # Valid test cases
+    def test_getFileFormat01(self):
+        response = self.get_file("image/webp,*/*", size=256)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/webp')
+        self.assertIn('Accept', response['Vary'])
+        image = self.get_image(response)
+        self.assertEqual(image.format, 'WEBP')
+        self.assertEqual(image.size, (256, 192))
+        
+    def test_getFileFormat02(self):
+        # AVIF is preferred if Pillow can encode it
+        response = self.get_file("image/avif,image/webp,*/*", size=256)
+        expected = 'avif' if features.check('avif') else 'webp'
+        self.assertEqual(response['Content-Type'], f'image/{expected}')
+        
+    def test_getFileFormat03(self):
+        # Full size image is converted in the background if the client accepts a modern format, the original is sent meanwhile
+        for _ in range(2):
+            response = self.get_file("image/webp")
+            self.assertEqual(response['Content-Type'], 'image/png')
+            self.assertIn('Accept', response['Vary'])
+            self.assertEqual(b''.join(response.streaming_content), self.CONTENT)
+        self.assertEqual(Job.objects.filter(kind='convert_image').count(), 1)
+        # A failed conversion is queued again by the next request
+        Job.objects.filter(kind='convert_image').update(status=JobStatus.FAILED.value)
+        self.get_file("image/webp")
+        Job.objects.filter(kind='convert_image', status=JobStatus.FAILED.value).delete()
+        self.assertEqual(Job.objects.filter(kind='convert_image').count(), 1)
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        response = self.get_file("image/webp")
+        self.assertEqual(response['Content-Type'], 'image/webp')
+        content = b''.join(response.streaming_content)
+        self.assertLess(len(content), len(self.CONTENT))
+        self.assertEqual(Image.open(io.BytesIO(content)).size, (800, 600))
+        
+    def test_getFileFormat04(self):
+        response = self.get_file("image/webp", original="true")
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT)
+        
+    def test_getFileFormat05(self):
+        # Wildcards do not select modern formats
+        response = self.get_file("*/*")
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('Accept', response['Vary'])
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT)
+        response = self.get_file("*/*", size=256)
+        self.assertEqual(response['Content-Type'], 'image/jpeg')
+        
+    def test_getFileFormat06(self):
+        self.assertIsNone(renditions.negotiate_format("image/webp;q=0, image/avif; q=0"))
+        self.assertIsNone(renditions.negotiate_format(None))
+        self.assertEqual(renditions.negotiate_format("text/html, image/webp;q=0.8"), 'webp')
+
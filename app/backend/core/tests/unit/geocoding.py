@@ -0,0 +1,180 @@
+import datetime
+import http.server
+import json
+import threading
+import time
+from unittest import mock
+import requests
+from django.test import TestCase
+from django.utils import timezone
+
+from core import geocoding
+from core.common import LOCATION_MAX_LENGTH
+from core.models import GeocodedLocation
+
+# TEST IDENTIFIER: UNIT-14-01
+class GeocodingCacheTests(TestCase):
+    def setUp(self):
+        geocoding.clear_memory_cache()
+        
+    # Valid test cases
+    def test_geocoding01(self):
+        # Nearby coordinates are fetched once
+        with mock.patch('core.geocoding.fetch_location', return_value="Madrid, Spain") as fetch:
+            self.assertEqual(geocoding.get_location("40.4168", "-3.7038"), "Madrid, Spain")
+            self.assertEqual(geocoding.get_location("40.4171", "-3.7041"), "Madrid, Spain")
+        self.assertEqual(fetch.call_count, 1)
+        fetch.assert_called_with("40.42", "-3.70")
+        self.assertEqual(GeocodedLocation.objects.get(key="40.42,-3.70").location, "Madrid, Spain")
+        
+    def test_geocoding02(self):
+        # Locations cached in the database are used by other processes
+        GeocodedLocation.objects.create(key="48.86,2.35", location="Paris, France")
+        with mock.patch('core.geocoding.fetch_location') as fetch:
+            self.assertEqual(geocoding.get_location(48.8566, 2.3522), "Paris, France")
+        fetch.assert_not_called()
+        
+    def test_geocoding03(self):
+        # Coordinates without place are cached too
+        with mock.patch('core.geocoding.fetch_location', return_value=None) as fetch:
+            self.assertIsNone(geocoding.get_location(0, -30))
+            self.assertIsNone(geocoding.get_location(0, -30))
+        self.assertEqual(fetch.call_count, 1)
+        
+    def test_geocoding04(self):
+        # Expired locations are fetched again
+        GeocodedLocation.objects.create(key="48.86,2.35", location="Old", creationdate=timezone.now() - datetime.timedelta(days=1000))
+        with mock.patch('core.geocoding.fetch_location', return_value="Paris, France") as fetch:
+            self.assertEqual(geocoding.get_location(48.8566, 2.3522), "Paris, France")
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(GeocodedLocation.objects.get(key="48.86,2.35").location, "Paris, France")
+        
+    # Invalid test cases
+    def test_geocoding05(self):
+        # Failed lookups are not cached
+        with mock.patch('core.geocoding.fetch_location', side_effect=requests.ConnectionError) as fetch:
+            for _ in range(2):
+                with self.assertRaises(requests.ConnectionError):
+                    geocoding.get_location(40.4168, -3.7038)
+        self.assertEqual(fetch.call_count, 2)
+        self.assertFalse(GeocodedLocation.objects.exists())
+        
+    def test_geocoding06(self):
+        with self.assertRaises(ValueError):
+            geocoding.get_location("north", "west")
+        
+    def test_geocoding07(self):
+        # Long place names are truncated to the location column
+        address = {'city': "Llanfairpwllgwyngyllgogerychwyrndrobwllllantysiliogogogoch", 'country': "United Kingdom"}
+        with mock.patch('core.geocoding.get_client') as client:
+            client.return_value.reverse.return_value = address
+            location = geocoding.fetch_location(53.22, -4.20)
+        self.assertEqual(len(location), LOCATION_MAX_LENGTH)
+        self.assertTrue(location.startswith("Llanfairpwll"))
+
+
+# Local stand-in of the geocoding service, answering with the status and delay set on the server
+class StubGeocodingHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        time.sleep(self.server.delay)
+        body = json.dumps({'address': {'city': "Madrid", 'country': "Spain"}}).encode()
+        try:
+            self.send_response(self.server.status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        # Client timed out
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+# TEST IDENTIFIER: UNIT-14-02
+class GeocodingClientTests(TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubGeocodingHandler)
+        self.server.requests, self.server.delay, self.server.status = 0, 0, 200
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/reverse"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # Valid test cases
+    def test_geocodingClient01(self):
+        client = geocoding.GeocodingClient(self.url, rate=100)
+        self.assertEqual(client.reverse(40.42, -3.70), {'city': "Madrid", 'country': "Spain"})
+        self.assertEqual(self.server.requests, 1)
+
+    def test_geocodingClient02(self):
+        # Requests are spaced by the rate limit
+        client = geocoding.GeocodingClient(self.url, rate=10)
+        start = time.monotonic()
+        for _ in range(3):
+            client.reverse(40.42, -3.70)
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_geocodingClient03(self):
+        # Concurrent lookups of the same place make a single request
+        client = geocoding.GeocodingClient(self.url, rate=100)
+        coalescer = geocoding.Coalescer()
+        self.server.delay = 0.2
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(coalescer.run("40.42,-3.70", lambda: client.reverse(40.42, -3.70))))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [{'city': "Madrid", 'country': "Spain"}] * 5)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_geocodingClient04(self):
+        # Circuit closes again once the service answers after the cooldown
+        client = geocoding.GeocodingClient(self.url, rate=100, failures=1, cooldown=0.1)
+        self.server.status = 503
+        with self.assertRaises(requests.HTTPError):
+            client.reverse(40.42, -3.70)
+        self.server.status = 200
+        time.sleep(0.1)
+        self.assertEqual(client.reverse(40.42, -3.70), {'city': "Madrid", 'country': "Spain"})
+        self.assertEqual(client.breaker.failures, 0)
+
+    # Invalid test cases
+    def test_geocodingClient05(self):
+        # Slow service times out
+        client = geocoding.GeocodingClient(self.url, rate=100, timeout=0.1)
+        self.server.delay = 0.5
+        with self.assertRaises(requests.Timeout):
+            client.reverse(40.42, -3.70)
+
+    def test_geocodingClient06(self):
+        # Circuit opens after consecutive failures, the service is not called until the cooldown is over
+        client = geocoding.GeocodingClient(self.url, rate=100, failures=2, cooldown=60)
+        self.server.status = 500
+        for _ in range(2):
+            with self.assertRaises(requests.HTTPError):
+                client.reverse(40.42, -3.70)
+        with self.assertRaises(geocoding.GeocodingUnavailable):
+            client.reverse(40.42, -3.70)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_geocodingClient07(self):
+        # Requests that would wait longer than the timeout for the rate limit are not sent
+        client = geocoding.GeocodingClient(self.url, rate=0.1, timeout=0.1)
+        client.reverse(40.42, -3.70)
+        with self.assertRaises(geocoding.GeocodingUnavailable):
+            client.reverse(40.42, -3.70)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_geocodingClient08(self):
+        # Failed lookups are not kept, the next call runs again
+        coalescer = geocoding.Coalescer()
+        with self.assertRaises(ValueError):
+            coalescer.run("key", mock.Mock(side_effect=ValueError))
+        self.assertEqual(coalescer.run("key", lambda: 1), 1)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from django.test import TestCase
+
+from core import geocoding, geonames
+
+CITIES = [
+    # geonameid, name, asciiname, alternatenames, latitude, longitude, feature class, feature code, country code
+    ["3117735", "Madrid", "Madrid", "", "40.4165", "-3.70256", "P", "PPLC", "ES"],
+    ["2988507", "Paris", "Paris", "", "48.85341", "2.3488", "P", "PPLC", "FR"],
+    ["2193733", "Auckland", "Auckland", "", "-36.84853", "174.76349", "P", "PPLA", "NZ"],
+    ["4031637", "Suva", "Suva", "", "-18.14161", "178.44149", "P", "PPLC", "FJ"],
+]
+COUNTRIES = "#ISO\tISO3\tISO-Numeric\tfips\tCountry\n" + "ES\tESP\t724\tSP\tSpain\nFR\tFRA\t250\tFR\tFrance\n"
+
+@unittest.skipUnless(geonames.np is not None, "numpy not available")
+# TEST IDENTIFIER: UNIT-15-01
+class OfflineGeocodingTests(TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.citiespath = os.path.join(self.folder.name, 'cities.txt')
+        self.countriespath = os.path.join(self.folder.name, 'countryInfo.txt')
+        with open(self.citiespath, 'w', encoding='utf-8') as file:
+            file.write(''.join('\t'.join(city) + '\n' for city in CITIES))
+        with open(self.countriespath, 'w', encoding='utf-8') as file:
+            file.write(COUNTRIES)
+        geonames.get_offline_geocoder.cache_clear()
+        
+    def tearDown(self):
+        geonames.get_offline_geocoder.cache_clear()
+        self.folder.cleanup()
+        
+    # Valid test cases
+    def test_geonames01(self):
+        # Nearest point of the tree is the nearest by brute force
+        rng = geonames.np.random.default_rng(1)
+        points = geonames.to_unit_vectors(rng.uniform(-90, 90, 5000), rng.uniform(-180, 180, 5000))
+        tree = geonames.KDTree(points)
+        for query in geonames.to_unit_vectors(rng.uniform(-90, 90, 200), rng.uniform(-180, 180, 200)):
+            index, distance = tree.query(query)
+            distances = ((points - query) ** 2).sum(axis=1)
+            self.assertEqual(index, int(distances.argmin()))
+            self.assertAlmostEqual(distance, float(distances.min()) ** 0.5)
+        
+    def test_geonames02(self):
+        # Locations are found offline when a dump is set
+        with self.settings(GEONAMES_CITIES_PATH=self.citiespath, GEONAMES_COUNTRIES_PATH=self.countriespath):
+            self.assertEqual(geocoding.get_location("40.45", "-3.69"), "Madrid, Spain")
+            self.assertEqual(geocoding.get_location(48.8, 2.3), "Paris, France")
+        
+    def test_geonames03(self):
+        # Countries without name use their code, distance is measured across the antimeridian
+        with self.settings(GEONAMES_CITIES_PATH=self.citiespath, GEONAMES_COUNTRIES_PATH=None, GEONAMES_MAX_DISTANCE_KM=500):
+            self.assertEqual(geocoding.get_location(-18.1, -179.9), "Suva, FJ")
+        
+    # Invalid test cases
+    def test_geonames04(self):
+        # Places far from every city have no location
+        with self.settings(GEONAMES_CITIES_PATH=self.citiespath, GEONAMES_MAX_DISTANCE_KM=100):
+            self.assertIsNone(geocoding.get_location(0, -30))
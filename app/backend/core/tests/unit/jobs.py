@@ -0,0 +1,156 @@
+import datetime
+import io
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import geocoding, jobs
+from core.common import JobStatus, MediaKinds
+from core.models import Job, Media
+from core.tests import login_user, register_user
+
+# Handlers used by the tests
+done = []
+
+@jobs.handler('test_record')
+def record_job(value):
+    done.append(value)
+
+@jobs.handler('test_fail')
+def fail_job():
+    raise RuntimeError("failed")
+
+@jobs.handler('test_batch', batch=3)
+def record_batch(payloads):
+    done.append([payload['value'] for payload in payloads])
+
+@jobs.handler('test_batch_fail', batch=3)
+def fail_batch(payloads):
+    raise RuntimeError("failed")
+
+# TEST IDENTIFIER: UNIT-13-01
+class JobQueueTests(APITestCase):
+    def setUp(self):
+        done.clear()
+        
+    def run_jobs(self):
+        call_command('runjobs', '--once', stdout=io.StringIO())
+        
+    # Valid test cases
+    def test_jobs01(self):
+        # Jobs are run by priority and deleted when done
+        jobs.enqueue('test_record', {'value': 'low'})
+        jobs.enqueue('test_record', {'value': 'high'}, priority=10)
+        self.run_jobs()
+        self.assertEqual(done, ['high', 'low'])
+        self.assertFalse(Job.objects.exists())
+        
+    def test_jobs02(self):
+        # Delayed jobs are not run before their time
+        jobs.enqueue('test_record', {'value': 'later'}, delay=60)
+        self.run_jobs()
+        self.assertEqual(done, [])
+        
+    def test_jobs03(self):
+        # Claimed jobs are not claimed by other workers until their timeout
+        job = jobs.enqueue('test_record', {'value': 'once'})
+        self.assertEqual(jobs.claim_job().id, job.id)
+        self.assertIsNone(jobs.claim_job())
+        Job.objects.filter(id=job.id).update(lockeduntil=timezone.now() - datetime.timedelta(seconds=1))
+        claimed = jobs.claim_job()
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.attempts, 2)
+        
+    def test_jobs04(self):
+        # Failed jobs are retried later with backoff, until they run out of attempts
+        job = jobs.enqueue('test_fail')
+        self.run_jobs()
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.PENDING.value)
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.runafter, timezone.now())
+        self.assertIn("RuntimeError", job.error)
+        
+        Job.objects.filter(id=job.id).update(attempts=job.maxattempts - 1, runafter=timezone.now())
+        self.run_jobs()
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.FAILED.value)
+        
+    def test_jobs05(self):
+        # A worker whose job was claimed again does not change it
+        job = jobs.enqueue('test_record', {'value': 'stale'})
+        stale = jobs.claim_job()
+        Job.objects.filter(id=job.id).update(lockeduntil=timezone.now() - datetime.timedelta(seconds=1))
+        jobs.claim_job()
+        jobs.run_job(stale)
+        self.assertTrue(Job.objects.filter(id=job.id, status=JobStatus.RUNNING.value).exists())
+        
+    def test_jobs06(self):
+        # Location of uploaded media is fetched in the background, once per place of a batch
+        register_user(self)
+        login_user(self)
+        files = [SimpleUploadedFile(f"image{i}.png", f"image {i}".encode()) for i in range(3)]
+        metadata = '[{"coordinates": "40.4,-3.7"}, {"coordinates": "40.4,-3.7"}, {"coordinates": "48.8,2.3"}]'
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse('mediabatch'), {"files": files, "metadata": metadata}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Job.objects.filter(kind='geocode_media').count(), 2)
+        
+        geocoding.clear_memory_cache()
+        with mock.patch('core.geocoding.fetch_location', return_value="Madrid, Spain") as geocode:
+            self.run_jobs()
+        self.assertEqual(geocode.call_count, 2)
+        ids = [m['id'] for m in response.json()]
+        self.assertEqual(list(Media.objects.filter(id__in=ids).values_list('location', flat=True)), ["Madrid, Spain"] * 3)
+        
+    def test_jobs09(self):
+        # Jobs of a batched kind are claimed and handled together, up to the batch size
+        for value in range(4):
+            jobs.enqueue('test_batch', {'value': value})
+        jobs.enqueue('test_record', {'value': 'single'})
+        self.run_jobs()
+        self.assertEqual(done, [[0, 1, 2], [3], 'single'])
+        self.assertFalse(Job.objects.exists())
+        
+    def test_jobs11(self):
+        # Jobs with a key are queued once while pending or running, and again after they failed
+        job = jobs.enqueue('test_fail', key='unique')
+        self.assertEqual(jobs.enqueue('test_fail', key='unique').id, job.id)
+        jobs.claim_job()
+        self.assertEqual(jobs.enqueue('test_fail', key='unique').id, job.id)
+        Job.objects.filter(id=job.id).update(status=JobStatus.FAILED.value)
+        again = jobs.enqueue('test_fail', key='unique')
+        self.assertNotEqual(again.id, job.id)
+        self.assertEqual(Job.objects.filter(key='unique').count(), 2)
+        # Retrying failed jobs drops the ones queued again since
+        call_command('runjobs', '--once', '--retry-failed', '--kind', 'test_fail', stdout=io.StringIO())
+        self.assertEqual(list(Job.objects.filter(key='unique').values_list('id', flat=True)), [again.id])
+        
+    # Invalid test cases
+    def test_jobs07(self):
+        # Jobs without handler fail at once
+        job = jobs.enqueue('test_unknown')
+        self.run_jobs()
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.FAILED.value)
+        self.assertEqual(job.attempts, 1)
+        
+    def test_jobs08(self):
+        register_user(self)
+        login_user(self)
+        files = [SimpleUploadedFile("image.png", b"image")]
+        response = self.client.put(reverse('mediabatch'), {"files": files, "metadata": '[{"coordinates": "40.4"}]'}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+        
+    def test_jobs10(self):
+        # Jobs of a failed batch are retried
+        ids = [jobs.enqueue('test_batch_fail').id for _ in range(2)]
+        claimed = jobs.claim_batch()
+        self.assertEqual([job.id for job in claimed], ids)
+        self.assertFalse(jobs.run_jobs(claimed))
+        self.assertEqual(Job.objects.filter(id__in=ids, status=JobStatus.PENDING.value, attempts=1).count(), 2)
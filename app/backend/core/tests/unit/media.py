@@ -1,10 +1,21 @@
+import hashlib
+import io
+import json
+import os
+from unittest import mock
 
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from core.common import MediaKinds
-from core.tests import AUTH_TOKEN_PREFIX, INCORRECT_TOKEN, TEST_IMAGE_FILE, TEST_VIDEO_FILE, check_media, setup_users_albums_media
+from core import geocoding, jobs, utils
+from core.common import BLOBS_FOLDER, MediaKinds
+from core.models import Blob, Media, MediaAlbum
+from core.storage import get_storage
+from core.tests import AUTH_TOKEN_PREFIX, INCORRECT_TOKEN, OTHERUSER_EMAIL, OTHERUSER_PASSWORD, OTHERUSER_USERNAME, TEST_IMAGE_FILE, TESTUSER_USERNAME, TEST_VIDEO_FILE, check_media, get_default_album, login_user, put_album, register_user, setup_users_albums_media, upload_media
 
 # TEST IDENTIFIER: UNIT-06-01
 class PutMediaTests(APITestCase):
@@ -272,5 +283,220 @@ class DeleteMediaTests(APITestCase):
         }
         response = self.client.delete(self.url, media)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-    
-    
\ No newline at end of file
+
+
+# TEST IDENTIFIER: UNIT-06-08
+class MediaBlobTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('media')
+        register_user(self)
+        login_user(self)
+        
+    def test_mediaBlob01(self):
+        # Same content uploaded twice is stored once
+        first = upload_media(self)
+        second = upload_media(self)
+        firstblob = Media.objects.get(id=first['id']).blob
+        secondblob = Media.objects.get(id=second['id']).blob
+        self.assertIsNotNone(firstblob)
+        self.assertEqual(firstblob.hash, secondblob.hash)
+        self.assertEqual(Blob.objects.get(hash=firstblob.hash).refcount, 2)
+        self.assertTrue(get_storage().exists(utils.get_blob_name(firstblob.hash)))
+        
+    def test_mediaBlob02(self):
+        # Copy to another album references the same blob
+        media = upload_media(self)
+        album = put_album(self, "copyalbum")
+        response = self.client.put(self.url, {"kind": MediaKinds.IMAGE.value, "id": media['id'], "albumid": album['id']}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        copy = Media.objects.get(id=response.json()['id'])
+        self.assertEqual(copy.blob.hash, Media.objects.get(id=media['id']).blob.hash)
+        self.assertEqual(copy.blob.refcount, 2)
+        
+    def test_mediaBlob03(self):
+        # Blob file is removed with its last reference, when deleted media are purged from the trash
+        first = upload_media(self)
+        second = upload_media(self)
+        hash = Media.objects.get(id=first['id']).blob.hash
+        albumid = get_default_album(self)['id']
+        response = self.client.delete(self.url, {"id": first['id'], "albumid": albumid})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Blob.objects.get(hash=hash).refcount, 2)
+        call_command('purgetrash', '--once', '--retention-days', '0', stdout=io.StringIO())
+        self.assertEqual(Blob.objects.get(hash=hash).refcount, 1)
+        self.assertTrue(get_storage().exists(utils.get_blob_name(hash)))
+        response = self.client.delete(self.url, {"id": second['id'], "albumid": albumid})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        call_command('purgetrash', '--once', '--retention-days', '0', stdout=io.StringIO())
+        self.assertFalse(Blob.objects.filter(hash=hash).exists())
+        self.assertFalse(get_storage().exists(utils.get_blob_name(hash)))
+
+        
+    def test_mediaBlob04(self):
+        # Big files are streamed into the blob store and moved without copying
+        content = os.urandom(3 * 1024 * 1024)
+        media = upload_media(self, content, kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        blob = Media.objects.get(id=media['id']).blob
+        self.assertEqual(blob.hash, hashlib.sha256(content).hexdigest())
+        self.assertEqual(blob.size, len(content))
+        with get_storage().open(utils.get_blob_name(blob.hash)) as file:
+            self.assertEqual(file.read(), content)
+        self.assertFalse([f for f in os.listdir(utils.get_blob_tempdir()) if f.endswith('.upload')])
+        
+    def test_mediaBlob05(self):
+        # Files of the legacy per-user layout are moved into the blob store by the migration command
+        content = b'legacy content'
+        media = Media.objects.get(id=upload_media(self, content)['id'])
+        legacypath = utils.get_legacy_media_path(TESTUSER_USERNAME, media.id)
+        os.makedirs(legacypath.parent, exist_ok=True)
+        with open(legacypath, 'wb') as file:
+            file.write(content)
+        get_storage().delete(utils.get_blob_name(media.blob.hash))
+        media.blob.delete()
+        
+        call_command('migratemedia', '--dry-run', stdout=io.StringIO())
+        self.assertTrue(legacypath.exists())
+        call_command('migratemedia', stdout=io.StringIO(), stderr=io.StringIO())
+        media.refresh_from_db()
+        self.assertEqual(media.blob.hash, hashlib.sha256(content).hexdigest())
+        self.assertEqual(media.blob.refcount, 1)
+        self.assertTrue(get_storage().exists(utils.get_blob_name(media.blob.hash)))
+        self.assertFalse(legacypath.parent.exists())
+        response = self.client.get(reverse('file'), {"mediaid": media.id})
+        self.assertEqual(b''.join(response.streaming_content), content)
+        
+    def test_mediaBlob06(self):
+        # Media of other users cannot be copied
+        media = upload_media(self, b'private content')
+        register_user(self, username=OTHERUSER_USERNAME, password=OTHERUSER_PASSWORD, email=OTHERUSER_EMAIL)
+        login_user(self, username=OTHERUSER_USERNAME, password=OTHERUSER_PASSWORD)
+        album = put_album(self, "copyalbum")
+        response = self.client.put(self.url, {"kind": MediaKinds.IMAGE.value, "id": media['id'], "albumid": album['id']}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Media.objects.get(id=media['id']).blob.refcount, 1)
+        self.assertFalse(Media.objects.filter(album__id=album['id']).exists())
+        
+    def test_mediaBlob07(self):
+        # Media of other users cannot be updated
+        media = upload_media(self, b'private content')
+        register_user(self, username=OTHERUSER_USERNAME, password=OTHERUSER_PASSWORD, email=OTHERUSER_EMAIL)
+        login_user(self, username=OTHERUSER_USERNAME, password=OTHERUSER_PASSWORD)
+        response = self.client.put(self.url, {"kind": MediaKinds.IMAGE.value, "id": media['id'], "label": "mine",
+                                              "file": SimpleUploadedFile("image.png", b'other content')}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        updated = Media.objects.get(id=media['id'])
+        self.assertEqual(updated.blob.hash, hashlib.sha256(b'private content').hexdigest())
+        self.assertIsNone(updated.label)
+
+
+# TEST IDENTIFIER: UNIT-06-09
+class GetMediaConditionalTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('medias')
+        register_user(self)
+        login_user(self)
+        upload_media(self)
+        
+    def test_getMediaConditional01(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('W/'))
+        response = self.client.get(self.url, headers={"If-None-Match": response['ETag']})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+    def test_getMediaConditional02(self):
+        # Listing changes when media is added
+        etag = self.client.get(self.url)['ETag']
+        upload_media(self, b'other content')
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 2)
+        
+    def test_getMediaConditional03(self):
+        # Listing changes when media are updated by background jobs
+        media = Media.objects.get()
+        jobs.enqueue_geocoding([media.id], "40.4,-3.7")
+        etag = self.client.get(self.url)['ETag']
+        geocoding.clear_memory_cache()
+        with mock.patch('core.geocoding.fetch_location', return_value="Madrid, Spain"):
+            call_command('runjobs', '--once', stdout=io.StringIO())
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]['location'], "Madrid, Spain")
+
+
+# TEST IDENTIFIER: UNIT-06-10
+class PutMediaBatchTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('mediabatch')
+        register_user(self)
+        login_user(self)
+        self.ALBUM = put_album(self, "batchalbum")
+        
+    def put_batch(self, count, metadata=None, albumid=None):
+        data = {
+            "files": [SimpleUploadedFile(f"image{i}.png", f"content {i}".encode()) for i in range(count)],
+        }
+        if metadata is not None:
+            data['metadata'] = json.dumps(metadata)
+        if albumid is not None:
+            data['albumid'] = albumid
+        return self.client.put(self.url, data, format='multipart')
+        
+    # Valid test cases
+    def test_putMediaBatch01(self):
+        metadata = [{"label": "first"}, {"kind": MediaKinds.VIDEO.value, "filename": "video.mp4"}, {}]
+        response = self.put_batch(3, metadata, self.ALBUM['id'])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.json()
+        self.assertEqual(len(data), 3)
+        for media in data:
+            check_media(self, media, {})
+        self.assertEqual(data[0]['label'], "first")
+        self.assertEqual(data[1]['kind'], MediaKinds.VIDEO.value)
+        self.assertEqual(data[1]['filename'], "video.mp4")
+        self.assertEqual(data[2]['filename'], "image2.png")
+        # Only the first image is the album cover
+        covers = MediaAlbum.objects.filter(album_id=self.ALBUM['id'], is_cover=True)
+        self.assertEqual([c.media_id for c in covers], [data[0]['id']])
+        
+    def test_putMediaBatch02(self):
+        response = self.put_batch(2)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.json()), 2)
+        
+    # Invalid test cases
+    def test_putMediaBatch03(self):
+        response = self.put_batch(2, [{}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_putMediaBatch04(self):
+        response = self.put_batch(1, [{"kind": MediaKinds.PROFILE.value}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_putMediaBatch05(self):
+        response = self.put_batch(0)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_putMediaBatch06(self):
+        response = self.put_batch(1, albumid=-1)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_putMediaBatch07(self):
+        # Metadata fields must be strings within the field lengths
+        for meta in [{"coordinates": [40.4, -3.7]}, {"coordinates": "north,south"}, {"modificationdate": 1700000000}, 
+                     {"modificationdate": "yesterday"}, {"filename": "a" * 501}, {"label": "a" * 51}, {"detectedobjects": ["cat"]}]:
+            response = self.put_batch(1, [meta])
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, meta)
+        self.assertFalse(Media.objects.exists())
+        
+    def test_putMediaBatch08(self):
+        # Files of a failed batch are not left in the blob store, nor their temporary copies
+        blobsfolder = settings.MEDIA_ROOT / BLOBS_FOLDER
+        files = set(os.path.join(root, f) for root, _, names in os.walk(blobsfolder) for f in names)
+        with mock.patch('core.models.MediaAlbum.objects.bulk_create', side_effect=RuntimeError):
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertRaises(RuntimeError):
+                    self.put_batch(2)
+        self.assertFalse(Blob.objects.exists())
+        self.assertEqual(set(os.path.join(root, f) for root, _, names in os.walk(blobsfolder) for f in names), files)
@@ -0,0 +1,118 @@
+import datetime
+import io
+import struct
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import ExifTags, Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import mediainfo
+from core.common import MediaKinds
+from core.models import Job
+from core.tests import login_user, register_user, upload_media
+
+# Builds a JPEG image with EXIF capture date, orientation and GPS position
+def get_exif_image(size=(64, 48), orientation=6) -> bytes:
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = orientation
+    exif.get_ifd(ExifTags.IFD.Exif).update({ExifTags.Base.DateTimeOriginal: "2024:05:01 10:20:30", ExifTags.Base.OffsetTimeOriginal: "+02:00"})
+    exif.get_ifd(ExifTags.IFD.GPSInfo).update({ExifTags.GPS.GPSLatitudeRef: 'N', ExifTags.GPS.GPSLatitude: (40.0, 25.0, 0.0),
+                                               ExifTags.GPS.GPSLongitudeRef: 'W', ExifTags.GPS.GPSLongitude: (3.0, 42.0, 0.0)})
+    image = io.BytesIO()
+    Image.new('RGB', size, 'blue').save(image, 'JPEG', exif=exif)
+    return image.getvalue()
+
+def get_mp4_box(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data) + 8) + kind + data
+
+# Builds an MP4 file of a video recorded in portrait (rotated by 90 degrees), with its movie box after the media data
+def get_mp4_video(width=1920, height=1080, seconds=12.5, mediasize=100000) -> bytes:
+    created = int((datetime.datetime(2024, 5, 1, 8, 20, 30, tzinfo=datetime.timezone.utc) - mediainfo.MP4_EPOCH).total_seconds())
+    mvhd = struct.pack('>B3xIIII', 0, created, created, 1000, int(seconds * 1000)) + b'\x00' * 80
+    matrix = struct.pack('>9i', 0, 0x10000, 0, -0x10000, 0, 0, 0, 0, 0x40000000)
+    tkhd = struct.pack('>B3xIIIII', 0, created, created, 1, 0, int(seconds * 1000)) + b'\x00' * 16 + matrix + struct.pack('>II', width << 16, height << 16)
+    xyz = "+40.4168-003.7038+650.000/".encode()
+    udta = get_mp4_box(b'\xa9xyz', struct.pack('>HH', len(xyz), 0) + xyz)
+    moov = get_mp4_box(b'moov', get_mp4_box(b'mvhd', mvhd) + get_mp4_box(b'trak', get_mp4_box(b'tkhd', tkhd)) + get_mp4_box(b'udta', udta))
+    return get_mp4_box(b'ftyp', b'isom\x00\x00\x02\x00isommp41') + get_mp4_box(b'mdat', b'\x00' * mediasize) + moov
+
+# TEST IDENTIFIER: UNIT-17-01
+class MediaInfoTests(APITestCase):
+    def setUp(self):
+        register_user(self)
+        login_user(self)
+        
+    # Valid test cases
+    def test_mediaInfo01(self):
+        metadata = mediainfo.read_metadata(io.BytesIO(get_exif_image()), 'image/jpeg')
+        self.assertEqual(metadata['orientation'], 6)
+        # Displayed dimensions of rotated images are swapped
+        self.assertEqual((metadata['width'], metadata['height']), (48, 64))
+        self.assertEqual(metadata['capturedate'], datetime.datetime(2024, 5, 1, 8, 20, 30, tzinfo=datetime.timezone.utc))
+        self.assertAlmostEqual(metadata['latitude'], 40.416667, places=5)
+        self.assertAlmostEqual(metadata['longitude'], -3.7, places=5)
+        
+    def test_mediaInfo02(self):
+        # Movie box is found after the media data
+        metadata = mediainfo.read_metadata(io.BytesIO(get_mp4_video()), 'video/mp4')
+        self.assertEqual(metadata['duration'], 12.5)
+        self.assertEqual((metadata['width'], metadata['height']), (1080, 1920))
+        self.assertEqual(metadata['capturedate'], datetime.datetime(2024, 5, 1, 8, 20, 30, tzinfo=datetime.timezone.utc))
+        self.assertEqual((metadata['latitude'], metadata['longitude']), (40.4168, -3.7038))
+        
+    def test_mediaInfo03(self):
+        # Metadata is stored on upload and returned with the user media, location is fetched from the position
+        media = upload_media(self, get_exif_image(), filename="photo.jpg")
+        self.assertEqual((media['width'], media['height'], media['orientation']), (48, 64, 6))
+        self.assertEqual(media['modificationdate'], media['capturedate'])
+        job = Job.objects.get(kind='geocode_media')
+        self.assertEqual(job.payload, {'mediaids': [media['id']], 'coordinates': "40.416667,-3.700000"})
+        response = self.client.get(reverse('medias'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()[0]
+        self.assertEqual((data['width'], data['height']), (48, 64))
+        self.assertEqual(datetime.datetime.fromisoformat(data['capturedate']), datetime.datetime(2024, 5, 1, 8, 20, 30, tzinfo=datetime.timezone.utc))
+        
+    def test_mediaInfo04(self):
+        # Values sent by the client come first
+        response = self.client.put(reverse('media'), {"kind": MediaKinds.IMAGE.value, "file": SimpleUploadedFile("photo.jpg", get_exif_image()),
+                                                      "modificationdate": "2020-01-01T00:00:00+00:00", "coordinates": "48.8566,2.3522"}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['modificationdate'], "2020-01-01T00:00:00+00:00")
+        self.assertEqual(Job.objects.get(kind='geocode_media').payload['coordinates'], "48.8566,2.3522")
+        
+    def test_mediaInfo05(self):
+        files = [SimpleUploadedFile("video.mp4", get_mp4_video()), SimpleUploadedFile("photo.jpg", get_exif_image(orientation=1))]
+        response = self.client.put(reverse('mediabatch'), {"files": files}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        video, photo = response.json()
+        self.assertEqual((video['kind'], video['duration'], video['width'], video['height']), (MediaKinds.VIDEO.value, 12.5, 1080, 1920))
+        self.assertEqual((photo['width'], photo['height'], photo['orientation']), (64, 48, 1))
+        self.assertIsNone(photo['duration'])
+        
+    def test_mediaInfo08(self):
+        # Metadata after long headers (e.g. embedded previews) is read
+        padding = b'\xff\xe9' + struct.pack('>H', 0xFFFF) + b'\x00' * (0xFFFF - 2)
+        image = get_exif_image()
+        metadata = mediainfo.read_metadata(io.BytesIO(image[:2] + padding * 2 + image[2:]), 'image/jpeg')
+        self.assertEqual(metadata['orientation'], 6)
+        self.assertEqual((metadata['latitude'], metadata['longitude']), (40.0 + 25 / 60, -(3.0 + 42 / 60)))
+        
+    # Invalid test cases
+    def test_mediaInfo06(self):
+        # Files without metadata or with broken metadata are stored without it
+        media = upload_media(self, b"video contents", kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        self.assertIsNone(media['width'])
+        self.assertIsNone(media['capturedate'])
+        self.assertEqual(mediainfo.read_metadata(io.BytesIO(get_mp4_video()[:5000]), 'video/mp4'), {})
+        self.assertEqual(mediainfo.read_metadata(io.BytesIO(b'\x00\x00\x00\x08moov'), 'video/mp4'), {})
+        self.assertEqual(mediainfo.read_metadata(io.BytesIO(b'\xff\xd8\xff\xe0broken'), 'image/jpeg'), {})
+        self.assertFalse(Job.objects.exists())
+        
+    def test_mediaInfo07(self):
+        # Dates without offset are in the configured time zone
+        self.assertEqual(mediainfo.get_exif_date("2024:05:01 10:20:30"), datetime.datetime(2024, 5, 1, 10, 20, 30, tzinfo=datetime.timezone.utc))
+        with self.settings(TIME_ZONE='Europe/Madrid'):
+            self.assertEqual(mediainfo.get_exif_date("2024:05:01 10:20:30", "\x00\x00"), datetime.datetime(2024, 5, 1, 8, 20, 30, tzinfo=datetime.timezone.utc))
+            self.assertEqual(mediainfo.get_exif_date("2024:05:01 10:20:30", "-05:00"), datetime.datetime(2024, 5, 1, 15, 20, 30, tzinfo=datetime.timezone.utc))
@@ -0,0 +1,144 @@
+import base64
+import io
+import struct
+import zlib
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import mediatypes, utils
+from core.common import MEDIA_MAX_IMAGE_BYTES, MediaKinds
+from core.models import Media
+from core.tests import login_user, register_user, upload_media
+
+def get_png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+# Builds the start of a PNG image of the given dimensions, with only a few bytes of pixel data
+def get_png_header(width: int, height: int) -> bytes:
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + get_png_chunk(b'IHDR', ihdr) + get_png_chunk(b'IDAT', zlib.compress(b'\x00' * 64))
+
+def get_image(format: str, size=(40, 30)) -> bytes:
+    image = io.BytesIO()
+    Image.new('RGB', size, 'red').save(image, format)
+    return image.getvalue()
+
+def get_jpeg_segment(marker: int, data: bytes) -> bytes:
+    return struct.pack('>BBH', 0xFF, marker, len(data) + 2) + data
+
+# Builds a JPEG image with metadata segments of 64 KB before the frame header, so its dimensions are not in the sniffed bytes
+def get_jpeg_big_metadata(width: int, height: int) -> bytes:
+    app1 = get_jpeg_segment(0xE1, b'Exif\x00\x00' + b'\x00' * (0xFFFF - 8))
+    sof = get_jpeg_segment(0xC0, struct.pack('>BHHB', 8, height, width, 3) + b'\x01\x22\x00\x02\x11\x01\x03\x11\x01')
+    sos = get_jpeg_segment(0xDA, b'\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00')
+    return b'\xff\xd8' + app1 + app1 + sof + sos + b'\x00' * 16 + b'\xff\xd9'
+
+MP4_HEADER = b'\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isom' + b'\x00' * 100
+
+# TEST IDENTIFIER: UNIT-16-01
+class MediaTypeTests(APITestCase):
+    def setUp(self):
+        register_user(self)
+        login_user(self)
+        
+    # Valid test cases
+    def test_mediaTypes01(self):
+        self.assertEqual(mediatypes.sniff_mimetype(get_image('PNG')), 'image/png')
+        self.assertEqual(mediatypes.sniff_mimetype(get_image('JPEG')), 'image/jpeg')
+        self.assertEqual(mediatypes.sniff_mimetype(get_image('GIF')), 'image/gif')
+        self.assertEqual(mediatypes.sniff_mimetype(get_image('WEBP')), 'image/webp')
+        self.assertEqual(mediatypes.sniff_mimetype(MP4_HEADER), 'video/mp4')
+        self.assertEqual(mediatypes.sniff_mimetype(b'\x00\x00\x00\x14ftypqt  \x00\x00\x02\x00qt  '), 'video/quicktime')
+        self.assertEqual(mediatypes.sniff_mimetype(b'\x00\x00\x00\x18ftypheic\x00\x00\x00\x00mif1heic'), 'image/heic')
+        self.assertEqual(mediatypes.sniff_mimetype(b'\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\x82\x84webm'), 'video/webm')
+        self.assertIsNone(mediatypes.sniff_mimetype(b'plain text'))
+        
+    def test_mediaTypes02(self):
+        # Dimensions are read from the header only
+        self.assertEqual(mediatypes.get_image_dimensions(get_png_header(4000, 3000)), (4000, 3000))
+        self.assertEqual(mediatypes.get_image_dimensions(get_image('JPEG', (640, 480))), (640, 480))
+        
+    def test_mediaTypes03(self):
+        # Detected type is stored and sent as Content-Type
+        media = upload_media(self, get_image('GIF'), filename="image.png")
+        self.assertEqual(media['mimetype'], 'image/gif')
+        response = self.client.get(reverse('file'), {"mediaid": media['id'], "kind": MediaKinds.IMAGE.value, "original": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/gif')
+        
+    def test_mediaTypes04(self):
+        # Media of an unknown type are sent with a generic type
+        media = upload_media(self, b"video contents", kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        self.assertIsNone(media['mimetype'])
+        response = self.client.get(reverse('file'), {"mediaid": media['id']})
+        self.assertEqual(response['Content-Type'], 'video/*')
+        
+    def test_mediaTypes05(self):
+        # Kind of batch media is detected from the contents, not the file name
+        files = [SimpleUploadedFile("clip.png", MP4_HEADER), SimpleUploadedFile("photo.mp4", get_image('PNG'))]
+        response = self.client.put(reverse('mediabatch'), {"files": files}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.json()
+        self.assertEqual([m['kind'] for m in data], [MediaKinds.VIDEO.value, MediaKinds.IMAGE.value])
+        self.assertEqual([m['mimetype'] for m in data], ['video/mp4', 'image/png'])
+        
+    def test_mediaTypes06(self):
+        content = base64.b64encode(get_image('PNG')).decode()
+        self.assertTrue(utils.validate_base64_image(content))
+        self.assertEqual(utils.validate_and_clean_base64_header("data:image/png;base64," + content), content)
+        
+    # Invalid test cases
+    def test_mediaTypes07(self):
+        # Decompression bombs are rejected before storing them
+        header = get_png_header(50000, 50000)
+        response = self.client.put(reverse('media'), {"kind": MediaKinds.IMAGE.value, "file": SimpleUploadedFile("bomb.png", header)}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(Media.objects.filter(filename="bomb.png").exists())
+        self.assertFalse(utils.validate_base64_image(base64.b64encode(header).decode()))
+        
+    def test_mediaTypes08(self):
+        with mock.patch('core.mediatypes.MEDIA_MAX_PIXELS', 1000):
+            files = [SimpleUploadedFile("small.png", get_image('PNG', (10, 10))), SimpleUploadedFile("big.png", get_image('PNG', (100, 100)))]
+            response = self.client.put(reverse('mediabatch'), {"files": files}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(Media.objects.exists())
+        
+    def test_mediaTypes09(self):
+        # Image uploads bigger than the limit are refused when created, resumable uploads are checked when finished
+        response = self.client.post(reverse('upload'), {"kind": MediaKinds.IMAGE.value, "size": MEDIA_MAX_IMAGE_BYTES + 1})
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        header = get_png_header(50000, 50000)
+        response = self.client.post(reverse('upload'), {"kind": MediaKinds.IMAGE.value, "size": len(header)})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        uploadid = response.json()['id']
+        self.client.patch(f"{reverse('upload')}?id={uploadid}", header, content_type='application/offset+octet-stream', headers={"Upload-Offset": "0"})
+        response = self.client.put(reverse('upload'), {"id": uploadid})
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        
+    def test_mediaTypes10(self):
+        self.assertFalse(utils.validate_base64_image("not base64!"))
+        self.assertFalse(utils.validate_base64_image(base64.b64encode(b"plain text").decode()))
+        self.assertFalse(utils.validate_base64_image(base64.b64encode(MP4_HEADER).decode()))
+        
+    def test_mediaTypes11(self):
+        # Dimensions after the sniffed bytes are read from the whole file
+        content = get_jpeg_big_metadata(30000, 30000)
+        self.assertIsNone(mediatypes.get_image_dimensions(content[:mediatypes.SNIFF_BYTES]))
+        self.assertEqual(mediatypes.get_image_dimensions(io.BytesIO(get_jpeg_big_metadata(400, 300))), (400, 300))
+        response = self.client.put(reverse('media'), {"kind": MediaKinds.IMAGE.value, "file": SimpleUploadedFile("bomb.jpg", content)}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(Media.objects.filter(filename="bomb.jpg").exists())
+        self.assertFalse(utils.validate_base64_image(base64.b64encode(content).decode()))
+        
+    def test_mediaTypes12(self):
+        # Images whose dimensions cannot be read are rejected
+        content = get_jpeg_big_metadata(400, 300)[:-100]
+        with self.assertRaises(mediatypes.InvalidMedia):
+            mediatypes.inspect_media(content[:mediatypes.SNIFF_BYTES], len(content))
+        response = self.client.put(reverse('media'), {"kind": MediaKinds.IMAGE.value, "file": SimpleUploadedFile("broken.jpg", content)}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Media.objects.filter(filename="broken.jpg").exists())
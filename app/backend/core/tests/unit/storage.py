@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+import uuid
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from core import storage
+from core.common import BLOBS_FOLDER, MEDIA_FILE_MODE
+
+# S3 tests run against an S3-compatible server (e.g. the MinIO service of docker-compose-dev.yml) if its URL is set
+S3_ENDPOINT_URL = os.getenv('GALERIA_TEST_S3_ENDPOINT_URL')
+S3_BUCKET = os.getenv('GALERIA_TEST_S3_BUCKET', 'galeria-test')
+S3_ACCESS_KEY = os.getenv('GALERIA_TEST_S3_ACCESS_KEY', 'minioadmin')
+S3_SECRET_KEY = os.getenv('GALERIA_TEST_S3_SECRET_KEY', 'minioadmin')
+
+# Tests common to every storage driver
+class StorageTests:
+    CONTENT = os.urandom(64 * 1024)
+    
+    def create_tempfile(self, content: bytes) -> str:
+        fd, tmppath = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        return tmppath
+        
+    def get_name(self) -> str:
+        name = uuid.uuid4().hex
+        return f"{name[:2]}/{name[2:4]}/{name}"
+        
+    # Valid test cases
+    def test_storage01(self):
+        name = self.get_name()
+        tmppath = self.create_tempfile(self.CONTENT)
+        self.storage.save(name, tmppath)
+        self.assertFalse(os.path.exists(tmppath))
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(self.storage.size(name), len(self.CONTENT))
+        with self.storage.open(name) as file:
+            self.assertEqual(file.size, len(self.CONTENT))
+            self.assertEqual(file.read(), self.CONTENT)
+        self.storage.delete(name)
+        self.assertFalse(self.storage.exists(name))
+        
+    def test_storage02(self):
+        # Files can be read from any position
+        name = self.get_name()
+        self.storage.save(name, self.create_tempfile(self.CONTENT))
+        with self.storage.open(name) as file:
+            file.seek(1000)
+            self.assertEqual(file.read(10), self.CONTENT[1000:1010])
+            file.seek(-10, os.SEEK_END)
+            self.assertEqual(file.read(), self.CONTENT[-10:])
+            file.seek(5)
+            self.assertEqual(file.read(5), self.CONTENT[5:10])
+        self.storage.delete(name)
+        
+    # Invalid test cases
+    def test_storage03(self):
+        name = self.get_name()
+        self.assertFalse(self.storage.exists(name))
+        with self.assertRaises(FileNotFoundError):
+            self.storage.open(name)
+        # Deleting a missing file does nothing
+        self.storage.delete(name)
+    
+
+# TEST IDENTIFIER: UNIT-10-01
+class LocalStorageTests(StorageTests, SimpleTestCase):
+    def setUp(self):
+        self.storage = storage.LocalStorage()
+        
+    def test_localStorage01(self):
+        self.assertEqual(self.storage.location, settings.MEDIA_ROOT / BLOBS_FOLDER)
+        name = self.get_name()
+        self.storage.save(name, self.create_tempfile(self.CONTENT))
+        self.assertTrue(self.storage.path(name).exists())
+        self.storage.delete(name)
+        
+    def test_localStorage02(self):
+        # Stored files are readable by nginx, though temporary files are only readable by their owner
+        name = self.get_name()
+        tmppath = self.create_tempfile(self.CONTENT)
+        self.assertEqual(os.stat(tmppath).st_mode & 0o777, 0o600)
+        self.storage.save(name, tmppath)
+        self.assertEqual(os.stat(self.storage.path(name)).st_mode & 0o777, MEDIA_FILE_MODE)
+        self.storage.delete(name)
+        
+    def test_localStorage03(self):
+        # Drivers not implementing every operation cannot be created
+        class ReadOnlyStorage(storage.Storage):
+            def exists(self, name): return False
+            def size(self, name): return 0
+            def open(self, name): raise FileNotFoundError(name)
+        with self.assertRaises(TypeError):
+            ReadOnlyStorage()
+        
+
+# TEST IDENTIFIER: UNIT-10-02
+@unittest.skipIf(storage.boto3 is None or not S3_ENDPOINT_URL, "S3-compatible server not configured")
+class S3StorageTests(StorageTests, SimpleTestCase):
+    # Minimum part size of S3
+    PART_SIZE = 5 * 1024 * 1024
+    
+    def setUp(self):
+        self.storage = storage.S3Storage(S3_BUCKET, endpoint_url=S3_ENDPOINT_URL, region='us-east-1', access_key=S3_ACCESS_KEY,
+                                         secret_key=S3_SECRET_KEY, prefix='test/', multipart_threshold=self.PART_SIZE,
+                                         multipart_chunksize=self.PART_SIZE)
+        try:
+            self.storage.client.head_bucket(Bucket=S3_BUCKET)
+        except storage.ClientError:
+            self.storage.client.create_bucket(Bucket=S3_BUCKET)
+            
+    def test_s3Storage01(self):
+        # Big files are uploaded in parts
+        content = os.urandom(2 * self.PART_SIZE + 1)
+        name = self.get_name()
+        self.storage.save(name, self.create_tempfile(content))
+        head = self.storage.client.head_object(Bucket=S3_BUCKET, Key=self.storage.get_key(name))
+        self.assertTrue(head['ETag'].endswith('-3"'))
+        with self.storage.open(name) as file:
+            file.seek(self.PART_SIZE - 5)
+            self.assertEqual(file.read(10), content[self.PART_SIZE - 5:self.PART_SIZE + 5])
+        self.assertIsNone(self.storage.path(name))
+        self.storage.delete(name)
@@ -0,0 +1,103 @@
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from django.conf import settings
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import streams
+from core.common import MediaKinds, VideoStreamStatus
+from core.models import Media, VideoStream
+from core.tests import get_default_album, login_user, register_user, upload_media
+
+FFMPEG_AVAILABLE = shutil.which(settings.FFMPEG_PATH) is not None and shutil.which(settings.FFPROBE_PATH) is not None
+
+# TEST IDENTIFIER: UNIT-11-01
+class GetStreamTests(APITestCase):
+    def setUp(self):
+        register_user(self)
+        login_user(self)
+        self.MEDIA = upload_media(self, b"video contents", kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        
+    def get_stream(self, name=None, mediaid=None):
+        mediaid = mediaid or self.MEDIA['id']
+        if name is None:
+            return self.client.get(reverse('stream', args=[mediaid]))
+        return self.client.get(reverse('streamfile', args=[mediaid, name]))
+        
+    # Valid test cases
+    def test_getStream01(self):
+        # Uploaded videos are queued for transcoding
+        response = self.get_stream()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['status'], VideoStreamStatus.PENDING.value)
+        
+    def test_getStream02(self):
+        # Only one worker claims a video
+        stream = streams.claim_video_stream()
+        self.assertEqual(stream.blob_id, Media.objects.get(id=self.MEDIA['id']).blob_id)
+        self.assertIsNone(streams.claim_video_stream())
+        self.assertEqual(self.get_stream().json()['status'], VideoStreamStatus.PROCESSING.value)
+        
+    def test_getStream03(self):
+        # Transcoding of files that are not videos fails
+        with self.settings(FFPROBE_PATH='/nonexistent/ffprobe'):
+            call_command('transcodevideos', '--once', stdout=io.StringIO())
+        self.assertEqual(self.get_stream().json()['status'], VideoStreamStatus.FAILED.value)
+        self.assertEqual(self.get_stream(streams.MASTER_PLAYLIST).status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_getStream04(self):
+        # Stream is hidden with the video, and deleted when it is purged from the trash
+        blobid = Media.objects.get(id=self.MEDIA['id']).blob_id
+        response = self.client.delete(reverse('media'), {"id": self.MEDIA['id'], "albumid": get_default_album(self)['id']})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get_stream().status_code, status.HTTP_404_NOT_FOUND)
+        call_command('purgetrash', '--once', '--retention-days', '0', stdout=io.StringIO())
+        self.assertFalse(VideoStream.objects.filter(blob_id=blobid).exists())
+        
+    @unittest.skipUnless(FFMPEG_AVAILABLE, "ffmpeg not available")
+    def test_getStream05(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "video.mp4")
+            subprocess.run([settings.FFMPEG_PATH, '-loglevel', 'error', '-f', 'lavfi', '-i', 'testsrc=size=1280x720:rate=25:duration=8',
+                            '-f', 'lavfi', '-i', 'sine=duration=8', '-c:v', 'libx264', '-c:a', 'aac', '-shortest', path], check=True)
+            with open(path, 'rb') as file:
+                media = upload_media(self, file.read(), kind=MediaKinds.VIDEO.value, filename="video.mp4")
+        call_command('transcodevideos', '--once', stdout=io.StringIO())
+        
+        response = self.get_stream(mediaid=media['id'])
+        self.assertEqual(response.json()['status'], VideoStreamStatus.READY.value)
+        self.assertEqual(response.json()['variants'], "h264:360;h264:720")
+        response = self.get_stream(streams.MASTER_PLAYLIST, media['id'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/vnd.apple.mpegurl')
+        master = b''.join(response.streaming_content).decode()
+        self.assertIn("RESOLUTION=1280x720", master)
+        self.assertIn("h264/360/index.m3u8", master)
+        playlist = b''.join(self.get_stream("h264/720/index.m3u8", media['id']).streaming_content).decode()
+        self.assertIn("segment00001.ts", playlist)
+        response = self.get_stream("h264/720/segment00001.ts", media['id'])
+        self.assertEqual(response['Content-Type'], 'video/mp2t')
+        
+    # Invalid test cases
+    def test_getStream06(self):
+        self.assertEqual(self.get_stream(mediaid=999999).status_code, status.HTTP_404_NOT_FOUND)
+        image = upload_media(self)
+        self.assertEqual(self.get_stream(mediaid=image['id']).status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_getStream07(self):
+        # Files outside the stream folder are never served
+        VideoStream.objects.update(status=VideoStreamStatus.READY.value)
+        hash = Media.objects.get(id=self.MEDIA['id']).blob_id
+        self.assertIsNone(streams.get_stream_file_path(hash, "../../../_blobs/x.ts"))
+        self.assertEqual(self.get_stream("../" + hash + "/master.m3u8").status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.get_stream("master.txt").status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_getStream08(self):
+        self.client.credentials()
+        self.assertEqual(self.get_stream().status_code, status.HTTP_401_UNAUTHORIZED)
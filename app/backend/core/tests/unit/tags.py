@@ -0,0 +1,94 @@
+import base64
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import tags
+from core.models import Tag
+from core.tests import TEST_IMAGE_FILE, login_user, put_album, register_user, upload_media
+
+# TEST IDENTIFIER: UNIT-21-01
+class TagsTests(APITestCase):
+    def setUp(self):
+        self.url = reverse('taggedmedia')
+        register_user(self)
+        login_user(self)
+        
+    def get_file(self):
+        return SimpleUploadedFile("image.png", base64.b64decode(TEST_IMAGE_FILE))
+        
+    def upload_tagged(self, detectedobjects, albumid=None):
+        media = {"kind": "image", "file": self.get_file(), "detectedobjects": detectedobjects}
+        if albumid:
+            media['albumid'] = albumid
+        response = self.client.put(reverse('media'), media, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()
+        
+    def get_tagged(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(m['id'] for m in response.json())
+        
+    # Valid test cases
+    def test_tags01(self):
+        # Detected objects are stored as normalized tags without duplicates, and returned joined as sent
+        media = self.upload_tagged("Dog;traffic  light;dog;" + "x" * 120)
+        self.assertEqual(media['detectedobjects'], "dog;traffic light;" + "x" * 100)
+        self.assertEqual(media['tags'], [{"name": "dog", "confidence": None}, {"name": "traffic light", "confidence": None},
+                                         {"name": "x" * 100, "confidence": None}])
+        self.assertEqual(Tag.objects.count(), 3)
+        
+    def test_tags02(self):
+        # Media with all the tags, or any of them
+        dog = self.upload_tagged("dog;person")['id']
+        cat = self.upload_tagged("cat;person")['id']
+        self.upload_tagged("car")
+        self.assertEqual(self.get_tagged({"tags": "person,dog"}), [dog])
+        self.assertEqual(self.get_tagged({"tags": "person"}), sorted([cat, dog]))
+        self.assertEqual(self.get_tagged({"tags": "dog,cat", "match": "any"}), sorted([cat, dog]))
+        self.assertEqual(self.get_tagged({"tags": "dog,cat"}), [])
+        self.assertEqual(self.get_tagged({"tags": "dog,unknown"}), [])
+        self.assertEqual(self.get_tagged({"tags": "Dog,unknown", "match": "any"}), [dog])
+        
+    def test_tags03(self):
+        # Searches of an album, media of other users and trashed media are not found
+        album = put_album(self, "pets")
+        dog = self.upload_tagged("dog", album['id'])['id']
+        other = self.upload_tagged("dog")['id']
+        self.assertEqual(self.get_tagged({"tags": "dog", "albumid": album['id']}), [dog])
+        self.client.delete(reverse('media'), {"id": other})
+        self.assertEqual(self.get_tagged({"tags": "dog"}), [dog])
+        
+    def test_tags04(self):
+        # Copies keep the tags, new files replace them with their detections
+        media = self.upload_tagged("dog")
+        response = self.client.put(reverse('media'), {"kind": "image", "id": media['id'], "albumid": put_album(self, "copy")['id']}, format='multipart')
+        copy = response.json()
+        self.assertEqual(copy['detectedobjects'], "dog")
+        response = self.client.put(reverse('media'), {"kind": "image", "id": media['id'], "file": self.get_file(), "detectedobjects": "cat"}, format='multipart')
+        self.assertEqual(response.json()['detectedobjects'], "cat")
+        self.assertEqual(self.get_tagged({"tags": "dog"}), [copy['id']])
+        self.assertEqual(self.get_tagged({"tags": "cat"}), [media['id']])
+        
+    def test_tags05(self):
+        # Media without detections have no tags, media detected without objects have an empty value
+        self.assertIsNone(upload_media(self)['detectedobjects'])
+        media = self.upload_tagged("")
+        self.assertEqual(media['detectedobjects'], "")
+        self.assertEqual(self.client.get(reverse('medias'), {"mediaid": media['id']}).json()[0]['detectedobjects'], "")
+        
+    def test_tags06(self):
+        # Media of the users view have the tags of their media
+        media = self.upload_tagged("dog;person")
+        tags.set_media_tags({media['id']: {"cat": 0.8}})
+        self.assertEqual(self.client.get(reverse('medias'), {"mediaid": media['id']}).json()[0]['detectedobjects'], "cat")
+        self.assertEqual(self.get_tagged({"tags": "dog"}), [])
+        
+    # Invalid test cases
+    def test_tags07(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"tags": " , "}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"tags": "dog", "match": "some"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"tags": "dog", "albumid": -1}).status_code, status.HTTP_404_NOT_FOUND)
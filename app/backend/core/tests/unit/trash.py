@@ -0,0 +1,116 @@
+import io
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import utils
+from core.models import Album, Blob, Media
+from core.storage import get_storage
+from core.tests import AUTH_TOKEN_PREFIX, INCORRECT_TOKEN, TESTUSER_USERNAME, get_default_album, login_user, put_album, register_user, upload_media
+
+# TEST IDENTIFIER: UNIT-12-01
+class TrashTests(APITestCase):
+    INCORRECT_MEDIA_ID = -1
+    
+    def setUp(self):
+        self.url = reverse('trash')
+        register_user(self)
+        login_user(self)
+        self.ALBUM = put_album(self, "trashalbum")
+        self.MEDIA = upload_media(self, b"trashed contents", albumid=self.ALBUM['id'])
+        
+    def purge(self):
+        call_command('purgetrash', '--once', '--retention-days', '0', '--pause', '0', stdout=io.StringIO())
+        
+    # Valid test cases
+    def test_trash01(self):
+        # Deleted media are hidden until restored
+        response = self.client.delete(reverse('media'), {"id": self.MEDIA['id'], "albumid": self.ALBUM['id']})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(reverse('file'), {"mediaid": self.MEDIA['id']}).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(reverse('medias'), {"albumid": self.ALBUM['id']})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([m['id'] for m in response.json()['media']], [self.MEDIA['id']])
+        
+        response = self.client.post(self.url, {"id": self.MEDIA['id']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(reverse('file'), {"mediaid": self.MEDIA['id']}).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(self.url).json()['media'], [])
+        
+    def test_trash02(self):
+        # Deleted albums are hidden with their media until restored
+        response = self.client.delete(reverse('album'), {"id": self.ALBUM['id']})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(reverse('albums'), {"id": self.ALBUM['id']}).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(reverse('file'), {"mediaid": self.MEDIA['id']}).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual([a['id'] for a in self.client.get(self.url).json()['albums']], [self.ALBUM['id']])
+        
+        response = self.client.post(self.url, {"albumid": self.ALBUM['id']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(reverse('albums'), {"id": self.ALBUM['id']})
+        self.assertEqual(response.json()[0]['elements'], 1)
+        
+    def test_trash03(self):
+        # Media are purged with their files once the retention days are over
+        hash = Media.objects.get(id=self.MEDIA['id']).blob_id
+        self.client.delete(reverse('media'), {"id": self.MEDIA['id'], "albumid": self.ALBUM['id']})
+        call_command('purgetrash', '--once', stdout=io.StringIO())
+        self.assertTrue(Media.all_objects.filter(id=self.MEDIA['id']).exists())
+        self.purge()
+        self.assertFalse(Media.all_objects.filter(id=self.MEDIA['id']).exists())
+        self.assertFalse(Blob.objects.filter(hash=hash).exists())
+        self.assertFalse(get_storage().exists(utils.get_blob_name(hash)))
+        
+    def test_trash04(self):
+        # Emptied trash is purged on the next run of the worker and can no longer be restored
+        self.client.delete(reverse('album'), {"id": self.ALBUM['id']})
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(self.url).json()['albums'], [])
+        self.assertEqual(self.client.post(self.url, {"albumid": self.ALBUM['id']}).status_code, status.HTTP_404_NOT_FOUND)
+        call_command('purgetrash', '--once', stdout=io.StringIO())
+        self.assertFalse(Album.all_objects.filter(id=self.ALBUM['id']).exists())
+        self.assertFalse(Media.all_objects.filter(id=self.MEDIA['id']).exists())
+        
+    def test_trash05(self):
+        # Media shared by many rows are purged in batches, releasing their blob once per batch
+        medias = [upload_media(self, b"batched contents", albumid=self.ALBUM['id']) for _ in range(5)]
+        hash = Media.objects.get(id=medias[0]['id']).blob_id
+        self.client.delete(reverse('album'), {"id": self.ALBUM['id']})
+        call_command('purgetrash', '--once', '--retention-days', '0', '--batch-size', '2', '--pause', '0', stdout=io.StringIO())
+        self.assertFalse(Media.all_objects.filter(id__in=[m['id'] for m in medias]).exists())
+        self.assertFalse(Blob.objects.filter(hash=hash).exists())
+        
+    def test_trash06(self):
+        # Deleted accounts cannot log in, their data and then the user are purged
+        default = get_default_album(self)
+        response = self.client.delete(reverse('user'))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(reverse('user')).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertTrue(User.objects.filter(username=TESTUSER_USERNAME).exists())
+        call_command('purgetrash', '--once', stdout=io.StringIO())
+        self.assertFalse(User.objects.filter(username=TESTUSER_USERNAME).exists())
+        self.assertFalse(Album.all_objects.filter(id__in=[default['id'], self.ALBUM['id']]).exists())
+        self.assertFalse(Media.all_objects.filter(id=self.MEDIA['id']).exists())
+        
+    # Invalid test cases
+    def test_trash07(self):
+        response = self.client.post(self.url, {"id": self.MEDIA['id']})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_trash08(self):
+        response = self.client.post(self.url, {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_trash09(self):
+        response = self.client.delete(self.url, {"id": self.INCORRECT_MEDIA_ID})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_trash10(self):
+        self.client.credentials(HTTP_AUTHORIZATION=AUTH_TOKEN_PREFIX + INCORRECT_TOKEN)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,114 @@
+import datetime
+import os
+from unittest import mock
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core import utils
+from core.common import UPLOAD_CLAIM_TIMEOUT_SECONDS, MediaKinds
+from core.models import Blob, Media, Upload
+from core.tests import login_user, register_user
+
+# TEST IDENTIFIER: UNIT-08-01
+class UploadTests(APITestCase):
+    CONTENT = b'0123456789' * 100
+    INCORRECT_UPLOAD_ID = "00000000-0000-0000-0000-000000000000"
+    
+    def setUp(self):
+        self.url = reverse('upload')
+        register_user(self)
+        login_user(self)
+        response = self.client.post(self.url, {"kind": MediaKinds.VIDEO.value, "size": len(self.CONTENT), "filename": "video.mp4"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.UPLOAD = response.json()
+        
+    def append(self, offset, data):
+        return self.client.patch(f"{self.url}?id={self.UPLOAD['id']}", data, content_type='application/offset+octet-stream', 
+                                 headers={"Upload-Offset": str(offset)})
+        
+    # Valid test cases
+    def test_upload01(self):
+        response = self.append(0, self.CONTENT[:600])
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response['Upload-Offset'], '600')
+        response = self.client.get(self.url, {"id": self.UPLOAD['id']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['offset'], 600)
+        response = self.append(600, self.CONTENT[600:])
+        self.assertEqual(response['Upload-Offset'], str(len(self.CONTENT)))
+        
+        # File is moved into the blob store once the media is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(self.url, {"id": self.UPLOAD['id']})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.json()
+        self.assertEqual(data['kind'], MediaKinds.VIDEO.value)
+        self.assertEqual(data['filename'], "video.mp4")
+        self.assertEqual(Media.objects.get(id=data['id']).blob.size, len(self.CONTENT))
+        self.assertFalse(Upload.objects.filter(id=self.UPLOAD['id']).exists())
+        
+        response = self.client.get(reverse('file'), {"mediaid": data['id']})
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT)
+        
+    def test_upload02(self):
+        response = self.client.delete(self.url, {"id": self.UPLOAD['id']})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Upload.objects.filter(id=self.UPLOAD['id']).exists())
+        
+    # Invalid test cases
+    def test_upload03(self):
+        # Offset does not match the received bytes
+        response = self.append(10, self.CONTENT[10:20])
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response['Upload-Offset'], '0')
+        
+    def test_upload04(self):
+        # Upload is not complete
+        self.append(0, self.CONTENT[:10])
+        response = self.client.put(self.url, {"id": self.UPLOAD['id']})
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        
+    def test_upload05(self):
+        response = self.append(0, self.CONTENT + b'extra')
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        
+    def test_upload06(self):
+        response = self.client.get(self.url, {"id": self.INCORRECT_UPLOAD_ID})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_upload07(self):
+        response = self.client.post(self.url, {"kind": "unknown", "size": 10})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_upload08(self):
+        # Uploads of other users cannot be resumed
+        register_user(self, username="otheruser", password="otherpassword", email="other@mail.com")
+        login_user(self, username="otheruser", password="otherpassword")
+        response = self.append(0, self.CONTENT)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
+    def test_upload09(self):
+        # Another chunk is being appended
+        Upload.objects.filter(id=self.UPLOAD['id']).update(receiving=timezone.now())
+        response = self.append(0, self.CONTENT[:10])
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        # Chunks not receiving data for a while are abandoned
+        abandoned = timezone.now() - datetime.timedelta(seconds=UPLOAD_CLAIM_TIMEOUT_SECONDS + 1)
+        Upload.objects.filter(id=self.UPLOAD['id']).update(receiving=abandoned)
+        response = self.append(0, self.CONTENT[:10])
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertIsNone(Upload.objects.get(id=self.UPLOAD['id']).receiving)
+        
+    def test_upload10(self):
+        # Upload is kept with its file if the media cannot be created, and no file is left in the blob store
+        self.append(0, self.CONTENT)
+        upload = Upload.objects.get(id=self.UPLOAD['id'])
+        with mock.patch('core.utils.create_album_media', side_effect=RuntimeError):
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertRaises(RuntimeError):
+                    self.client.put(self.url, {"id": self.UPLOAD['id']})
+        self.assertTrue(Upload.objects.filter(id=self.UPLOAD['id']).exists())
+        self.assertTrue(os.path.exists(utils.get_upload_path(upload)))
+        self.assertFalse(Blob.objects.exists())
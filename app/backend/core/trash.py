@@ -0,0 +1,78 @@
+import collections
+import datetime
+import logging
+import time
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from knox.models import AuthToken
+
+from core import utils
+from core.common import TRASH_RETENTION_DAYS
+from core.models import Album, AlbumUser, Blob, Media
+
+logger = logging.getLogger(__name__)
+
+# Deleted albums and media are moved to the trash with a single update, so delete requests return immediately
+# whatever their size. The purgetrash worker removes them when the retention days are over
+
+# Gets the date before which trashed albums and media are purged (and can no longer be restored)
+def get_purge_cutoff(retention_days: int = TRASH_RETENTION_DAYS) -> datetime.datetime:
+    return timezone.now() - datetime.timedelta(days=retention_days)
+
+# Gets accounts deleted by their users, waiting for their albums to be purged
+def get_deleted_users():
+    return User.objects.filter(is_active=False, password__startswith=UNUSABLE_PASSWORD_PREFIX)
+
+# Deletes an account without waiting for its data: login is disabled and the albums it owns are trashed already expired
+# (a deleted account cannot restore them), the worker purges them and then the user
+def trash_user(user: User):
+    with transaction.atomic():
+        Album.all_objects.filter(albumuser__user=user, albumuser__is_owner=True).update(deletiondate=get_purge_cutoff())
+        AuthToken.objects.filter(user=user).delete()
+        user.is_active = False
+        user.set_unusable_password()
+        user.save(update_fields=['is_active', 'password'])
+
+# Deletes a batch of media rows with set-based queries and releases their files
+# Returns number of purged media
+def purge_media(ids: list[int]) -> int:
+    medias = list(Media.all_objects.filter(id__in=ids).only('id', 'blob_id'))
+    # Media sharing a blob release it at once
+    blobs = collections.Counter(media.blob_id for media in medias if media.blob_id)
+    # Files of the legacy per-user layout are found with the username of the album owner
+    legacy = [media for media in medias if not media.blob_id]
+    usernames = dict(AlbumUser.objects.filter(album__mediaalbum__media__in=legacy, is_owner=True)
+                     .values_list('album__mediaalbum__media_id', 'user__username')) if legacy else {}
+
+    with transaction.atomic():
+        Media.all_objects.filter(id__in=ids).delete()
+        # Rows and references are removed together, so a failed batch is purged again without releasing a blob twice
+        for blob in Blob.objects.filter(hash__in=blobs):
+            utils.release_blob(blob, blobs[blob.hash])
+    for media in legacy:
+        if media.id in usernames:
+            utils.delete_media_file(usernames[media.id], media)
+    return len(medias)
+
+# Purges media and albums trashed before the cutoff, then the deleted accounts left without albums
+# Media are purged in batches with a pause between them, so a big account does not hold locks for long
+# or saturate the storage with deletes
+# Returns number of purged media, albums and users
+def purge_trash(cutoff: datetime.datetime, batch_size: int = 500, pause: float = 0) -> dict:
+    purged = {'media': 0, 'albums': 0, 'users': 0}
+    expired = Media.all_objects.filter(Q(deletiondate__lt=cutoff) | Q(album__deletiondate__lt=cutoff))
+    while ids := list(expired.values_list('id', flat=True).distinct()[:batch_size]):
+        purged['media'] += purge_media(ids)
+        logger.info(f"Purged {purged['media']} media from the trash")
+        if pause:
+            time.sleep(pause)
+
+    # Media are gone, albums only cascade to their few sharing and upload rows
+    _, deleted = Album.all_objects.filter(deletiondate__lt=cutoff).delete()
+    purged['albums'] = deleted.get(Album._meta.label, 0)
+    _, deleted = get_deleted_users().exclude(albumuser__is_owner=True).delete()
+    purged['users'] = deleted.get(User._meta.label, 0)
+    return purged
@@ -0,0 +1,49 @@
+import hashlib
+import os
+import tempfile
+import zlib
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+from core import utils
+
+# Uploaded file written to the blob store temporary folder, with its SHA-256 hash and CRC-32
+# It is moved into the store without copying it (see utils.store_blob)
+class BlobUploadedFile(TemporaryUploadedFile):
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        file = tempfile.NamedTemporaryFile(suffix=".upload", dir=utils.get_blob_tempdir())
+        UploadedFile.__init__(self, file, name, content_type, size, charset, content_type_extra)
+        self.hash = None
+        self.crc = None
+        
+
+# Streams uploaded files into the filesystem of the blob store, computing their hash and CRC-32 in the same pass,
+# instead of spooling them to a temporary file that is later copied into MEDIA_ROOT
+class BlobUploadHandler(FileUploadHandler):
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = BlobUploadedFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.sha256 = hashlib.sha256()
+        self.crc = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.sha256.update(raw_data)
+        self.crc = zlib.crc32(raw_data, self.crc)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.flush()
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.hash = self.sha256.hexdigest()
+        self.file.crc = self.crc
+        return self.file
+
+    def upload_interrupted(self):
+        if hasattr(self, "file"):
+            temp_location = self.file.temporary_file_path()
+            try:
+                self.file.close()
+                os.remove(temp_location)
+            except FileNotFoundError:
+                pass
@@ -18,8 +18,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
 
-from core.views import LoginAPI, MediaAPI, RegisterAPI, UserAlbumsAPI, UserMediaAPI, FileAPI, UserAPI, AlbumAPI, index
-from .common import USER_API, ALBUM_API, USER_ALBUMS_API, MEDIA_API, LOGIN_API, LOGOUT_API, REGISTER_API, USER_MEDIA_API, FILE_API
+from core.views import BatchMediaAPI, DuplicatesAPI, SearchMediaAPI, SimilarMediaAPI, TaggedMediaAPI, ExportAPI, StreamAPI, TrashAPI, LoginAPI, MediaAPI, RegisterAPI, UploadAPI, UserAlbumsAPI, UserMediaAPI, FileAPI, UserAPI, AlbumAPI, index
+from .common import USER_API, ALBUM_API, USER_ALBUMS_API, MEDIA_API, MEDIA_BATCH_API, LOGIN_API, LOGOUT_API, REGISTER_API, USER_MEDIA_API, FILE_API, UPLOAD_API, EXPORT_API, STREAM_API, TRASH_API, DUPLICATES_API, SIMILAR_MEDIA_API, SEARCH_MEDIA_API, TAGGED_MEDIA_API
 from knox.views import LogoutView as LogoutAPI
 
 
@@ -47,8 +47,18 @@ urlpatterns = [
     path(ALBUM_API, AlbumAPI.as_view(), name='album'),
     path(USER_ALBUMS_API, UserAlbumsAPI.as_view(), name='albums'),
     path(MEDIA_API, MediaAPI.as_view(), name='media'),
+    path(MEDIA_BATCH_API, BatchMediaAPI.as_view(), name='mediabatch'),
     path(USER_MEDIA_API, UserMediaAPI.as_view(), name='medias'),
+    path(SIMILAR_MEDIA_API, SimilarMediaAPI.as_view(), name='similarmedia'),
+    path(SEARCH_MEDIA_API, SearchMediaAPI.as_view(), name='searchmedia'),
+    path(TAGGED_MEDIA_API, TaggedMediaAPI.as_view(), name='taggedmedia'),
     path(FILE_API, FileAPI.as_view(), name='file'),
+    path(UPLOAD_API, UploadAPI.as_view(), name='upload'),
+    path(EXPORT_API, ExportAPI.as_view(), name='export'),
+    path(STREAM_API + '/<int:mediaid>', StreamAPI.as_view(), name='stream'),
+    path(STREAM_API + '/<int:mediaid>/<path:name>', StreamAPI.as_view(), name='streamfile'),
+    path(TRASH_API, TrashAPI.as_view(), name='trash'),
+    path(DUPLICATES_API, DuplicatesAPI.as_view(), name='duplicates'),
     # Robots.txt
     path("robots.txt", TemplateView.as_view(template_name="robots.txt", content_type="text/plain")),    
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -1,66 +1,442 @@
 import base64
+import contextlib
+import datetime
+import hashlib
 import io
+import logging
 import os
-import shutil
+import tempfile
+import time
+import zlib
 from django.conf import settings
+from django.contrib.auth.models import User
 from django.core.files import File
-import requests
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
 import re
-from PIL import Image
 
+from core import derived, mediatypes, streams, tags
+from core.storage import get_storage
+from core.common import BLOBS_FOLDER, MEDIA_MAX_IMAGE_BYTES, UPLOAD_CLAIM_TIMEOUT_SECONDS, UPLOAD_EXPIRATION_HOURS, MediaKinds
+from core.models import Album, Blob, Media, MediaAlbum, Upload
+
+logger = logging.getLogger(__name__)
+
+# Checks a base64 string is an image within the limits, decoding only its header
+# unless the image dimensions are not in it
 def validate_base64_image(base64img: str):
     try:
-        image = base64.b64decode(base64img)
-        img = Image.open(io.BytesIO(image))
-        return True
-    except:
+        # Base64 groups of 4 characters decode into 3 bytes
+        header = base64.b64decode(base64img[:mediatypes.SNIFF_BYTES // 3 * 4])
+        size = len(base64img) * 3 // 4
+        file = None
+        if size <= MEDIA_MAX_IMAGE_BYTES and len(header) < size and mediatypes.get_image_dimensions(header) is None:
+            file = io.BytesIO(base64.b64decode(base64img))
+        mimetype = mediatypes.inspect_media(header, size, file)
+        return mimetype is not None and mimetype.startswith('image/')
+    except (ValueError, mediatypes.InvalidMedia):
         return False
 
-# Writes file to specified path
-def write_file(filepath: str, file: File | io.BufferedReader):
+BLOB_CHUNK_SIZE = 64 * 1024
+
+# Yields file contents in chunks, without loading the whole file in memory
+def read_chunks(file: File | io.BufferedReader):
+    if hasattr(file, 'chunks'):
+        yield from file.chunks(BLOB_CHUNK_SIZE)
+    else:
+        while chunk := file.read(BLOB_CHUNK_SIZE):
+            yield chunk
+
+# Gets name of a blob in the storage, sharded by hash prefix (ab/cd/abcd...)
+def get_blob_name(hash: str) -> str:
+    return f"{hash[:2]}/{hash[2:4]}/{hash}"
+
+# Gets path of a media file stored with the legacy per-user layout
+def get_legacy_media_path(username: str, id: int):
+    return settings.MEDIA_ROOT / username / str(id)
+
+# Gets folder for temporary files of the blob store, in the same filesystem so they can be moved into it
+def get_blob_tempdir():
+    tmpdir = settings.MEDIA_ROOT / BLOBS_FOLDER / 'tmp'
+    os.makedirs(tmpdir, exist_ok=True)
+    return tmpdir
+
+# Writes file to a temporary file inside the blob store, computing its hash, size and CRC-32 in the same pass
+def write_blob_tempfile(file: File | io.BufferedReader) -> tuple[str, str, int, int]:
+    fd, tmppath = tempfile.mkstemp(dir=get_blob_tempdir())
+    sha256 = hashlib.sha256()
+    size = 0
+    crc = 0
     try:
-        with open(filepath, 'wb+') as dest:
-            if type(file) is File:
-                for chunk in file.chunks():
-                    dest.write(chunk)
-            elif type(file) is io.BufferedReader:
-                shutil.copyfileobj(file, dest)
+        with os.fdopen(fd, 'wb') as dest:
+            for chunk in read_chunks(file):
+                sha256.update(chunk)
+                size += len(chunk)
+                crc = zlib.crc32(chunk, crc)
+                dest.write(chunk)
+    except:
+        os.remove(tmppath)
+        raise
+    return tmppath, sha256.hexdigest(), size, crc
+
+# Gets the hash, size and CRC-32 of a file
+def hash_blob_file(path: str) -> tuple[str, int, int]:
+    sha256 = hashlib.sha256()
+    size = 0
+    crc = 0
+    with open(path, 'rb') as src:
+        while chunk := src.read(BLOB_CHUNK_SIZE):
+            sha256.update(chunk)
+            size += len(chunk)
+            crc = zlib.crc32(chunk, crc)
+    return sha256.hexdigest(), size, crc
+
+# Gets a local path with the contents of a blob, for tools that need a file (e.g. ffmpeg)
+# Blobs of a remote storage are downloaded to a temporary file, removed when the context exits
+@contextlib.contextmanager
+def get_blob_local_path(hash: str):
+    storage = get_storage()
+    name = get_blob_name(hash)
+    path = storage.path(name)
+    if path is not None:
+        yield path
+        return
+    fd, tmppath = tempfile.mkstemp(dir=get_blob_tempdir())
+    try:
+        with os.fdopen(fd, 'wb') as dest, storage.open(name) as src:
+            for chunk in read_chunks(src):
+                dest.write(chunk)
+        yield tmppath
+    finally:
+        os.remove(tmppath)
+
+# Moves a hashed temporary file into the blob store and references it
+# If a blob with the same content already exists, the temporary file is discarded
+# If deferred, the file is only moved (or discarded) once the current transaction commits, so a rolled back transaction
+# leaves no unreferenced file in the store and keeps the temporary file
+def commit_blob_tempfile(tmppath: str, hash: str, size: int, crc: int = None, defer: bool = False) -> Blob:
+    name = get_blob_name(hash)
+    storage = get_storage()
+    with transaction.atomic():
+        blob, created = Blob.objects.select_for_update().get_or_create(hash=hash, defaults={'size': size, 'crc32': crc, 'refcount': 1})
+        if not created:
+            blob.refcount = F('refcount') + 1
+            # Blobs stored before their CRC-32 was recorded get it
+            blob.crc32 = blob.crc32 if blob.crc32 is not None else crc
+            blob.save(update_fields=['refcount', 'crc32'])
+            blob.refresh_from_db()
+        if created or not storage.exists(name):
+            if defer:
+                transaction.on_commit(lambda: storage.save(name, tmppath))
             else:
-                dest.write(file.read())
-    except Exception as e:
-        print(e)
+                storage.save(name, tmppath)
+            return blob
+    if defer:
+        transaction.on_commit(lambda: os.remove(tmppath))
+    else:
+        os.remove(tmppath)
+    return blob
+
+# Hashes a file already written inside the blob temporary folder and moves it into the store without copying it
+def commit_blob_file(tmppath: str, defer: bool = False) -> Blob:
+    return commit_blob_tempfile(tmppath, *hash_blob_file(tmppath), defer=defer)
+
+# Gets a hashed temporary file of the blob store with the file contents, as its path, hash, size and CRC-32,
+# and whether it was written for it
+# Files streamed by the upload handler are already hashed in the blob temporary folder, so they are not copied
+def get_blob_tempfile(file: File | io.BufferedReader) -> tuple[str, str, int, int, bool]:
+    if getattr(file, 'hash', None) and hasattr(file, 'temporary_file_path'):
+        return file.temporary_file_path(), file.hash, file.size, getattr(file, 'crc', None), False
+    return *write_blob_tempfile(file), True
+
+# Stores file in the blob store, deduplicating by content
+def store_blob(file: File | io.BufferedReader) -> Blob:
+    tmppath, hash, size, crc, _ = get_blob_tempfile(file)
+    return commit_blob_tempfile(tmppath, hash, size, crc)
+
+# Records the CRC-32 of a blob stored before it was recorded
+def set_blob_crc(hash: str, crc: int):
+    Blob.objects.filter(hash=hash, crc32__isnull=True).update(crc32=crc)
+
+# Adds a reference to an existing blob
+def acquire_blob(blob: Blob) -> Blob:
+    Blob.objects.filter(hash=blob.hash).update(refcount=F('refcount') + 1)
+    blob.refresh_from_db()
+    return blob
+
+# Removes references to a blob (one by default), deleting its file when no media uses it
+def release_blob(blob: Blob, count: int = 1):
+    with transaction.atomic():
+        try:
+            blob = Blob.objects.select_for_update().get(hash=blob.hash)
+        except Blob.DoesNotExist:
+            return
+        if blob.refcount > count:
+            blob.refcount = F('refcount') - count
+            blob.save(update_fields=['refcount'])
+            return
+        # File is removed while the row is locked, so a concurrent upload of the same content waits for it
+        get_storage().delete(get_blob_name(blob.hash))
+        derived.invalidate_derived_files(blob.hash)
+        streams.delete_video_stream(blob.hash)
+        blob.delete()
             
-# Creates or updates media file in server's media folder
-def create_update_media_file(username: str, id: int, fileOrCopyId: File | io.BufferedReader | int):
-    filename = str(id)
-    filepath = settings.MEDIA_ROOT / username / filename
-    # Update media file
-    if os.path.exists(filepath):
-        os.remove(filepath)
-    
+# Moves a media file stored with the legacy per-user layout into the blob store
+# Legacy files are never written again, so the file is hashed in place and moved into the storage (renamed if local)
+# Returns False if there is nothing to migrate (no file, or no media without blob for it)
+def migrate_legacy_media_file(username: str, mediaid: int) -> bool:
+    legacypath = get_legacy_media_path(username, mediaid)
+    if not os.path.exists(legacypath):
+        return False
+    hash, size, crc = hash_blob_file(legacypath)
+
+    # Media is locked, so a concurrent update of its file cannot be overwritten
+    with transaction.atomic():
+        media = Media.all_objects.select_for_update().filter(id=mediaid).first()
+        if media is None or media.blob is not None or not os.path.exists(legacypath):
+            return False
+        media.blob = commit_blob_tempfile(legacypath, hash, size, crc)
+        media.save(update_fields=['blob'])
+    derived.invalidate_derived_files(derived.get_legacy_derived_key(username, mediaid))
+    return True
+            
+# Creates or updates media file, storing its contents in the blob store
+# If a media is given instead of a file, the new media shares its contents
+# If a blob is given, it must already be referenced for this media (see commit_blob_tempfile)
+def create_update_media_file(username: str, media: Media, fileOrCopy: File | io.BufferedReader | Media | Blob):
+    if isinstance(fileOrCopy, Blob):
+        blob = fileOrCopy
     # Create copy of media file
-    if type(fileOrCopyId) is int:
-        copypath = settings.MEDIA_ROOT / username / str(fileOrCopyId)
-        with open(copypath, 'rb') as src:
-            if os.path.exists(copypath):
-                write_file(filepath, src)
+    elif isinstance(fileOrCopy, Media):
+        if fileOrCopy.blob is not None:
+            blob = acquire_blob(fileOrCopy.blob)
+        else:
+            # Media stored with the legacy layout is moved into the blob store on first copy
+            copypath = get_legacy_media_path(username, fileOrCopy.id)
+            if not os.path.exists(copypath):
+                return
+            with open(copypath, 'rb') as src:
+                blob = store_blob(src)
+            fileOrCopy.blob = acquire_blob(blob)
+            fileOrCopy.save(update_fields=['blob'])
+            os.remove(copypath)
     # Create media file
     else:
-        write_file(filepath, fileOrCopyId)
+        blob = store_blob(fileOrCopy)
+    
+    # Update media file
+    # Files derived from the old contents are invalidated when the blob is released
+    old = media.blob
+    media.blob = blob
+    media.save(update_fields=['blob'])
+    # Videos are transcoded in the background into adaptive streams
+    if media.kind == MediaKinds.VIDEO.value:
+        streams.request_video_stream(blob)
+    if old is not None:
+        release_blob(old)
+    legacypath = get_legacy_media_path(username, media.id)
+    if os.path.exists(legacypath):
+        os.remove(legacypath)
+        derived.invalidate_derived_files(derived.get_legacy_derived_key(username, media.id))
                      
-def get_media_file(username: str, id: int):
-    filename = str(id)
-    filepath = settings.MEDIA_ROOT / username / filename
+def get_media_file(username: str, media: Media):
+    if media.blob is not None:
+        try:
+            return get_storage().open(get_blob_name(media.blob.hash))
+        except FileNotFoundError:
+            return None
+    filepath = get_legacy_media_path(username, media.id)
     if os.path.exists(filepath):
         file = open(filepath, 'rb')
         return File(file)
     return None
     
-def delete_media_file(username: str, id: int):
-    filename = str(id)
-    filepath = settings.MEDIA_ROOT / username / filename
+def delete_media_file(username: str, media: Media):
+    if media.blob is not None:
+        release_blob(media.blob)
+        media.blob = None
+    filepath = get_legacy_media_path(username, media.id)
     if os.path.exists(filepath):
         os.remove(filepath)
+        derived.invalidate_derived_files(derived.get_legacy_derived_key(username, media.id))
+
+# Creates media with its file in an album
+# File can also be a blob already referenced for the new media (e.g. a finished resumable upload)
+# Metadata read from the file (see core.mediainfo) is given as a dict of media fields
+def create_album_media(user: User, album: Album, kind: str, filename: str, file: File | io.BufferedReader | Blob, label=None, coordinates=None,
+                       location=None, modificationdate=None, detectedobjects=None, mimetype=None, metadata=None) -> Media:
+    metadata = metadata or {}
+    # Profile photo upload
+    if kind == MediaKinds.PROFILE.value:
+        # Get current profile photo
+        current = album.media_set.filter(kind=MediaKinds.PROFILE.value)
+        if current and current.count() == 1:
+            delete_media_file(user.username, current[0])
+            current.delete()
+        media = Media.objects.create(filename=filename, kind=MediaKinds.PROFILE.value, modificationdate=modificationdate, mimetype=mimetype, **metadata)
+        # Add profile picture to user profile album
+        media.album.add(album)
+    # Image upload
+    elif kind == MediaKinds.IMAGE.value:
+        media = Media.objects.create(filename=filename, kind=MediaKinds.IMAGE.value, label=label, coordinates=coordinates, location=location, modificationdate=modificationdate, mimetype=mimetype, **metadata)
+        # Check if there are any images in the album
+        other = album.media_set.filter(kind=MediaKinds.IMAGE.value).exists()
+        # If no images, set this image as album cover
+        if not other: is_cover = True
+        else: is_cover = False
+        # Add image to user default album
+        MediaAlbum.objects.create(media=media, album=album, is_cover=is_cover)
+    # Video upload
+    elif kind == MediaKinds.VIDEO.value:
+        media = Media.objects.create(filename=filename, kind=MediaKinds.VIDEO.value, label=label, coordinates=coordinates, location=location, modificationdate=modificationdate, mimetype=mimetype, **metadata)
+        # Add video to user default album
+        media.album.add(album)
+        
+    # Objects detected in the browser are stored as tags
+    if detectedobjects is not None and kind != MediaKinds.PROFILE.value:
+        tags.set_media_tags({media.id: tags.parse_tags(detectedobjects)})
+        media.detected = True
+        
+    # Save media file
+    create_update_media_file(user.username, media, file)
+        
+    # Update album last update date
+    album.save()
+    
+    return media
+
+# Updates the last update date of the albums of media changed in the background (e.g. by jobs), as their media lists are cached by it
+def touch_media_albums(mediaids: list[int]):
+    Album.objects.filter(mediaalbum__media__in=mediaids).update(lastupdate=timezone.now())
+
+# Gets path of the temporary file of a resumable upload, inside the blob store so it can be moved into it when finished
+def get_upload_path(upload: Upload):
+    return get_blob_tempdir() / f"upload-{upload.id}"
+
+# Claims a resumable upload at its current offset, so only one chunk is appended at a time without locking the upload while data is received
+# Claims not receiving data for a while (e.g. the worker died) expire, so the upload can be resumed
+# Returns False if the offset changed or another chunk is being appended
+def claim_upload(upload: Upload) -> bool:
+    now = timezone.now()
+    expired = now - datetime.timedelta(seconds=UPLOAD_CLAIM_TIMEOUT_SECONDS)
+    claimed = Upload.objects.filter(Q(receiving__isnull=True) | Q(receiving__lt=expired), id=upload.id, offset=upload.offset).update(receiving=now)
+    if claimed:
+        upload.receiving = now
+    return bool(claimed)
+
+# Renews the claim of a resumable upload while receiving data, returns False if it was lost (expired or upload cancelled)
+def renew_upload_claim(upload: Upload) -> bool:
+    now = timezone.now()
+    renewed = Upload.objects.filter(id=upload.id, receiving=upload.receiving).update(receiving=now)
+    if renewed:
+        upload.receiving = now
+    return bool(renewed)
+
+# Releases the claim of a resumable upload, moving its offset past the received bytes
+# Offset is only updated if it did not change since the upload was claimed, returns False otherwise (claim lost)
+def release_upload_claim(upload: Upload, received: int) -> bool:
+    released = Upload.objects.filter(id=upload.id, offset=upload.offset, receiving=upload.receiving).update(
+        offset=F('offset') + received, receiving=None, lastupdate=timezone.now())
+    if released:
+        upload.offset += received
+        upload.receiving = None
+    return bool(released)
+
+# Appends data from a stream to a claimed resumable upload file at its current offset (see claim_upload)
+# Returns number of bytes received, which may be less than sent if the connection is lost or the claim expired
+def append_upload_chunk(upload: Upload, stream) -> int:
+    received = 0
+    remaining = upload.size - upload.offset
+    renewed = time.monotonic()
+    with open(get_upload_path(upload), 'r+b') as dest:
+        dest.seek(upload.offset)
+        while remaining > 0:
+            try:
+                chunk = stream.read(min(BLOB_CHUNK_SIZE, remaining))
+            except Exception as e:
+                # Bytes received before the connection was lost are kept, the client resumes from them
+                logger.warning("Upload %s interrupted after %d bytes: %s", upload.id, received, e)
+                break
+            if not chunk:
+                break
+            # Claim is renewed before writing, so a chunk that stalled past its expiration never overwrites the chunk that claimed the upload since
+            if time.monotonic() - renewed > UPLOAD_CLAIM_TIMEOUT_SECONDS / 4:
+                if not renew_upload_claim(upload):
+                    break
+                renewed = time.monotonic()
+            dest.write(chunk)
+            received += len(chunk)
+            remaining -= len(chunk)
+    return received
+
+def delete_upload(upload: Upload):
+    path = get_upload_path(upload)
+    if os.path.exists(path):
+        os.remove(path)
+    upload.delete()
+
+# Deletes resumable uploads not updated recently, and temporary files left behind
+# (uploads of deleted albums, uploads interrupted by a worker dying)
+def delete_expired_uploads():
+    expiration = datetime.datetime.now().astimezone() - datetime.timedelta(hours=UPLOAD_EXPIRATION_HOURS)
+    for upload in Upload.objects.filter(lastupdate__lt=expiration):
+        delete_upload(upload)
+    tmpdir = get_blob_tempdir()
+    for filename in os.listdir(tmpdir):
+        path = tmpdir / filename
+        if os.path.getmtime(path) >= expiration.timestamp():
+            continue
+        if filename.startswith('upload-') and Upload.objects.filter(id=filename.removeprefix('upload-')).exists():
+            continue
+        os.remove(path)
+
+# Creates many media with their files in an album using bulk inserts, in a single transaction
+# Each item is a dict with the file and its media fields (kind, filename, label, coordinates, location, modificationdate, detectedobjects, mimetype)
+# and the metadata read from the file
+# Only images and videos can be created this way
+# Files are moved into the blob store once the media are committed, so a failed insert leaves no unreferenced file in the store,
+# and the temporary copies written for the batch are removed
+def create_album_media_batch(user: User, album: Album, items: list[dict]) -> list[Media]:
+    tempfiles = []
+    try:
+        for item in items:
+            tempfiles.append(get_blob_tempfile(item['file']))
+        with transaction.atomic():
+            medias = []
+            for item, (tmppath, hash, size, crc, _) in zip(items, tempfiles):
+                media = Media(filename=item['filename'], kind=item['kind'], label=item.get('label'), coordinates=item.get('coordinates'),
+                              location=item.get('location'), modificationdate=item['modificationdate'], mimetype=item.get('mimetype'),
+                              **item.get('metadata', {}))
+                media.blob = commit_blob_tempfile(tmppath, hash, size, crc, defer=True)
+                medias.append(media)
+            medias = Media.objects.bulk_create(medias)
+            detected = {media.id: tags.parse_tags(item['detectedobjects']) for media, item in zip(medias, items) if item.get('detectedobjects') is not None}
+            if detected:
+                tags.set_media_tags(detected)
+                for media in medias:
+                    media.detected = media.id in detected
+            for media in medias:
+                if media.kind == MediaKinds.VIDEO.value:
+                    streams.request_video_stream(media.blob)
+            
+            # If there are no images in the album, first image is set as album cover
+            has_cover = album.media_set.filter(kind=MediaKinds.IMAGE.value).exists()
+            mediaalbums = []
+            for media in medias:
+                is_cover = not has_cover and media.kind == MediaKinds.IMAGE.value
+                has_cover = has_cover or is_cover
+                mediaalbums.append(MediaAlbum(media=media, album=album, is_cover=is_cover))
+            MediaAlbum.objects.bulk_create(mediaalbums)
+            
+            # Update album last update date
+            album.save()
+    except:
+        for tmppath, _, _, _, written in tempfiles:
+            if written and os.path.exists(tmppath):
+                os.remove(tmppath)
+        raise
+    return medias
 
 # Removes data header
 def validate_and_clean_base64_header(file, validate=True):
@@ -76,33 +452,6 @@ def validate_and_clean_base64_header(file, validate=True):
     return file
 
 
-# Gets location metadata from coordinates
-def get_location_from_coordinates(lat: float, lon: float) -> str:
-    try:
-        location_address = None
-        url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lon}"
-        headers = {
-            'User-Agent': 'PostmanRuntime/7.39.0',
-        }
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code == 200:
-            data = response.json()
-            address = data.get('address', {})
-            if 'city' in address and 'country' in address:
-                location_address = f"{address['city']}, {address['country']}"
-            elif 'county' in address and 'country' in address:
-                location_address = f"{address['county']}, {address['country']}"
-            elif 'state' in address and 'country' in address:
-                location_address = f"{address['state']}, {address['country']}"
-            elif 'country' in address:
-                location_address = address['country']
-        else:
-            location_address = None
-    except:
-        location_address = None
-    return location_address
-
 # Generates a random code for sharing
 def generate_sharing_code():
     import random
@@ -1,8 +1,9 @@
 import datetime
+import json
 import os
 import dateutil
 from django.conf import settings
-from django.http import FileResponse, HttpResponse, HttpRequest
+from django.http import HttpResponse, HttpRequest
 from django.template import loader
 from django.core.files import File
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiResponse
@@ -14,15 +15,21 @@ def index(request: HttpRequest):
     return response
 
 # API views
-from core import utils
-from core.common import ALBUM_NAME_MAX_LENGTH, DEFAULT_ALBUM, MediaKinds, SharingPermissionKinds
-from core.models import Album, AlbumUser, Media, MediaAlbum, UserAlbums, UserData, UserMedia
+from core import archive, detection, duplicates, embeddings, jobs, mediainfo, mediatypes, renditions, streams, tags, trash, utils
+from core.common import ALBUM_NAME_MAX_LENGTH, DEFAULT_ALBUM, DUPLICATE_DISTANCE, DUPLICATE_MAX_DISTANCE, EMBEDDING_SEARCH_MAX_RESULTS, EMBEDDING_SEARCH_RESULTS, MEDIA_BATCH_MAX_FILES, MEDIA_COORDINATES_MAX_LENGTH, MEDIA_FILENAME_MAX_LENGTH, MEDIA_LABEL_MAX_LENGTH, MEDIA_MAX_IMAGE_BYTES, MEDIA_MAX_PIXELS, RENDITION_SIZES, MediaKinds, SharingPermissionKinds, TagMatchKinds, VideoStreamStatus
+from core.models import Album, AlbumUser, Embedding, Media, MediaAlbum, Upload, UserAlbums, UserData, UserMedia, VideoStream
+from core.responses import FileContentNegotiation, archive_response, file_response, not_modified_response, set_validators, weak_etag
 from core.serializers import UserSerializer
 from rest_framework.authtoken.serializers import AuthTokenSerializer
 from rest_framework import status, generics, permissions
 from knox.views import LoginView as KnoxLoginView, APIView as KnoxAPIView
 from django.contrib.auth import login
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import OperationalError, transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 
 
 # Login API view
@@ -142,8 +149,7 @@ class RegisterAPI(generics.CreateAPIView):
         try:
             created = self.create(request)
             if (created):
-                # Create user folder and default album for new user
-                self.create_user_folder(request)
+                # Create default album for new user (media files are kept in the shared blob store)
                 self.create_default_album(request)
             else:
                 return HttpResponse(status=status.HTTP_409_CONFLICT)
@@ -151,11 +157,6 @@ class RegisterAPI(generics.CreateAPIView):
         except:
             return HttpResponse(status=status.HTTP_409_CONFLICT)
         
-    def create_user_folder(self, request):
-        user = User.objects.get(username=request.data['username'])
-        if not os.path.exists(f"{settings.MEDIA_ROOT}/{user.username}"):
-            os.makedirs(f"{settings.MEDIA_ROOT}/{user.username}")
-        
     # Create album for new users
     def create_default_album(self, request):
         user = User.objects.get(username=request.data['username'])
@@ -207,7 +208,7 @@ class RegisterAPI(generics.CreateAPIView):
     ),
     delete=extend_schema(
         summary="Delete user",
-        description="Deletes the requesting user and all associated albums and media.",
+        description="Deletes the requesting user and all associated albums and media. Login is disabled at once, albums and media are removed in the background.",
         responses={
             204: OpenApiResponse(description="User and associated data deleted successfully."),
             401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
@@ -250,16 +251,8 @@ class UserAPI(KnoxAPIView):
     
     def delete(self, request):
         user = User.objects.get(id=request.user.id)
-        # Get user albums
-        albums = Album.objects.filter(user=user)
-        for album in albums:
-            # Delete media
-            media = album.media_set.all()
-            for m in media:
-                m.delete()
-            album.delete()
-    
-        user.delete()
+        # User albums and media are purged by the purgetrash worker, then the user
+        trash.trash_user(user)
         return HttpResponse(status=status.HTTP_204_NO_CONTENT)
     
 
@@ -345,7 +338,7 @@ class UserAPI(KnoxAPIView):
     ),
     delete=extend_schema(
         summary="Delete album",
-        description="Deletes album and all associated media.",
+        description="Moves album and all associated media to the trash, from where they can be restored until they are purged.",
         parameters=[
             OpenApiParameter(name='id', description='Album ID', required=True, type=int),
         ],
@@ -478,10 +471,9 @@ class AlbumAPI(KnoxAPIView):
             if album.name == DEFAULT_ALBUM:
                 return HttpResponse(status=status.HTTP_403_FORBIDDEN)
             
-            media = album.media_set.all()
-            for m in media:
-                m.delete()
-            album.delete()
+            # Media are hidden with the album, and purged with it
+            album.deletiondate = timezone.now()
+            album.save()
             return HttpResponse(status=status.HTTP_204_NO_CONTENT)
         except Album.DoesNotExist:
             return HttpResponse(status=status.HTTP_404_NOT_FOUND)
@@ -500,6 +492,7 @@ class AlbumAPI(KnoxAPIView):
         ],
         responses={
             200: OpenApiResponse(response=str, description="Albums retrieved successfully."),
+            304: OpenApiResponse(description="Not modified if the cached copy (If-None-Match or If-Modified-Since) is still valid."),
             401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
             404: OpenApiResponse(description="Albums not found."),
         }
@@ -520,16 +513,24 @@ class UserAlbumsAPI(KnoxAPIView):
             albumid = request.GET.get('id')
             albumname = request.GET.get('name')
             
+            # Any change to the user albums or their media updates the album last update date
+            validators = Album.objects.filter(user=user).aggregate(count=Count('id'), lastupdate=Max('lastupdate'))
+            lastmodified = validators['lastupdate'].timestamp() if validators['lastupdate'] else None
+            etag = weak_etag(user.id, validators['count'], lastmodified)
+            notmodified = not_modified_response(request, etag, lastmodified)
+            if notmodified:
+                return notmodified
+            
             if albumid:
                 album = UserAlbums.objects.get(id=user.id, album_id=albumid)
                 if skipCover:
                     album.cover = None
-                return HttpResponse("[" + str(album) + "]", content_type='application/json')
+                return set_validators(HttpResponse("[" + str(album) + "]", content_type='application/json'), etag, lastmodified)
             elif albumname:
                 album = UserAlbums.objects.get(id=user.id, album_name=albumname)
                 if skipCover:
                     album.cover = None
-                return HttpResponse("[" + str(album) + "]", content_type='application/json')
+                return set_validators(HttpResponse("[" + str(album) + "]", content_type='application/json'), etag, lastmodified)
             # Create JSON response
             albums_json = "["
             if len(albums) != 0:
@@ -540,7 +541,7 @@ class UserAlbumsAPI(KnoxAPIView):
                 # Remove last comma
                 albums_json = albums_json[:-1]
             albums_json += "]"     
-            return HttpResponse(albums_json, content_type='application/json')
+            return set_validators(HttpResponse(albums_json, content_type='application/json'), etag, lastmodified)
         except UserAlbums.DoesNotExist:
             return HttpResponse(status=status.HTTP_404_NOT_FOUND)
     
@@ -576,7 +577,7 @@ class UserAlbumsAPI(KnoxAPIView):
                     },
                     "detectedobjects": {
                         "type": "string",
-                        "description": "Detected objects in image",
+                        "description": "Detected objects in image, separated by ';'. If not provided, they are detected by the server if a detection model is configured",
                     },
                     "albumid": {
                         "type": "integer",
@@ -592,11 +593,12 @@ class UserAlbumsAPI(KnoxAPIView):
             400: OpenApiResponse(description="Bad request if required data is missing."),
             401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
             404: OpenApiResponse(description="Media not found."),
+            413: OpenApiResponse(description=f"Image bigger than {MEDIA_MAX_IMAGE_BYTES} bytes or {MEDIA_MAX_PIXELS} pixels."),
         }
     ),
     delete=extend_schema(
         summary="Delete media",
-        description="Deletes media from the requesting user's album. If not specified, deletes media from the default album.",
+        description="Moves media from the requesting user's album to the trash. If not specified, deletes media from the default album.",
         parameters=[
             OpenApiParameter(name='id', description='Media ID', required=True, type=int),
             OpenApiParameter(name='albumid', description='Album ID. If not provided, deletes from default album.', required=False, type=int),
@@ -626,42 +628,68 @@ class MediaAPI(KnoxAPIView):
         
         if (not kind):
             return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        # File type is detected and images are checked against the limits from the file header, before storing it
+        try:
+            mimetype = mediatypes.inspect_file(file) if file else None
+        except mediatypes.MediaTooLarge:
+            return HttpResponse(status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        except mediatypes.InvalidMedia:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        # Capture date, position and dimensions are read from the file headers, the values sent by the client come first
+        metadata = mediainfo.read_metadata(file, mimetype) if file else {}
+        coordinates = coordinates or mediainfo.get_metadata_coordinates(metadata)
         
         try:
             user = User.objects.get(id=request.user.id)
-
-            if coordinates:
-                # Fetch location from coordinates
-                lat, lon = coordinates.split(',')
-                location = utils.get_location_from_coordinates(lat, lon)
-            else: location = None
             
             if modification:
                 modificationdate = dateutil.parser.isoparse(modification)
             else:
-                modificationdate = datetime.datetime.now().astimezone()
+                modificationdate = metadata.get('capturedate') or datetime.datetime.now().astimezone()
                             
+            # Only media from albums of the requesting user can be copied or updated
+            usermedias = Media.objects.filter(album__user=user, album__deletiondate__isnull=True).distinct()
             # Copy media to another album
             if mediaid and not file:
-                media = Media.objects.get(id=mediaid)
+                media = usermedias.get(id=mediaid)
                 album = Album.objects.get(id=albumid, user=user)
-                mediacopy = Media.objects.create(filename=media.filename, kind=media.kind, label=media.label, coordinates=media.coordinates, location=media.location, modificationdate=media.modificationdate, detectedobjects=media.detectedobjects)
+                mediacopy = Media.objects.create(filename=media.filename, kind=media.kind, label=media.label, coordinates=media.coordinates, location=media.location, modificationdate=media.modificationdate,
+                                                 mimetype=media.mimetype, **{field: getattr(media, field) for field in mediainfo.METADATA_FIELDS},
+                                                 **duplicates.get_hash_fields(duplicates.get_media_hash(media)))
                 mediacopy.album.add(album)
-                utils.create_update_media_file(user.username, mediacopy.id, media.id)
+                tags.copy_media_tags(media, mediacopy)
+                utils.create_update_media_file(user.username, mediacopy, media)
                 mediacopy.save()
+                # Update album last update date
+                album.save()
                 return HttpResponse(str(mediacopy), content_type='application/json', status=status.HTTP_200_OK)
             # Update media
             elif mediaid and file:
-                media = Media.objects.get(id=mediaid)
-                if location:
-                    media.location = location
+                media = usermedias.get(id=mediaid)
                 if label:
                     media.label = label
                 if detectedobjects:
-                    media.detectedobjects = detectedobjects
+                    tags.set_media_tags({media.id: tags.parse_tags(detectedobjects)})
+                    media.detected = True
+                # Objects of the previous file are detected again on the new one
+                elif detection.is_enabled():
+                    tags.clear_media_tags(media)
                 media.modificationdate = datetime.datetime.now().astimezone()
-                utils.create_update_media_file(user.username, media.id, file)
+                media.mimetype = mimetype
+                for field in mediainfo.METADATA_FIELDS:
+                    setattr(media, field, metadata.get(field))
+                for field, value in duplicates.get_hash_fields(None).items():
+                    setattr(media, field, value)
+                utils.create_update_media_file(user.username, media, file)
                 media.save()
+                # Location is fetched from coordinates and the perceptual hash, embedding and objects of images computed in the background
+                if coordinates:
+                    jobs.enqueue_geocoding([media.id], coordinates)
+                if media.kind == MediaKinds.IMAGE.value:
+                    jobs.enqueue_image_processing([media.id])
+                # Update last update date of albums containing the media
+                for album in media.album.all():
+                    album.save()
                 return HttpResponse(str(media), content_type='application/json', status=status.HTTP_200_OK)
             
             if not file:
@@ -672,37 +700,13 @@ class MediaAPI(KnoxAPIView):
             else:
                 album = Album.objects.get(user=user, name=DEFAULT_ALBUM)
             
-            # Profile photo upload
-            if kind == MediaKinds.PROFILE.value:
-                # Get current profile photo
-                current = album.media_set.filter(kind=MediaKinds.PROFILE.value)
-                if current and current.count() == 1:
-                    utils.delete_media_file(user.username, current[0].id)
-                    current.delete()
-                media = Media.objects.create(filename=filename, kind=MediaKinds.PROFILE.value, modificationdate=modificationdate)
-                # Add profile picture to user profile album
-                media.album.add(album)
-            # Image upload
-            elif kind == MediaKinds.IMAGE.value:
-                media = Media.objects.create(filename=filename, kind=MediaKinds.IMAGE.value, label=label, coordinates=coordinates, location=location, modificationdate=modificationdate, detectedobjects=detectedobjects)
-                # Check if there are any images in the album
-                other = album.media_set.filter(kind=MediaKinds.IMAGE.value)
-                # If no images, set this image as album cover
-                if not other: is_cover = True
-                else: is_cover = False
-                # Add image to user default album
-                MediaAlbum.objects.create(media=media, album=album, is_cover=is_cover)
-            # Video upload
-            elif kind == MediaKinds.VIDEO.value:
-                media = Media.objects.create(filename=filename, kind=MediaKinds.VIDEO.value, label=label, coordinates=coordinates, location=location, modificationdate=modificationdate, detectedobjects=detectedobjects)
-                # Add video to user default album
-                media.album.add(album)
-                
-            # Save media file
-            utils.create_update_media_file(user.username, media.id, file)
-                
-            # Update album last update date
-            album.save()
+            media = utils.create_album_media(user, album, kind, filename, file, label=label, coordinates=coordinates,
+                                             modificationdate=modificationdate, detectedobjects=detectedobjects, mimetype=mimetype, metadata=metadata)
+            # Location is fetched from coordinates and the perceptual hash, embedding and objects of images computed in the background
+            if media.coordinates:
+                jobs.enqueue_geocoding([media.id], media.coordinates)
+            if media.kind == MediaKinds.IMAGE.value:
+                jobs.enqueue_image_processing([media.id])
                 
             return HttpResponse(str(media), content_type='application/json', status=status.HTTP_201_CREATED)
         except Album.DoesNotExist:
@@ -729,9 +733,9 @@ class MediaAPI(KnoxAPIView):
             media = Media.objects.get(id=mediaid, album=album)
             
             if media and album:
-                # Delete media file
-                utils.delete_media_file(user.username, media.id)
-                media.delete()
+                # Media file is released when the media is purged from the trash
+                media.deletiondate = timezone.now()
+                media.save(update_fields=['deletiondate'])
                 # Update album last update date
                 album.save()
                 return HttpResponse(status=status.HTTP_204_NO_CONTENT)
@@ -742,10 +746,411 @@ class MediaAPI(KnoxAPIView):
             return HttpResponse(status=status.HTTP_404_NOT_FOUND)
     
 
+@extend_schema_view(
+    put=extend_schema(
+        summary="Add media in batch",
+        description="Adds many images or videos to the requesting user's album in a single request.",
+        request={
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {
+                    "files": {
+                        "type": "array",
+                        "items": {"type": "string", "format": "binary"},
+                        "description": f"Media files (at most {MEDIA_BATCH_MAX_FILES})",
+                    },
+                    "metadata": {
+                        "type": "string",
+                        "description": "JSON array with an object per file, in the same order, with optional 'kind' ('" + MediaKinds.IMAGE.value + "' or '" + 
+                        MediaKinds.VIDEO.value + "', detected from the file contents if missing), 'filename' (at most " + str(MEDIA_FILENAME_MAX_LENGTH) + " characters), " +
+                        "'coordinates' ('latitude,longitude'), 'label' (at most " + str(MEDIA_LABEL_MAX_LENGTH) + " characters), 'modificationdate' (ISO 8601) and 'detectedobjects', all strings",
+                    },
+                    "albumid": {
+                        "type": "integer",
+                        "description": "Album ID to add media to. If not provided, adds to default album.",
+                    },
+                },
+                "required": ["files"]
+            }
+        },
+        responses={
+            201: OpenApiResponse(response=str, description="Media created successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing or invalid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album not found."),
+            413: OpenApiResponse(description=f"An image is bigger than {MEDIA_MAX_IMAGE_BYTES} bytes or {MEDIA_MAX_PIXELS} pixels."),
+        }
+    )
+)
+class BatchMediaAPI(KnoxAPIView):
+    # Add many media to user album
+    def put(self, request):
+        files = request.FILES.getlist('files')
+        metadata = request.data['metadata'] if 'metadata' in request.data else None
+        albumid = request.data['albumid'] if 'albumid' in request.data else None
+        if (not files) or len(files) > MEDIA_BATCH_MAX_FILES:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            metadata = json.loads(metadata) if metadata else [{}] * len(files)
+        except ValueError:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(metadata, list) or len(metadata) != len(files) or not all(isinstance(m, dict) and self.validate_metadata(m) for m in metadata):
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            if albumid:
+                album = Album.objects.get(id=albumid, user=user)
+            else:
+                album = Album.objects.get(user=user, name=DEFAULT_ALBUM)
+            
+            items = []
+            for file, meta in zip(files, metadata):
+                mimetype = mediatypes.inspect_file(file)
+                filemetadata = mediainfo.read_metadata(file, mimetype)
+                kind = meta.get('kind')
+                if not kind:
+                    contenttype = mimetype or file.content_type
+                    kind = MediaKinds.VIDEO.value if contenttype and contenttype.startswith('video/') else MediaKinds.IMAGE.value
+                if kind not in [MediaKinds.IMAGE.value, MediaKinds.VIDEO.value]:
+                    return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+                
+                coordinates = meta.get('coordinates') or mediainfo.get_metadata_coordinates(filemetadata)
+                modification = meta.get('modificationdate')
+                
+                items.append({
+                    "file": file,
+                    "kind": kind,
+                    "filename": meta.get('filename') or file.name,
+                    "label": meta.get('label'),
+                    "coordinates": coordinates,
+                    "modificationdate": dateutil.parser.isoparse(modification) if modification else filemetadata.get('capturedate') or datetime.datetime.now().astimezone(),
+                    "detectedobjects": meta.get('detectedobjects'),
+                    "mimetype": mimetype,
+                    "metadata": filemetadata,
+                })
+            
+            medias = utils.create_album_media_batch(user, album, items)
+            # Files of a batch are usually taken in few places, so each location is fetched once in the background
+            places = {}
+            for media in medias:
+                if media.coordinates:
+                    places.setdefault(media.coordinates, []).append(media.id)
+            for coordinates, mediaids in places.items():
+                jobs.enqueue_geocoding(mediaids, coordinates)
+            images = [media.id for media in medias if media.kind == MediaKinds.IMAGE.value]
+            if images:
+                jobs.enqueue_image_processing(images)
+            return HttpResponse("[" + ",".join(str(m) for m in medias) + "]", content_type='application/json', status=status.HTTP_201_CREATED)
+        except Album.DoesNotExist:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        except mediatypes.MediaTooLarge:
+            return HttpResponse(status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        except (mediatypes.InvalidMedia, ValueError):
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+    # Fields of the media metadata, all optional strings, with their maximum length
+    METADATA_FIELDS = {
+        "kind": None,
+        "filename": MEDIA_FILENAME_MAX_LENGTH,
+        "label": MEDIA_LABEL_MAX_LENGTH,
+        "coordinates": MEDIA_COORDINATES_MAX_LENGTH,
+        "modificationdate": None,
+        "detectedobjects": None,
+    }
+        
+    # Checks the metadata of a media is valid before any file is stored
+    def validate_metadata(self, meta: dict) -> bool:
+        for field, maxlength in self.METADATA_FIELDS.items():
+            value = meta.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, str) or (maxlength is not None and len(value) > maxlength):
+                return False
+        coordinates = meta.get('coordinates')
+        if coordinates:
+            try:
+                if len([float(c) for c in coordinates.split(',')]) != 2:
+                    return False
+            except ValueError:
+                return False
+        modification = meta.get('modificationdate')
+        if modification:
+            try:
+                dateutil.parser.isoparse(modification)
+            except ValueError:
+                return False
+        return True
+        
+
+@extend_schema_view(
+    post=extend_schema(
+        summary="Create resumable upload",
+        description="Creates a resumable upload for a media file. Data is then sent in chunks with PATCH and the media is created with PUT.",
+        request={
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {
+                    "kind": {
+                        "type": "string",
+                        "description": "Media kind ('" + MediaKinds.PROFILE.value + "', '" + MediaKinds.IMAGE.value + "' or '" + MediaKinds.VIDEO.value + "')",
+                    },
+                    "size": {
+                        "type": "integer",
+                        "description": "Total size of the file in bytes",
+                    },
+                    "filename": {
+                        "type": "string",
+                        "description": "Media file name",
+                    },
+                    "coordinates": {
+                        "type": "string",
+                        "description": "Media coordinates",
+                    },
+                    "label": {
+                        "type": "string",
+                        "description": "Media label",
+                    },
+                    "modificationdate": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Media modification date",
+                    },
+                    "detectedobjects": {
+                        "type": "string",
+                        "description": "Detected objects in image, separated by ';'. If not provided, they are detected by the server if a detection model is configured",
+                    },
+                    "albumid": {
+                        "type": "integer",
+                        "description": "Album ID to add media to. If not provided, adds to default album.",
+                    },
+                },
+                "required": ["kind", "size"]
+            }
+        },
+        responses={
+            201: OpenApiResponse(response=str, description="Upload created successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing or invalid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album not found."),
+            413: OpenApiResponse(description=f"Image bigger than {MEDIA_MAX_IMAGE_BYTES} bytes."),
+        }
+    ),
+    get=extend_schema(
+        summary="Get resumable upload",
+        description="Fetches the state of a resumable upload. The Upload-Offset header has the number of bytes received, from which the upload is resumed.",
+        parameters=[
+            OpenApiParameter(name='id', description='Upload ID', required=True, type=str),
+        ],
+        responses={
+            200: OpenApiResponse(response=str, description="Upload retrieved successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Upload not found."),
+        }
+    ),
+    patch=extend_schema(
+        summary="Append data to resumable upload",
+        description="Appends the request body (application/offset+octet-stream) to the upload. The Upload-Offset header must match the bytes already received.",
+        parameters=[
+            OpenApiParameter(name='id', description='Upload ID', required=True, type=str),
+            OpenApiParameter(name='Upload-Offset', location=OpenApiParameter.HEADER, description='Offset of the data in the file', required=True, type=int),
+        ],
+        request={"application/offset+octet-stream": {"type": "string", "format": "binary"}},
+        responses={
+            204: OpenApiResponse(description="Data appended, new offset in the Upload-Offset header."),
+            400: OpenApiResponse(description="Bad request if required data is missing."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Upload not found."),
+            409: OpenApiResponse(description="Conflict if the offset does not match or another chunk is being appended."),
+            413: OpenApiResponse(description="Data exceeds the upload size."),
+        }
+    ),
+    put=extend_schema(
+        summary="Finish resumable upload",
+        description="Creates the media from a fully received upload.",
+        request={
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "string",
+                        "description": "Upload ID",
+                    },
+                },
+                "required": ["id"]
+            }
+        },
+        responses={
+            201: OpenApiResponse(response=str, description="Media created successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Upload not found."),
+            409: OpenApiResponse(description="Conflict if the upload is not complete or is being appended to."),
+            413: OpenApiResponse(description=f"Image bigger than {MEDIA_MAX_PIXELS} pixels, the upload is deleted."),
+        }
+    ),
+    delete=extend_schema(
+        summary="Cancel resumable upload",
+        description="Deletes a resumable upload and its received data.",
+        parameters=[
+            OpenApiParameter(name='id', description='Upload ID', required=True, type=str),
+        ],
+        responses={
+            204: OpenApiResponse(description="Upload deleted successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Upload not found."),
+        }
+    )
+)
+class UploadAPI(KnoxAPIView):
+    # Create resumable upload
+    def post(self, request):
+        kind = request.data['kind'] if 'kind' in request.data else None
+        size = request.data['size'] if 'size' in request.data else None
+        filename = request.data['filename'] if 'filename' in request.data else "Uploaded image.png"
+        albumid = request.data['albumid'] if 'albumid' in request.data else None
+        label = request.data['label'] if 'label' in request.data else None
+        modification = request.data['modificationdate'] if 'modificationdate' in request.data else None
+        detectedobjects = request.data['detectedobjects'] if 'detectedobjects' in request.data else None
+        coordinates = request.data['coordinates'] if 'coordinates' in request.data else None
+        if (not kind) or (not size):
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        if kind not in [MediaKinds.PROFILE.value, MediaKinds.IMAGE.value, MediaKinds.VIDEO.value]:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        if not str(size).isdigit() or int(size) == 0:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        if kind != MediaKinds.VIDEO.value and int(size) > MEDIA_MAX_IMAGE_BYTES:
+            return HttpResponse(status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            if albumid:
+                album = Album.objects.get(id=albumid, user=user)
+            else:
+                album = Album.objects.get(user=user, name=DEFAULT_ALBUM)
+            modificationdate = dateutil.parser.isoparse(modification) if modification else None
+            
+            utils.delete_expired_uploads()
+            upload = Upload.objects.create(user=user, album=album, size=int(size), filename=filename, kind=kind, modificationdate=modificationdate, 
+                                           coordinates=coordinates, label=label, detectedobjects=detectedobjects)
+            open(utils.get_upload_path(upload), 'wb').close()
+            return self.upload_response(upload, status.HTTP_201_CREATED)
+        except Album.DoesNotExist:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        except ValueError:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+    # Get upload offset
+    def get(self, request):
+        uploadid = request.GET.get('id')
+        if not uploadid:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            upload = Upload.objects.get(id=uploadid, user=request.user)
+            return self.upload_response(upload, status.HTTP_200_OK)
+        except (Upload.DoesNotExist, ValidationError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        
+    # Append chunk to upload
+    def patch(self, request):
+        uploadid = request.GET.get('id')
+        offset = request.headers.get('Upload-Offset')
+        if (not uploadid) or (not offset) or (not offset.isdigit()):
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            upload = Upload.objects.get(id=uploadid, user=request.user)
+            if int(offset) != upload.offset:
+                return self.upload_response(upload, status.HTTP_409_CONFLICT)
+            length = request.headers.get('Content-Length')
+            if length and length.isdigit() and upload.offset + int(length) > upload.size:
+                return self.upload_response(upload, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            
+            # Only one chunk of an upload is appended at a time
+            # Upload is claimed instead of locked, so no transaction is kept open while data is received
+            if not utils.claim_upload(upload):
+                upload.refresh_from_db()
+                return self.upload_response(upload, status.HTTP_409_CONFLICT)
+            received = utils.append_upload_chunk(upload, request.stream) if request.stream is not None else 0
+            if not utils.release_upload_claim(upload, received):
+                return HttpResponse(status=status.HTTP_409_CONFLICT)
+            response = HttpResponse(status=status.HTTP_204_NO_CONTENT)
+            response['Upload-Offset'] = upload.offset
+            return response
+        except (Upload.DoesNotExist, ValidationError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        
+    # Finish upload, creating the media
+    def put(self, request):
+        uploadid = request.data['id'] if 'id' in request.data else None
+        if not uploadid:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            with transaction.atomic():
+                upload = Upload.objects.select_for_update(nowait=True).select_related('album').get(id=uploadid, user=user)
+                if upload.offset != upload.size:
+                    return self.upload_response(upload, status.HTTP_409_CONFLICT)
+                path = utils.get_upload_path(upload)
+                try:
+                    mimetype = mediatypes.inspect_path(path)
+                except mediatypes.MediaTooLarge:
+                    utils.delete_upload(upload)
+                    return HttpResponse(status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+                except mediatypes.InvalidMedia:
+                    utils.delete_upload(upload)
+                    return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+                metadata = mediainfo.read_path_metadata(path, mimetype)
+                # Received file is moved into the blob store without copying it, once the media is committed
+                # If creating the media fails, the upload is kept with its file so it can be finished again
+                blob = utils.commit_blob_file(path, defer=True)
+                modificationdate = upload.modificationdate or metadata.get('capturedate') or datetime.datetime.now().astimezone()
+                coordinates = upload.coordinates or mediainfo.get_metadata_coordinates(metadata)
+                media = utils.create_album_media(user, upload.album, upload.kind, upload.filename, blob, label=upload.label, coordinates=coordinates,
+                                                 modificationdate=modificationdate, detectedobjects=upload.detectedobjects, mimetype=mimetype, metadata=metadata)
+                # Location is fetched from coordinates and the perceptual hash, embedding and objects of images computed in the background
+                if media.coordinates:
+                    jobs.enqueue_geocoding([media.id], media.coordinates)
+                if media.kind == MediaKinds.IMAGE.value:
+                    jobs.enqueue_image_processing([media.id])
+                upload.delete()
+            return HttpResponse(str(media), content_type='application/json', status=status.HTTP_201_CREATED)
+        except (Upload.DoesNotExist, ValidationError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        except OperationalError:
+            return HttpResponse(status=status.HTTP_409_CONFLICT)
+        
+    # Cancel upload
+    def delete(self, request):
+        uploadid = request.data['id'] if 'id' in request.data else None
+        if not uploadid:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            upload = Upload.objects.get(id=uploadid, user=request.user)
+            utils.delete_upload(upload)
+            return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+        except (Upload.DoesNotExist, ValidationError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        
+    # Upload state, with tus-like headers
+    def upload_response(self, upload: Upload, status_code: int):
+        response = HttpResponse(str(upload), content_type='application/json', status=status_code)
+        response['Upload-Offset'] = upload.offset
+        response['Upload-Length'] = upload.size
+        return response
+        
+
 @extend_schema_view(
     get=extend_schema(
         summary="Get user media",
-        description="Fetches media for the requesting user from the specified album.",
+        description="Fetches media for the requesting user from the specified album. Media include the metadata read from their files on upload "
+                    "(capture date, GPS position, EXIF orientation, displayed width and height, video duration), so they can be laid out without loading the files.",
         parameters=[
             OpenApiParameter(name='mediaid', description='Media ID', required=False, type=int),
             OpenApiParameter(name='albumid', description='Album ID', required=False, type=int),
@@ -753,6 +1158,7 @@ class MediaAPI(KnoxAPIView):
         ],
         responses={
             200: OpenApiResponse(response=str, description="Media retrieved successfully."),
+            304: OpenApiResponse(description="Not modified if the cached copy (If-None-Match or If-Modified-Since) is still valid."),
             400: OpenApiResponse(description="Bad request if required data is missing."),
             401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
             404: OpenApiResponse(description="Media not found."),
@@ -777,15 +1183,27 @@ class UserMediaAPI(KnoxAPIView):
                 usermedia = UserMedia.objects.filter(id=user.id, album_name=DEFAULT_ALBUM)
                 if usermedia.count() == 0:
                     return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+            
+            # Adding or removing media updates the album last update date, updating media changes its modification date
+            albums = Album.objects.filter(user=user)
+            if albumid:
+                albums = albums.filter(id=albumid)
+            lastupdate = albums.aggregate(lastupdate=Max('lastupdate'))['lastupdate']
+            validators = usermedia.aggregate(count=Count('media_id'), modificationdate=Max('modificationdate'))
+            lastmodified = lastupdate.timestamp() if lastupdate else None
+            etag = weak_etag(user.id, albumid, lastmodified, validators['count'], validators['modificationdate'])
+            notmodified = not_modified_response(request, etag, lastmodified)
+            if notmodified:
+                return notmodified
                 
             # If only one media is requested
             if mediaid and albumid:
                 usermedia = usermedia.get(media_id=mediaid)
-                return HttpResponse("[" + str(usermedia) + "]", content_type='application/json')
+                return set_validators(HttpResponse("[" + str(usermedia) + "]", content_type='application/json'), etag, lastmodified)
             # If no album ID is provided, get media directly from default album
             elif mediaid:
                 usermedia = UserMedia.objects.get(id=user.id, media_id=mediaid)
-                return HttpResponse("[" + str(usermedia) + "]", content_type='application/json')
+                return set_validators(HttpResponse("[" + str(usermedia) + "]", content_type='application/json'), etag, lastmodified)
             
             media = list(usermedia)
             
@@ -802,41 +1220,452 @@ class UserMediaAPI(KnoxAPIView):
                 # Remove last comma
                 media_json = media_json[:-1]
             media_json += "]"
-            return HttpResponse(media_json, content_type='application/json')
+            return set_validators(HttpResponse(media_json, content_type='application/json'), etag, lastmodified)
         except UserMedia.DoesNotExist:
             return HttpResponse(status=status.HTTP_404_NOT_FOUND)
         
 
+@extend_schema_view(
+    get=extend_schema(
+        summary="Find similar media",
+        description="Finds the images of the requesting user most similar in content to an image, the most similar first. "
+                    "Images are embedded in the background after upload, images still waiting for theirs are not included.",
+        parameters=[
+            OpenApiParameter(name='mediaid', description='Media ID', required=True, type=int),
+            OpenApiParameter(name='albumid', description='Album ID. If not provided, searches all the albums of the user.', required=False, type=int),
+            OpenApiParameter(name='limit', description=f"Maximum number of images, {EMBEDDING_SEARCH_RESULTS} by default, at most {EMBEDDING_SEARCH_MAX_RESULTS}", required=False, type=int),
+        ],
+        responses={
+            200: OpenApiResponse(response=str, description="Similar media retrieved successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing or the limit is not valid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album or media not found, or media not embedded yet."),
+            503: OpenApiResponse(description="Embeddings are not enabled on the server."),
+        }
+    )
+)
+class SimilarMediaAPI(KnoxAPIView):
+    def get(self, request):
+        mediaid = request.GET.get('mediaid')
+        albumid = request.GET.get('albumid')
+        limit = request.GET.get('limit', str(EMBEDDING_SEARCH_RESULTS))
+        if not mediaid or not limit.isdigit() or not 0 < int(limit) <= EMBEDDING_SEARCH_MAX_RESULTS:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        limit = int(limit)
+        if not embeddings.is_enabled():
+            return HttpResponse(status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            if albumid:
+                Album.objects.get(id=albumid, user=user)
+            media = Media.objects.filter(id=mediaid, album__user=user, album__deletiondate__isnull=True).distinct().get()
+            embedding = Embedding.objects.get(blob_id=media.blob_id)
+            similar = embeddings.search_media(user, embeddings.from_bytes(embedding.vector), limit, albumid=albumid, exclude=media.blob_id)
+            return HttpResponse("[" + ",".join(str(m) for m in similar) + "]", content_type='application/json')
+        except (Album.DoesNotExist, Media.DoesNotExist, Embedding.DoesNotExist, ValueError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Search media by text",
+        description="Finds the images of the requesting user best matching a text description (e.g. 'dog on a beach at sunset'), the best match first. "
+                    "Images are embedded in the background after upload, images still waiting for theirs are not included.",
+        parameters=[
+            OpenApiParameter(name='query', description='Text description of the images', required=True, type=str),
+            OpenApiParameter(name='albumid', description='Album ID. If not provided, searches all the albums of the user.', required=False, type=int),
+            OpenApiParameter(name='limit', description=f"Maximum number of images, {EMBEDDING_SEARCH_RESULTS} by default, at most {EMBEDDING_SEARCH_MAX_RESULTS}", required=False, type=int),
+        ],
+        responses={
+            200: OpenApiResponse(response=str, description="Matching media retrieved successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing or the limit is not valid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album not found."),
+            503: OpenApiResponse(description="Text search is not enabled on the server."),
+        }
+    )
+)
+class SearchMediaAPI(KnoxAPIView):
+    def get(self, request):
+        query = request.GET.get('query', '').strip()
+        albumid = request.GET.get('albumid')
+        limit = request.GET.get('limit', str(EMBEDDING_SEARCH_RESULTS))
+        if not query or not limit.isdigit() or not 0 < int(limit) <= EMBEDDING_SEARCH_MAX_RESULTS:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        limit = int(limit)
+        encoder = embeddings.get_text_encoder() if embeddings.is_enabled() else None
+        if encoder is None:
+            return HttpResponse(status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            if albumid:
+                Album.objects.get(id=albumid, user=user)
+            found = embeddings.search_media(user, encoder.encode([query])[0], limit, albumid=albumid)
+            return HttpResponse("[" + ",".join(str(m) for m in found) + "]", content_type='application/json')
+        except (Album.DoesNotExist, ValueError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Find media by tags",
+        description="Finds the media of the requesting user tagged with all the given tags, or with any of them. "
+                    "Tags are the objects detected in images, in the browser or by the server. Media are returned newest first.",
+        parameters=[
+            OpenApiParameter(name='tags', description="Tags separated by commas (e.g. 'dog,traffic light')", required=True, type=str),
+            OpenApiParameter(name='match', description=f"'{TagMatchKinds.ALL.value}' (by default) to find media with all the tags, '{TagMatchKinds.ANY.value}' with any of them", required=False, type=str),
+            OpenApiParameter(name='albumid', description='Album ID. If not provided, searches all the albums of the user.', required=False, type=int),
+        ],
+        responses={
+            200: OpenApiResponse(response=str, description="Tagged media retrieved successfully."),
+            400: OpenApiResponse(description="Bad request if the tags are missing or the match is not valid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album not found."),
+        }
+    )
+)
+class TaggedMediaAPI(KnoxAPIView):
+    def get(self, request):
+        names = [name for name in request.GET.get('tags', '').split(',') if name.strip()]
+        match = request.GET.get('match', TagMatchKinds.ALL.value)
+        albumid = request.GET.get('albumid')
+        if not names or match not in [kind.value for kind in TagMatchKinds]:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            medias = Media.objects.filter(album__user=user, album__deletiondate__isnull=True)
+            if albumid:
+                album = Album.objects.get(id=albumid, user=user)
+                medias = medias.filter(album=album)
+            medias = tags.filter_tagged_media(medias, names, match == TagMatchKinds.ALL.value)
+            medias = medias.distinct().order_by('-modificationdate', '-id').prefetch_related('mediatags__tag')
+            return HttpResponse("[" + ",".join(str(m) for m in medias) + "]", content_type='application/json')
+        except (Album.DoesNotExist, ValueError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+
+
 @extend_schema_view(
     get=extend_schema(
         summary="Get media file",
-        description="Fetches media file for the requesting user.",
+        description="Fetches media file for the requesting user. Supports Range and If-Range headers for partial content. "
+                    "Images are sent as WebP or AVIF if the Accept header lists them. Full size images are converted in the background, "
+                    "they are sent converted once ready and if smaller, and the original is sent meanwhile.",
         parameters=[
             OpenApiParameter(name='mediaid', description='Media ID', required=True, type=int),
             OpenApiParameter(name='kind', description=f"Media kind. Can be '{MediaKinds.IMAGE}', '{MediaKinds.PROFILE}' or '{MediaKinds.VIDEO}'", required=True, type=str),
+            OpenApiParameter(name='size', description=f"Maximum long edge in pixels for images. Served as the smallest rendition ({', '.join(str(s) for s in RENDITION_SIZES)}) covering it, or the original if bigger", required=False, type=int),
+            OpenApiParameter(name='original', description="If 'true', full size images are sent with their original bytes, never converted to another format", required=False, type=bool),
         ],
         responses={
             200: OpenApiResponse(response=File, description="Media file retrieved successfully."),
+            206: OpenApiResponse(response=File, description="Requested byte ranges of the media file."),
+            304: OpenApiResponse(description="Not modified if the cached copy (If-None-Match or If-Modified-Since) is still valid."),
             400: OpenApiResponse(description="Bad request if required data is missing."),
             401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
             404: OpenApiResponse(description="Media not found."),
+            416: OpenApiResponse(description="Requested range not satisfiable."),
         }
     )
 )
 class FileAPI(KnoxAPIView):
+    content_negotiation_class = FileContentNegotiation
+    
     def get(self, request):
         mediaid = request.GET.get('mediaid')
         kind = request.GET.get('kind')
+        size = request.GET.get('size')
+        original = request.GET.get('original', 'false').lower() == 'true'
         if not mediaid:
             return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        if size is not None and (not size.isdigit() or int(size) == 0):
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
         
         try:
+            # Only media from albums of the requesting user can be fetched
+            media = Media.objects.select_related('blob').filter(id=mediaid, album__user=request.user, album__deletiondate__isnull=True).first()
+            if not media:
+                return HttpResponse(status=status.HTTP_404_NOT_FOUND)
             if not kind:
-                # Get kind from DB
-                media = Media.objects.get(id=mediaid)
                 kind = media.kind
-            file = utils.get_media_file(request.user.username, mediaid)
-            return FileResponse(file, content_type='video/*' if kind == MediaKinds.VIDEO.value else 'image/*')
+            
+            # Images are converted to the best format the client accepts (WebP, AVIF), unless the original is requested
+            format = None
+            if media.kind != MediaKinds.VIDEO.value and not original:
+                format = renditions.negotiate_format(request.headers.get('Accept'))
+            # Downscaled image if requested, the original is untouched
+            file = None
+            if size:
+                format = format or renditions.DEFAULT_RENDITION_FORMAT
+                file = renditions.get_rendition_file(request.user.username, media, int(size), format)
+            # Whole image is converted in the background, the original is served until the conversion is made
+            elif format:
+                file, converted = renditions.get_converted_file(media, format)
+                if not converted:
+                    jobs.enqueue_conversion(media.blob.hash, format)
+            if file is not None:
+                response = file_response(request, file, content_type=renditions.get_rendition_content_type(format))
+                patch_vary_headers(response, ['Accept'])
+                return response
+            
+            file = utils.get_media_file(request.user.username, media)
+            if file is None:
+                return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+            # Supports Range requests, so videos can be seeked without downloading the whole file
+            # Content hash is used as strong ETag
+            etag = f'"{media.blob.hash}"' if media.blob else None
+            # Type detected on upload, generic for media uploaded before or of an unknown type
+            contenttype = media.mimetype or ('video/*' if kind == MediaKinds.VIDEO.value else 'image/*')
+            response = file_response(request, file, content_type=contenttype, etag=etag)
+            # Response of images depends on the accepted formats
+            if media.kind != MediaKinds.VIDEO.value:
+                patch_vary_headers(response, ['Accept'])
+            return response
         except:
             return HttpResponse(status=status.HTTP_404_NOT_FOUND)
-        
\ No newline at end of file
+        
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Get video stream",
+        description="Without file name, fetches status of the adaptive HLS stream transcoded from a video ('" + VideoStreamStatus.PENDING.value + "', '" +
+                    VideoStreamStatus.PROCESSING.value + "', '" + VideoStreamStatus.READY.value + "' or '" + VideoStreamStatus.FAILED.value + "'). "
+                    "With file name, fetches a file of a ready stream, starting with 'master.m3u8'. Playlists reference the other files "
+                    "with relative paths, so they are part of the URL instead of a query parameter.",
+        responses={
+            200: OpenApiResponse(response=File, description="Stream status or file retrieved successfully."),
+            304: OpenApiResponse(description="Not modified if the cached copy (If-None-Match or If-Modified-Since) is still valid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Video, stream or file not found, or stream not ready."),
+        }
+    )
+)
+class StreamAPI(KnoxAPIView):
+    content_negotiation_class = FileContentNegotiation
+    
+    def get(self, request, mediaid, name=None):
+        # Only videos from albums of the requesting user can be fetched
+        media = Media.objects.filter(id=mediaid, album__user=request.user, album__deletiondate__isnull=True, kind=MediaKinds.VIDEO.value).first()
+        if not media or not media.blob_id:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        stream = VideoStream.objects.filter(blob_id=media.blob_id).first()
+        if not stream:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        if name is None:
+            return HttpResponse(str(stream), content_type='application/json')
+        
+        if stream.status != VideoStreamStatus.READY.value:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        path = streams.get_stream_file_path(media.blob_id, name)
+        contenttype = streams.STREAM_CONTENT_TYPES.get(os.path.splitext(name)[1])
+        if path is None or contenttype is None or not os.path.exists(path):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        return file_response(request, File(open(path, 'rb')), content_type=contenttype)
+        
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Export media",
+        description="Downloads a ZIP archive with the media files of an album, or of all the requesting user's albums (a folder per album). "
+                    "The archive is streamed as it is generated and supports Range and If-Range headers to resume interrupted downloads.",
+        parameters=[
+            OpenApiParameter(name='albumid', description='Album ID. If not provided, exports all albums.', required=False, type=int),
+        ],
+        responses={
+            200: OpenApiResponse(response=File, description="ZIP archive."),
+            206: OpenApiResponse(response=File, description="Requested byte range of the ZIP archive."),
+            304: OpenApiResponse(description="Not modified if the cached copy (If-None-Match) is still valid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album not found."),
+            416: OpenApiResponse(description="Requested range not satisfiable."),
+        }
+    )
+)
+class ExportAPI(KnoxAPIView):
+    content_negotiation_class = FileContentNegotiation
+    
+    def get(self, request):
+        albumid = request.GET.get('albumid')
+        try:
+            user = User.objects.get(id=request.user.id)
+            albums = Album.objects.filter(user=user)
+            if albumid:
+                albums = albums.filter(id=albumid)
+                album = albums.first()
+                if not album:
+                    return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+                filename = f"{album.name}.zip"
+            else:
+                filename = f"{user.username}.zip"
+            
+            mediaarchive = archive.get_media_archive(user, albums, folders=not albumid)
+            return archive_response(request, mediaarchive, filename)
+        except (ValueError, ValidationError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Get trash",
+        description="Fetches albums and media in the requesting user's trash, which can be restored until they are purged.",
+        responses={
+            200: OpenApiResponse(response=str, description="Trashed albums and media retrieved successfully."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+        }
+    ),
+    post=extend_schema(
+        summary="Restore from trash",
+        description="Restores an album or a media from the trash.",
+        request={
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "description": "Media ID. Required if album ID is not provided.",
+                    },
+                    "albumid": {
+                        "type": "integer",
+                        "description": "Album ID. Required if media ID is not provided.",
+                    },
+                },
+            }
+        },
+        responses={
+            200: OpenApiResponse(response=str, description="Album or media restored successfully."),
+            400: OpenApiResponse(description="Bad request if required data is missing."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album or media not found in the trash."),
+        }
+    ),
+    delete=extend_schema(
+        summary="Empty trash",
+        description="Deletes an album or a media from the trash, or everything in it if neither is provided. They are removed in the background.",
+        parameters=[
+            OpenApiParameter(name='id', description='Media ID', required=False, type=int),
+            OpenApiParameter(name='albumid', description='Album ID', required=False, type=int),
+        ],
+        responses={
+            204: OpenApiResponse(description="Trash emptied successfully."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album or media not found in the trash."),
+        }
+    )
+)
+class TrashAPI(KnoxAPIView):
+    # Albums in the trash that can be restored
+    def get_trashed_albums(self, user: User):
+        return Album.all_objects.filter(user=user, deletiondate__gte=trash.get_purge_cutoff())
+    
+    # Media in the trash that can be restored (media of trashed albums are restored with their album)
+    def get_trashed_media(self, user: User):
+        return Media.all_objects.filter(album__user=user, album__deletiondate__isnull=True, deletiondate__gte=trash.get_purge_cutoff())
+    
+    # Get trashed albums and media
+    def get(self, request):
+        user = User.objects.get(id=request.user.id)
+        albums = self.get_trashed_albums(user).order_by('-deletiondate')
+        medias = self.get_trashed_media(user).order_by('-deletiondate')
+        trash_json = ('{"albums": [' + ",".join(str(a) for a in albums) + '], '
+                      '"media": [' + ",".join(str(m) for m in medias) + ']}')
+        return HttpResponse(trash_json, content_type='application/json')
+    
+    # Restore album or media
+    def post(self, request):
+        mediaid = request.data['id'] if 'id' in request.data else None
+        albumid = request.data['albumid'] if 'albumid' in request.data else None
+        if (not mediaid) and (not albumid):
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            if albumid:
+                album = self.get_trashed_albums(user).get(id=albumid)
+                album.deletiondate = None
+                album.save()
+                return HttpResponse(str(album), content_type='application/json')
+            
+            media = self.get_trashed_media(user).get(id=mediaid)
+            media.deletiondate = None
+            media.save(update_fields=['deletiondate'])
+            # Update last update date of albums containing the media
+            for album in media.album.all():
+                album.save()
+            return HttpResponse(str(media), content_type='application/json')
+        except (Album.DoesNotExist, Media.DoesNotExist, ValueError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        
+    # Delete album, media or everything from the trash
+    # Their deletion date is set past the retention days, so the purgetrash worker removes them on its next run
+    def delete(self, request):
+        mediaid = request.data['id'] if 'id' in request.data else None
+        albumid = request.data['albumid'] if 'albumid' in request.data else None
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            albums = self.get_trashed_albums(user)
+            medias = self.get_trashed_media(user)
+            if mediaid or albumid:
+                albums = albums.filter(id=albumid) if albumid else albums.none()
+                medias = medias.filter(id=mediaid) if mediaid else medias.none()
+            
+            cutoff = trash.get_purge_cutoff()
+            deleted = albums.update(deletiondate=cutoff) + Media.all_objects.filter(id__in=medias.values('id')).update(deletiondate=cutoff)
+            if (mediaid or albumid) and not deleted:
+                return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+            return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+        except ValueError:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="Find duplicate media",
+        description="Finds near-duplicate images (bursts, edited or re-encoded copies) of the requesting user, or of an album, by their perceptual hashes. "
+                    "Returns groups of similar images, or the images similar to a media if its ID is provided. "
+                    "Hashes are computed in the background after upload, images still waiting for theirs are not included.",
+        parameters=[
+            OpenApiParameter(name='albumid', description='Album ID. If not provided, searches all the albums of the user.', required=False, type=int),
+            OpenApiParameter(name='mediaid', description='Media ID. If provided, returns the images similar to this media.', required=False, type=int),
+            OpenApiParameter(name='distance', description=f"Maximum number of different bits (of 64) between similar images, {DUPLICATE_DISTANCE} by default, at most {DUPLICATE_MAX_DISTANCE}", required=False, type=int),
+        ],
+        responses={
+            200: OpenApiResponse(response=str, description="Groups of duplicate media, or media similar to the requested one."),
+            400: OpenApiResponse(description="Bad request if the distance is not valid."),
+            401: OpenApiResponse(description="Unauthorized if the user is not authenticated."),
+            404: OpenApiResponse(description="Album or media not found."),
+        }
+    )
+)
+class DuplicatesAPI(KnoxAPIView):
+    def get(self, request):
+        albumid = request.GET.get('albumid')
+        mediaid = request.GET.get('mediaid')
+        distance = request.GET.get('distance', str(DUPLICATE_DISTANCE))
+        if not distance.isdigit() or int(distance) > DUPLICATE_MAX_DISTANCE:
+            return HttpResponse(status=status.HTTP_400_BAD_REQUEST)
+        distance = int(distance)
+        
+        try:
+            user = User.objects.get(id=request.user.id)
+            medias = Media.objects.filter(album__user=user, album__deletiondate__isnull=True, kind=MediaKinds.IMAGE.value, phash__isnull=False)
+            if albumid:
+                album = Album.objects.get(id=albumid, user=user)
+                medias = medias.filter(album=album)
+            
+            # Similar media of one media are found with the indexed hash chunks
+            if mediaid:
+                media = Media.objects.filter(id=mediaid, album__user=user, album__deletiondate__isnull=True).distinct().get()
+                similar = duplicates.find_similar_media(media, medias, distance)
+                return HttpResponse("[" + ",".join(str(m) for m in similar) + "]", content_type='application/json')
+            
+            # Hashes of all the media are grouped in memory
+            hashes = {id: duplicates.get_stored_hash(phash) for id, phash in medias.values_list('id', 'phash').distinct()}
+            groups = duplicates.group_duplicates(hashes, distance)
+            found = Media.objects.prefetch_related('mediatags__tag').in_bulk([id for group in groups for id in group])
+            groups_json = ",".join("[" + ",".join(str(found[id]) for id in group) + "]" for group in groups)
+            return HttpResponse("[" + groups_json + "]", content_type='application/json')
+        except (Album.DoesNotExist, Media.DoesNotExist, ValueError):
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
@@ -162,7 +162,8 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = 'en-us'
 
-TIME_ZONE = 'UTC'
+# Also the time zone of dates recorded without offset (e.g. EXIF capture dates of most cameras)
+TIME_ZONE = os.getenv('GALERIA_TIME_ZONE', 'UTC')
 
 USE_I18N = False
 
@@ -187,6 +188,60 @@ CORS_ALLOWED_ORIGINS = [
 STATIC_URL = '/static/'
 STATIC_ROOT = BACKEND_DIR / 'staticfiles'
 MEDIA_ROOT = BACKEND_DIR / 'usermedia' if not DEBUG else BACKEND_DIR / 'usermedia-test'
+# Tests run with MEDIA_ROOT in a temporary folder (see core.tests.runner)
+TEST_RUNNER = 'core.tests.runner.TestRunner'
+# Media files are sent by nginx (X-Accel-Redirect to an internal location mapped to MEDIA_ROOT)
+# after Django authorizes the request, instead of being streamed by gunicorn workers
+MEDIA_ACCEL_REDIRECT = not DEBUG
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+# Disk budget for files derived from media (renditions), least recently used ones are evicted over it
+DERIVED_CACHE_MAX_BYTES = int(os.getenv('GALERIA_DERIVED_CACHE_MAX_BYTES', 10 * 1024 ** 3))
+# Videos are transcoded into adaptive HLS streams by the transcodevideos worker
+FFMPEG_PATH = os.getenv('GALERIA_FFMPEG_PATH', 'ffmpeg')
+FFPROBE_PATH = os.getenv('GALERIA_FFPROBE_PATH', 'ffprobe')
+# Codecs of the streams ('h264', 'av1'), comma separated. H.264 plays everywhere, AV1 is smaller but much slower to encode
+VIDEO_STREAM_CODECS = [codec.strip() for codec in os.getenv('GALERIA_VIDEO_STREAM_CODECS', 'h264').split(',') if codec.strip()]
+# Maximum seconds to transcode a video with each codec
+VIDEO_TRANSCODE_TIMEOUT = int(os.getenv('GALERIA_VIDEO_TRANSCODE_TIMEOUT', 3 * 60 * 60))
+# Nominatim reverse geocoding service, requests per second allowed by its usage policy (per process) and seconds to wait for it
+GEOCODING_URL = os.getenv('GALERIA_GEOCODING_URL', 'https://nominatim.openstreetmap.org/reverse')
+GEOCODING_REQUESTS_PER_SECOND = float(os.getenv('GALERIA_GEOCODING_REQUESTS_PER_SECOND', 1))
+GEOCODING_TIMEOUT = float(os.getenv('GALERIA_GEOCODING_TIMEOUT', 5))
+# Locations of media are found offline in a GeoNames cities dump (e.g. cities500.txt) if set, instead of querying Nominatim
+# Country names are read from the GeoNames countryInfo.txt file, places farther than the maximum distance are not used
+GEONAMES_CITIES_PATH = os.getenv('GALERIA_GEONAMES_CITIES_PATH')
+GEONAMES_COUNTRIES_PATH = os.getenv('GALERIA_GEONAMES_COUNTRIES_PATH')
+GEONAMES_MAX_DISTANCE_KM = float(os.getenv('GALERIA_GEONAMES_MAX_DISTANCE_KM', 100))
+# CLIP-style ONNX models embedding images and texts in the same space, for similar photos and text search (disabled if not set)
+# Image and text encoders are separate models (e.g. the vision and text models of CLIP exported with optimum), texts are
+# tokenized with the tokenizer.json file of the model
+EMBEDDING_IMAGE_MODEL_PATH = os.getenv('GALERIA_EMBEDDING_IMAGE_MODEL_PATH')
+EMBEDDING_TEXT_MODEL_PATH = os.getenv('GALERIA_EMBEDDING_TEXT_MODEL_PATH')
+EMBEDDING_TOKENIZER_PATH = os.getenv('GALERIA_EMBEDDING_TOKENIZER_PATH')
+# YOLO ONNX model detecting objects in images uploaded without detections from the browser (disabled if not set)
+# Exported by scripts/modeling/yolo-onnx-export.py, with a dynamic batch axis so queued images are detected together
+DETECTION_MODEL_PATH = os.getenv('GALERIA_DETECTION_MODEL_PATH')
+# Threads used by each ONNX session (0 lets onnxruntime choose)
+ONNX_THREADS = int(os.getenv('GALERIA_ONNX_THREADS', 0))
+# Storage of media files (blob store): local disk (MEDIA_ROOT) by default, or an S3-compatible
+# object storage (AWS S3, MinIO...) if a bucket is set, so app nodes do not need a shared volume
+# Temporary upload files and derived files stay in MEDIA_ROOT of every node
+if os.getenv('GALERIA_S3_BUCKET'):
+    MEDIA_STORAGE = {
+        'BACKEND': 'core.storage.S3Storage',
+        'OPTIONS': {
+            'bucket': os.getenv('GALERIA_S3_BUCKET'),
+            'endpoint_url': os.getenv('GALERIA_S3_ENDPOINT_URL'),
+            'region': os.getenv('GALERIA_S3_REGION'),
+            'access_key': os.getenv('GALERIA_S3_ACCESS_KEY'),
+            'secret_key': os.getenv('GALERIA_S3_SECRET_KEY'),
+            'prefix': os.getenv('GALERIA_S3_PREFIX', ''),
+        },
+    }
+else:
+    MEDIA_STORAGE = {
+        'BACKEND': 'core.storage.LocalStorage',
+    }
 
 DJANGO_VITE_DEV_MODE = DEBUG
 VITE_APP_DIR = BASE_DIR / "frontend"
@@ -235,6 +290,7 @@ REST_KNOX = {
 FILE_UPLOAD_HANDLERS = [
     # "encrypted_files.uploadhandler.EncryptedFileUploadHandler",
     "django.core.files.uploadhandler.MemoryFileUploadHandler",
-    "django.core.files.uploadhandler.TemporaryFileUploadHandler"
+    # Big files are streamed into the blob store filesystem and hashed while received
+    "core.uploadhandlers.BlobUploadHandler"
 ]
 
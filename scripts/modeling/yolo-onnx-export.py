@@ -3,5 +3,5 @@ from ultralytics import YOLO
 # Load a model
 model = YOLO('yolov8n-oiv7.pt')  # load an official model
 
-# Export the model
-model.export(format='onnx')
\ No newline at end of file
+# Export the model, with a dynamic batch axis so the server detects several images per run
+model.export(format='onnx', dynamic=True)
\ No newline at end of file